@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+from enum import Enum
+
+class ChangeOperation(Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+@dataclass
+class ChangeEvent:
+    """
+    One saved change to a stored record
+    
+    before and after are the stored forms of the record (None before a
+    create and after a delete). They are shared with the repository and
+    every other subscriber, so they must not be modified.
+    """
+    sequence: int
+    entity: str
+    entity_id: str
+    operation: ChangeOperation
+    user_id: Optional[str] = None
+    before: Optional[Dict[str, Any]] = None
+    after: Optional[Dict[str, Any]] = None
+    occurred_at: datetime = field(default_factory=datetime.now)
+    
+    def to_dict(self):
+        """Convert change event to dictionary for JSON serialization"""
+        return {
+            'sequence': self.sequence,
+            'entity': self.entity,
+            'entity_id': self.entity_id,
+            'operation': self.operation.value,
+            'user_id': self.user_id,
+            'before': self.before,
+            'after': self.after,
+            'occurred_at': self.occurred_at.isoformat()
+        }
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from datetime import date
+
+@dataclass
+class DailyRollup:
+    """
+    Aggregated time entries of one user and project on one day
+    """
+    user_id: str
+    project_id: str
+    day: date
+    minutes: int = 0
+    entry_count: int = 0
+    session_count: int = 0
+    longest_session_minutes: int = 0
+    shortest_session_minutes: int = 0
+    
+    def to_dict(self):
+        """Convert rollup to dictionary for JSON serialization"""
+        return {
+            'user_id': self.user_id,
+            'project_id': self.project_id,
+            'day': self.day.isoformat(),
+            'minutes': self.minutes,
+            'entry_count': self.entry_count,
+            'session_count': self.session_count,
+            'longest_session_minutes': self.longest_session_minutes,
+            'shortest_session_minutes': self.shortest_session_minutes
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Create rollup from dictionary"""
+        return cls(
+            user_id=data.get('user_id', ''),
+            project_id=data.get('project_id', ''),
+            day=date.fromisoformat(data['day']),
+            minutes=data.get('minutes', 0),
+            entry_count=data.get('entry_count', 0),
+            session_count=data.get('session_count', 0),
+            longest_session_minutes=data.get('longest_session_minutes', 0),
+            shortest_session_minutes=data.get('shortest_session_minutes', 0)
+        )
\ No newline at end of file
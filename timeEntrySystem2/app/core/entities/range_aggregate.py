@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Tuple
+
+@dataclass
+class RangeAggregate:
+    """
+    Totals of one user's time entries starting within a date range
+    """
+    entry_count: int = 0
+    active_days: int = 0
+    # project_id -> minutes, for projects with entries in the range
+    project_minutes: Dict[str, int] = field(default_factory=dict)
+    # Minutes on each day of the range, when requested
+    day_minutes: List[int] = field(default_factory=list)
+    # (week start, minutes) of each week with entries, in order, when requested
+    week_minutes: List[Tuple[date, int]] = field(default_factory=list)
+    session_count: int = 0
+    longest_session_minutes: int = 0
+    shortest_session_minutes: int = 0
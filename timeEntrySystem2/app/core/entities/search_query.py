@@ -0,0 +1,52 @@
+import re
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+_TOKEN = re.compile(r'[^\W_]+')
+_PHRASE = re.compile(r'"([^"]*)"?')
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase words, dropping punctuation"""
+    return _TOKEN.findall(text.lower()) if text else []
+
+@dataclass
+class SearchQuery:
+    """
+    A parsed search query
+    
+    Bare words match any word containing them, so "port" finds
+    "portal" and "report"; a trailing * is accepted but not needed.
+    Quoted text matches those exact words in order. An entry matches
+    when every word and phrase does.
+    """
+    terms: List[str] = field(default_factory=list)
+    phrases: List[Tuple[str, ...]] = field(default_factory=list)
+    
+    @classmethod
+    def parse(cls, text: str) -> 'SearchQuery':
+        """Parse query text, with "double quotes" around phrases"""
+        query = cls()
+        for word in tokenize(_PHRASE.sub(' ', text or '')):
+            if word not in query.terms:
+                query.terms.append(word)
+        for phrase in _PHRASE.findall(text or ''):
+            words = tuple(tokenize(phrase))
+            if words and words not in query.phrases:
+                query.phrases.append(words)
+        return query
+    
+    def is_empty(self) -> bool:
+        """Check if the query has nothing to match"""
+        return not self.terms and not self.phrases
+    
+    def matches(self, text: str) -> bool:
+        """Check if every term and phrase matches text"""
+        words = tokenize(text)
+        return (all(any(term in word for word in words) for term in self.terms) and
+                all(contains_phrase(words, phrase) for phrase in self.phrases))
+
+def contains_phrase(words, phrase: Tuple[str, ...]) -> bool:
+    """Check if phrase occurs as consecutive words"""
+    size = len(phrase)
+    return any(tuple(words[i:i + size]) == phrase
+               for i in range(len(words) - size + 1) if words[i] == phrase[0])
\ No newline at end of file
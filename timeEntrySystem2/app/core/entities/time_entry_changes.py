@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from typing import List
+from app.core.entities.time_entry import TimeEntry
+
+@dataclass
+class TimeEntryChanges:
+    """
+    A user's time entries changed since a data version
+    
+    When reset is True the version asked about is no longer known, and
+    entries holds all of the user's entries, replacing what the client has.
+    """
+    version: int
+    reset: bool = False
+    entries: List[TimeEntry] = field(default_factory=list)
+    deleted_ids: List[str] = field(default_factory=list)
+    
+    def to_dict(self):
+        """Convert changes to dictionary for JSON serialization"""
+        return {
+            'version': self.version,
+            'reset': self.reset,
+            'entries': [entry.to_dict() for entry in self.entries],
+            'deleted_ids': self.deleted_ids
+        }
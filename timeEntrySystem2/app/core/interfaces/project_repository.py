@@ -45,4 +45,9 @@ class IProjectRepository(ABC):
     @abstractmethod
     def list_all(self) -> List[Project]:
         """Get all projects"""
+        pass
+    
+    @abstractmethod
+    def get_data_version(self, user_id: Optional[str] = None) -> int:
+        """Get a number that changes whenever any of the user's projects change, or any project when user_id is None"""
         pass
\ No newline at end of file
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, ContextManager, Iterator, Tuple
 from datetime import datetime, date
 from app.core.entities.time_entry import TimeEntry
+from app.core.entities.daily_rollup import DailyRollup
+from app.core.entities.range_aggregate import RangeAggregate
+from app.core.entities.time_entry_changes import TimeEntryChanges
+from app.core.entities.search_query import SearchQuery
 
 class ITimeEntryRepository(ABC):
     """
@@ -13,11 +17,21 @@ class ITimeEntryRepository(ABC):
         """Create a new time entry"""
         pass
     
+    @abstractmethod
+    def create_many(self, time_entries: List[TimeEntry]) -> List[TimeEntry]:
+        """Create several time entries in one write"""
+        pass
+    
     @abstractmethod
     def get_by_id(self, entry_id: str) -> Optional[TimeEntry]:
         """Get time entry by ID"""
         pass
     
+    @abstractmethod
+    def get_many(self, entry_ids: List[str]) -> List[TimeEntry]:
+        """Get time entries for a list of IDs, in the given order, skipping unknown IDs"""
+        pass
+    
     @abstractmethod
     def get_by_user_id(self, user_id: str) -> List[TimeEntry]:
         """Get all time entries for a user"""
@@ -43,11 +57,62 @@ class ITimeEntryRepository(ABC):
         """Get time entries within a date range for a user"""
         pass
     
+    @abstractmethod
+    def iter_by_date_range(self, user_id: str, start_date: date, end_date: date) -> Iterator[TimeEntry]:
+        """Yield time entries within a date range for a user, ordered by start time, without loading them all at once"""
+        pass
+    
+    @abstractmethod
+    def get_page(self, user_id: str, limit: Optional[int] = None, after: Optional[Tuple[datetime, str]] = None,
+                 start_date: Optional[date] = None, end_date: Optional[date] = None,
+                 project_id: Optional[str] = None) -> List[TimeEntry]:
+        """Get up to limit of a user's entries ordered by (start_time, entry_id) descending, starting after the given key, optionally filtered by start date and project"""
+        pass
+    
     @abstractmethod
     def get_by_project_and_date_range(self, project_id: str, start_date: date, end_date: date) -> List[TimeEntry]:
         """Get time entries for a project within a date range"""
         pass
     
+    @abstractmethod
+    def get_daily_rollups(self, user_id: str, start_date: date, end_date: date,
+                          project_id: Optional[str] = None) -> List[DailyRollup]:
+        """Get per-day, per-project totals for a user within a date range, ordered by day"""
+        pass
+    
+    @abstractmethod
+    def get_range_totals(self, user_id: str, start_date: date, end_date: date,
+                         project_id: Optional[str] = None) -> Tuple[int, int]:
+        """Get (total minutes, entry count) of a user's entries starting within a date range"""
+        pass
+    
+    @abstractmethod
+    def get_project_totals(self, user_id: str, start_date: Optional[date] = None,
+                           end_date: Optional[date] = None) -> Dict[str, Tuple[int, int]]:
+        """Get project_id -> (total minutes, entry count) of a user's entries, optionally starting within a date range, for projects with entries"""
+        pass
+    
+    def aggregate_range(self, user_id: str, start_date: date, end_date: date,
+                        by_day: bool = False, by_week: bool = False) -> Optional[RangeAggregate]:
+        """Total a user's entries starting within a date range in one pass, or None if unsupported
+        
+        Optional: repositories without a faster path than get_daily_rollups
+        keep this default, and reports total the rollups instead.
+        """
+        return None
+    
+    @abstractmethod
+    def search_descriptions(self, user_id: str, query: SearchQuery,
+                            start_date: Optional[date] = None, end_date: Optional[date] = None,
+                            project_id: Optional[str] = None) -> List[Tuple[str, datetime, float]]:
+        """Get (entry_id, start_time, relevance) of a user's entries whose descriptions match query, optionally filtered by start date and project"""
+        pass
+    
+    @abstractmethod
+    def get_changes(self, user_id: str, since_version: Optional[int] = None) -> TimeEntryChanges:
+        """Get a user's entries saved, and IDs of those deleted, after since_version, which must be a version returned by get_data_version; if the repository no longer knows that version, or it is None, get all of the user's entries with reset set"""
+        pass
+    
     @abstractmethod
     def check_overlap(self, user_id: str, start_time: datetime, end_time: datetime, exclude_entry_id: Optional[str] = None) -> bool:
         """Check if time range overlaps with existing entries"""
@@ -66,4 +131,19 @@ class ITimeEntryRepository(ABC):
     @abstractmethod
     def list_all(self) -> List[TimeEntry]:
         """Get all time entries"""
+        pass
+    
+    @abstractmethod
+    def batch(self) -> ContextManager[None]:
+        """Context manager that saves all changes made inside it in one write"""
+        pass
+    
+    @abstractmethod
+    def get_data_version(self, user_id: Optional[str] = None) -> int:
+        """Get a number that changes whenever any of the user's time entries change, or any time entry when user_id is None"""
+        pass
+    
+    @abstractmethod
+    def wait_for_change(self, user_id: Optional[str], version: int, timeout: float) -> int:
+        """Block until get_data_version(user_id) differs from version, or timeout seconds pass, and return the current version"""
         pass
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, ContextManager
 from datetime import date
 from app.core.entities.timesheet import Timesheet, PeriodType, TimesheetStatus
 
@@ -18,6 +18,11 @@ class ITimesheetRepository(ABC):
         """Get timesheet by ID"""
         pass
     
+    @abstractmethod
+    def get_many(self, timesheet_ids: List[str]) -> List[Timesheet]:
+        """Get timesheets for a list of IDs, in the given order, skipping unknown IDs"""
+        pass
+    
     @abstractmethod
     def get_by_user_id(self, user_id: str) -> List[Timesheet]:
         """Get all timesheets for a user"""
@@ -56,4 +61,14 @@ class ITimesheetRepository(ABC):
     @abstractmethod
     def list_all(self) -> List[Timesheet]:
         """Get all timesheets"""
+        pass
+    
+    @abstractmethod
+    def batch(self) -> ContextManager[None]:
+        """Context manager that saves all changes made inside it in one write"""
+        pass
+    
+    @abstractmethod
+    def get_data_version(self, user_id: Optional[str] = None) -> int:
+        """Get a number that changes whenever any of the user's timesheets change, or any timesheet when user_id is None"""
         pass
\ No newline at end of file
@@ -35,4 +35,9 @@ class IUserRepository(ABC):
     @abstractmethod
     def list_all(self) -> List[User]:
         """Get all users"""
+        pass
+    
+    @abstractmethod
+    def get_data_version(self, user_id: Optional[str] = None) -> int:
+        """Get a number that changes whenever the user's record changes, or any user when user_id is None"""
         pass
\ No newline at end of file
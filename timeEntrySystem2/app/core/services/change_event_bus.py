@@ -0,0 +1,195 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from app.core.entities.change_event import ChangeEvent, ChangeOperation
+
+ChangeHandler = Callable[[ChangeEvent], None]
+
+# What a threaded subscription does when its queue is full: 'block' makes
+# the publisher wait up to block_timeout seconds before dropping the event,
+# 'drop' drops it at once
+OVERFLOW_POLICIES = ('block', 'drop')
+
+# Tells a subscription's worker thread to stop
+_STOP = object()
+
+class ChangeSubscription:
+    """
+    A handler registered with a ChangeEventBus, and its delivery counters
+    
+    Synchronous subscriptions call the handler in the publishing thread,
+    while the repository still holds its write lock, so handlers must be
+    quick and must not wait on other threads. Threaded subscriptions hand
+    events to a worker thread through a bounded queue. Handler errors are
+    counted and never reach the writer, whose change is already saved.
+    """
+    
+    def __init__(self, handler: ChangeHandler, entities: Optional[Iterable[str]] = None,
+                 threaded: bool = False, max_queue: int = 1000, overflow: str = 'block',
+                 block_timeout: float = 1.0):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}'")
+        if threaded and max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        self.handler = handler
+        self.entities = frozenset(entities) if entities is not None else None
+        self.threaded = threaded
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self._lock = threading.Lock()
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.blocked = 0
+        self.blocked_seconds = 0.0
+        self.max_depth = 0
+        self.last_error: Optional[str] = None
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        if threaded:
+            self._queue = queue.Queue(max_queue)
+            self._worker = threading.Thread(target=self._run, name='change-subscriber', daemon=True)
+            self._worker.start()
+    
+    def wants(self, event: ChangeEvent) -> bool:
+        """Check if the subscription receives events for event's entity"""
+        return self.entities is None or event.entity in self.entities
+    
+    def offer(self, event: ChangeEvent) -> None:
+        """Deliver an event, or queue it for the worker thread"""
+        if self._queue is None:
+            self._handle(event)
+            return
+        
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            if not self._put_when_room(event):
+                with self._lock:
+                    self.dropped += 1
+                return
+        
+        depth = self._queue.qsize()
+        with self._lock:
+            self.max_depth = max(self.max_depth, depth)
+    
+    def _put_when_room(self, event: ChangeEvent) -> bool:
+        """Wait for room in a full queue as the overflow policy allows; return whether the event was queued"""
+        if self.overflow == 'drop':
+            return False
+        
+        started = time.monotonic()
+        try:
+            self._queue.put(event, timeout=self.block_timeout)
+            return True
+        except queue.Full:
+            return False
+        finally:
+            with self._lock:
+                self.blocked += 1
+                self.blocked_seconds += time.monotonic() - started
+    
+    def _handle(self, event: ChangeEvent) -> None:
+        """Call the handler, counting the outcome"""
+        try:
+            self.handler(event)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+                self.last_error = str(e)
+        else:
+            with self._lock:
+                self.delivered += 1
+    
+    def _run(self) -> None:
+        """Worker thread: handle queued events until close()"""
+        while True:
+            event = self._queue.get()
+            if event is _STOP:
+                return
+            self._handle(event)
+    
+    def close(self) -> None:
+        """Stop the worker thread once it has handled the events already queued"""
+        if self._queue is not None:
+            self._queue.put(_STOP)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get delivery and backpressure counters"""
+        with self._lock:
+            return {
+                'entities': sorted(self.entities) if self.entities is not None else None,
+                'threaded': self.threaded,
+                'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+                'max_queue': self.max_queue if self.threaded else 0,
+                'max_depth': self.max_depth,
+                'delivered': self.delivered,
+                'dropped': self.dropped,
+                'errors': self.errors,
+                'blocked': self.blocked,
+                'blocked_seconds': round(self.blocked_seconds, 3),
+                'last_error': self.last_error
+            }
+
+class ChangeEventBus:
+    """
+    In-process publisher of saved record changes
+    
+    Repositories publish one event per created, updated or deleted record
+    after the change is saved. Every event gets the next sequence number.
+    Events of one repository reach each subscriber in sequence order;
+    events of different repositories may interleave. Changes made by
+    other processes are not seen.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._subscriptions: List[ChangeSubscription] = []
+    
+    @property
+    def last_sequence(self) -> int:
+        """Get the sequence number of the latest event, or 0 if none was published"""
+        with self._lock:
+            return self._sequence
+    
+    def subscribe(self, handler: ChangeHandler, entities: Optional[Iterable[str]] = None,
+                  threaded: bool = False, max_queue: int = 1000, overflow: str = 'block',
+                  block_timeout: float = 1.0) -> ChangeSubscription:
+        """Register handler for events of the given entities, or all entities if None"""
+        subscription = ChangeSubscription(handler, entities, threaded, max_queue, overflow, block_timeout)
+        with self._lock:
+            # Copy on write so publish() can iterate without the lock
+            self._subscriptions = self._subscriptions + [subscription]
+        return subscription
+    
+    def unsubscribe(self, subscription: ChangeSubscription) -> None:
+        """Stop delivering events to a subscription"""
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s is not subscription]
+        subscription.close()
+    
+    def publish(self, entity: str, entity_id: str, operation: ChangeOperation, user_id: Optional[str] = None,
+                before: Optional[Dict[str, Any]] = None, after: Optional[Dict[str, Any]] = None) -> ChangeEvent:
+        """Number an event and deliver it to the subscriptions that want it"""
+        with self._lock:
+            self._sequence += 1
+            event = ChangeEvent(self._sequence, entity, entity_id, operation, user_id, before, after)
+            subscriptions = self._subscriptions
+        
+        for subscription in subscriptions:
+            if subscription.wants(event):
+                subscription.offer(event)
+        return event
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get the latest sequence number and every subscription's counters"""
+        with self._lock:
+            sequence = self._sequence
+            subscriptions = self._subscriptions
+        return {
+            'last_sequence': sequence,
+            'subscriptions': [subscription.stats() for subscription in subscriptions]
+        }
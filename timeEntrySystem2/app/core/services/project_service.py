@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date
 from app.core.entities.project import Project, ProjectStatus
 from app.core.interfaces.project_repository import IProjectRepository
@@ -13,6 +13,11 @@ class ProjectService:
         self._project_repository = project_repository
         self._time_entry_repository = time_entry_repository
     
+    def get_data_version(self, user_id: Optional[str] = None) -> tuple:
+        """Get the versions of the projects and time entries this service reads for user_id"""
+        return (self._project_repository.get_data_version(user_id),
+                self._time_entry_repository.get_data_version(user_id))
+    
     def create_project(self, user_id: str, name: str, description: Optional[str] = None, 
                       color_code: Optional[str] = None, deadline: Optional[date] = None) -> Project:
         """Creates new project with validation"""
@@ -90,24 +95,50 @@ class ProjectService:
     def get_project_time_summary(self, project_id: str, start_date: Optional[date] = None, 
                                 end_date: Optional[date] = None) -> dict:
         """Get time spent summary for a project"""
-        if start_date and end_date:
-            time_entries = self._time_entry_repository.get_by_project_and_date_range(
-                project_id, start_date, end_date)
+        project = self._project_repository.get_by_id(project_id)
+        if project:
+            # Range totals are indexed per owner and project
+            total_minutes, entry_count = self._time_entry_repository.get_range_totals(
+                project.user_id,
+                start_date if start_date and end_date else date.min,
+                end_date if start_date and end_date else date.max,
+                project_id)
         else:
-            time_entries = self._time_entry_repository.get_by_project_id(project_id)
+            total_minutes, entry_count = 0, 0
         
-        total_minutes = sum(entry.duration_minutes for entry in time_entries)
         total_hours = round(total_minutes / 60.0, 2)
         
         return {
             'project_id': project_id,
             'total_hours': total_hours,
             'total_minutes': total_minutes,
-            'entry_count': len(time_entries),
+            'entry_count': entry_count,
             'start_date': start_date.isoformat() if start_date else None,
             'end_date': end_date.isoformat() if end_date else None
         }
     
+    def get_projects_with_stats(self, user_id: str,
+                                status: Optional[ProjectStatus] = None) -> List[Tuple[Project, dict]]:
+        """Get a user's projects, optionally by status, each with its all-time totals
+        
+        Totals of every project come from one grouped repository query.
+        """
+        if status is not None:
+            projects = self._project_repository.get_by_user_and_status(user_id, status)
+        else:
+            projects = self._project_repository.get_by_user_id(user_id)
+        
+        totals = self._time_entry_repository.get_project_totals(user_id)
+        result = []
+        for project in projects:
+            total_minutes, entry_count = totals.get(project.project_id, (0, 0))
+            result.append((project, {
+                'total_hours': round(total_minutes / 60.0, 2),
+                'total_minutes': total_minutes,
+                'entry_count': entry_count
+            }))
+        return result
+    
     def delete_project(self, project_id: str) -> bool:
         """Delete project if no associated time entries"""
         # Check if project has time entries
@@ -0,0 +1,37 @@
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Iterable
+from app.core.entities.daily_rollup import DailyRollup
+from app.core.entities.range_aggregate import RangeAggregate
+
+def aggregate_rollups(rollups: Iterable[DailyRollup], start_date: date, end_date: date,
+                      by_day: bool = False, by_week: bool = False) -> RangeAggregate:
+    """Total daily rollups in pure Python"""
+    aggregate = RangeAggregate()
+    project_minutes = defaultdict(int)
+    daily_minutes = defaultdict(int)
+    weekly_minutes = defaultdict(int)
+    shortest = None
+    
+    for rollup in rollups:
+        aggregate.entry_count += rollup.entry_count
+        project_minutes[rollup.project_id] += rollup.minutes
+        daily_minutes[rollup.day] += rollup.minutes
+        if by_week:
+            weekly_minutes[rollup.day - timedelta(days=rollup.day.weekday())] += rollup.minutes
+        if rollup.session_count > 0:
+            aggregate.session_count += rollup.session_count
+            aggregate.longest_session_minutes = max(aggregate.longest_session_minutes,
+                                                    rollup.longest_session_minutes)
+            if shortest is None or rollup.shortest_session_minutes < shortest:
+                shortest = rollup.shortest_session_minutes
+    
+    aggregate.project_minutes = dict(project_minutes)
+    aggregate.active_days = len(daily_minutes)
+    aggregate.shortest_session_minutes = shortest or 0
+    if by_day:
+        span = (end_date - start_date).days + 1
+        aggregate.day_minutes = [daily_minutes[start_date + timedelta(days=i)] for i in range(span)]
+    if by_week:
+        aggregate.week_minutes = sorted(weekly_minutes.items())
+    return aggregate
@@ -1,48 +1,108 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from datetime import date, datetime, timedelta
 from collections import defaultdict
+import csv
+import functools
+import heapq
+import io
+import json
 from app.core.interfaces.time_entry_repository import ITimeEntryRepository
 from app.core.interfaces.project_repository import IProjectRepository
 from app.core.interfaces.timesheet_repository import ITimesheetRepository
+from app.core.services.report_cache import ReportCache
+from app.core.services.report_aggregates import aggregate_rollups
+from app.core.entities.range_aggregate import RangeAggregate
+from app.core.entities.search_query import SearchQuery
+
+# Columns of exported time entries, in CSV order
+EXPORT_FIELDS = ['entry_id', 'date', 'project_id', 'project_name', 'description',
+                 'start_time', 'end_time', 'duration_minutes', 'duration_hours', 'timesheet_id']
+
+# Fields of each search result
+SEARCH_RESULT_FIELDS = ['entry_id', 'project_name', 'project_id', 'description', 'start_time',
+                        'end_time', 'duration', 'duration_minutes', 'date', 'relevance']
+
+# Export formats; 'json' is accepted as an alias for JSON lines
+EXPORT_FORMATS = ('csv', 'jsonl', 'json')
+
+def cached_report(method):
+    """Serve a report method's results from the service's cache
+    
+    Results are keyed by method, user and arguments, and reused until the
+    user's time entries or projects change.
+    """
+    @functools.wraps(method)
+    def wrapper(self, user_id, *args, **kwargs):
+        if self._cache is None:
+            return method(self, user_id, *args, **kwargs)
+        key = (method.__name__, user_id, args, tuple(sorted(kwargs.items())))
+        # Read the version before computing, so a result is never older than
+        # the version it is stored under
+        version = self.get_data_version(user_id)
+        return self._cache.get_or_compute(key, version, lambda: method(self, user_id, *args, **kwargs))
+    return wrapper
 
 class ReportingService:
     """
     Generates reports and analytics for time tracking data
     """
     
+    # Rows written per chunk of export output
+    EXPORT_CHUNK_ROWS = 500
+    
+    # Relevance added to search results whose project name matches the query
+    PROJECT_NAME_SCORE = 1.0
+    
     def __init__(self, time_entry_repository: ITimeEntryRepository, 
                  project_repository: IProjectRepository,
-                 timesheet_repository: ITimesheetRepository):
+                 timesheet_repository: ITimesheetRepository,
+                 cache: Optional[ReportCache] = None):
         self._time_entry_repository = time_entry_repository
         self._project_repository = project_repository
         self._timesheet_repository = timesheet_repository
+        self._cache = cache
+    
+    def get_data_version(self, user_id: Optional[str] = None) -> tuple:
+        """Get the versions of the data reports for user_id are built from"""
+        return (self._time_entry_repository.get_data_version(user_id),
+                self._project_repository.get_data_version(user_id))
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get report cache counters"""
+        if self._cache is None:
+            return {'enabled': False}
+        return dict(self._cache.stats(), enabled=True)
+    
+    def _aggregate(self, user_id: str, start_date: date, end_date: date,
+                   by_day: bool = False, by_week: bool = False) -> RangeAggregate:
+        """Total a user's entries in a date range
+        
+        Uses the repository's own aggregation when it provides one, such as
+        NumPy columns, and the daily rollups otherwise.
+        """
+        aggregate = self._time_entry_repository.aggregate_range(user_id, start_date, end_date, by_day, by_week)
+        if aggregate is not None:
+            return aggregate
+        rollups = self._time_entry_repository.get_daily_rollups(user_id, start_date, end_date)
+        return aggregate_rollups(rollups, start_date, end_date, by_day, by_week)
+    
+    @cached_report
     def get_time_by_project(self, user_id: str, start_date: date, end_date: date) -> Dict[str, Any]:
         """Get time distribution by project"""
-        time_entries = self._time_entry_repository.get_by_date_range(user_id, start_date, end_date)
+        aggregate = self._aggregate(user_id, start_date, end_date)
         projects = {p.project_id: p for p in self._project_repository.get_by_user_id(user_id)}
         
-        project_times = defaultdict(int)
-        project_names = {}
-        
-        for entry in time_entries:
-            project_times[entry.project_id] += entry.duration_minutes
-            if entry.project_id in projects:
-                project_names[entry.project_id] = projects[entry.project_id].name
-            else:
-                project_names[entry.project_id] = "Unknown Project"
-        
         # Convert to hours and create result
         result = []
-        total_minutes = sum(project_times.values())
+        total_minutes = sum(aggregate.project_minutes.values())
         
-        for project_id, minutes in project_times.items():
+        for project_id, minutes in aggregate.project_minutes.items():
             hours = round(minutes / 60.0, 2)
             percentage = round((minutes / total_minutes * 100), 1) if total_minutes > 0 else 0
             
             result.append({
                 'project_id': project_id,
-                'project_name': project_names[project_id],
+                'project_name': projects[project_id].name if project_id in projects else "Unknown Project",
                 'hours': hours,
                 'minutes': minutes,
                 'percentage': percentage
@@ -59,56 +119,176 @@ class ReportingService:
             'end_date': end_date.isoformat()
         }
     
+    @cached_report
+    def get_range_total(self, user_id: str, start_date: date, end_date: date,
+                        project_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get total time for a user, optionally for one project, in a date range"""
+        total_minutes, entry_count = self._time_entry_repository.get_range_totals(
+            user_id, start_date, end_date, project_id)
+        
+        return {
+            'user_id': user_id,
+            'project_id': project_id,
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'total_hours': round(total_minutes / 60.0, 2),
+            'total_minutes': total_minutes,
+            'entry_count': entry_count
+        }
+    
+    @cached_report
     def get_daily_summary(self, user_id: str, target_date: date) -> Dict[str, Any]:
         """Get daily time tracking summary"""
         time_entries = self._time_entry_repository.get_by_date_range(user_id, target_date, target_date)
         projects = {p.project_id: p for p in self._project_repository.get_by_user_id(user_id)}
         
-        total_minutes = sum(entry.duration_minutes for entry in time_entries)
-        
-        entry_details = []
-        for entry in time_entries:
-            project_name = projects[entry.project_id].name if entry.project_id in projects else "Unknown"
-            entry_details.append({
-                'entry_id': entry.entry_id,
-                'project_name': project_name,
-                'project_id': entry.project_id,
-                'description': entry.description,
-                'start_time': entry.start_time.strftime('%H:%M'),
-                'end_time': entry.end_time.strftime('%H:%M') if entry.end_time else 'Running',
-                'duration': entry.get_duration_formatted(),
-                'duration_minutes': entry.duration_minutes,
-                'is_running': entry.is_running
-            })
+        total_minutes = self.get_range_total(user_id, target_date, target_date)['total_minutes']
         
         return {
             'date': target_date.isoformat(),
             'total_hours': round(total_minutes / 60.0, 2),
             'total_minutes': total_minutes,
             'entry_count': len(time_entries),
-            'entries': entry_details
+            'entries': [self._daily_entry_details(entry, projects) for entry in time_entries]
         }
     
-    def get_weekly_summary(self, user_id: str, week_start_date: date) -> Dict[str, Any]:
-        """Get weekly time tracking summary"""
-        week_end_date = week_start_date + timedelta(days=6)
-        time_entries = self._time_entry_repository.get_by_date_range(user_id, week_start_date, week_end_date)
+    def _daily_entry_details(self, entry, projects: Dict[str, Any]) -> Dict[str, Any]:
+        """Describe an entry for a daily summary"""
+        project_name = projects[entry.project_id].name if entry.project_id in projects else "Unknown"
+        return {
+            'entry_id': entry.entry_id,
+            'project_name': project_name,
+            'project_id': entry.project_id,
+            'description': entry.description,
+            'start_time': entry.start_time.strftime('%H:%M'),
+            'end_time': entry.end_time.strftime('%H:%M') if entry.end_time else 'Running',
+            'duration': entry.get_duration_formatted(),
+            'duration_minutes': entry.duration_minutes,
+            'is_running': entry.is_running
+        }
+    
+    def get_dashboard(self, user_id: str, today: Optional[date] = None) -> Dict[str, Any]:
+        """Get today's, this week's and this month's totals, the running timer and a project breakdown
+        
+        Entries are read once, for the days covering both the week and the
+        month, and everything is totalled in one pass over that snapshot.
+        """
+        return self._build_dashboard(user_id, today or date.today())
+    
+    @cached_report
+    def _build_dashboard(self, user_id: str, today: date) -> Dict[str, Any]:
+        """Build the dashboard for a given day"""
+        week_start = today - timedelta(days=today.weekday())
+        week_end = week_start + timedelta(days=6)
+        month_start = today.replace(day=1)
+        month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        
+        time_entries = self._time_entry_repository.get_by_date_range(
+            user_id, min(week_start, month_start), max(week_end, month_end))
         projects = {p.project_id: p for p in self._project_repository.get_by_user_id(user_id)}
         
-        # Group by day
+        today_entries = []
+        today_minutes = week_minutes = month_minutes = 0
+        week_count = month_count = 0
         daily_totals = defaultdict(int)
-        project_totals = defaultdict(int)
+        # project_id -> [today, week, month] minutes
+        project_totals = defaultdict(lambda: [0, 0, 0])
+        running_timer = None
         
         for entry in time_entries:
-            entry_date = entry.start_time.date()
-            daily_totals[entry_date] += entry.duration_minutes
-            project_totals[entry.project_id] += entry.duration_minutes
+            day = entry.start_time.date()
+            minutes = entry.duration_minutes
+            totals = project_totals[entry.project_id]
+            if entry.is_running:
+                running_timer = entry
+            if day == today:
+                today_entries.append(entry)
+                today_minutes += minutes
+                totals[0] += minutes
+            if week_start <= day <= week_end:
+                week_minutes += minutes
+                week_count += 1
+                daily_totals[day] += minutes
+                totals[1] += minutes
+            if month_start <= day <= month_end:
+                month_minutes += minutes
+                month_count += 1
+                totals[2] += minutes
+        
+        if running_timer is None:
+            # A timer started before the period is not in the snapshot
+            running_timer = self._time_entry_repository.get_running_timer(user_id)
+        
+        days = []
+        for i in range(7):
+            day = week_start + timedelta(days=i)
+            days.append({
+                'date': day.isoformat(),
+                'day_name': day.strftime('%A'),
+                'hours': round(daily_totals[day] / 60.0, 2),
+                'minutes': daily_totals[day]
+            })
+        
+        project_breakdown = []
+        for project_id, (project_today, project_week, project_month) in project_totals.items():
+            project = projects.get(project_id)
+            project_breakdown.append({
+                'project_id': project_id,
+                'project_name': project.name if project else "Unknown",
+                'color_code': project.color_code if project else None,
+                'today_hours': round(project_today / 60.0, 2),
+                'week_hours': round(project_week / 60.0, 2),
+                'month_hours': round(project_month / 60.0, 2),
+                'month_minutes': project_month,
+                'month_percentage': round(project_month / month_minutes * 100, 1) if month_minutes > 0 else 0
+            })
+        
+        project_breakdown.sort(key=lambda x: x['month_minutes'], reverse=True)
+        
+        return {
+            'date': today.isoformat(),
+            'today': {
+                'date': today.isoformat(),
+                'total_hours': round(today_minutes / 60.0, 2),
+                'total_minutes': today_minutes,
+                'entry_count': len(today_entries),
+                'entries': [self._daily_entry_details(entry, projects) for entry in today_entries]
+            },
+            'week': {
+                'week_start': week_start.isoformat(),
+                'week_end': week_end.isoformat(),
+                'total_hours': round(week_minutes / 60.0, 2),
+                'total_minutes': week_minutes,
+                'entry_count': week_count,
+                'daily_breakdown': days
+            },
+            'month': {
+                'year': today.year,
+                'month': today.month,
+                'month_name': month_start.strftime('%B'),
+                'start_date': month_start.isoformat(),
+                'end_date': month_end.isoformat(),
+                'total_hours': round(month_minutes / 60.0, 2),
+                'total_minutes': month_minutes,
+                'entry_count': month_count
+            },
+            'running_timer': running_timer.to_dict() if running_timer else None,
+            'project_breakdown': project_breakdown
+        }
+    
+    @cached_report
+    def get_weekly_summary(self, user_id: str, week_start_date: date) -> Dict[str, Any]:
+        """Get weekly time tracking summary"""
+        week_end_date = week_start_date + timedelta(days=6)
+        aggregate = self._aggregate(user_id, week_start_date, week_end_date, by_day=True)
+        projects = {p.project_id: p for p in self._project_repository.get_by_user_id(user_id)}
+        
+        week_total = self.get_range_total(user_id, week_start_date, week_end_date)
         
         # Create daily breakdown
         days = []
         current_date = week_start_date
-        for i in range(7):
-            day_minutes = daily_totals[current_date]
+        for day_minutes in aggregate.day_minutes:
             days.append({
                 'date': current_date.isoformat(),
                 'day_name': current_date.strftime('%A'),
@@ -119,9 +299,9 @@ class ReportingService:
         
         # Create project breakdown
         project_breakdown = []
-        total_minutes = sum(project_totals.values())
+        total_minutes = week_total['total_minutes']
         
-        for project_id, minutes in project_totals.items():
+        for project_id, minutes in aggregate.project_minutes.items():
             project_name = projects[project_id].name if project_id in projects else "Unknown"
             hours = round(minutes / 60.0, 2)
             percentage = round((minutes / total_minutes * 100), 1) if total_minutes > 0 else 0
@@ -141,11 +321,12 @@ class ReportingService:
             'week_end': week_end_date.isoformat(),
             'total_hours': round(total_minutes / 60.0, 2),
             'total_minutes': total_minutes,
-            'entry_count': len(time_entries),
+            'entry_count': week_total['entry_count'],
             'daily_breakdown': days,
             'project_breakdown': project_breakdown
         }
     
+    @cached_report
     def get_monthly_summary(self, user_id: str, year: int, month: int) -> Dict[str, Any]:
         """Get monthly time tracking summary"""
         start_date = date(year, month, 1)
@@ -156,23 +337,12 @@ class ReportingService:
         else:
             end_date = date(year, month + 1, 1) - timedelta(days=1)
         
-        time_entries = self._time_entry_repository.get_by_date_range(user_id, start_date, end_date)
+        aggregate = self._aggregate(user_id, start_date, end_date, by_week=True)
         projects = {p.project_id: p for p in self._project_repository.get_by_user_id(user_id)}
         
-        # Group by week
-        weekly_totals = defaultdict(int)
-        project_totals = defaultdict(int)
-        
-        for entry in time_entries:
-            # Get week number
-            entry_date = entry.start_time.date()
-            week_start = entry_date - timedelta(days=entry_date.weekday())
-            weekly_totals[week_start] += entry.duration_minutes
-            project_totals[entry.project_id] += entry.duration_minutes
-        
         # Create weekly breakdown
         weeks = []
-        for week_start, minutes in sorted(weekly_totals.items()):
+        for week_start, minutes in aggregate.week_minutes:
             week_end = week_start + timedelta(days=6)
             weeks.append({
                 'week_start': week_start.isoformat(),
@@ -183,9 +353,9 @@ class ReportingService:
         
         # Create project breakdown
         project_breakdown = []
-        total_minutes = sum(project_totals.values())
+        total_minutes = sum(aggregate.project_minutes.values())
         
-        for project_id, minutes in project_totals.items():
+        for project_id, minutes in aggregate.project_minutes.items():
             project_name = projects[project_id].name if project_id in projects else "Unknown"
             hours = round(minutes / 60.0, 2)
             percentage = round((minutes / total_minutes * 100), 1) if total_minutes > 0 else 0
@@ -208,16 +378,17 @@ class ReportingService:
             'end_date': end_date.isoformat(),
             'total_hours': round(total_minutes / 60.0, 2),
             'total_minutes': total_minutes,
-            'entry_count': len(time_entries),
+            'entry_count': aggregate.entry_count,
             'weekly_breakdown': weeks,
             'project_breakdown': project_breakdown
         }
     
+    @cached_report
     def get_productivity_trends(self, user_id: str, start_date: date, end_date: date) -> Dict[str, Any]:
         """Get productivity analysis and trends"""
-        time_entries = self._time_entry_repository.get_by_date_range(user_id, start_date, end_date)
+        aggregate = self._aggregate(user_id, start_date, end_date)
         
-        if not time_entries:
+        if not aggregate.entry_count:
             return {
                 'start_date': start_date.isoformat(),
                 'end_date': end_date.isoformat(),
@@ -231,24 +402,16 @@ class ReportingService:
             }
         
         # Calculate metrics
-        daily_totals = defaultdict(int)
-        session_durations = []
-        
-        for entry in time_entries:
-            entry_date = entry.start_time.date()
-            daily_totals[entry_date] += entry.duration_minutes
-            if entry.duration_minutes > 0:
-                session_durations.append(entry.duration_minutes)
-        
+        session_count = aggregate.session_count
         total_days = (end_date - start_date).days + 1
-        active_days = len(daily_totals)
-        total_minutes = sum(daily_totals.values())
+        active_days = aggregate.active_days
+        total_minutes = sum(aggregate.project_minutes.values())
         
         avg_hours_per_day = round(total_minutes / 60.0 / total_days, 2)
         avg_hours_per_active_day = round(total_minutes / 60.0 / active_days, 2) if active_days > 0 else 0
         
-        longest_session = round(max(session_durations) / 60.0, 2) if session_durations else 0
-        shortest_session = round(min(session_durations) / 60.0, 2) if session_durations else 0
+        longest_session = round(aggregate.longest_session_minutes / 60.0, 2) if session_count else 0
+        shortest_session = round(aggregate.shortest_session_minutes / 60.0, 2) if session_count else 0
         
         return {
             'start_date': start_date.isoformat(),
@@ -259,10 +422,11 @@ class ReportingService:
             'average_hours_per_active_day': avg_hours_per_active_day,
             'longest_session_hours': longest_session,
             'shortest_session_hours': shortest_session,
-            'total_sessions': len(session_durations),
+            'total_sessions': session_count,
             'total_hours': round(total_minutes / 60.0, 2)
         }
     
+    @cached_report
     def generate_time_distribution_chart(self, user_id: str, start_date: date, end_date: date) -> Dict[str, Any]:
         """Generate chart data for time visualization"""
         project_data = self.get_time_by_project(user_id, start_date, end_date)
@@ -294,45 +458,156 @@ class ReportingService:
             'end_date': end_date.isoformat()
         }
     
-    def search_entries(self, user_id: str, query: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Search through time entries"""
-        all_entries = self._time_entry_repository.get_by_user_id(user_id)
+    def search_entries(self, user_id: str, query: str, filters: Optional[Dict[str, Any]] = None,
+                       limit: Optional[int] = None,
+                       after: Optional[Tuple[float, datetime, str]] = None) -> Tuple[List[Dict[str, Any]], Optional[tuple]]:
+        """Search through time entries
+        
+        Entries match when their description, or their project's name, has
+        every word and "quoted phrase" of the query; a word matches any
+        word containing it. Results are ordered by relevance, then most
+        recent first.
+        An empty query lists the entries matching the filters.
+        
+        Returns up to limit results following the (relevance, start_time,
+        entry_id) key after, and the key of the last result when more follow.
+        Only the returned entries are loaded.
+        """
+        filters = filters or {}
+        start_date = filters.get('start_date')
+        end_date = filters.get('end_date')
+        project_id = filters.get('project_id')
+        search_query = SearchQuery.parse(query)
         projects = {p.project_id: p for p in self._project_repository.get_by_user_id(user_id)}
+        # One extra result tells whether another page follows
+        fetch = limit + 1 if limit is not None else None
+        
+        if search_query.is_empty():
+            # Every entry scores 0, so the repository pages by start time itself
+            entries = self._time_entry_repository.get_page(
+                user_id, fetch, after[1:] if after else None, start_date, end_date, project_id)
+            ranked = [(0.0, entry.start_time, entry.entry_id) for entry in entries]
+            loaded = {entry.entry_id: entry for entry in entries}
+        else:
+            scores = {}
+            starts = {}
+            for entry_id, start_time, score in self._time_entry_repository.search_descriptions(
+                    user_id, search_query, start_date, end_date, project_id):
+                scores[entry_id] = score
+                starts[entry_id] = start_time
+            
+            # Entries of projects whose name matches get a fixed boost
+            boost_key = round(self.PROJECT_NAME_SCORE, 3)
+            for project in projects.values():
+                if project_id is not None and project.project_id != project_id:
+                    continue
+                if not search_query.matches(project.name):
+                    continue
+                described = set()
+                for entry_id, _, _ in self._time_entry_repository.search_descriptions(
+                        user_id, search_query, start_date, end_date, project.project_id):
+                    scores[entry_id] += self.PROJECT_NAME_SCORE
+                    described.add(entry_id)
+                
+                # The project's other entries score the boost alone and rank
+                # by start time, so only the first fetch of them after the
+                # cursor can make this page
+                if after is not None and boost_key > after[0]:
+                    continue
+                cursor = after[1:] if after is not None and boost_key == after[0] else None
+                found = 0
+                while fetch is None or found < fetch:
+                    page = self._time_entry_repository.get_page(
+                        user_id, fetch, cursor, start_date, end_date, project.project_id)
+                    for entry in page:
+                        if entry.entry_id not in described:
+                            scores[entry.entry_id] = self.PROJECT_NAME_SCORE
+                            starts[entry.entry_id] = entry.start_time
+                            found += 1
+                    if fetch is None or len(page) < fetch:
+                        break
+                    cursor = (page[-1].start_time, page[-1].entry_id)
+            
+            # Rounded as reported, so a cursor built from a result finds it again
+            keys = ((round(score, 3), starts[entry_id], entry_id) for entry_id, score in scores.items())
+            if after is not None:
+                keys = (key for key in keys if key < after)
+            ranked = heapq.nlargest(fetch, keys) if fetch is not None else sorted(keys, reverse=True)
+            loaded = None
+        
+        next_key = None
+        if limit is not None and len(ranked) > limit:
+            ranked = ranked[:limit]
+            next_key = ranked[-1]
+        if loaded is None:
+            loaded = {entry.entry_id: entry for entry in
+                      self._time_entry_repository.get_many([entry_id for _, _, entry_id in ranked])}
         
         results = []
-        query_lower = query.lower() if query else ""
+        for score, _, entry_id in ranked:
+            entry = loaded[entry_id]
+            results.append({
+                'entry_id': entry.entry_id,
+                'project_name': projects[entry.project_id].name if entry.project_id in projects else "",
+                'project_id': entry.project_id,
+                'description': entry.description,
+                'start_time': entry.start_time.isoformat(),
+                'end_time': entry.end_time.isoformat() if entry.end_time else None,
+                'duration': entry.get_duration_formatted(),
+                'duration_minutes': entry.duration_minutes,
+                'date': entry.start_time.date().isoformat(),
+                'relevance': score
+            })
         
-        for entry in all_entries:
-            # Search in description
-            description_match = not query or (entry.description and query_lower in entry.description.lower())
-            
-            # Search in project name
-            project_name = projects[entry.project_id].name if entry.project_id in projects else ""
-            project_match = not query or query_lower in project_name.lower()
+        return results, next_key
+    
+    def export_entries(self, user_id: str, start_date: date, end_date: date,
+                       format_type: str = 'csv') -> Iterator[str]:
+        """Export time entries in a date range as chunks of CSV or JSON-lines text
+        
+        Entries are read from the repository one at a time, so memory use
+        does not grow with the size of the range.
+        """
+        if format_type not in EXPORT_FORMATS:
+            raise ValueError("Format must be csv or jsonl")
+        
+        projects = {p.project_id: p.name for p in self._project_repository.get_by_user_id(user_id)}
+        entries = self._time_entry_repository.iter_by_date_range(user_id, start_date, end_date)
+        
+        buffer = io.StringIO()
+        if format_type == 'csv':
+            writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+            write_row = writer.writerow
             
-            if description_match or project_match:
-                # Apply additional filters
-                if filters:
-                    if 'project_id' in filters and entry.project_id != filters['project_id']:
-                        continue
-                    if 'start_date' in filters and entry.start_time.date() < filters['start_date']:
-                        continue
-                    if 'end_date' in filters and entry.start_time.date() > filters['end_date']:
-                        continue
-                
-                results.append({
-                    'entry_id': entry.entry_id,
-                    'project_name': project_name,
-                    'project_id': entry.project_id,
-                    'description': entry.description,
-                    'start_time': entry.start_time.isoformat(),
-                    'end_time': entry.end_time.isoformat() if entry.end_time else None,
-                    'duration': entry.get_duration_formatted(),
-                    'duration_minutes': entry.duration_minutes,
-                    'date': entry.start_time.date().isoformat()
-                })
-        
-        # Sort by start time descending
-        results.sort(key=lambda x: x['start_time'], reverse=True)
-        
-        return results
\ No newline at end of file
+            # Send the header straight away to keep time to first byte low
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        else:
+            def write_row(row):
+                buffer.write(json.dumps(row))
+                buffer.write('\n')
+        
+        rows = 0
+        for entry in entries:
+            write_row({
+                'entry_id': entry.entry_id,
+                'date': entry.start_time.date().isoformat(),
+                'project_id': entry.project_id,
+                'project_name': projects.get(entry.project_id, "Unknown Project"),
+                'description': entry.description,
+                'start_time': entry.start_time.isoformat(),
+                'end_time': entry.end_time.isoformat() if entry.end_time else None,
+                'duration_minutes': entry.duration_minutes,
+                'duration_hours': round(entry.duration_minutes / 60.0, 2),
+                'timesheet_id': entry.timesheet_id
+            })
+            rows += 1
+            if rows % self.EXPORT_CHUNK_ROWS == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        
+        if buffer.tell():
+            yield buffer.getvalue()
\ No newline at end of file
@@ -0,0 +1,258 @@
+import csv
+import json
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Iterator, Tuple, Optional
+from app.core.entities.time_entry import TimeEntry
+from app.core.interfaces.time_entry_repository import ITimeEntryRepository
+from app.core.interfaces.project_repository import IProjectRepository
+
+# 'csv' and 'jsonl' are read line by line; 'json' is a single array, read item by item
+IMPORT_FORMATS = ('csv', 'jsonl', 'json')
+
+class _MalformedDataError(ValueError):
+    """Import data that cannot be read any further"""
+    
+    def __init__(self, line_number: int, message: str):
+        super().__init__(message)
+        self.line_number = line_number
+
+class TimeEntryImportService:
+    """
+    Imports historical time entries from CSV or JSON data
+    
+    Rows are parsed as they are read and handled in chunks of CHUNK_SIZE:
+    each chunk is validated in start-time order against the user's projects
+    and existing entries, including those saved from earlier chunks, and
+    its valid rows are saved with one create_many call. Invalid rows are
+    skipped and reported by line number.
+    """
+    
+    # Rows validated and saved together
+    CHUNK_SIZE = 5000
+    
+    # Errors beyond this many are counted but not listed
+    MAX_REPORTED_ERRORS = 1000
+    
+    def __init__(self, time_entry_repository: ITimeEntryRepository, project_repository: IProjectRepository):
+        self._time_entry_repository = time_entry_repository
+        self._project_repository = project_repository
+    
+    def import_entries(self, lines: Iterable[str], format_type: str,
+                       user_id: str = 'default_user') -> Dict[str, Any]:
+        """Import user_id's entries from lines of CSV or JSON data and summarize the result
+        
+        Each row needs project_id, start_time and end_time, and may set
+        description. A row may also set user_id, but rows of any other user
+        are rejected. Data that cannot be read ends the import with an
+        error at that line; rows of chunks before it stay imported.
+        """
+        if format_type not in IMPORT_FORMATS:
+            raise ValueError("Unsupported import format")
+        
+        errors: List[Tuple[int, str]] = []
+        chunk: List[Tuple[int, TimeEntry]] = []
+        projects = {project.project_id: project for project in self._project_repository.get_by_user_id(user_id)}
+        project_errors: Dict[str, str] = {}
+        rows_processed = 0
+        entries_imported = 0
+        imported_at = datetime.now()
+        
+        try:
+            for line_number, row in self._read_rows(lines, format_type):
+                rows_processed += 1
+                try:
+                    entry = self._build_entry(row, user_id, imported_at)
+                except (ValueError, TypeError) as e:
+                    errors.append((line_number, str(e)))
+                    continue
+                
+                chunk.append((line_number, entry))
+                if len(chunk) == self.CHUNK_SIZE:
+                    entries_imported += self._import_chunk(user_id, chunk, projects, project_errors, errors)
+                    chunk = []
+        except _MalformedDataError as e:
+            errors.append((e.line_number, str(e)))
+        
+        if chunk:
+            entries_imported += self._import_chunk(user_id, chunk, projects, project_errors, errors)
+        
+        errors.sort()
+        if not errors:
+            status = 'success'
+        elif entries_imported:
+            status = 'partial'
+        else:
+            status = 'failed'
+        
+        return {
+            'status': status,
+            'rows_processed': rows_processed,
+            'entries_imported': entries_imported,
+            'error_count': len(errors),
+            'errors': [{'line': line_number, 'error': message}
+                       for line_number, message in errors[:self.MAX_REPORTED_ERRORS]]
+        }
+    
+    def _read_rows(self, lines: Iterable[str], format_type: str) -> Iterator[Tuple[int, Any]]:
+        """Yield (line number, raw row) pairs"""
+        if format_type == 'csv':
+            reader = csv.DictReader(lines)
+            try:
+                for row in reader:
+                    yield reader.line_num, row
+            except csv.Error as e:
+                raise _MalformedDataError(reader.line_num, f"Malformed CSV: {e}") from e
+        elif format_type == 'jsonl':
+            for line_number, line in enumerate(lines, 1):
+                if line.strip():
+                    yield line_number, line
+        else:
+            yield from self._read_json_array(lines)
+    
+    def _read_json_array(self, lines: Iterable[str]) -> Iterator[Tuple[int, Any]]:
+        """Yield (item number, item) pairs of a JSON array, decoding each item once its lines are read
+        
+        Array items are numbered from 1 in place of line numbers.
+        """
+        decoder = json.JSONDecoder()
+        lines = iter(lines)
+        buffer = ''
+        item_number = 0
+        # What may come next: '[' opens the array, 'item' is an item or the
+        # closing ']' right after '[', ',' is a separator or the closing ']'
+        expected = '['
+        
+        while True:
+            buffer = buffer.lstrip()
+            if not buffer:
+                line = next(lines, None)
+                if line is None:
+                    if expected is None:
+                        return
+                    raise _MalformedDataError(item_number + 1, "Invalid JSON: unexpected end of data")
+                buffer = line
+                continue
+            
+            if expected is None:
+                raise _MalformedDataError(item_number + 1, "Invalid JSON: extra data after the array")
+            
+            if expected == '[':
+                if buffer[0] != '[':
+                    raise _MalformedDataError(1, "JSON import data must be an array of entries")
+                buffer = buffer[1:]
+                expected = 'item'
+            elif buffer[0] == ']' and (expected == ',' or item_number == 0):
+                buffer = buffer[1:]
+                expected = None
+            elif expected == ',':
+                if buffer[0] != ',':
+                    raise _MalformedDataError(item_number + 1, "Invalid JSON: expected ',' between entries")
+                buffer = buffer[1:]
+                expected = 'item'
+            else:
+                try:
+                    item, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError as e:
+                    # Items may span lines; read on until this one is whole
+                    line = next(lines, None)
+                    if line is None:
+                        raise _MalformedDataError(item_number + 1, f"Invalid JSON: {e}") from e
+                    buffer += line
+                    continue
+                buffer = buffer[end:]
+                item_number += 1
+                expected = ','
+                yield item_number, item
+    
+    def _build_entry(self, row: Any, user_id: str, imported_at: datetime) -> TimeEntry:
+        """Create a time entry from a raw row, checking fields and times"""
+        if isinstance(row, str):
+            row = json.loads(row)
+        if not isinstance(row, dict):
+            raise ValueError("Row must be an object")
+        
+        if row.get('user_id') and row['user_id'] != user_id:
+            raise ValueError("Row belongs to another user")
+        
+        project_id = row.get('project_id')
+        if not project_id:
+            raise ValueError("Project ID is required")
+        
+        start_time_str = row.get('start_time')
+        end_time_str = row.get('end_time')
+        if not start_time_str or not end_time_str:
+            raise ValueError("start_time and end_time are required")
+        
+        try:
+            start_time = datetime.fromisoformat(start_time_str)
+            end_time = datetime.fromisoformat(end_time_str)
+        except (ValueError, TypeError):
+            raise ValueError("Invalid datetime format. Use ISO format (YYYY-MM-DDTHH:MM:SS)")
+        
+        # Same rules as TimeEntry.update_times, without a clock read per row
+        if start_time > imported_at:
+            raise ValueError("Start time cannot be in the future")
+        
+        if end_time <= start_time:
+            raise ValueError("End time must be after start time")
+        
+        return TimeEntry(
+            user_id=user_id,
+            project_id=project_id,
+            description=row.get('description') or None,
+            start_time=start_time,
+            end_time=end_time,
+            is_running=False,
+            created_at=imported_at,
+            updated_at=imported_at
+        )
+    
+    def _import_chunk(self, user_id: str, rows: List[Tuple[int, TimeEntry]], projects: Dict[str, Any],
+                      project_errors: Dict[str, str], errors: List[Tuple[int, str]]) -> int:
+        """Check a chunk of rows against the user's projects and entries, save the valid ones and count them
+        
+        Rows are checked in start-time order. A row overlaps if the
+        repository finds an overlapping entry, the same check as
+        TimeEntryService.validate_time_overlap, or if it starts before the
+        latest end of the rows accepted so far in this chunk. Rows that
+        fail validation do not block later rows.
+        """
+        rows.sort(key=lambda row: row[1].start_time)
+        
+        accepted = []
+        imported_end: Optional[datetime] = None
+        
+        for line_number, entry in rows:
+            error = self._project_error(entry, projects, project_errors)
+            if error is None:
+                if imported_end is not None and imported_end > entry.start_time:
+                    error = "Time entry overlaps with another imported entry"
+                elif self._time_entry_repository.check_overlap(user_id, entry.start_time, entry.end_time):
+                    error = "Time entry overlaps with existing entry"
+            
+            if error is not None:
+                errors.append((line_number, error))
+                continue
+            
+            accepted.append(entry)
+            if imported_end is None or entry.end_time > imported_end:
+                imported_end = entry.end_time
+        
+        if accepted:
+            self._time_entry_repository.create_many(accepted)
+        return len(accepted)
+    
+    def _project_error(self, entry: TimeEntry, projects: Dict[str, Any],
+                       project_errors: Dict[str, str]) -> Optional[str]:
+        """Get the reason entry's project cannot take entries, or None if it can"""
+        project = projects.get(entry.project_id)
+        if project is not None:
+            return "Cannot create entries for archived project" if project.is_archived() else None
+        
+        # Not one of the user's projects; look it up once to explain why
+        if entry.project_id not in project_errors:
+            if self._project_repository.get_by_id(entry.project_id):
+                project_errors[entry.project_id] = "Project does not belong to user"
+            else:
+                project_errors[entry.project_id] = "Project not found"
+        return project_errors[entry.project_id]
\ No newline at end of file
@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, date
 from app.core.entities.time_entry import TimeEntry
+from app.core.entities.time_entry_changes import TimeEntryChanges
 from app.core.entities.project import ProjectStatus
 from app.core.interfaces.time_entry_repository import ITimeEntryRepository
 from app.core.interfaces.project_repository import IProjectRepository
@@ -14,6 +15,42 @@ class TimeEntryService:
         self._time_entry_repository = time_entry_repository
         self._project_repository = project_repository
     
+    def get_data_version(self, user_id: Optional[str] = None) -> int:
+        """Get the version of user_id's time entries"""
+        return self._time_entry_repository.get_data_version(user_id)
+    
+    def wait_for_change(self, user_id: Optional[str], version: int, timeout: float) -> int:
+        """Wait up to timeout seconds for user_id's time entries to move past version and return the current version"""
+        return self._time_entry_repository.wait_for_change(user_id, version, timeout)
+    
+    def watch_changes(self, user_id: str, since_version: Optional[int] = None,
+                      heartbeat_seconds: float = 15) -> Iterator[Optional[Tuple[str, int, Any]]]:
+        """Yield (event, version, data) as a user's time entries change, and None after each quiet heartbeat_seconds
+        
+        A 'timer' event carries the running timer as a dictionary, or None,
+        when it differs from the last one sent; the first change always
+        sends it. An 'entries' event follows every change after
+        since_version. With since_version None only the timer is sent at
+        first; with the current version nothing is sent until a change.
+        """
+        seen = since_version
+        timer: Optional[Dict[str, Any]] = None
+        timer_known = False
+        while True:
+            version = self.get_data_version(user_id)
+            if version == seen:
+                yield None
+            else:
+                running = self.get_running_timer(user_id)
+                running_dict = running.to_dict() if running else None
+                if not timer_known or running_dict != timer:
+                    timer, timer_known = running_dict, True
+                    yield 'timer', version, timer
+                if seen is not None:
+                    yield 'entries', version, {'version': version}
+                seen = version
+            self.wait_for_change(user_id, seen, heartbeat_seconds)
+    
     def start_timer(self, user_id: str, project_id: str, description: Optional[str] = None) -> TimeEntry:
         """Starts new time tracking session"""
         # Validate project exists and is not archived
@@ -131,6 +168,21 @@ class TimeEntryService:
         else:
             return self._time_entry_repository.get_by_project_id(project_id)
     
+    def get_entries_page(self, user_id: str, limit: int, after: Optional[Tuple[datetime, str]] = None,
+                         start_date: Optional[date] = None, end_date: Optional[date] = None,
+                         project_id: Optional[str] = None) -> Tuple[List[TimeEntry], Optional[Tuple[datetime, str]]]:
+        """Get a page of entries, newest first, and the key to pass as after for the next page, or None on the last"""
+        # One extra entry tells whether another page follows
+        entries = self._time_entry_repository.get_page(user_id, limit + 1, after, start_date, end_date, project_id)
+        if len(entries) <= limit:
+            return entries, None
+        entries = entries[:limit]
+        return entries, (entries[-1].start_time, entries[-1].entry_id)
+    
+    def get_changes(self, user_id: str, since_version: Optional[int] = None) -> TimeEntryChanges:
+        """Get a user's entries changed after a data version, or all of them when that version is unknown"""
+        return self._time_entry_repository.get_changes(user_id, since_version)
+    
     def get_user_entries(self, user_id: str) -> List[TimeEntry]:
         """Get all time entries for a user"""
         return self._time_entry_repository.get_by_user_id(user_id)
@@ -173,4 +225,8 @@ class TimeEntryService:
     
     def get_entry_by_id(self, entry_id: str) -> Optional[TimeEntry]:
         """Get time entry by ID"""
-        return self._time_entry_repository.get_by_id(entry_id)
\ No newline at end of file
+        return self._time_entry_repository.get_by_id(entry_id)
+    
+    def get_entries_by_ids(self, entry_ids: List[str]) -> List[TimeEntry]:
+        """Get time entries for a list of IDs in one lookup, in the given order, skipping unknown IDs"""
+        return self._time_entry_repository.get_many(entry_ids)
\ No newline at end of file
@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import date
 from app.core.entities.timesheet import Timesheet, PeriodType, TimesheetStatus
+from app.core.entities.time_entry import TimeEntry
 from app.core.interfaces.timesheet_repository import ITimesheetRepository
 from app.core.interfaces.time_entry_repository import ITimeEntryRepository
 
@@ -13,6 +14,11 @@ class TimesheetService:
         self._timesheet_repository = timesheet_repository
         self._time_entry_repository = time_entry_repository
     
+    def get_data_version(self, user_id: Optional[str] = None) -> tuple:
+        """Get the versions of the timesheets and time entries this service reads for user_id"""
+        return (self._timesheet_repository.get_data_version(user_id),
+                self._time_entry_repository.get_data_version(user_id))
+    
     def create_timesheet(self, user_id: str, name: str, period_type: PeriodType, 
                         start_date: date, end_date: date) -> Timesheet:
         """Creates new timesheet with validation"""
@@ -37,7 +43,13 @@ class TimesheetService:
         return created_timesheet
     
     def add_entries_to_timesheet(self, timesheet_id: str, entry_ids: List[str]) -> Timesheet:
-        """Associates entries with timesheet"""
+        """Associates entries with timesheet
+        
+        Entries of another user, or already in another timesheet, are
+        rejected before anything is written. The timesheet is saved before
+        the entries; if saving the entries then fails, the timesheet lists
+        entries that do not point back at it.
+        """
         timesheet = self._timesheet_repository.get_by_id(timesheet_id)
         if not timesheet:
             raise ValueError("Timesheet not found")
@@ -45,17 +57,35 @@ class TimesheetService:
         if timesheet.is_locked():
             raise ValueError("Cannot modify locked timesheet")
         
-        # Add entries
-        for entry_id in entry_ids:
-            timesheet.add_entry(entry_id)
-        
-        # Recalculate totals
-        self.calculate_timesheet_totals(timesheet_id)
-        
-        return self._timesheet_repository.update(timesheet)
+        entries = self._time_entry_repository.get_many(entry_ids)
+        for entry in entries:
+            if entry.user_id != timesheet.user_id:
+                raise ValueError(f"Time entry {entry.entry_id} belongs to another user")
+            if entry.timesheet_id and entry.timesheet_id != timesheet_id:
+                raise ValueError(f"Time entry {entry.entry_id} is already in timesheet {entry.timesheet_id}")
+        
+        # Add entries and point them at this timesheet in one write, which
+        # is dropped if the timesheet cannot be saved
+        with self._time_entry_repository.batch():
+            for entry_id in entry_ids:
+                timesheet.add_entry(entry_id)
+            
+            for entry in entries:
+                if entry.timesheet_id != timesheet_id:
+                    entry.timesheet_id = timesheet_id
+                    self._time_entry_repository.update(entry)
+            
+            # Recalculate totals
+            self._recalculate_totals(timesheet)
+            
+            return self._timesheet_repository.update(timesheet)
     
     def remove_entries_from_timesheet(self, timesheet_id: str, entry_ids: List[str]) -> Timesheet:
-        """Removes entries from timesheet"""
+        """Removes entries from timesheet
+        
+        The timesheet is saved before the entries; if saving the entries
+        then fails, they still point at a timesheet that no longer lists them.
+        """
         timesheet = self._timesheet_repository.get_by_id(timesheet_id)
         if not timesheet:
             raise ValueError("Timesheet not found")
@@ -63,14 +93,21 @@ class TimesheetService:
         if timesheet.is_locked():
             raise ValueError("Cannot modify locked timesheet")
         
-        # Remove entries
-        for entry_id in entry_ids:
-            timesheet.remove_entry(entry_id)
-        
-        # Recalculate totals
-        self.calculate_timesheet_totals(timesheet_id)
-        
-        return self._timesheet_repository.update(timesheet)
+        # Remove entries and detach them from this timesheet in one write,
+        # which is dropped if the timesheet cannot be saved
+        with self._time_entry_repository.batch():
+            for entry_id in entry_ids:
+                timesheet.remove_entry(entry_id)
+            
+            for entry in self._time_entry_repository.get_many(entry_ids):
+                if entry.timesheet_id == timesheet_id:
+                    entry.timesheet_id = None
+                    self._time_entry_repository.update(entry)
+            
+            # Recalculate totals
+            self._recalculate_totals(timesheet)
+            
+            return self._timesheet_repository.update(timesheet)
     
     def calculate_timesheet_totals(self, timesheet_id: str) -> Timesheet:
         """Recalculates total hours for timesheet"""
@@ -78,16 +115,15 @@ class TimesheetService:
         if not timesheet:
             raise ValueError("Timesheet not found")
         
-        # Get all time entries for this timesheet
-        time_entries = []
-        for entry_id in timesheet.entry_ids:
-            entry = self._time_entry_repository.get_by_id(entry_id)
-            if entry:
-                time_entries.append(entry)
-        
-        timesheet.calculate_total_hours(time_entries)
+        self._recalculate_totals(timesheet)
         return self._timesheet_repository.update(timesheet)
     
+    def _recalculate_totals(self, timesheet: Timesheet) -> None:
+        """Recalculate total hours from the timesheet's entries"""
+        # Get all time entries for this timesheet in one lookup
+        time_entries = self._time_entry_repository.get_many(timesheet.entry_ids)
+        timesheet.calculate_total_hours(time_entries)
+    
     def submit_timesheet(self, timesheet_id: str) -> Timesheet:
         """Marks timesheet as submitted"""
         timesheet = self._timesheet_repository.get_by_id(timesheet_id)
@@ -123,6 +159,23 @@ class TimesheetService:
         """Get all timesheets for a user"""
         return self._timesheet_repository.get_by_user_id(user_id)
     
+    def get_timesheets_with_entries(self, user_id: str,
+                                    status: Optional[TimesheetStatus] = None) -> List[Tuple[Timesheet, List[TimeEntry]]]:
+        """Get a user's timesheets, optionally by status, each with its time entries
+        
+        Entries of all the timesheets are loaded in one lookup.
+        """
+        if status is not None:
+            timesheets = self._timesheet_repository.get_by_user_and_status(user_id, status)
+        else:
+            timesheets = self._timesheet_repository.get_by_user_id(user_id)
+        
+        entry_ids = [entry_id for timesheet in timesheets for entry_id in timesheet.entry_ids]
+        entries: Dict[str, TimeEntry] = {entry.entry_id: entry
+                                         for entry in self._time_entry_repository.get_many(entry_ids)}
+        return [(timesheet, [entries[entry_id] for entry_id in timesheet.entry_ids if entry_id in entries])
+                for timesheet in timesheets]
+    
     def get_timesheet_by_id(self, timesheet_id: str) -> Optional[Timesheet]:
         """Get timesheet by ID"""
         return self._timesheet_repository.get_by_id(timesheet_id)
@@ -172,14 +225,16 @@ class TimesheetService:
         time_entries = self._time_entry_repository.get_by_date_range(
             timesheet.user_id, timesheet.start_date, timesheet.end_date)
         
-        # Add entries that don't already belong to another timesheet
-        for entry in time_entries:
-            if not entry.timesheet_id:  # Entry not assigned to any timesheet
-                timesheet.add_entry(entry.entry_id)
-                # Update the time entry to reference this timesheet
-                entry.timesheet_id = timesheet.timesheet_id
-                self._time_entry_repository.update(entry)
-        
-        # Calculate totals
-        timesheet.calculate_total_hours(time_entries)
-        self._timesheet_repository.update(timesheet)
\ No newline at end of file
+        # Add entries that don't already belong to another timesheet,
+        # saving all entry updates in one write
+        with self._time_entry_repository.batch():
+            for entry in time_entries:
+                if not entry.timesheet_id:  # Entry not assigned to any timesheet
+                    timesheet.add_entry(entry.entry_id)
+                    # Update the time entry to reference this timesheet
+                    entry.timesheet_id = timesheet.timesheet_id
+                    self._time_entry_repository.update(entry)
+            
+            # Calculate totals
+            timesheet.calculate_total_hours(time_entries)
+            self._timesheet_repository.update(timesheet)
\ No newline at end of file
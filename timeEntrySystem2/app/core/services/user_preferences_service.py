@@ -1,6 +1,8 @@
 from typing import Dict, Any, Optional
 from app.core.entities.user import User
 from app.core.interfaces.user_repository import IUserRepository
+from app.core.services.time_entry_import_service import TimeEntryImportService
+import io
 import json
 import os
 
@@ -9,8 +11,10 @@ class UserPreferencesService:
     Manages user settings and preferences
     """
     
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(self, user_repository: IUserRepository,
+                 time_entry_import_service: Optional[TimeEntryImportService] = None):
         self._user_repository = user_repository
+        self._time_entry_import_service = time_entry_import_service
     
     def get_user_preferences(self, user_id: str) -> Dict[str, Any]:
         """Retrieves user preferences"""
@@ -72,20 +76,10 @@ class UserPreferencesService:
     
     def import_time_data(self, user_id: str, import_data: str, format_type: str) -> Dict[str, Any]:
         """Imports data from external systems"""
-        # This is a placeholder for import functionality
-        # In a real implementation, you'd parse different formats (CSV, JSON, etc.)
-        # and create time entries accordingly
+        if self._time_entry_import_service is None:
+            raise ValueError("Import is not available")
         
-        if format_type not in ['csv', 'json']:
-            raise ValueError("Unsupported import format")
-        
-        # For now, just return a summary
-        return {
-            'status': 'success',
-            'message': f'Import from {format_type} format initiated',
-            'entries_imported': 0,
-            'errors': []
-        }
+        return self._time_entry_import_service.import_entries(io.StringIO(import_data), format_type, user_id)
     
     def create_default_user(self, user_id: str) -> User:
         """Create a user with default preferences"""
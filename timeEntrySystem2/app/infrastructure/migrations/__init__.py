@@ -0,0 +1 @@
+# Data migration tools
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+One-shot migration of the single-file JSON time entries into monthly partitions.
+
+Usage: python -m app.infrastructure.migrations.json_to_monthly [--data-dir DIR]
+"""
+import argparse
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List
+from app.infrastructure.repositories.json_storage import JournalStorage
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.monthly_json_time_entry_repository import MonthlyJsonTimeEntryRepository, month_of
+from app.infrastructure.repositories.monthly_layout import (
+    MonthLayout, record_span, PARTITION_FILE, PARTITION_ROOT, RUNNING_FILE, SEGMENT_SUMMARY
+)
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+from app.core.entities.timesheet import TimesheetStatus
+
+def migrate_json_to_monthly(data_dir: str) -> Dict[str, int]:
+    """Copy every time entry in data_dir's JSON file into the partition of its start month
+
+    Records already in a partition with the same ID are replaced, so the
+    migration can be re-run to pick up changes made since the previous
+    run; months that have since been frozen are skipped. The source file
+    is left in place. Past months whose entries all belong to approved
+    timesheets are then frozen. Returns the number of records copied per
+    month.
+    """
+    source = JsonTimeEntryRepository(data_dir, storage='journal')
+    by_month: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    with source._storage.lock():
+        for record in source._read_data():
+            by_month[month_of(datetime.fromisoformat(record['start_time']))].append(record)
+    source._storage.close()
+
+    id_field = source._get_id_field()
+    layout = MonthLayout(os.path.join(data_dir, PARTITION_ROOT))
+    counts = {}
+    for month, records in sorted(by_month.items()):
+        path = os.path.join(data_dir, PARTITION_ROOT, month)
+        if os.path.exists(os.path.join(path, SEGMENT_SUMMARY)):
+            continue
+        os.makedirs(path, exist_ok=True)
+        # Overlap checks must not skip the month for a copied entry longer than its recorded span
+        layout.raise_longest(month, max(record_span(record) for record in records))
+        # Write a fresh snapshot that the partition reads with either storage type
+        target = JournalStorage(os.path.join(path, PARTITION_FILE), id_field)
+        with target.lock():
+            merged = {record.get(id_field): record for record in target.load()}
+            merged.update((record.get(id_field), record) for record in records)
+            target.compact(list(merged.values()))
+        counts[month] = len(records)
+
+    # Copied entries may be running timers in any month: rebuild the record of those months
+    running_path = os.path.join(data_dir, PARTITION_ROOT, RUNNING_FILE)
+    if os.path.exists(running_path):
+        os.remove(running_path)
+
+    approved = [timesheet.timesheet_id for timesheet in JsonTimesheetRepository(data_dir).list_all()
+                if timesheet.status == TimesheetStatus.APPROVED]
+    MonthlyJsonTimeEntryRepository(data_dir).archive_approved_months(approved)
+    return counts
+
+def main():
+    base_dir = os.path.join(os.path.dirname(__file__), '..', '..', '..')
+    parser = argparse.ArgumentParser(description='Split JSON time entries into monthly partitions')
+    parser.add_argument('--data-dir', default=os.path.join(base_dir, 'data'),
+                        help='Directory containing the JSON data files')
+    args = parser.parse_args()
+
+    counts = migrate_json_to_monthly(args.data_dir)
+    for month, count in counts.items():
+        print(f'{month}: {count} time entries')
+    print(f'Migrated to {os.path.join(args.data_dir, PARTITION_ROOT)}; run with JSON_LAYOUT=monthly')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+One-shot migration of the single-file JSON time entries and timesheets into per-user shards.
+
+Usage: python -m app.infrastructure.migrations.json_to_sharded [--data-dir DIR]
+"""
+import argparse
+import os
+from collections import defaultdict
+from typing import Any, Dict, List
+from app.infrastructure.repositories.json_storage import JournalStorage
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+from app.infrastructure.repositories.sharded_json_repository import shard_dir
+
+def migrate_json_to_sharded(data_dir: str) -> Dict[str, Dict[str, int]]:
+    """Copy every time entry and timesheet in data_dir's JSON files into its user's shard
+
+    Records already in a shard with the same ID are replaced, so the
+    migration can be re-run to pick up changes made since the previous
+    run. The source files are left in place. Returns the number of records
+    copied per file and user.
+    """
+    # Journal storage reads a plain snapshot as well as one with a pending
+    # journal, so it works whichever backend the JSON repositories used
+    sources = [
+        JsonTimeEntryRepository(data_dir, storage='journal'),
+        JsonTimesheetRepository(data_dir, storage='journal'),
+    ]
+
+    counts = {}
+    for source in sources:
+        by_user: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        with source._storage.lock():
+            for record in source._read_data():
+                by_user[record.get('user_id')].append(record)
+        source._storage.close()
+
+        id_field = source._get_id_field()
+        for user_id, records in by_user.items():
+            path = shard_dir(data_dir, user_id)
+            os.makedirs(path, exist_ok=True)
+            # Write a fresh snapshot that the shard reads with either storage type
+            target = JournalStorage(os.path.join(path, source.filename), id_field)
+            with target.lock():
+                merged = {record.get(id_field): record for record in target.load()}
+                merged.update((record.get(id_field), record) for record in records)
+                target.compact(list(merged.values()))
+        counts[source.filename] = {user_id: len(records) for user_id, records in by_user.items()}
+
+    return counts
+
+def main():
+    base_dir = os.path.join(os.path.dirname(__file__), '..', '..', '..')
+    parser = argparse.ArgumentParser(description='Split JSON time entries and timesheets into per-user shards')
+    parser.add_argument('--data-dir', default=os.path.join(base_dir, 'data'),
+                        help='Directory containing the JSON data files')
+    args = parser.parse_args()
+
+    counts = migrate_json_to_sharded(args.data_dir)
+    for filename, users in counts.items():
+        print(f'{filename}: {sum(users.values())} records for {len(users)} users')
+    print(f'Migrated to {os.path.join(args.data_dir, "users")}; run with JSON_LAYOUT=sharded')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+One-shot migration of the JSON data files into a SQLite database.
+
+Usage: python -m app.infrastructure.migrations.json_to_sqlite [--data-dir DIR] [--db PATH]
+"""
+import argparse
+import os
+from typing import Dict
+from app.infrastructure.repositories.json_user_repository import JsonUserRepository
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+from app.infrastructure.repositories.sqlite_user_repository import SqliteUserRepository
+from app.infrastructure.repositories.sqlite_project_repository import SqliteProjectRepository
+from app.infrastructure.repositories.sqlite_time_entry_repository import SqliteTimeEntryRepository
+from app.infrastructure.repositories.sqlite_timesheet_repository import SqliteTimesheetRepository
+
+def migrate_json_to_sqlite(data_dir: str, db_path: str) -> Dict[str, int]:
+    """Copy every record from data_dir's JSON files into db_path
+
+    Existing rows with the same ID are updated, so the migration can be
+    re-run to pick up changes made since the previous run. Returns the
+    number of rows copied per table.
+    """
+    # Journal storage reads a plain snapshot as well as one with a pending
+    # journal, so it works whichever backend the JSON repositories used
+    pairs = [
+        (JsonUserRepository(data_dir, storage='journal'), SqliteUserRepository(db_path)),
+        (JsonProjectRepository(data_dir, storage='journal'), SqliteProjectRepository(db_path)),
+        (JsonTimeEntryRepository(data_dir, storage='journal'), SqliteTimeEntryRepository(db_path)),
+        (JsonTimesheetRepository(data_dir, storage='journal'), SqliteTimesheetRepository(db_path)),
+    ]
+
+    counts = {}
+    for json_repo, sqlite_repo in pairs:
+        # Go through the entities so stored values are normalized the same
+        # way the application writes them
+        rows = [sqlite_repo._from_entity(json_repo._to_entity(record))
+                for record in json_repo._read_data()]
+        json_repo._storage.close()
+
+        table = sqlite_repo._get_table()
+        if rows:
+            columns = list(rows[0])
+            id_field = sqlite_repo._get_id_field()
+            updated = [column for column in columns if column != id_field]
+            placeholders = ', '.join('?' for _ in columns)
+            # Upsert rather than INSERT OR REPLACE, whose deletes skip the
+            # triggers that keep rollups, search and change logs in step;
+            # rows that did not change are left alone
+            assignments = ', '.join(f'{column} = excluded.{column}' for column in updated)
+            current = ', '.join(updated)
+            incoming = ', '.join(f'excluded.{column}' for column in updated)
+            connection = sqlite_repo._connection()
+            with connection:
+                connection.executemany(
+                    f'INSERT INTO {table} ({", ".join(columns)}) VALUES ({placeholders}) '
+                    f'ON CONFLICT ({id_field}) DO UPDATE SET {assignments} '
+                    f'WHERE ({current}) IS NOT ({incoming})',
+                    [tuple(row[column] for column in columns) for row in rows])
+        counts[table] = len(rows)
+
+    return counts
+
+def main():
+    base_dir = os.path.join(os.path.dirname(__file__), '..', '..', '..')
+    parser = argparse.ArgumentParser(description='Migrate JSON data files into SQLite')
+    parser.add_argument('--data-dir', default=os.path.join(base_dir, 'data'),
+                        help='Directory containing the JSON data files')
+    parser.add_argument('--db', help='SQLite database path (default: <data-dir>/time_tracking.db)')
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(args.data_dir, 'time_tracking.db')
+    counts = migrate_json_to_sqlite(args.data_dir, db_path)
+    for table, count in counts.items():
+        print(f'{table}: {count} rows')
+    print(f'Migrated to {db_path}')
+
+if __name__ == '__main__':
+    main()
@@ -1,47 +1,437 @@
-import json
 import os
-from typing import List, Dict, Any, TypeVar, Generic, Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, TypeVar, Generic, Optional, Iterator, Set, Tuple
 from abc import ABC, abstractmethod
+from app.core.entities.change_event import ChangeOperation
+from app.core.services.change_event_bus import ChangeEventBus
+from app.infrastructure.repositories.json_storage import JournalStorage, Mutation, create_storage
 
 T = TypeVar('T')
 
+class VersionClock:
+    """
+    Source of data versions, shared by repositories whose versions must be comparable
+    
+    Starts at the wall time so versions are not reused after a restart. The
+    time is in microseconds, which keeps versions exact as JavaScript numbers.
+    """
+    
+    def __init__(self):
+        self._changed = threading.Condition(threading.Lock())
+        self._value = time.time_ns() // 1000
+    
+    @property
+    def value(self) -> int:
+        """Get the latest version handed out"""
+        with self._changed:
+            return self._value
+    
+    def advance(self) -> int:
+        """Hand out the next version"""
+        with self._changed:
+            self._value += 1
+            self._changed.notify_all()
+            return self._value
+    
+    def wait(self, value: int, timeout: float) -> int:
+        """Block until the clock moves past value, or timeout seconds pass, and return its value"""
+        with self._changed:
+            self._changed.wait_for(lambda: self._value != value, timeout)
+            return self._value
+
 class BaseJsonRepository(Generic[T], ABC):
     """
     Base class for JSON file-based repositories
     """
     
-    def __init__(self, data_dir: str, filename: str):
+    # Seconds between storage signature checks in wait_for_change
+    CHANGE_POLL_INTERVAL = 1.0
+    
+    def __init__(self, data_dir: str, filename: str, storage: str = 'snapshot',
+                 fsync: str = 'file', event_bus: Optional[ChangeEventBus] = None,
+                 version_clock: Optional[VersionClock] = None):
         self.data_dir = data_dir
         self.filename = filename
         self.filepath = os.path.join(data_dir, filename)
+        self._storage = create_storage(storage, self.filepath, self._get_id_field(), fsync)
+        self._cache: Optional[List[Dict[str, Any]]] = None
+        self._cache_signature: Optional[tuple] = None
+        self._cache_lock = threading.RLock()
+        # Notified whenever the data version changes
+        self._changed = threading.Condition(self._cache_lock)
+        # Primary-key index (id -> position) for the list it was built from
+        self._indexed_data: Optional[List[Dict[str, Any]]] = None
+        self._id_index: Dict[str, int] = {}
+        # Changes made since the last _write_data, for journaling storage
+        self._pending_mutations: List[Mutation] = []
+        # Records being modified by an open batch() and the thread that owns it
+        self._batch_data: Optional[List[Dict[str, Any]]] = None
+        self._batch_owner: Optional[int] = None
+        # Data versions: a user's version is the clock value at the last save
+        # that changed their records, and never less than the floor, which is
+        # raised whenever the stored data changes outside this repository
+        self._clock = version_clock if version_clock is not None else VersionClock()
+        self._version_floor = self._clock.value
+        self._user_versions: Dict[str, int] = {}
+        self._version_signature: Optional[tuple] = None
+        # Owners of the records changed since the last _write_data
+        self._pending_owners: Set[str] = set()
+        # Changes to report once saved: (operation, before, after)
+        self._event_bus = event_bus
+        self._pending_changes: List[Tuple[ChangeOperation, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]] = []
+        self._closed = False
         self._ensure_file_exists()
+        
+        if isinstance(self._storage, JournalStorage):
+            self._storage.start_compaction(self.compact)
     
     def _ensure_file_exists(self) -> None:
         """Ensure the JSON file exists"""
-        if not os.path.exists(self.filepath):
-            with open(self.filepath, 'w') as f:
-                json.dump([], f)
+        self._storage.ensure_exists()
+    
+    def _file_signature(self) -> Optional[tuple]:
+        """Get the storage signature (file mtimes and sizes), used to detect external changes"""
+        return self._storage.signature()
+    
+    def _load_file(self) -> List[Dict[str, Any]]:
+        """Load and parse the stored records"""
+        return self._storage.load()
     
     def _read_data(self) -> List[Dict[str, Any]]:
-        """Read data from JSON file"""
-        try:
-            with open(self.filepath, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+        """Read data from JSON file
+        
+        The parsed records are kept in memory, along with the indexes built
+        from them, and only re-read when the file's mtime or size changes.
+        The cached list is returned as-is, so callers that modify it must
+        pass it back to _write_data.
+        """
+        if self._batch_data is not None and self._batch_owner == threading.get_ident():
+            # Reads inside a batch see its unsaved changes
+            return self._batch_data
+        
+        with self._cache_lock:
+            signature = self._file_signature()
+            if self._cache is None or signature != self._cache_signature:
+                # Take the signature before reading so a concurrent external
+                # write is picked up on the next call rather than missed
+                self._cache = self._load_file()
+                self._cache_signature = signature
+            return self._cache
     
     def _write_data(self, data: List[Dict[str, Any]]) -> None:
         """Write data to JSON file"""
-        with open(self.filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        with self._cache_lock:
+            mutations = self._pending_mutations
+            owners = self._pending_owners
+            changes = self._pending_changes
+            self._pending_mutations = []
+            self._pending_owners = set()
+            self._pending_changes = []
+            try:
+                self._storage.save(data, mutations)
+            except Exception:
+                # The cache may hold mutations that never reached disk
+                self.invalidate_cache()
+                raise
+            
+            # Versions change only once the new data can be read
+            version = self._clock.advance()
+            for owner in owners:
+                self._user_versions[owner] = version
+            self._changes_saved(version, changes)
+            self._changed.notify_all()
+            signature = self._file_signature()
+            self._version_signature = signature
+            self._cache = data
+            self._cache_signature = signature
+            
+            # Published under the lock so subscribers see this repository's
+            # changes in the order they were saved
+            if self._event_bus is not None:
+                for operation, before, after in changes:
+                    self._publish_change(operation, before, after)
+    
+    def _publish_change(self, operation: ChangeOperation, before: Optional[Dict[str, Any]],
+                        after: Optional[Dict[str, Any]]) -> None:
+        """Publish a saved change to the event bus"""
+        record = after if after is not None else before
+        self._event_bus.publish(self._get_entity_name(), record.get(self._get_id_field()), operation,
+                                self._get_owner_id(record), before, after)
+    
+    def _track_change(self, operation: ChangeOperation, before: Optional[Dict[str, Any]],
+                      after: Optional[Dict[str, Any]]) -> None:
+        """Remember a change to report once it is saved"""
+        self._pending_changes.append((operation, before, after))
+    
+    def _changes_saved(self, version: int, changes: List[Tuple[ChangeOperation, Optional[Dict[str, Any]],
+                                                               Optional[Dict[str, Any]]]]) -> None:
+        """Record changes that were just saved as data version version in subclass-specific indexes"""
+        pass
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[List[Dict[str, Any]]]:
+        """Read-modify-write under the storage write lock
+        
+        Yields the current records, re-read if another process changed
+        them. Changes made through _append_record, _replace_record and
+        _remove_record are saved once when the block exits; nothing is
+        written if the block raises or makes no changes.
+        """
+        with self._storage.lock(), self._cache_lock:
+            self._check_not_closed()
+            self._check_external_changes()
+            data = self._read_data()
+            if self._batch_data is not None:
+                # The enclosing batch() saves once when it exits
+                yield data
+                return
+            
+            try:
+                yield data
+            except BaseException:
+                self._discard_pending()
+                raise
+            
+            if self._pending_mutations:
+                self._write_data(data)
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group create/update/delete calls into a single save
+        
+        The write lock is held for the whole block. All changes are saved
+        together when the block exits, or discarded if it raises.
+        """
+        with self._storage.lock(), self._cache_lock:
+            if self._batch_data is not None:
+                # Nested batch: the outermost one saves
+                yield
+                return
+            
+            self._check_not_closed()
+            self._check_external_changes()
+            data = self._read_data()
+            self._batch_data = data
+            self._batch_owner = threading.get_ident()
+            try:
+                yield
+            except BaseException:
+                self._discard_pending()
+                raise
+            finally:
+                self._batch_data = None
+                self._batch_owner = None
+            
+            if self._pending_mutations:
+                self._write_data(data)
+    
+    def _check_not_closed(self) -> None:
+        """Refuse to write through a closed repository, whose files may have been superseded"""
+        if not self._closed and self._superseded():
+            self._closed = True
+            self._storage.close()
+        if self._closed:
+            raise ValueError(f"Repository for {self.filepath} is closed")
+    
+    def _superseded(self) -> bool:
+        """Check if another process has replaced this repository's files; checked under the write lock"""
+        return False
+    
+    def _discard_pending(self) -> None:
+        """Drop unsaved in-memory changes after a failed transaction"""
+        if self._pending_mutations:
+            self._pending_mutations = []
+            self._pending_owners = set()
+            self._pending_changes = []
+            self.invalidate_cache()
+    
+    def compact(self) -> None:
+        """Fold a journal into a fresh snapshot; a no-op for snapshot storage"""
+        if not isinstance(self._storage, JournalStorage):
+            return
+        
+        with self._storage.lock(), self._cache_lock:
+            if self._closed or self._superseded():
+                # Its files may have been superseded and must not be rewritten
+                return
+            self._check_external_changes()
+            data = self._read_data()
+            self._storage.compact(data)
+            signature = self._file_signature()
+            self._version_signature = signature
+            self._cache_signature = signature
+    
+    @property
+    def closed(self) -> bool:
+        """Check if close() was called; a closed repository refuses writes"""
+        return self._closed
+    
+    def close(self) -> None:
+        """Stop background work on the files, such as journal compaction, and refuse further writes"""
+        with self._storage.lock():
+            self._closed = True
+            self._storage.close()
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached records and indexes so the next read goes to disk"""
+        with self._cache_lock:
+            self._cache = None
+            self._cache_signature = None
+            self._indexed_data = None
+            # Readers may have seen changes that were then dropped
+            self._raise_version_floor()
+    
+    def get_data_version(self, user_id: Optional[str] = None) -> int:
+        """Get a number that changes whenever any of user_id's records change, or any record if None"""
+        with self._cache_lock:
+            self._check_external_changes()
+            if user_id is None:
+                # The clock moves on every save and external change
+                return self._clock.value
+            return max(self._user_versions.get(user_id, 0), self._version_floor)
+    
+    def wait_for_change(self, user_id: Optional[str], version: int, timeout: float) -> int:
+        """Block until the data version of user_id differs from version, or timeout seconds pass, and return it
+        
+        Saves through this repository wake waiters at once; changes made by
+        other processes are seen within CHANGE_POLL_INTERVAL seconds.
+        """
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                current = self.get_data_version(user_id)
+                remaining = deadline - time.monotonic()
+                if current != version or remaining <= 0:
+                    return current
+                self._changed.wait(min(remaining, self.CHANGE_POLL_INTERVAL))
+    
+    def _check_external_changes(self) -> None:
+        """Raise every user's version if the stored data changed outside this repository"""
+        signature = self._file_signature()
+        if signature != self._version_signature:
+            self._raise_version_floor()
+            self._version_signature = signature
+    
+    def _raise_version_floor(self) -> None:
+        """Give every user a new data version"""
+        self._version_floor = self._clock.advance()
+        self._changed.notify_all()
+    
+    def _get_entity_name(self) -> str:
+        """Get the entity name used in change events: the file name without extension"""
+        return os.path.splitext(self.filename)[0]
+    
+    def _get_owner_id(self, record: Dict[str, Any]) -> Optional[str]:
+        """Get the ID of the user who owns a record"""
+        return record.get('user_id')
+    
+    def _ensure_indexes(self, data: List[Dict[str, Any]]) -> None:
+        """Build indexes for data unless they were already built for this list"""
+        with self._cache_lock:
+            if data is not self._indexed_data:
+                self._rebuild_indexes(data)
+    
+    def _rebuild_indexes(self, data: List[Dict[str, Any]]) -> None:
+        """Rebuild all indexes from scratch"""
+        id_field = self._get_id_field()
+        id_index = {}
+        for i, item in enumerate(data):
+            id_index.setdefault(item.get(id_field), i)
+        self._id_index = id_index
+        
+        self._reset_secondary_indexes()
+        for item in data:
+            self._index_record(item)
+        self._indexed_data = data
+    
+    def _reset_secondary_indexes(self) -> None:
+        """Clear subclass-specific indexes before a rebuild"""
+        pass
+    
+    def _index_record(self, record: Dict[str, Any]) -> None:
+        """Add a record to subclass-specific indexes"""
+        pass
+    
+    def _unindex_record(self, record: Dict[str, Any]) -> None:
+        """Remove a record from subclass-specific indexes"""
+        pass
     
     def _find_index(self, data: List[Dict[str, Any]], id_field: str, id_value: str) -> int:
         """Find index of item by ID"""
+        if id_field == self._get_id_field():
+            self._ensure_indexes(data)
+            return self._id_index.get(id_value, -1)
+        
         for i, item in enumerate(data):
             if item.get(id_field) == id_value:
                 return i
         return -1
     
+    def _get_record(self, id_value: str) -> Optional[Dict[str, Any]]:
+        """Get the record with an ID, or None
+        
+        The record is read under the cache lock, so a concurrent delete or
+        reload cannot shift another record into its position.
+        """
+        with self._cache_lock:
+            data = self._read_data()
+            index = self._find_index(data, self._get_id_field(), id_value)
+            return data[index] if index != -1 else None
+    
+    def _get_records(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """Resolve a list of IDs to records in one pass, skipping unknown IDs"""
+        with self._cache_lock:
+            data = self._read_data()
+            self._ensure_indexes(data)
+            records = []
+            for id_value in ids:
+                index = self._id_index.get(id_value)
+                if index is not None:
+                    records.append(data[index])
+            return records
+    
+    def _append_record(self, data: List[Dict[str, Any]], record: Dict[str, Any]) -> None:
+        """Append a record, keeping indexes consistent"""
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            data.append(record)
+            self._id_index[record.get(self._get_id_field())] = len(data) - 1
+            self._pending_mutations.append(('put', record))
+            self._pending_owners.add(self._get_owner_id(record))
+            self._track_change(ChangeOperation.CREATE, None, record)
+            self._index_record(record)
+    
+    def _replace_record(self, data: List[Dict[str, Any]], index: int, record: Dict[str, Any]) -> None:
+        """Replace the record at index, keeping indexes consistent"""
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            self._unindex_record(data[index])
+            self._pending_owners.add(self._get_owner_id(data[index]))
+            self._pending_owners.add(self._get_owner_id(record))
+            self._track_change(ChangeOperation.UPDATE, data[index], record)
+            data[index] = record
+            self._index_record(record)
+            self._pending_mutations.append(('put', record))
+    
+    def _remove_record(self, data: List[Dict[str, Any]], index: int) -> Dict[str, Any]:
+        """Remove the record at index, keeping indexes consistent"""
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            record = data.pop(index)
+            id_field = self._get_id_field()
+            self._id_index.pop(record.get(id_field), None)
+            self._unindex_record(record)
+            self._pending_mutations.append(('delete', record.get(id_field)))
+            self._pending_owners.add(self._get_owner_id(record))
+            self._track_change(ChangeOperation.DELETE, record, None)
+            
+            # Records after the removed one shift down by one
+            for i in range(index, len(data)):
+                self._id_index[data[i].get(id_field)] = i
+            return record
+    
     @abstractmethod
     def _to_entity(self, data: Dict[str, Any]) -> T:
         """Convert dictionary to entity"""
@@ -0,0 +1,423 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, TypeVar, Generic, Optional, Iterator
+from abc import ABC, abstractmethod
+
+T = TypeVar('T')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id TEXT PRIMARY KEY,
+    username TEXT,
+    email TEXT,
+    preferences TEXT NOT NULL DEFAULT '{}',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_users_username ON users (username);
+
+CREATE TABLE IF NOT EXISTS projects (
+    project_id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    color_code TEXT,
+    status TEXT NOT NULL,
+    deadline TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_user_name ON projects (user_id, name);
+CREATE INDEX IF NOT EXISTS idx_projects_user_status ON projects (user_id, status);
+
+CREATE TABLE IF NOT EXISTS time_entries (
+    entry_id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    timesheet_id TEXT,
+    description TEXT,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    duration_minutes INTEGER NOT NULL DEFAULT 0,
+    is_running INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+-- entry_id breaks start time ties for keyset pages; this replaces an index on (user_id, start_time)
+DROP INDEX IF EXISTS idx_time_entries_user_start;
+CREATE INDEX IF NOT EXISTS idx_time_entries_user_start_id ON time_entries (user_id, start_time, entry_id);
+CREATE INDEX IF NOT EXISTS idx_time_entries_project_start ON time_entries (project_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_time_entries_timesheet ON time_entries (timesheet_id);
+CREATE INDEX IF NOT EXISTS idx_time_entries_user_duration ON time_entries (user_id, duration_minutes);
+CREATE INDEX IF NOT EXISTS idx_time_entries_running ON time_entries (user_id) WHERE is_running = 1;
+
+CREATE TABLE IF NOT EXISTS timesheets (
+    timesheet_id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    period_type TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total_hours REAL NOT NULL DEFAULT 0,
+    entry_ids TEXT NOT NULL DEFAULT '[]',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_timesheets_user_start ON timesheets (user_id, start_date);
+
+CREATE TABLE IF NOT EXISTS daily_rollups (
+    user_id TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    minutes INTEGER NOT NULL,
+    entry_count INTEGER NOT NULL,
+    session_count INTEGER NOT NULL,
+    longest_session_minutes INTEGER NOT NULL,
+    shortest_session_minutes INTEGER NOT NULL,
+    PRIMARY KEY (user_id, day, project_id)
+) WITHOUT ROWID;
+"""
+
+# Aggregate time entries into daily_rollups rows; entries count on the day they start
+ROLLUP_SELECT = (
+    "SELECT user_id, project_id, substr(start_time, 1, 10), SUM(duration_minutes), COUNT(*), "
+    "SUM(duration_minutes > 0), MAX(duration_minutes), "
+    "COALESCE(MIN(CASE WHEN duration_minutes > 0 THEN duration_minutes END), 0) "
+    "FROM time_entries "
+)
+
+# Recompute the rollup of the (user, project, day) that {row} falls on
+_REFRESH_ROLLUP = """
+    DELETE FROM daily_rollups WHERE user_id = {row}.user_id AND project_id = {row}.project_id
+        AND day = substr({row}.start_time, 1, 10);
+    INSERT INTO daily_rollups """ + ROLLUP_SELECT + """
+        WHERE user_id = {row}.user_id AND project_id = {row}.project_id
+        AND start_time >= substr({row}.start_time, 1, 10) AND start_time < date({row}.start_time, '+1 day')
+        GROUP BY user_id, project_id;"""
+
+# Keep daily_rollups in step with time_entries inside the writing transaction.
+# Inserts add to the rollup in place; deletes and updates recompute it.
+SCHEMA += f"""
+CREATE TRIGGER IF NOT EXISTS time_entries_rollup_insert AFTER INSERT ON time_entries
+BEGIN
+    INSERT INTO daily_rollups (user_id, project_id, day, minutes, entry_count, session_count,
+                               longest_session_minutes, shortest_session_minutes)
+    VALUES (NEW.user_id, NEW.project_id, substr(NEW.start_time, 1, 10), NEW.duration_minutes, 1,
+            NEW.duration_minutes > 0, NEW.duration_minutes, NEW.duration_minutes)
+    ON CONFLICT (user_id, day, project_id) DO UPDATE SET
+        minutes = minutes + excluded.minutes,
+        entry_count = entry_count + 1,
+        session_count = session_count + excluded.session_count,
+        longest_session_minutes = MAX(longest_session_minutes, excluded.longest_session_minutes),
+        shortest_session_minutes = CASE
+            WHEN excluded.session_count = 0 THEN shortest_session_minutes
+            WHEN session_count = 0 THEN excluded.shortest_session_minutes
+            ELSE MIN(shortest_session_minutes, excluded.shortest_session_minutes) END;
+END;
+
+CREATE TRIGGER IF NOT EXISTS time_entries_rollup_delete AFTER DELETE ON time_entries
+BEGIN{_REFRESH_ROLLUP.format(row='OLD')}
+END;
+
+CREATE TRIGGER IF NOT EXISTS time_entries_rollup_update
+AFTER UPDATE OF user_id, project_id, start_time, duration_minutes ON time_entries
+WHEN OLD.user_id IS NOT NEW.user_id OR OLD.project_id IS NOT NEW.project_id
+    OR OLD.start_time IS NOT NEW.start_time OR OLD.duration_minutes IS NOT NEW.duration_minutes
+BEGIN{_REFRESH_ROLLUP.format(row='OLD')}{_REFRESH_ROLLUP.format(row='NEW')}
+END;
+"""
+
+# Full-text index of entry descriptions, kept in step by triggers. It reads
+# descriptions from time_entries by rowid, so VACUUM, which may renumber the
+# rowids of a table without an INTEGER PRIMARY KEY, must be followed by
+# rebuild_search_index(). unicode61 splits words like SearchQuery's tokenize.
+# The vocabulary table lists the indexed words, for terms found inside words.
+SCHEMA += """
+CREATE VIRTUAL TABLE IF NOT EXISTS time_entries_fts USING fts5(
+    description, content='time_entries', tokenize='unicode61 remove_diacritics 0'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS time_entries_fts_vocab USING fts5vocab(time_entries_fts, 'row');
+
+CREATE TRIGGER IF NOT EXISTS time_entries_fts_insert AFTER INSERT ON time_entries
+BEGIN
+    INSERT INTO time_entries_fts (rowid, description) VALUES (NEW.rowid, NEW.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS time_entries_fts_delete AFTER DELETE ON time_entries
+BEGIN
+    INSERT INTO time_entries_fts (time_entries_fts, rowid, description) VALUES ('delete', OLD.rowid, OLD.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS time_entries_fts_update AFTER UPDATE OF description ON time_entries
+WHEN OLD.description IS NOT NEW.description
+BEGIN
+    INSERT INTO time_entries_fts (time_entries_fts, rowid, description) VALUES ('delete', OLD.rowid, OLD.description);
+    INSERT INTO time_entries_fts (rowid, description) VALUES (NEW.rowid, NEW.description);
+END;
+"""
+
+# Latest change of each time entry, numbered from one increasing sequence,
+# for delta sync. Deleting an entry, or moving it to another user, leaves a
+# tombstone row for its previous owner.
+SCHEMA += """
+CREATE TABLE IF NOT EXISTS time_entry_changes (
+    user_id TEXT NOT NULL,
+    entry_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, entry_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_time_entry_changes_user_version ON time_entry_changes (user_id, version);
+CREATE INDEX IF NOT EXISTS idx_time_entry_changes_version ON time_entry_changes (version);
+"""
+
+_LOG_CHANGE = """
+    INSERT INTO time_entry_changes (user_id, entry_id, version, deleted)
+        SELECT {row}.user_id, {row}.entry_id, (SELECT COALESCE(MAX(version), 0) + 1 FROM time_entry_changes), {deleted}
+        WHERE {condition}
+        ON CONFLICT (user_id, entry_id) DO UPDATE SET version = excluded.version, deleted = excluded.deleted;"""
+
+SCHEMA += f"""
+CREATE TRIGGER IF NOT EXISTS time_entries_changes_insert AFTER INSERT ON time_entries
+BEGIN{_LOG_CHANGE.format(row='NEW', deleted=0, condition='true')}
+END;
+
+CREATE TRIGGER IF NOT EXISTS time_entries_changes_delete AFTER DELETE ON time_entries
+BEGIN{_LOG_CHANGE.format(row='OLD', deleted=1, condition='true')}
+END;
+
+CREATE TRIGGER IF NOT EXISTS time_entries_changes_update AFTER UPDATE ON time_entries
+BEGIN{_LOG_CHANGE.format(row='OLD', deleted=1, condition='OLD.user_id IS NOT NEW.user_id')}{_LOG_CHANGE.format(row='NEW', deleted=0, condition='true')}
+END;
+"""
+
+# Per-user data versions of each table, bumped by triggers in the writing
+# transaction so changes made by any process are seen
+SCHEMA += """
+CREATE TABLE IF NOT EXISTS data_versions (
+    table_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    PRIMARY KEY (table_name, user_id)
+) WITHOUT ROWID;
+"""
+
+_BUMP_VERSION = """
+    INSERT INTO data_versions (table_name, user_id, version) SELECT '{table}', {row}.user_id, 1 WHERE {condition}
+        ON CONFLICT (table_name, user_id) DO UPDATE SET version = version + 1;"""
+
+for _table in ('users', 'projects', 'time_entries', 'timesheets'):
+    SCHEMA += f"""
+CREATE TRIGGER IF NOT EXISTS {_table}_version_insert AFTER INSERT ON {_table}
+BEGIN{_BUMP_VERSION.format(table=_table, row='NEW', condition='true')}
+END;
+
+CREATE TRIGGER IF NOT EXISTS {_table}_version_delete AFTER DELETE ON {_table}
+BEGIN{_BUMP_VERSION.format(table=_table, row='OLD', condition='true')}
+END;
+
+CREATE TRIGGER IF NOT EXISTS {_table}_version_update AFTER UPDATE ON {_table}
+BEGIN{_BUMP_VERSION.format(table=_table, row='NEW', condition='true')}{_BUMP_VERSION.format(table=_table, row='OLD', condition='OLD.user_id IS NOT NEW.user_id')}
+END;
+"""
+
+class BaseSqliteRepository(Generic[T], ABC):
+    """
+    Base class for SQLite-backed repositories
+
+    Each thread gets its own connection. The database runs in WAL mode so
+    readers do not block the writer.
+    """
+
+    # Seconds between data version checks while waiting for a change
+    CHANGE_POLL_INTERVAL = 1.0
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        # Notified after every commit made through this repository
+        self._changed = threading.Condition()
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=30)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Run a SELECT and return rows as dictionaries"""
+        return [dict(row) for row in self._connection().execute(sql, params)]
+
+    def _iter_query(self, sql: str, params: tuple = (), chunk_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Run a SELECT and yield rows as dictionaries, fetching chunk_size rows at a time"""
+        cursor = self._connection().execute(sql, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield dict(row)
+        finally:
+            cursor.close()
+
+    def _query_one(self, sql: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
+        """Run a SELECT and return the first row, if any"""
+        row = self._connection().execute(sql, params).fetchone()
+        return dict(row) if row else None
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        """Run a write statement and return the affected row count
+
+        Outside batch() each statement is committed on its own.
+        """
+        connection = self._connection()
+        if getattr(self._local, 'batch_depth', 0):
+            return connection.execute(sql, params).rowcount
+        with connection:
+            rowcount = connection.execute(sql, params).rowcount
+        self._notify_change()
+        return rowcount
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Run all writes inside the block in one transaction"""
+        connection = self._connection()
+        depth = getattr(self._local, 'batch_depth', 0)
+        self._local.batch_depth = depth + 1
+        try:
+            yield
+        except BaseException:
+            if depth == 0:
+                connection.rollback()
+            raise
+        else:
+            if depth == 0:
+                connection.commit()
+                self._notify_change()
+        finally:
+            self._local.batch_depth = depth
+
+    def get_data_version(self, user_id: Optional[str] = None) -> int:
+        """Get a number that changes whenever any of user_id's rows in this table change, or any row if None"""
+        if user_id is None:
+            # Versions only grow, so their sum changes whenever any of them does
+            row = self._query_one('SELECT COALESCE(SUM(version), 0) AS version FROM data_versions WHERE table_name = ?',
+                                  (self._get_table(),))
+        else:
+            row = self._query_one('SELECT version FROM data_versions WHERE table_name = ? AND user_id = ?',
+                                  (self._get_table(), user_id))
+        return row['version'] if row else 0
+
+    def wait_for_change(self, user_id: Optional[str], version: int, timeout: float) -> int:
+        """Block until the data version of user_id differs from version, or timeout seconds pass, and return it
+
+        Commits made through this repository wake waiters at once; those of
+        other processes are seen within CHANGE_POLL_INTERVAL seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self.get_data_version(user_id)
+            remaining = deadline - time.monotonic()
+            if current != version or remaining <= 0:
+                return current
+            with self._changed:
+                self._changed.wait(min(remaining, self.CHANGE_POLL_INTERVAL))
+
+    def _notify_change(self) -> None:
+        """Wake threads waiting in wait_for_change"""
+        with self._changed:
+            self._changed.notify_all()
+
+    def _insert(self, row: Dict[str, Any]) -> None:
+        """Insert a row into the repository's table"""
+        columns = ', '.join(row)
+        placeholders = ', '.join('?' for _ in row)
+        self._execute(f'INSERT INTO {self._get_table()} ({columns}) VALUES ({placeholders})',
+                      tuple(row.values()))
+
+    def _insert_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert rows with the same columns in one transaction"""
+        if not rows:
+            return
+        columns = ', '.join(rows[0])
+        placeholders = ', '.join('?' for _ in rows[0])
+        sql = f'INSERT INTO {self._get_table()} ({columns}) VALUES ({placeholders})'
+        params = [tuple(row.values()) for row in rows]
+        connection = self._connection()
+        if getattr(self._local, 'batch_depth', 0):
+            connection.executemany(sql, params)
+            return
+        with connection:
+            connection.executemany(sql, params)
+        self._notify_change()
+
+    def _update_row(self, row: Dict[str, Any]) -> int:
+        """Update a row by primary key and return the affected row count"""
+        id_field = self._get_id_field()
+        assignments = ', '.join(f'{column} = ?' for column in row if column != id_field)
+        params = tuple(value for column, value in row.items() if column != id_field)
+        return self._execute(f'UPDATE {self._get_table()} SET {assignments} WHERE {id_field} = ?',
+                             params + (row[id_field],))
+
+    def _delete_row(self, id_value: str) -> bool:
+        """Delete a row by primary key"""
+        return self._execute(f'DELETE FROM {self._get_table()} WHERE {self._get_id_field()} = ?',
+                             (id_value,)) > 0
+
+    def _exists(self, id_value: str) -> bool:
+        """Check if a row exists by primary key"""
+        return self._query_one(f'SELECT 1 FROM {self._get_table()} WHERE {self._get_id_field()} = ?',
+                               (id_value,)) is not None
+
+    def _get_row(self, id_value: str) -> Optional[Dict[str, Any]]:
+        """Get a row by primary key"""
+        return self._query_one(f'SELECT * FROM {self._get_table()} WHERE {self._get_id_field()} = ?',
+                               (id_value,))
+
+    def _get_rows(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """Get rows for a list of primary keys, in the given order, skipping unknown keys"""
+        id_field = self._get_id_field()
+        rows = {}
+        # Stay below SQLite's bound-parameter limit
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            placeholders = ', '.join('?' for _ in chunk)
+            for row in self._query(f'SELECT * FROM {self._get_table()} WHERE {id_field} IN ({placeholders})',
+                                   tuple(chunk)):
+                rows[row[id_field]] = row
+        return [rows[id_value] for id_value in ids if id_value in rows]
+
+    @abstractmethod
+    def _to_entity(self, row: Dict[str, Any]) -> T:
+        """Convert a database row to entity"""
+        pass
+
+    @abstractmethod
+    def _from_entity(self, entity: T) -> Dict[str, Any]:
+        """Convert entity to a database row"""
+        pass
+
+    @abstractmethod
+    def _get_table(self) -> str:
+        """Get the table name for the entity"""
+        pass
+
+    @abstractmethod
+    def _get_id_field(self) -> str:
+        """Get the ID field name for the entity"""
+        pass
@@ -0,0 +1,134 @@
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+from app.core.entities.daily_rollup import DailyRollup
+from app.infrastructure.repositories.day_fenwick_tree import DayFenwickTree
+
+class _Bucket:
+    """Totals of one project on one day"""
+    __slots__ = ('minutes', 'entry_count', 'sessions')
+
+    def __init__(self):
+        self.minutes = 0
+        self.entry_count = 0
+        # session length in minutes -> number of entries with that length
+        self.sessions: Dict[int, int] = {}
+
+class DailyRollupIndex:
+    """
+    Per-day, per-project totals of one user's time entries.
+
+    Entries are counted on the day they start. Totals are updated in O(1)
+    as entries are added and removed, so reports over a range cost
+    O(days) instead of O(entries). Session lengths are kept as counts per
+    length so the longest and shortest survive removals. Fenwick trees of
+    minutes and entry counts, overall and per project, answer range
+    totals in O(log days).
+    """
+
+    def __init__(self):
+        self._days: Dict[date, Dict[str, _Bucket]] = {}
+        self._minutes = DayFenwickTree()
+        self._counts = DayFenwickTree()
+        # project_id -> (minutes tree, entry count tree)
+        self._project_trees: Dict[str, Tuple[DayFenwickTree, DayFenwickTree]] = {}
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def add(self, day: date, project_id: str, minutes: int) -> None:
+        """Count an entry of the given length"""
+        projects = self._days.get(day)
+        if projects is None:
+            projects = self._days[day] = {}
+        bucket = projects.get(project_id)
+        if bucket is None:
+            bucket = projects[project_id] = _Bucket()
+        bucket.minutes += minutes
+        bucket.entry_count += 1
+        if minutes > 0:
+            bucket.sessions[minutes] = bucket.sessions.get(minutes, 0) + 1
+        self._update_trees(day, project_id, minutes, 1)
+
+    def remove(self, day: date, project_id: str, minutes: int) -> None:
+        """Uncount an entry previously added with the same values"""
+        projects = self._days.get(day)
+        bucket = projects.get(project_id) if projects else None
+        if bucket is None:
+            return
+
+        bucket.minutes -= minutes
+        bucket.entry_count -= 1
+        self._update_trees(day, project_id, -minutes, -1)
+        if minutes > 0:
+            remaining = bucket.sessions.get(minutes, 0) - 1
+            if remaining > 0:
+                bucket.sessions[minutes] = remaining
+            else:
+                bucket.sessions.pop(minutes, None)
+
+        if bucket.entry_count <= 0:
+            del projects[project_id]
+            if not projects:
+                del self._days[day]
+
+    def rollups(self, user_id: str, start_date: date, end_date: date,
+                project_id: Optional[str] = None) -> List[DailyRollup]:
+        """Get rollups for days in [start_date, end_date], ordered by day"""
+        span = (end_date - start_date).days + 1
+        if span <= 0:
+            return []
+
+        # Walk the range or the populated days, whichever is shorter
+        if span <= len(self._days):
+            days = (start_date + timedelta(days=i) for i in range(span))
+        else:
+            days = sorted(day for day in self._days if start_date <= day <= end_date)
+
+        result = []
+        for day in days:
+            projects = self._days.get(day)
+            if not projects:
+                continue
+            for bucket_project_id, bucket in projects.items():
+                if project_id is not None and bucket_project_id != project_id:
+                    continue
+                result.append(DailyRollup(
+                    user_id=user_id,
+                    project_id=bucket_project_id,
+                    day=day,
+                    minutes=bucket.minutes,
+                    entry_count=bucket.entry_count,
+                    session_count=sum(bucket.sessions.values()),
+                    longest_session_minutes=max(bucket.sessions, default=0),
+                    shortest_session_minutes=min(bucket.sessions, default=0)
+                ))
+        return result
+
+    def totals(self, start_date: date, end_date: date, project_id: Optional[str] = None) -> Tuple[int, int]:
+        """Get (minutes, entry count) for days in [start_date, end_date]"""
+        if project_id is None:
+            minutes, counts = self._minutes, self._counts
+        elif project_id in self._project_trees:
+            minutes, counts = self._project_trees[project_id]
+        else:
+            return 0, 0
+        return minutes.range_sum(start_date, end_date), counts.range_sum(start_date, end_date)
+
+    def project_totals(self, start_date: date, end_date: date) -> Dict[str, Tuple[int, int]]:
+        """Get project_id -> (minutes, entry count) for days in [start_date, end_date], skipping projects without entries there"""
+        totals = {}
+        for project_id, (minutes, counts) in self._project_trees.items():
+            count = counts.range_sum(start_date, end_date)
+            if count:
+                totals[project_id] = (minutes.range_sum(start_date, end_date), count)
+        return totals
+
+    def _update_trees(self, day: date, project_id: str, minutes: int, count: int) -> None:
+        """Apply a change to the overall and per-project trees"""
+        self._minutes.add(day, minutes)
+        self._counts.add(day, count)
+        trees = self._project_trees.get(project_id)
+        if trees is None:
+            trees = self._project_trees[project_id] = (DayFenwickTree(), DayFenwickTree())
+        trees[0].add(day, minutes)
+        trees[1].add(day, count)
@@ -0,0 +1,83 @@
+from datetime import date
+from typing import List
+
+class DayFenwickTree:
+    """
+    Fenwick (binary indexed) tree of integer totals per day.
+
+    add() and range_sum() are O(log days). The covered days grow as
+    needed in either direction; growing rebuilds the tree in O(days),
+    which amortizes to O(1) per new day.
+    """
+
+    _INITIAL_SIZE = 64
+
+    def __init__(self):
+        self._origin = 0  # ordinal of the day at position 0
+        self._values: List[int] = []
+        self._tree: List[int] = [0]  # 1-based
+
+    def add(self, day: date, delta: int) -> None:
+        """Add delta to the total of day"""
+        if delta == 0:
+            return
+        position = self._position(day)
+        self._values[position] += delta
+        i = position + 1
+        tree = self._tree
+        size = len(tree)
+        while i < size:
+            tree[i] += delta
+            i += i & -i
+
+    def range_sum(self, start: date, end: date) -> int:
+        """Sum of totals for days in [start, end]"""
+        if not self._values or end < start:
+            return 0
+        first = max(start.toordinal() - self._origin, 0)
+        last = min(end.toordinal() - self._origin, len(self._values) - 1)
+        if last < first:
+            return 0
+        return self._prefix_sum(last + 1) - self._prefix_sum(first)
+
+    def _prefix_sum(self, count: int) -> int:
+        """Sum of the first count positions"""
+        total = 0
+        tree = self._tree
+        while count > 0:
+            total += tree[count]
+            count -= count & -count
+        return total
+
+    def _position(self, day: date) -> int:
+        """Get the position of day, growing the covered range if needed"""
+        ordinal = day.toordinal()
+        if not self._values:
+            self._origin = ordinal
+            self._values = [0] * self._INITIAL_SIZE
+            self._tree = [0] * (self._INITIAL_SIZE + 1)
+            return 0
+
+        position = ordinal - self._origin
+        size = len(self._values)
+        if position < 0:
+            # Prepend at least as many days as are covered, so repeated
+            # earlier days do not each trigger a rebuild
+            shift = max(-position, size)
+            self._origin -= shift
+            self._rebuild([0] * shift + self._values)
+            return position + shift
+        if position >= size:
+            self._rebuild(self._values + [0] * max(position + 1 - size, size))
+        return position
+
+    def _rebuild(self, values: List[int]) -> None:
+        """Replace the values and rebuild the tree in O(n)"""
+        tree = [0] + values
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._values = values
+        self._tree = tree
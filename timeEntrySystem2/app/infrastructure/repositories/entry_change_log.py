@@ -0,0 +1,33 @@
+from collections import OrderedDict
+from typing import List, Tuple
+
+class EntryChangeLog:
+    """
+    Latest change of each of one user's records, ordered by data version
+
+    Each record keeps only its last change, so a log holds at most one
+    item per record ever changed, and listing the changes after a version
+    costs O(changes) however long the history is.
+    """
+
+    def __init__(self):
+        # record_id -> (version, deleted), oldest change first
+        self._changes: 'OrderedDict[str, Tuple[int, bool]]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def record(self, record_id: str, version: int, deleted: bool = False) -> None:
+        """Record that record_id was saved, or deleted, in version; versions must not decrease"""
+        self._changes[record_id] = (version, deleted)
+        self._changes.move_to_end(record_id)
+
+    def since(self, version: int) -> List[Tuple[str, int, bool]]:
+        """Get (record_id, version, deleted) of records changed after version, oldest first"""
+        changes = []
+        for record_id, (changed_in, deleted) in reversed(self._changes.items()):
+            if changed_in <= version:
+                break
+            changes.append((record_id, changed_in, deleted))
+        changes.reverse()
+        return changes
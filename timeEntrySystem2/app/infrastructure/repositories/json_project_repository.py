@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
 from app.core.entities.project import Project, ProjectStatus
 from app.core.interfaces.project_repository import IProjectRepository
+from app.core.services.change_event_bus import ChangeEventBus
 from app.infrastructure.repositories.base_json_repository import BaseJsonRepository
 
 class JsonProjectRepository(BaseJsonRepository[Project], IProjectRepository):
@@ -8,8 +9,9 @@ class JsonProjectRepository(BaseJsonRepository[Project], IProjectRepository):
     JSON file-based implementation of project repository
     """
     
-    def __init__(self, data_dir: str):
-        super().__init__(data_dir, "projects.json")
+    def __init__(self, data_dir: str, storage: str = 'snapshot',
+                 fsync: str = 'file', event_bus: Optional[ChangeEventBus] = None):
+        super().__init__(data_dir, "projects.json", storage, fsync, event_bus)
     
     def _to_entity(self, data: Dict[str, Any]) -> Project:
         """Convert dictionary to Project entity"""
@@ -29,29 +31,25 @@ class JsonProjectRepository(BaseJsonRepository[Project], IProjectRepository):
     
     def create(self, project: Project) -> Project:
         """Create a new project"""
-        data = self._read_data()
-        
-        # Check if project already exists
-        if self._find_index(data, self._get_id_field(), project.project_id) != -1:
-            raise ValueError(f"Project with ID {project.project_id} already exists")
-        
-        # Check name uniqueness for user
-        for item in data:
-            if (item.get('user_id') == project.user_id and 
-                item.get('name') == project.name):
-                raise ValueError(f"Project name '{project.name}' already exists for this user")
-        
-        data.append(self._from_entity(project))
-        self._write_data(data)
+        with self._transaction() as data:
+            # Check if project already exists
+            if self._find_index(data, self._get_id_field(), project.project_id) != -1:
+                raise ValueError(f"Project with ID {project.project_id} already exists")
+            
+            # Check name uniqueness for user
+            for item in data:
+                if (item.get('user_id') == project.user_id and 
+                    item.get('name') == project.name):
+                    raise ValueError(f"Project name '{project.name}' already exists for this user")
+            
+            self._append_record(data, self._from_entity(project))
         return project
     
     def get_by_id(self, project_id: str) -> Optional[Project]:
         """Get project by ID"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), project_id)
-        
-        if index != -1:
-            return self._to_entity(data[index])
+        record = self._get_record(project_id)
+        if record is not None:
+            return self._to_entity(record)
         return None
     
     def get_by_user_id(self, user_id: str) -> List[Project]:
@@ -93,33 +91,31 @@ class JsonProjectRepository(BaseJsonRepository[Project], IProjectRepository):
     
     def update(self, project: Project) -> Project:
         """Update existing project"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), project.project_id)
-        
-        if index == -1:
-            raise ValueError(f"Project with ID {project.project_id} not found")
-        
-        # Check name uniqueness for user (excluding current project)
-        for i, item in enumerate(data):
-            if (i != index and 
-                item.get('user_id') == project.user_id and 
-                item.get('name') == project.name):
-                raise ValueError(f"Project name '{project.name}' already exists for this user")
-        
-        data[index] = self._from_entity(project)
-        self._write_data(data)
+        with self._transaction() as data:
+            index = self._find_index(data, self._get_id_field(), project.project_id)
+            
+            if index == -1:
+                raise ValueError(f"Project with ID {project.project_id} not found")
+            
+            # Check name uniqueness for user (excluding current project)
+            for i, item in enumerate(data):
+                if (i != index and 
+                    item.get('user_id') == project.user_id and 
+                    item.get('name') == project.name):
+                    raise ValueError(f"Project name '{project.name}' already exists for this user")
+            
+            self._replace_record(data, index, self._from_entity(project))
         return project
     
     def delete(self, project_id: str) -> bool:
         """Delete project by ID"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), project_id)
-        
-        if index != -1:
-            data.pop(index)
-            self._write_data(data)
-            return True
-        return False
+        with self._transaction() as data:
+            index = self._find_index(data, self._get_id_field(), project_id)
+            
+            if index == -1:
+                return False
+            self._remove_record(data, index)
+        return True
     
     def list_all(self) -> List[Project]:
         """Get all projects"""
@@ -0,0 +1,323 @@
+import gzip
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process locking is available
+    fcntl = None
+
+# A pending change: ('put', record) or ('delete', record_id)
+Mutation = Tuple[str, Any]
+
+# fsync policies: 'always' syncs files and the directory entry of a rename,
+# 'file' syncs file contents only, 'never' leaves flushing to the OS
+FSYNC_POLICIES = ('always', 'file', 'never')
+
+# Suffix of a journal file relative to the snapshot path it is replayed over
+JOURNAL_SUFFIX = '.journal'
+
+# Suffix of a segment file relative to the snapshot path it replaces
+SEGMENT_SUFFIX = '.gz'
+
+class SnapshotStorage:
+    """
+    Stores all records as one JSON array, rewritten on every save
+
+    Saves write a temporary file and rename it over the snapshot, so readers
+    and crashes only ever see a complete file. lock() serializes writers
+    across threads and, where fcntl is available, across processes.
+    """
+
+    def __init__(self, filepath: str, id_field: str, fsync: str = 'file'):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy '{fsync}'")
+        self.filepath = filepath
+        self.id_field = id_field
+        self.fsync = fsync
+        self.lock_path = filepath + '.lock'
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file = None
+
+    def ensure_exists(self) -> None:
+        """Create an empty snapshot if none exists, folding in a journal left by JournalStorage"""
+        journal_path = self.filepath + JOURNAL_SUFFIX
+        if os.path.exists(journal_path) and os.path.getsize(journal_path) > 0:
+            with self.lock():
+                if os.path.exists(journal_path) and os.path.getsize(journal_path) > 0:
+                    # The file used journal storage before; its latest changes are only in the journal
+                    journal = JournalStorage(self.filepath, self.id_field, self.fsync)
+                    journal.compact(journal.load())
+        self._ensure_snapshot()
+
+    def _ensure_snapshot(self) -> None:
+        """Create an empty snapshot if none exists"""
+        if not os.path.exists(self.filepath):
+            with self.lock():
+                if not os.path.exists(self.filepath):
+                    _write_atomic(self.filepath, [], self.fsync)
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold the exclusive write lock; re-entrant within a thread"""
+        with self._thread_lock:
+            if self._lock_depth == 0 and fcntl is not None:
+                self._lock_file = open(self.lock_path, 'a')
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and self._lock_file is not None:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def signature(self) -> Optional[tuple]:
+        """Get a value that changes whenever the stored data changes"""
+        return _file_signature(self.filepath)
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load all records"""
+        return _load_snapshot(self.filepath)
+
+    def save(self, data: List[Dict[str, Any]], mutations: List[Mutation]) -> None:
+        """Persist data; mutations are ignored since the whole list is rewritten"""
+        _write_atomic(self.filepath, data, self.fsync)
+
+    def close(self) -> None:
+        """Release background resources"""
+        pass
+
+class JournalStorage(SnapshotStorage):
+    """
+    Stores records as a JSON snapshot plus an append-only JSON-lines journal.
+
+    Each save appends one line per mutation, so write cost is proportional
+    to the change rather than the dataset. Loading replays the journal over
+    the snapshot. compact() folds the journal back into the snapshot and is
+    run periodically from a background thread once the journal is long enough.
+    """
+
+    def __init__(self, filepath: str, id_field: str, fsync: str = 'file',
+                 compact_threshold: int = 1000, compact_interval: float = 30.0):
+        super().__init__(filepath, id_field, fsync)
+        self.journal_path = filepath + JOURNAL_SUFFIX
+        self.compact_threshold = compact_threshold
+        self.compact_interval = compact_interval
+        self.journal_length = 0
+        self._stop_event = threading.Event()
+        self._compaction_thread: Optional[threading.Thread] = None
+
+    def ensure_exists(self) -> None:
+        """Create an empty snapshot if none exists; the journal is replayed on load"""
+        self._ensure_snapshot()
+
+    def signature(self) -> Optional[tuple]:
+        """Combine snapshot and journal signatures"""
+        return (_file_signature(self.filepath), _file_signature(self.journal_path))
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load the snapshot and replay the journal over it"""
+        records = {}
+        for item in _load_snapshot(self.filepath):
+            records[item.get(self.id_field)] = item
+
+        length = 0
+        try:
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        change = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn line from an interrupted append
+                        continue
+                    length += 1
+                    if change.get('op') == 'put':
+                        record = change.get('record', {})
+                        records[record.get(self.id_field)] = record
+                    elif change.get('op') == 'delete':
+                        records.pop(change.get('id'), None)
+        except FileNotFoundError:
+            pass
+
+        self.journal_length = length
+        return list(records.values())
+
+    def save(self, data: List[Dict[str, Any]], mutations: List[Mutation]) -> None:
+        """Append mutations to the journal"""
+        if not mutations:
+            return
+
+        lines = []
+        for op, value in mutations:
+            if op == 'put':
+                lines.append(json.dumps({'op': 'put', 'record': value}, default=str))
+            else:
+                lines.append(json.dumps({'op': 'delete', 'id': value}))
+
+        payload = ('\n'.join(lines) + '\n').encode('utf-8')
+        with open(self.journal_path, 'a+b') as f:
+            # Terminate a torn line left by an interrupted append so it
+            # does not swallow the first new mutation
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    payload = b'\n' + payload
+            f.write(payload)
+            if self.fsync != 'never':
+                f.flush()
+                os.fsync(f.fileno())
+        self.journal_length += len(lines)
+
+    def compact(self, data: List[Dict[str, Any]]) -> None:
+        """Write data as the new snapshot and empty the journal"""
+        _write_atomic(self.filepath, data, self.fsync)
+
+        # Replaying a stale journal over the new snapshot is idempotent, so a
+        # crash before this truncation loses nothing
+        with open(self.journal_path, 'w'):
+            pass
+        self.journal_length = 0
+
+    def start_compaction(self, compact: Callable[[], None]) -> None:
+        """Run compact() periodically once the journal passes the threshold"""
+        if self._compaction_thread is not None:
+            return
+
+        def run():
+            while not self._stop_event.wait(self.compact_interval):
+                if self.journal_length >= self.compact_threshold:
+                    try:
+                        compact()
+                    except OSError:
+                        # Retry on the next interval
+                        pass
+
+        self._compaction_thread = threading.Thread(
+            target=run, name=f'compaction-{os.path.basename(self.filepath)}', daemon=True)
+        self._compaction_thread.start()
+
+    def close(self) -> None:
+        """Stop background compaction"""
+        self._stop_event.set()
+
+class SegmentStorage(SnapshotStorage):
+    """
+    Reads records from an immutable, gzip-compressed JSON array
+
+    The segment lives next to the snapshot path, with a .gz suffix, and is
+    written once with write_segment(). Saving through this storage is an
+    error; callers replace the whole segment instead.
+    """
+
+    def __init__(self, filepath: str, id_field: str, fsync: str = 'file'):
+        super().__init__(filepath, id_field, fsync)
+        self.segment_path = filepath + SEGMENT_SUFFIX
+
+    def ensure_exists(self) -> None:
+        """Segments are never created empty"""
+        pass
+
+    def signature(self) -> Optional[tuple]:
+        """Get the segment file's signature"""
+        return _file_signature(self.segment_path)
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Decompress and load all records"""
+        try:
+            with gzip.open(self.segment_path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+        except (OSError, EOFError, json.JSONDecodeError) as e:
+            raise ValueError(f"Segment {self.segment_path} is corrupt: {e}") from e
+
+    def save(self, data: List[Dict[str, Any]], mutations: List[Mutation]) -> None:
+        """Refuse to change a segment"""
+        raise ValueError(f"Segment {self.segment_path} is read-only")
+
+STORAGE_TYPES = {
+    'snapshot': SnapshotStorage,
+    'journal': JournalStorage,
+    'segment': SegmentStorage,
+}
+
+def create_storage(storage_type: str, filepath: str, id_field: str, fsync: str = 'file') -> SnapshotStorage:
+    """Create a storage backend by name"""
+    if storage_type not in STORAGE_TYPES:
+        raise ValueError(f"Unknown storage type '{storage_type}'")
+    return STORAGE_TYPES[storage_type](filepath, id_field, fsync)
+
+def write_segment(filepath: str, data: List[Dict[str, Any]], fsync: str = 'file') -> None:
+    """Write data as the compressed segment read by SegmentStorage(filepath)"""
+    _write_atomic(filepath + SEGMENT_SUFFIX, data, fsync, compress=True)
+
+def write_json(path: str, value: Any, fsync: str = 'file') -> None:
+    """Atomically replace path with value as JSON"""
+    _write_atomic(path, value, fsync)
+
+def _file_signature(path: str) -> Optional[tuple]:
+    """Get (inode, mtime, ctime, size) of a file, or None if it does not exist
+
+    Atomic saves replace the file, so the inode changes on every snapshot
+    write even when timestamps are too coarse to tell writes apart.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+
+def _load_snapshot(path: str) -> List[Dict[str, Any]]:
+    """Load a JSON array file"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+    except json.JSONDecodeError as e:
+        # Never treat a damaged file as empty: the next save would
+        # overwrite every record
+        raise ValueError(f"Data file {path} is corrupt: {e}") from e
+
+def _write_atomic(path: str, data: Any, fsync: str, compress: bool = False) -> None:
+    """Write data to a temporary file and rename it over path, gzip-compressed if compress"""
+    directory = os.path.dirname(path) or '.'
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        # Keep the permissions of the file being replaced
+        if os.path.exists(path):
+            os.chmod(temp_path, os.stat(path).st_mode & 0o777)
+        with os.fdopen(fd, 'wb' if compress else 'w') as f:
+            if compress:
+                # mtime=0 keeps the output identical for identical data
+                with gzip.GzipFile(fileobj=f, mode='wb', mtime=0) as compressed:
+                    compressed.write(json.dumps(data, separators=(',', ':'), default=str).encode('utf-8'))
+            else:
+                json.dump(data, f, indent=2, default=str)
+            if fsync != 'never':
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    if fsync == 'always' and hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
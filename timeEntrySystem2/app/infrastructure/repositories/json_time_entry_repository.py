@@ -1,16 +1,35 @@
-from typing import List, Optional, Dict, Any
-from datetime import datetime, date
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+from datetime import datetime, date, time, timedelta
 from app.core.entities.time_entry import TimeEntry
+from app.core.entities.daily_rollup import DailyRollup
+from app.core.entities.range_aggregate import RangeAggregate
+from app.core.entities.time_entry_changes import TimeEntryChanges
+from app.core.entities.change_event import ChangeOperation
+from app.core.entities.search_query import SearchQuery
 from app.core.interfaces.time_entry_repository import ITimeEntryRepository
-from app.infrastructure.repositories.base_json_repository import BaseJsonRepository
+from app.core.services.change_event_bus import ChangeEventBus
+from app.infrastructure.repositories.base_json_repository import BaseJsonRepository, VersionClock
+from app.infrastructure.repositories.time_interval_index import TimeIntervalIndex
+from app.infrastructure.repositories.daily_rollup_index import DailyRollupIndex
+from app.infrastructure.repositories.time_entry_column_store import (
+    TimeEntryColumns, TimeEntryColumnStore, aggregate_columns, COLUMNS_AVAILABLE
+)
+from app.infrastructure.repositories.text_search_index import TextSearchIndex
+from app.infrastructure.repositories.entry_change_log import EntryChangeLog
 
 class JsonTimeEntryRepository(BaseJsonRepository[TimeEntry], ITimeEntryRepository):
     """
     JSON file-based implementation of time entry repository
     """
     
-    def __init__(self, data_dir: str):
-        super().__init__(data_dir, "time_entries.json")
+    # Fields with a value -> entries secondary index
+    INDEXED_FIELDS = ('user_id', 'project_id', 'timesheet_id')
+    
+    def __init__(self, data_dir: str, storage: str = 'snapshot',
+                 fsync: str = 'file', event_bus: Optional[ChangeEventBus] = None,
+                 version_clock: Optional[VersionClock] = None):
+        super().__init__(data_dir, "time_entries.json", storage, fsync, event_bus, version_clock)
+        self._reset_secondary_indexes()
     
     def _to_entity(self, data: Dict[str, Any]) -> TimeEntry:
         """Convert dictionary to TimeEntry entity"""
@@ -28,35 +47,188 @@ class JsonTimeEntryRepository(BaseJsonRepository[TimeEntry], ITimeEntryRepositor
         """Get ID from TimeEntry entity"""
         return entity.entry_id
     
-    def create(self, time_entry: TimeEntry) -> TimeEntry:
-        """Create a new time entry"""
-        data = self._read_data()
+    def _reset_secondary_indexes(self) -> None:
+        """Clear field, running-timer, interval, rollup, column and search indexes"""
+        # field -> value -> {entry_id: record}
+        self._field_indexes: Dict[str, Dict[Any, Dict[str, Dict[str, Any]]]] = {
+            field: {} for field in self.INDEXED_FIELDS
+        }
+        # user_id -> {entry_id: record} for running timers
+        self._running_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # user_id / project_id -> start-time sorted intervals
+        self._user_intervals: Dict[str, TimeIntervalIndex] = {}
+        self._project_intervals: Dict[str, TimeIntervalIndex] = {}
+        # user_id -> per-day, per-project totals
+        self._daily_rollups: Dict[str, DailyRollupIndex] = {}
+        # user_id -> NumPy columns, kept only when NumPy is installed
+        self._column_stores: Dict[str, TimeEntryColumnStore] = {}
+        # user_id -> words of entry descriptions
+        self._search_indexes: Dict[str, TextSearchIndex] = {}
+        # user_id -> entries saved or deleted since the indexes were built,
+        # which is as far back as changes can be listed
+        self._change_logs: Dict[str, EntryChangeLog] = {}
+        self._changes_horizon = self._clock.value
+    
+    def _index_record(self, record: Dict[str, Any]) -> None:
+        """Add a record to the field, running-timer, interval, rollup, column and search indexes"""
+        entry_id = record.get('entry_id')
+        for field in self.INDEXED_FIELDS:
+            self._field_indexes[field].setdefault(record.get(field), {})[entry_id] = record
         
-        # Check if time entry already exists
-        if self._find_index(data, self._get_id_field(), time_entry.entry_id) != -1:
-            raise ValueError(f"Time entry with ID {time_entry.entry_id} already exists")
+        if record.get('is_running') is True:
+            self._running_index.setdefault(record.get('user_id'), {})[entry_id] = record
         
-        data.append(self._from_entity(time_entry))
-        self._write_data(data)
+        start_time = datetime.fromisoformat(record.get('start_time', ''))
+        end_str = record.get('end_time')
+        end_time = datetime.fromisoformat(end_str) if end_str else None
+        for intervals, key in ((self._user_intervals, record.get('user_id')),
+                               (self._project_intervals, record.get('project_id'))):
+            index = intervals.get(key)
+            if index is None:
+                index = intervals[key] = TimeIntervalIndex()
+            index.add(entry_id, start_time, end_time)
+        
+        user_id = record.get('user_id')
+        rollups = self._daily_rollups.get(user_id)
+        if rollups is None:
+            rollups = self._daily_rollups[user_id] = DailyRollupIndex()
+        rollups.add(start_time.date(), record.get('project_id'), record.get('duration_minutes', 0))
+        
+        if COLUMNS_AVAILABLE:
+            columns = self._column_stores.get(user_id)
+            if columns is None:
+                columns = self._column_stores[user_id] = TimeEntryColumnStore()
+            columns.add(entry_id, start_time, end_time, record.get('duration_minutes', 0), record.get('project_id'))
+        
+        if record.get('description'):
+            search_index = self._search_indexes.get(user_id)
+            if search_index is None:
+                search_index = self._search_indexes[user_id] = TextSearchIndex()
+            search_index.add(entry_id, record.get('description'))
+    
+    def _unindex_record(self, record: Dict[str, Any]) -> None:
+        """Remove a record from the field, running-timer, interval, rollup, column and search indexes"""
+        entry_id = record.get('entry_id')
+        for field in self.INDEXED_FIELDS:
+            self._discard(self._field_indexes[field], record.get(field), entry_id)
+        
+        if record.get('is_running') is True:
+            self._discard(self._running_index, record.get('user_id'), entry_id)
+        
+        for intervals, key in ((self._user_intervals, record.get('user_id')),
+                               (self._project_intervals, record.get('project_id'))):
+            index = intervals.get(key)
+            if index is not None:
+                index.remove(entry_id)
+                if not len(index):
+                    del intervals[key]
+        
+        rollups = self._daily_rollups.get(record.get('user_id'))
+        if rollups is not None:
+            day = datetime.fromisoformat(record.get('start_time', '')).date()
+            rollups.remove(day, record.get('project_id'), record.get('duration_minutes', 0))
+            if not len(rollups):
+                del self._daily_rollups[record.get('user_id')]
+        
+        columns = self._column_stores.get(record.get('user_id'))
+        if columns is not None:
+            columns.remove(entry_id)
+            if not len(columns):
+                del self._column_stores[record.get('user_id')]
+        
+        search_index = self._search_indexes.get(record.get('user_id'))
+        if search_index is not None:
+            search_index.remove(entry_id)
+            if not len(search_index):
+                del self._search_indexes[record.get('user_id')]
+    
+    def _changes_saved(self, version: int, changes: List[Tuple[ChangeOperation, Optional[Dict[str, Any]],
+                                                               Optional[Dict[str, Any]]]]) -> None:
+        """Log the entries changed in version, with tombstones for deleted entries"""
+        for operation, before, after in changes:
+            if before is not None and (after is None or before.get('user_id') != after.get('user_id')):
+                # Deleted, or moved away from its previous owner
+                self._change_log(before.get('user_id')).record(before.get('entry_id'), version, deleted=True)
+            if after is not None:
+                self._change_log(after.get('user_id')).record(after.get('entry_id'), version)
+    
+    def _change_log(self, user_id: str) -> EntryChangeLog:
+        """Get a user's change log, creating it if needed"""
+        change_log = self._change_logs.get(user_id)
+        if change_log is None:
+            change_log = self._change_logs[user_id] = EntryChangeLog()
+        return change_log
+    
+    @staticmethod
+    def _discard(index: Dict[Any, Dict[str, Dict[str, Any]]], key: Any, entry_id: str) -> None:
+        """Remove entry_id from index[key], dropping the bucket when empty"""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(entry_id, None)
+            if not bucket:
+                del index[key]
+    
+    def _records_by_field(self, field: str, value: Any) -> List[Dict[str, Any]]:
+        """Get records whose field equals value using the secondary index"""
+        data = self._read_data()
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            return list(self._field_indexes[field].get(value, {}).values())
+    
+    def _records_in_date_range(self, field: str, key: str,
+                               start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """Get records with field == key whose start date falls in [start_date, end_date], ordered by start time"""
+        range_start = datetime.combine(start_date, time.min)
+        range_end = datetime.combine(end_date + timedelta(days=1), time.min)
+        
+        data = self._read_data()
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            # Look the index up only after _ensure_indexes, which may rebuild it
+            intervals = self._user_intervals if field == 'user_id' else self._project_intervals
+            index = intervals.get(key)
+            if index is None:
+                return []
+            return [data[self._id_index[entry_id]] for entry_id in index.range(range_start, range_end)]
+    
+    def create(self, time_entry: TimeEntry) -> TimeEntry:
+        """Create a new time entry"""
+        with self._transaction() as data:
+            # Check if time entry already exists
+            if self._find_index(data, self._get_id_field(), time_entry.entry_id) != -1:
+                raise ValueError(f"Time entry with ID {time_entry.entry_id} already exists")
+            
+            self._append_record(data, self._from_entity(time_entry))
         return time_entry
     
+    def create_many(self, time_entries: List[TimeEntry]) -> List[TimeEntry]:
+        """Create several time entries in one write"""
+        with self._transaction() as data:
+            self._ensure_indexes(data)
+            new_ids = set()
+            for time_entry in time_entries:
+                if time_entry.entry_id in self._id_index or time_entry.entry_id in new_ids:
+                    raise ValueError(f"Time entry with ID {time_entry.entry_id} already exists")
+                new_ids.add(time_entry.entry_id)
+            
+            for time_entry in time_entries:
+                self._append_record(data, self._from_entity(time_entry))
+        return time_entries
+    
     def get_by_id(self, entry_id: str) -> Optional[TimeEntry]:
         """Get time entry by ID"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), entry_id)
-        
-        if index != -1:
-            return self._to_entity(data[index])
+        record = self._get_record(entry_id)
+        if record is not None:
+            return self._to_entity(record)
         return None
     
+    def get_many(self, entry_ids: List[str]) -> List[TimeEntry]:
+        """Get time entries for a list of IDs"""
+        return [self._to_entity(item) for item in self._get_records(entry_ids)]
+    
     def get_by_user_id(self, user_id: str) -> List[TimeEntry]:
         """Get all time entries for a user"""
-        data = self._read_data()
-        
-        entries = []
-        for item in data:
-            if item.get('user_id') == user_id:
-                entries.append(self._to_entity(item))
+        entries = [self._to_entity(item) for item in self._records_by_field('user_id', user_id)]
         
         # Sort by start_time descending
         entries.sort(key=lambda e: e.start_time, reverse=True)
@@ -64,12 +236,7 @@ class JsonTimeEntryRepository(BaseJsonRepository[TimeEntry], ITimeEntryRepositor
     
     def get_by_project_id(self, project_id: str) -> List[TimeEntry]:
         """Get all time entries for a project"""
-        data = self._read_data()
-        
-        entries = []
-        for item in data:
-            if item.get('project_id') == project_id:
-                entries.append(self._to_entity(item))
+        entries = [self._to_entity(item) for item in self._records_by_field('project_id', project_id)]
         
         # Sort by start_time descending
         entries.sort(key=lambda e: e.start_time, reverse=True)
@@ -77,12 +244,7 @@ class JsonTimeEntryRepository(BaseJsonRepository[TimeEntry], ITimeEntryRepositor
     
     def get_by_timesheet_id(self, timesheet_id: str) -> List[TimeEntry]:
         """Get all time entries for a timesheet"""
-        data = self._read_data()
-        
-        entries = []
-        for item in data:
-            if item.get('timesheet_id') == timesheet_id:
-                entries.append(self._to_entity(item))
+        entries = [self._to_entity(item) for item in self._records_by_field('timesheet_id', timesheet_id)]
         
         # Sort by start_time ascending for timesheet view
         entries.sort(key=lambda e: e.start_time)
@@ -91,89 +253,200 @@ class JsonTimeEntryRepository(BaseJsonRepository[TimeEntry], ITimeEntryRepositor
     def get_running_timer(self, user_id: str) -> Optional[TimeEntry]:
         """Get currently running timer for a user"""
         data = self._read_data()
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            running = self._running_index.get(user_id)
+            item = next(iter(running.values())) if running else None
         
-        for item in data:
-            if (item.get('user_id') == user_id and 
-                item.get('is_running') is True):
-                return self._to_entity(item)
-        return None
+        return self._to_entity(item) if item else None
+    
+    def has_running_timers(self) -> bool:
+        """Check if any user has a running timer"""
+        data = self._read_data()
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            return any(self._running_index.values())
     
     def get_by_date_range(self, user_id: str, start_date: date, end_date: date) -> List[TimeEntry]:
         """Get time entries within a date range for a user"""
-        data = self._read_data()
+        records = self._records_in_date_range('user_id', user_id, start_date, end_date)
+        
+        # Already sorted by start_time ascending
+        return [self._to_entity(item) for item in records]
+    
+    def iter_by_date_range(self, user_id: str, start_date: date, end_date: date) -> Iterator[TimeEntry]:
+        """Yield time entries within a date range for a user, ordered by start time"""
+        # Records are already in memory; only entity conversion is deferred
+        for item in self._records_in_date_range('user_id', user_id, start_date, end_date):
+            yield self._to_entity(item)
+    
+    def get_page(self, user_id: str, limit: Optional[int] = None, after: Optional[Tuple[datetime, str]] = None,
+                 start_date: Optional[date] = None, end_date: Optional[date] = None,
+                 project_id: Optional[str] = None) -> List[TimeEntry]:
+        """Get up to limit of a user's entries ordered by (start_time, entry_id) descending, starting after the given key"""
+        range_start = datetime.combine(start_date, time.min) if start_date else None
+        range_end = datetime.combine(end_date + timedelta(days=1), time.min) if end_date else None
         
-        entries = []
-        for item in data:
-            if item.get('user_id') == user_id:
-                entry_date = datetime.fromisoformat(item.get('start_time', '')).date()
-                if start_date <= entry_date <= end_date:
-                    entries.append(self._to_entity(item))
+        data = self._read_data()
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            if project_id is not None:
+                index = self._project_intervals.get(project_id)
+            else:
+                index = self._user_intervals.get(user_id)
+            if index is None:
+                return []
+            
+            records = []
+            for entry_id in index.descending(range_start, range_end, after):
+                if limit is not None and len(records) >= limit:
+                    break
+                record = data[self._id_index[entry_id]]
+                if record.get('user_id') == user_id:
+                    records.append(record)
         
-        # Sort by start_time ascending
-        entries.sort(key=lambda e: e.start_time)
-        return entries
+        return [self._to_entity(item) for item in records]
     
     def get_by_project_and_date_range(self, project_id: str, start_date: date, end_date: date) -> List[TimeEntry]:
         """Get time entries for a project within a date range"""
+        records = self._records_in_date_range('project_id', project_id, start_date, end_date)
+        
+        # Already sorted by start_time ascending
+        return [self._to_entity(item) for item in records]
+    
+    def get_daily_rollups(self, user_id: str, start_date: date, end_date: date,
+                          project_id: Optional[str] = None) -> List[DailyRollup]:
+        """Get per-day, per-project totals for a user within a date range"""
+        data = self._read_data()
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            rollups = self._daily_rollups.get(user_id)
+            if rollups is None:
+                return []
+            return rollups.rollups(user_id, start_date, end_date, project_id)
+    
+    def get_range_totals(self, user_id: str, start_date: date, end_date: date,
+                         project_id: Optional[str] = None) -> Tuple[int, int]:
+        """Get (total minutes, entry count) of a user's entries starting within a date range"""
         data = self._read_data()
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            rollups = self._daily_rollups.get(user_id)
+            if rollups is None:
+                return 0, 0
+            return rollups.totals(start_date, end_date, project_id)
+    
+    def get_project_totals(self, user_id: str, start_date: Optional[date] = None,
+                           end_date: Optional[date] = None) -> Dict[str, Tuple[int, int]]:
+        """Get project_id -> (total minutes, entry count) of a user's entries, for projects with entries"""
+        data = self._read_data()
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            rollups = self._daily_rollups.get(user_id)
+            if rollups is None:
+                return {}
+            # Per-project range sums, so no entry is visited
+            return rollups.project_totals(start_date or date.min, end_date or date.max)
+    
+    def get_columns(self, user_id: str, start_date: date, end_date: date) -> Optional[TimeEntryColumns]:
+        """Get a user's entries starting within a date range as NumPy columns, or None without NumPy"""
+        if not COLUMNS_AVAILABLE:
+            return None
         
-        entries = []
-        for item in data:
-            if item.get('project_id') == project_id:
-                entry_date = datetime.fromisoformat(item.get('start_time', '')).date()
-                if start_date <= entry_date <= end_date:
-                    entries.append(self._to_entity(item))
+        data = self._read_data()
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            columns = self._column_stores.get(user_id) or TimeEntryColumnStore()
+            return columns.select(start_date, end_date)
+
+    def aggregate_range(self, user_id: str, start_date: date, end_date: date,
+                        by_day: bool = False, by_week: bool = False) -> Optional[RangeAggregate]:
+        """Total a user's entries starting within a date range over NumPy columns, or None without NumPy"""
+        columns = self.get_columns(user_id, start_date, end_date)
+        return aggregate_columns(columns, end_date, by_day, by_week) if columns is not None else None
+    
+    def search_descriptions(self, user_id: str, query: SearchQuery,
+                            start_date: Optional[date] = None, end_date: Optional[date] = None,
+                            project_id: Optional[str] = None) -> List[Tuple[str, datetime, float]]:
+        """Get (entry_id, start_time, relevance) of a user's entries whose descriptions match query"""
+        data = self._read_data()
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            search_index = self._search_indexes.get(user_id)
+            scores = search_index.search(query) if search_index is not None else {}
+            if project_id is not None and scores:
+                # Walk whichever of the matches and the project's entries is smaller
+                project_entries = self._field_indexes['project_id'].get(project_id, {})
+                if len(project_entries) < len(scores):
+                    scores = {entry_id: scores[entry_id] for entry_id in project_entries if entry_id in scores}
+                else:
+                    scores = {entry_id: score for entry_id, score in scores.items() if entry_id in project_entries}
+            
+            intervals = self._user_intervals.get(user_id)
+            matches = []
+            for entry_id, score in scores.items():
+                start_time = intervals.span(entry_id)[0]
+                if ((start_date is None or start_time.date() >= start_date) and
+                        (end_date is None or start_time.date() <= end_date)):
+                    matches.append((entry_id, start_time, score))
+            return matches
+    
+    def get_changes(self, user_id: str, since_version: Optional[int] = None) -> TimeEntryChanges:
+        """Get a user's entries saved or deleted after since_version, or all of them if that version is not known"""
+        with self._cache_lock:
+            # Take the version before reading, so data changed in between
+            # is sent again rather than missed
+            version = self.get_data_version(user_id)
+            data = self._read_data()
+            self._ensure_indexes(data)
+            
+            # Changes before the horizon or the floor were not logged
+            oldest = max(self._changes_horizon, self._version_floor)
+            if since_version is None or since_version < oldest or since_version > version:
+                records = list(self._field_indexes['user_id'].get(user_id, {}).values())
+                changes = TimeEntryChanges(version, reset=True)
+            else:
+                change_log = self._change_logs.get(user_id)
+                logged = change_log.since(since_version) if change_log is not None else []
+                records = [data[self._id_index[entry_id]] for entry_id, _, deleted in logged if not deleted]
+                changes = TimeEntryChanges(version, deleted_ids=[entry_id for entry_id, _, deleted in logged if deleted])
         
-        # Sort by start_time ascending
-        entries.sort(key=lambda e: e.start_time)
-        return entries
+        changes.entries = [self._to_entity(item) for item in records]
+        if changes.reset:
+            changes.entries.sort(key=lambda e: e.start_time, reverse=True)
+        return changes
     
     def check_overlap(self, user_id: str, start_time: datetime, end_time: datetime, 
                      exclude_entry_id: Optional[str] = None) -> bool:
         """Check if time range overlaps with existing entries"""
         data = self._read_data()
-        
-        for item in data:
-            if (item.get('user_id') == user_id and 
-                item.get('entry_id') != exclude_entry_id):
-                
-                entry_start = datetime.fromisoformat(item.get('start_time', ''))
-                entry_end_str = item.get('end_time')
-                
-                # Skip running timers or entries without end time
-                if not entry_end_str:
-                    continue
-                
-                entry_end = datetime.fromisoformat(entry_end_str)
-                
-                # Check for overlap
-                if (start_time < entry_end and end_time > entry_start):
-                    return True
-        
-        return False
+        with self._cache_lock:
+            self._ensure_indexes(data)
+            index = self._user_intervals.get(user_id)
+            
+            # Running timers (no end time) never count as overlapping
+            return index is not None and index.overlaps(start_time, end_time, exclude_entry_id)
     
     def update(self, time_entry: TimeEntry) -> TimeEntry:
         """Update existing time entry"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), time_entry.entry_id)
-        
-        if index == -1:
-            raise ValueError(f"Time entry with ID {time_entry.entry_id} not found")
-        
-        data[index] = self._from_entity(time_entry)
-        self._write_data(data)
+        with self._transaction() as data:
+            index = self._find_index(data, self._get_id_field(), time_entry.entry_id)
+            
+            if index == -1:
+                raise ValueError(f"Time entry with ID {time_entry.entry_id} not found")
+            
+            self._replace_record(data, index, self._from_entity(time_entry))
         return time_entry
     
     def delete(self, entry_id: str) -> bool:
         """Delete time entry by ID"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), entry_id)
-        
-        if index != -1:
-            data.pop(index)
-            self._write_data(data)
-            return True
-        return False
+        with self._transaction() as data:
+            index = self._find_index(data, self._get_id_field(), entry_id)
+            
+            if index == -1:
+                return False
+            self._remove_record(data, index)
+        return True
     
     def list_all(self) -> List[TimeEntry]:
         """Get all time entries"""
@@ -2,6 +2,7 @@ from typing import List, Optional, Dict, Any
 from datetime import date
 from app.core.entities.timesheet import Timesheet, PeriodType, TimesheetStatus
 from app.core.interfaces.timesheet_repository import ITimesheetRepository
+from app.core.services.change_event_bus import ChangeEventBus
 from app.infrastructure.repositories.base_json_repository import BaseJsonRepository
 
 class JsonTimesheetRepository(BaseJsonRepository[Timesheet], ITimesheetRepository):
@@ -9,8 +10,9 @@ class JsonTimesheetRepository(BaseJsonRepository[Timesheet], ITimesheetRepositor
     JSON file-based implementation of timesheet repository
     """
     
-    def __init__(self, data_dir: str):
-        super().__init__(data_dir, "timesheets.json")
+    def __init__(self, data_dir: str, storage: str = 'snapshot',
+                 fsync: str = 'file', event_bus: Optional[ChangeEventBus] = None):
+        super().__init__(data_dir, "timesheets.json", storage, fsync, event_bus)
     
     def _to_entity(self, data: Dict[str, Any]) -> Timesheet:
         """Convert dictionary to Timesheet entity"""
@@ -30,25 +32,25 @@ class JsonTimesheetRepository(BaseJsonRepository[Timesheet], ITimesheetRepositor
     
     def create(self, timesheet: Timesheet) -> Timesheet:
         """Create a new timesheet"""
-        data = self._read_data()
-        
-        # Check if timesheet already exists
-        if self._find_index(data, self._get_id_field(), timesheet.timesheet_id) != -1:
-            raise ValueError(f"Timesheet with ID {timesheet.timesheet_id} already exists")
-        
-        data.append(self._from_entity(timesheet))
-        self._write_data(data)
+        with self._transaction() as data:
+            # Check if timesheet already exists
+            if self._find_index(data, self._get_id_field(), timesheet.timesheet_id) != -1:
+                raise ValueError(f"Timesheet with ID {timesheet.timesheet_id} already exists")
+            
+            self._append_record(data, self._from_entity(timesheet))
         return timesheet
     
     def get_by_id(self, timesheet_id: str) -> Optional[Timesheet]:
         """Get timesheet by ID"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), timesheet_id)
-        
-        if index != -1:
-            return self._to_entity(data[index])
+        record = self._get_record(timesheet_id)
+        if record is not None:
+            return self._to_entity(record)
         return None
     
+    def get_many(self, timesheet_ids: List[str]) -> List[Timesheet]:
+        """Get timesheets for a list of IDs"""
+        return [self._to_entity(item) for item in self._get_records(timesheet_ids)]
+    
     def get_by_user_id(self, user_id: str) -> List[Timesheet]:
         """Get all timesheets for a user"""
         data = self._read_data()
@@ -128,26 +130,24 @@ class JsonTimesheetRepository(BaseJsonRepository[Timesheet], ITimesheetRepositor
     
     def update(self, timesheet: Timesheet) -> Timesheet:
         """Update existing timesheet"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), timesheet.timesheet_id)
-        
-        if index == -1:
-            raise ValueError(f"Timesheet with ID {timesheet.timesheet_id} not found")
-        
-        data[index] = self._from_entity(timesheet)
-        self._write_data(data)
+        with self._transaction() as data:
+            index = self._find_index(data, self._get_id_field(), timesheet.timesheet_id)
+            
+            if index == -1:
+                raise ValueError(f"Timesheet with ID {timesheet.timesheet_id} not found")
+            
+            self._replace_record(data, index, self._from_entity(timesheet))
         return timesheet
     
     def delete(self, timesheet_id: str) -> bool:
         """Delete timesheet by ID"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), timesheet_id)
-        
-        if index != -1:
-            data.pop(index)
-            self._write_data(data)
-            return True
-        return False
+        with self._transaction() as data:
+            index = self._find_index(data, self._get_id_field(), timesheet_id)
+            
+            if index == -1:
+                return False
+            self._remove_record(data, index)
+        return True
     
     def list_all(self) -> List[Timesheet]:
         """Get all timesheets"""
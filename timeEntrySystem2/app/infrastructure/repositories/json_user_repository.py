@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
 from app.core.entities.user import User
 from app.core.interfaces.user_repository import IUserRepository
+from app.core.services.change_event_bus import ChangeEventBus
 from app.infrastructure.repositories.base_json_repository import BaseJsonRepository
 
 class JsonUserRepository(BaseJsonRepository[User], IUserRepository):
@@ -8,8 +9,9 @@ class JsonUserRepository(BaseJsonRepository[User], IUserRepository):
     JSON file-based implementation of user repository
     """
     
-    def __init__(self, data_dir: str):
-        super().__init__(data_dir, "users.json")
+    def __init__(self, data_dir: str, storage: str = 'snapshot',
+                 fsync: str = 'file', event_bus: Optional[ChangeEventBus] = None):
+        super().__init__(data_dir, "users.json", storage, fsync, event_bus)
     
     def _to_entity(self, data: Dict[str, Any]) -> User:
         """Convert dictionary to User entity"""
@@ -29,29 +31,25 @@ class JsonUserRepository(BaseJsonRepository[User], IUserRepository):
     
     def create(self, user: User) -> User:
         """Create a new user"""
-        data = self._read_data()
-        
-        # Check if user already exists
-        if self._find_index(data, self._get_id_field(), user.user_id) != -1:
-            raise ValueError(f"User with ID {user.user_id} already exists")
-        
-        # Check username uniqueness
-        if user.username:
-            for item in data:
-                if item.get('username') == user.username:
-                    raise ValueError(f"Username '{user.username}' already exists")
-        
-        data.append(self._from_entity(user))
-        self._write_data(data)
+        with self._transaction() as data:
+            # Check if user already exists
+            if self._find_index(data, self._get_id_field(), user.user_id) != -1:
+                raise ValueError(f"User with ID {user.user_id} already exists")
+            
+            # Check username uniqueness
+            if user.username:
+                for item in data:
+                    if item.get('username') == user.username:
+                        raise ValueError(f"Username '{user.username}' already exists")
+            
+            self._append_record(data, self._from_entity(user))
         return user
     
     def get_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), user_id)
-        
-        if index != -1:
-            return self._to_entity(data[index])
+        record = self._get_record(user_id)
+        if record is not None:
+            return self._to_entity(record)
         return None
     
     def get_by_username(self, username: str) -> Optional[User]:
@@ -65,32 +63,30 @@ class JsonUserRepository(BaseJsonRepository[User], IUserRepository):
     
     def update(self, user: User) -> User:
         """Update existing user"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), user.user_id)
-        
-        if index == -1:
-            raise ValueError(f"User with ID {user.user_id} not found")
-        
-        # Check username uniqueness (excluding current user)
-        if user.username:
-            for i, item in enumerate(data):
-                if i != index and item.get('username') == user.username:
-                    raise ValueError(f"Username '{user.username}' already exists")
-        
-        data[index] = self._from_entity(user)
-        self._write_data(data)
+        with self._transaction() as data:
+            index = self._find_index(data, self._get_id_field(), user.user_id)
+            
+            if index == -1:
+                raise ValueError(f"User with ID {user.user_id} not found")
+            
+            # Check username uniqueness (excluding current user)
+            if user.username:
+                for i, item in enumerate(data):
+                    if i != index and item.get('username') == user.username:
+                        raise ValueError(f"Username '{user.username}' already exists")
+            
+            self._replace_record(data, index, self._from_entity(user))
         return user
     
     def delete(self, user_id: str) -> bool:
         """Delete user by ID"""
-        data = self._read_data()
-        index = self._find_index(data, self._get_id_field(), user_id)
-        
-        if index != -1:
-            data.pop(index)
-            self._write_data(data)
-            return True
-        return False
+        with self._transaction() as data:
+            index = self._find_index(data, self._get_id_field(), user_id)
+            
+            if index == -1:
+                return False
+            self._remove_record(data, index)
+        return True
     
     def list_all(self) -> List[User]:
         """Get all users"""
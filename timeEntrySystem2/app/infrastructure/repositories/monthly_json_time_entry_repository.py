@@ -0,0 +1,677 @@
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from datetime import datetime, date, timedelta
+from app.core.entities.time_entry import TimeEntry
+from app.core.entities.daily_rollup import DailyRollup
+from app.core.entities.range_aggregate import RangeAggregate
+from app.core.entities.time_entry_changes import TimeEntryChanges
+from app.core.entities.search_query import SearchQuery
+from app.core.interfaces.time_entry_repository import ITimeEntryRepository
+from app.core.services.change_event_bus import ChangeEventBus
+from app.infrastructure.repositories.base_json_repository import VersionClock
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.monthly_layout import MonthLayout, span_minutes, PARTITION_ROOT, SEGMENT_SUMMARY
+from app.infrastructure.repositories.sharded_json_repository import BaseShardedJsonRepository
+from app.infrastructure.repositories.time_entry_column_store import (
+    TimeEntryColumns, aggregate_columns, concat_columns, COLUMNS_AVAILABLE
+)
+
+def month_of(moment: date) -> str:
+    """Get the partition key (YYYY-MM) of a date or datetime"""
+    return f'{moment.year:04d}-{moment.month:02d}'
+
+def _month_end(month: str) -> datetime:
+    """Get the first moment after a partition key's month"""
+    year, number = int(month[:4]), int(month[5:])
+    return datetime(year + number // 12, number % 12 + 1, 1)
+
+class _MonthPartition(JsonTimeEntryRepository):
+    """
+    A hot month's repository, which reports its saves and refuses writes once the month is frozen
+    """
+
+    def __init__(self, data_dir: str, storage: str, fsync: str, event_bus: Optional[ChangeEventBus],
+                 version_clock: VersionClock, on_saved: Callable[[str, List[Tuple]], None],
+                 version_floor: Optional[int] = None):
+        self._on_saved = on_saved
+        super().__init__(data_dir, storage, fsync, event_bus, version_clock)
+        if version_floor is not None:
+            # The caller knows the files have not changed since version_floor
+            self._version_floor = version_floor
+            self._version_signature = self._file_signature()
+
+    def _superseded(self) -> bool:
+        """Check if another process froze the month, leaving these hot files behind"""
+        return os.path.exists(os.path.join(self.data_dir, SEGMENT_SUMMARY))
+
+    def _changes_saved(self, version: int, changes: List[Tuple]) -> None:
+        """Log the saved changes and report them to the monthly repository"""
+        super()._changes_saved(version, changes)
+        self._on_saved(os.path.basename(self.data_dir), changes)
+
+    def retire(self) -> None:
+        """Stop background work after the month was frozen elsewhere; writes are already refused"""
+        self._storage.close()
+
+class MonthlyJsonTimeEntryRepository(BaseShardedJsonRepository[JsonTimeEntryRepository], ITimeEntryRepository):
+    """
+    Time entry repository with one JsonTimeEntryRepository per month of start_time
+
+    Months are hot or frozen. A hot month is an ordinary snapshot or
+    journal that takes writes; a timer start or stop only rewrites the
+    current month. A frozen month is an immutable, gzip-compressed segment
+    with a summary of the users, projects and timesheets it holds.
+    Segments are loaded on first use and kept in a small LRU cache, and
+    queries skip those whose summary rules them out. Date-range queries
+    only open the months they overlap.
+
+    archive_approved_months() freezes past months whose entries all belong
+    to approved timesheets. Writing to a frozen month thaws it back into a
+    hot one first. Several processes can share the data directory: freezing,
+    thawing and creating a month happen under the month's write lock and the
+    layout file's lock, and each process re-reads the layout file when it
+    changes; MonthLayout handles those shared files. Running timers and data
+    versions only check the current month and the months recorded in the
+    running file, and overlap checks only the months whose longest entry can
+    reach the checked range.
+    """
+
+    # Frozen segments kept parsed in memory
+    SEGMENT_CACHE_SIZE = 12
+
+    def __init__(self, data_dir: str, storage: str = 'snapshot',
+                 fsync: str = 'file', event_bus: Optional[ChangeEventBus] = None):
+        # One clock for all hot months, so their data versions are comparable
+        self._clock = VersionClock()
+        self._storage_type = storage
+        self._event_bus = event_bus
+        super().__init__(data_dir, self._open_partition)
+        self.fsync = fsync
+        # Guards the state below; never held while waiting on a file lock
+        self._layout_lock = threading.RLock()
+        self._hot: Set[str] = set()
+        # month -> summary of its segment, with the indexed fields as sets
+        self._frozen: Dict[str, Dict[str, Any]] = {}
+        self._segments: 'OrderedDict[str, JsonTimeEntryRepository]' = OrderedDict()
+        # month -> clock value when this process first saw it
+        self._created: Dict[str, int] = {}
+        # Moves whenever a month is frozen or thawed; older versions cannot be
+        # answered with changes
+        self._layout_version = self._clock.value
+        # Raised when another process saves to a month that is not checked
+        # directly; user -> version of their last save through this repository
+        self._version_floor = self._clock.value
+        self._user_versions: Dict[str, int] = {}
+
+        self._layout = MonthLayout(os.path.join(data_dir, PARTITION_ROOT), fsync)
+        self._layout_signature: Optional[tuple] = None
+        # month -> longest span in minutes of its entries, None if not yet counted
+        self._longest: Dict[str, Optional[int]] = {}
+        self._scan_partitions()
+
+    def _open_partition(self, path: str) -> _MonthPartition:
+        """Open a hot month's partition"""
+        month = os.path.basename(path)
+        version_floor = None
+        if month != month_of(date.today()):
+            # Other processes' saves to this month raise our floor, so it is
+            # unchanged since then and its versions can start there
+            self._check_outside_changes()
+            with self._layout_lock:
+                version_floor = max(self._version_floor, self._layout_version)
+        return _MonthPartition(path, self._storage_type, self.fsync, self._event_bus, self._clock,
+                               self._month_saved, version_floor)
+
+    def _scan_partitions(self) -> None:
+        """Record the hot and frozen months on disk in the layout file, and remove hot files left by freezing"""
+        with self._layout.lock():
+            layout = self._layout.scan()
+            self._refresh_layout()
+
+        for record in layout:
+            if record['frozen']:
+                self._layout.remove_leftovers(record['month'])
+            elif 'longest' not in record:
+                self._count_longest(record['month'])
+        if not self._layout.has_running_file():
+            with self._layout_lock:
+                months = sorted(self._hot)
+            self._layout.seed_running(months, self._has_running_timers)
+
+    def _has_running_timers(self, month: str) -> bool:
+        """Check if a hot month holds a running timer"""
+        partition = self._shard(month)
+        return partition is not None and partition.has_running_timers()
+
+    def _count_longest(self, month: str) -> None:
+        """Record the longest span of a hot month's entries, for months saved before spans were kept"""
+        partition = self._shard(month)
+        if not isinstance(partition, _MonthPartition):
+            return
+        try:
+            with partition.batch():
+                # Writers of this month wait, so no longer entry is saved uncounted
+                longest = max((span_minutes(entry.start_time, entry.end_time) for entry in partition.list_all()),
+                              default=0)
+                self._layout.save_state(month, False, longest)
+        except ValueError:
+            if not partition.closed:
+                raise
+            # Frozen by another process meanwhile, which counted it
+        self._refresh_layout()
+
+    def _refresh_layout(self) -> None:
+        """Pick up months frozen, thawed or created since the layout file was last read"""
+        if self._layout.signature() == self._layout_signature:
+            return
+
+        with self._layout.lock():
+            signature = self._layout.signature()
+            layout = self._layout.load()
+            with self._layout_lock:
+                if signature == self._layout_signature:
+                    return
+                initial = self._layout_signature is None
+                hot = {record['month'] for record in layout if not record['frozen']}
+                frozen = {record['month'] for record in layout if record['frozen']}
+                moved = False
+                for month in frozen - set(self._frozen):
+                    summary = self._layout.read_summary(month)
+                    if summary is None:
+                        # Interrupted thaw: its hot snapshot is already complete
+                        hot.add(month)
+                        continue
+                    self._frozen[month] = summary
+                    moved = True
+                for month in set(self._frozen) - frozen:
+                    del self._frozen[month]
+                    self._segments.pop(month, None)
+                    moved = True
+
+                if not initial:
+                    for month in hot - self._hot - set(self._frozen):
+                        # Everything in a month created elsewhere is new here
+                        self._created[month] = self._clock.advance()
+                for month in set(self._created) - hot:
+                    del self._created[month]
+                stale = [self._shards.pop(month) for month in list(self._shards) if month not in hot]
+                self._hot = hot
+                self._longest = {record['month']: record.get('longest') for record in layout}
+                if moved and not initial:
+                    self._layout_version = self._clock.advance()
+                self._layout_signature = signature
+
+        for partition in stale:
+            partition.retire()
+
+    def _shard_path(self, month: str) -> str:
+        """Get the directory holding a month's files"""
+        return self._layout.month_path(month)
+
+    def _shard_keys(self) -> List[str]:
+        """Get every month, hot ones first, newest first within each tier"""
+        self._refresh_layout()
+        with self._layout_lock:
+            return sorted(self._hot, reverse=True) + sorted(self._frozen, reverse=True)
+
+    def _shard(self, month: str, create: bool = False) -> Optional[JsonTimeEntryRepository]:
+        """Get a month's partition, or None if it has none and create is False
+
+        With create, the partition is hot and can be written to: a frozen
+        month is thawed and a new month is created.
+        """
+        if create:
+            # Writes must not go to a month frozen elsewhere
+            self._refresh_layout()
+        while True:
+            with self._layout_lock:
+                frozen = month in self._frozen
+                hot = month in self._hot
+                shard = self._shards.get(month)
+                if frozen and not create:
+                    # Immutable, so it never joins a batch
+                    return self._segment(month)
+            if frozen:
+                self._thaw(month)
+                continue
+            if not hot:
+                if not create:
+                    return None
+                self._add_month(month)
+                continue
+
+            if shard is None:
+                opened = self._create_shard(self._shard_path(month))
+                with self._layout_lock:
+                    shard = self._shards.setdefault(month, opened) if month in self._hot else opened
+                if shard is not opened:
+                    opened.retire()
+
+            try:
+                self._join_batch(shard)
+            except ValueError:
+                if not shard.closed:
+                    raise
+                # Frozen since it was looked up, here or by another process
+                with self._layout_lock:
+                    if self._shards.get(month) is shard:
+                        del self._shards[month]
+                self._refresh_layout()
+                with self._layout_lock:
+                    missed = month in self._hot
+                if missed:
+                    # The freeze never reached the layout file; thawing checks the files
+                    self._thaw(month)
+                continue
+            return shard
+
+    def _segment(self, month: str) -> JsonTimeEntryRepository:
+        """Get a frozen month's segment, loading it if it is not cached"""
+        segment = self._segments.get(month)
+        if segment is None:
+            segment = JsonTimeEntryRepository(self._shard_path(month), storage='segment')
+            self._segments[month] = segment
+            while len(self._segments) > self.SEGMENT_CACHE_SIZE:
+                self._segments.popitem(last=False)
+        else:
+            self._segments.move_to_end(month)
+        return segment
+
+    def _watched_partitions(self) -> List[Tuple[str, JsonTimeEntryRepository]]:
+        """Get (month, partition) of the current month and the months recorded as holding running timers
+
+        Newest first; recorded months that are no longer hot are dropped
+        from the running file, since frozen months never hold running timers.
+        """
+        self._refresh_layout()
+        months = self._layout.running_months() | {month_of(date.today())}
+        watched = []
+        for month in sorted(months, reverse=True):
+            with self._layout_lock:
+                hot = month in self._hot
+            partition = self._shard(month) if hot else None
+            if partition is not None:
+                watched.append((month, partition))
+            elif month != month_of(date.today()):
+                self._layout.forget_running(month)
+        return watched
+
+    def _month_saved(self, month: str, changes: List[Tuple]) -> None:
+        """Note a month partition's saved changes; called under its locks"""
+        owners = {record.get('user_id') for _, before, after in changes
+                  for record in (before, after) if record is not None}
+        running = any(after is not None and after.get('is_running') for _, _, after in changes)
+        with self._layout_lock:
+            # A version of its own, so waiters it wakes see the owners' versions already moved
+            version = self._clock.advance()
+            for owner in owners:
+                self._user_versions[owner] = version
+        self._after_save(lambda: self._announce_save(month, running))
+
+    def _announce_save(self, month: str, running: bool) -> None:
+        """Tell other processes about a save to month; called once its locks are released"""
+        if running:
+            self._layout.record_running(month)
+        if month != month_of(date.today()):
+            # Other processes would not otherwise check this month
+            self._check_outside_changes()
+            self._layout.announce_change()
+
+    def _check_outside_changes(self) -> None:
+        """Raise the version floor if another process saved to a month other than its current one"""
+        if self._layout.changed_elsewhere():
+            with self._layout_lock:
+                self._version_floor = self._clock.advance()
+
+    def _partitions(self, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                    field: Optional[str] = None, value: Any = None,
+                    newest_first: bool = False) -> Iterator[JsonTimeEntryRepository]:
+        """Yield the partitions of months overlapping [start_date, end_date], oldest first
+
+        Frozen months whose summary has no entry with field == value are
+        skipped without being loaded.
+        """
+        low = month_of(start_date) if start_date else None
+        high = month_of(end_date) if end_date else None
+        self._refresh_layout()
+        with self._layout_lock:
+            months = sorted(self._hot | set(self._frozen), reverse=newest_first)
+
+        for month in months:
+            if (low is not None and month < low) or (high is not None and month > high):
+                continue
+            with self._layout_lock:
+                summary = self._frozen.get(month)
+            if summary is not None and field is not None and value not in summary[field]:
+                continue
+            partition = self._shard(month)
+            if partition is not None:
+                yield partition
+
+    def archive_approved_months(self, approved_timesheet_ids: Iterable[str]) -> List[str]:
+        """Freeze each past hot month whose entries all belong to the given approved timesheets
+
+        Returns the months frozen.
+        """
+        approved = set(approved_timesheet_ids)
+        current = month_of(date.today())
+        self._refresh_layout()
+        with self._layout_lock:
+            months = sorted(month for month in self._hot if month < current)
+        return [month for month in months if self._freeze(month, approved)]
+
+    def _freeze(self, month: str, approved: Set[str]) -> bool:
+        """Replace a hot month with a segment if all its entries are in approved timesheets"""
+        partition = self._shard(month)
+        if not isinstance(partition, _MonthPartition) or partition.closed:
+            # Frozen since it was listed
+            return False
+
+        try:
+            with partition.batch():
+                # Writers of this month wait until the segment is in place
+                records = [entry.to_dict() for entry in partition.list_all()]
+                if not records or any(record.get('is_running') or record.get('timesheet_id') not in approved
+                                      for record in records):
+                    return False
+
+                self._layout.freeze(month, records)
+                self._refresh_layout()
+                # The hot files stay until the next start, for readers still holding the partition
+                partition.close()
+        except ValueError:
+            if not partition.closed:
+                raise
+            # Frozen by another process meanwhile
+            return False
+        return True
+
+    def _thaw(self, month: str) -> None:
+        """Turn a frozen month back into a hot one holding the same entries; call without _layout_lock held"""
+        self._layout.thaw(month)
+        self._refresh_layout()
+
+    def _add_month(self, month: str) -> None:
+        """Create a new hot month, unless another process already did"""
+        self._layout.add_month(month)
+        self._refresh_layout()
+
+    def _writable(self, month: str, entries: List[TimeEntry]) -> JsonTimeEntryRepository:
+        """Get a month's hot partition for saving entries, first recording their longest span in the layout"""
+        partition = self._shard(month, create=True)
+        longest = max(span_minutes(entry.start_time, entry.end_time) for entry in entries)
+        with self._layout_lock:
+            known = self._longest.get(month)
+        if known is None or longest > known:
+            # Spans only grow, so a known span at least this long is still on disk
+            self._layout.raise_longest(month, longest)
+            self._refresh_layout()
+        return partition
+
+    def create(self, time_entry: TimeEntry) -> TimeEntry:
+        """Create a new time entry in its month"""
+        month = month_of(time_entry.start_time)
+        with self.batch():
+            self._writable(month, [time_entry]).create(time_entry)
+        self._remember_owner(time_entry.entry_id, month)
+        return time_entry
+
+    def create_many(self, time_entries: List[TimeEntry]) -> List[TimeEntry]:
+        """Create several time entries with one write per month"""
+        by_month: Dict[str, List[TimeEntry]] = defaultdict(list)
+        for time_entry in time_entries:
+            by_month[month_of(time_entry.start_time)].append(time_entry)
+
+        with self.batch():
+            for month, entries in by_month.items():
+                self._writable(month, entries).create_many(entries)
+        for month, entries in by_month.items():
+            for time_entry in entries:
+                self._remember_owner(time_entry.entry_id, month)
+        return time_entries
+
+    def get_by_id(self, entry_id: str) -> Optional[TimeEntry]:
+        """Get time entry by ID"""
+        found = self._locate(entry_id, lambda partition, record_id: partition.get_by_id(record_id))
+        return found[1] if found else None
+
+    def get_many(self, entry_ids: List[str]) -> List[TimeEntry]:
+        """Get time entries for a list of IDs"""
+        return self._locate_many(entry_ids, lambda partition, ids: partition.get_many(ids), lambda e: e.entry_id)
+
+    def get_by_user_id(self, user_id: str) -> List[TimeEntry]:
+        """Get all time entries for a user"""
+        # Months are disjoint and each is sorted by start_time descending
+        return [entry for partition in self._partitions(field='user_id', value=user_id, newest_first=True)
+                for entry in partition.get_by_user_id(user_id)]
+
+    def get_by_project_id(self, project_id: str) -> List[TimeEntry]:
+        """Get all time entries for a project"""
+        return [entry for partition in self._partitions(field='project_id', value=project_id, newest_first=True)
+                for entry in partition.get_by_project_id(project_id)]
+
+    def get_by_timesheet_id(self, timesheet_id: str) -> List[TimeEntry]:
+        """Get all time entries for a timesheet"""
+        return [entry for partition in self._partitions(field='timesheet_id', value=timesheet_id)
+                for entry in partition.get_by_timesheet_id(timesheet_id)]
+
+    def get_running_timer(self, user_id: str) -> Optional[TimeEntry]:
+        """Get currently running timer for a user"""
+        # Only the current month and months recorded with running timers can hold one
+        current = month_of(date.today())
+        for month, partition in self._watched_partitions():
+            running = partition.get_running_timer(user_id)
+            if running is not None:
+                return running
+            if month != current and not partition.has_running_timers():
+                self._layout.forget_running(month, partition.has_running_timers)
+        return None
+
+    def get_by_date_range(self, user_id: str, start_date: date, end_date: date) -> List[TimeEntry]:
+        """Get time entries within a date range for a user"""
+        return list(self.iter_by_date_range(user_id, start_date, end_date))
+
+    def iter_by_date_range(self, user_id: str, start_date: date, end_date: date) -> Iterator[TimeEntry]:
+        """Yield time entries within a date range for a user, ordered by start time"""
+        # Each month is opened only once the previous one is exhausted
+        for partition in self._partitions(start_date, end_date, 'user_id', user_id):
+            yield from partition.iter_by_date_range(user_id, start_date, end_date)
+
+    def get_page(self, user_id: str, limit: Optional[int] = None, after: Optional[Tuple[datetime, str]] = None,
+                 start_date: Optional[date] = None, end_date: Optional[date] = None,
+                 project_id: Optional[str] = None) -> List[TimeEntry]:
+        """Get up to limit of a user's entries ordered by (start_time, entry_id) descending, starting after the given key"""
+        if after is not None and (end_date is None or after[0].date() < end_date):
+            # Months after the cursor hold nothing past it
+            end = after[0].date()
+        else:
+            end = end_date
+
+        entries = []
+        for partition in self._partitions(start_date, end, 'user_id', user_id, newest_first=True):
+            remaining = limit - len(entries) if limit is not None else None
+            if remaining is not None and remaining <= 0:
+                break
+            entries.extend(partition.get_page(user_id, remaining, after, start_date, end_date, project_id))
+        return entries
+
+    def get_by_project_and_date_range(self, project_id: str, start_date: date, end_date: date) -> List[TimeEntry]:
+        """Get time entries for a project within a date range"""
+        return [entry for partition in self._partitions(start_date, end_date, 'project_id', project_id)
+                for entry in partition.get_by_project_and_date_range(project_id, start_date, end_date)]
+
+    def get_daily_rollups(self, user_id: str, start_date: date, end_date: date,
+                          project_id: Optional[str] = None) -> List[DailyRollup]:
+        """Get per-day, per-project totals for a user within a date range"""
+        return [rollup for partition in self._partitions(start_date, end_date, 'user_id', user_id)
+                for rollup in partition.get_daily_rollups(user_id, start_date, end_date, project_id)]
+
+    def get_range_totals(self, user_id: str, start_date: date, end_date: date,
+                         project_id: Optional[str] = None) -> Tuple[int, int]:
+        """Get (total minutes, entry count) of a user's entries starting within a date range"""
+        minutes = count = 0
+        for partition in self._partitions(start_date, end_date, 'user_id', user_id):
+            partition_minutes, partition_count = partition.get_range_totals(user_id, start_date, end_date, project_id)
+            minutes += partition_minutes
+            count += partition_count
+        return minutes, count
+
+    def get_project_totals(self, user_id: str, start_date: Optional[date] = None,
+                           end_date: Optional[date] = None) -> Dict[str, Tuple[int, int]]:
+        """Get project_id -> (total minutes, entry count) of a user's entries, for projects with entries"""
+        totals: Dict[str, Tuple[int, int]] = {}
+        for partition in self._partitions(start_date, end_date, 'user_id', user_id):
+            for project_id, (minutes, count) in partition.get_project_totals(user_id, start_date, end_date).items():
+                total_minutes, total_count = totals.get(project_id, (0, 0))
+                totals[project_id] = (total_minutes + minutes, total_count + count)
+        return totals
+
+    def get_columns(self, user_id: str, start_date: date, end_date: date) -> Optional[TimeEntryColumns]:
+        """Get a user's entries starting within a date range as NumPy columns, or None without NumPy"""
+        if not COLUMNS_AVAILABLE:
+            return None
+        parts = [partition.get_columns(user_id, start_date, end_date)
+                 for partition in self._partitions(start_date, end_date, 'user_id', user_id)]
+        return concat_columns(parts, start_date)
+
+    def aggregate_range(self, user_id: str, start_date: date, end_date: date,
+                        by_day: bool = False, by_week: bool = False) -> Optional[RangeAggregate]:
+        """Total a user's entries starting within a date range over NumPy columns, or None without NumPy"""
+        columns = self.get_columns(user_id, start_date, end_date)
+        return aggregate_columns(columns, end_date, by_day, by_week) if columns is not None else None
+
+    def search_descriptions(self, user_id: str, query: SearchQuery,
+                            start_date: Optional[date] = None, end_date: Optional[date] = None,
+                            project_id: Optional[str] = None) -> List[Tuple[str, datetime, float]]:
+        """Get (entry_id, start_time, relevance) of a user's entries whose descriptions match query"""
+        return [match for partition in self._partitions(start_date, end_date, 'user_id', user_id)
+                for match in partition.search_descriptions(user_id, query, start_date, end_date, project_id)]
+
+    def get_changes(self, user_id: str, since_version: Optional[int] = None) -> TimeEntryChanges:
+        """Get a user's entries saved or deleted after since_version, or all of them if that version is not known"""
+        # Taken before reading, so data changed in between is sent again
+        version = self.get_data_version(user_id)
+        with self._layout_lock:
+            # Entries of a frozen or thawed month, or one another process
+            # saved to, may have changed unlogged
+            oldest = max(self._layout_version, self._version_floor)
+            created = dict(self._created)
+            months = sorted(self._hot, reverse=True)
+            opened = set(self._shards)
+
+        if since_version is None or since_version < oldest or since_version > version:
+            return TimeEntryChanges(version, reset=True, entries=self.get_by_user_id(user_id))
+
+        entries: Dict[str, TimeEntry] = {}
+        deleted_ids: Set[str] = set()
+        for month in months:
+            if since_version < created.get(month, since_version):
+                # Created after since_version: everything in it is new to the client
+                partition = self._shard(month)
+                if partition is not None:
+                    entries.update((entry.entry_id, entry) for entry in partition.get_by_user_id(user_id))
+                continue
+            if month not in opened:
+                # Nothing saved here by this process, and other processes' saves raise the floor
+                continue
+            partition = self._shard(month)
+            if partition is None or since_version >= partition.get_data_version(user_id):
+                # Nothing of the user's saved here since
+                continue
+
+            changes = partition.get_changes(user_id, since_version)
+            if changes.reset:
+                return TimeEntryChanges(version, reset=True, entries=self.get_by_user_id(user_id))
+            entries.update((entry.entry_id, entry) for entry in changes.entries)
+            deleted_ids.update(changes.deleted_ids)
+
+        # An entry moved to another month is deleted from one and saved in the other
+        return TimeEntryChanges(version, entries=list(entries.values()),
+                                deleted_ids=sorted(deleted_ids - set(entries)))
+
+    def check_overlap(self, user_id: str, start_time: datetime, end_time: datetime,
+                     exclude_entry_id: Optional[str] = None) -> bool:
+        """Check if time range overlaps with existing entries"""
+        # Entries overlapping the range start before its end and end after its
+        # start. Like the SQLite repository's bound on the longest duration, a
+        # month is skipped unloaded when its longest entry, started at the end
+        # of the month, would still end by the range's start; a frozen month
+        # also when its summary has no entry of the user's ending later
+        self._refresh_layout()
+        with self._layout_lock:
+            months = [month for month in sorted(self._hot | set(self._frozen), reverse=True)
+                      if month <= month_of(end_time) and
+                      (self._longest.get(month) is None or
+                       _month_end(month) + timedelta(minutes=self._longest[month]) > start_time)]
+
+        for month in months:
+            with self._layout_lock:
+                summary = self._frozen.get(month)
+            if summary is not None and (user_id not in summary['user_id'] or not summary.get('latest_end') or
+                                        datetime.fromisoformat(summary['latest_end']) <= start_time):
+                continue
+            partition = self._shard(month)
+            if partition is not None and partition.check_overlap(user_id, start_time, end_time, exclude_entry_id):
+                return True
+        return False
+
+    def update(self, time_entry: TimeEntry) -> TimeEntry:
+        """Update existing time entry, moving it if its start time changed month"""
+        month = month_of(time_entry.start_time)
+        with self.batch():
+            found = self._locate(time_entry.entry_id, lambda partition, record_id: partition.get_by_id(record_id))
+            if found is None:
+                raise ValueError(f"Time entry with ID {time_entry.entry_id} not found")
+
+            if found[0] == month:
+                self._writable(month, [time_entry]).update(time_entry)
+            else:
+                self._writable(month, [time_entry]).create(time_entry)
+                self._shard(found[0], create=True).delete(time_entry.entry_id)
+        self._remember_owner(time_entry.entry_id, month)
+        return time_entry
+
+    def delete(self, entry_id: str) -> bool:
+        """Delete time entry by ID from the month holding it"""
+        with self.batch():
+            found = self._locate(entry_id, lambda partition, record_id: partition.get_by_id(record_id))
+            if found is None:
+                return False
+            self._forget_owner(entry_id)
+            return self._shard(found[0], create=True).delete(entry_id)
+
+    def list_all(self) -> List[TimeEntry]:
+        """Get all time entries"""
+        # Months are disjoint and each is sorted by start_time descending
+        return [entry for partition in self._partitions(newest_first=True) for entry in partition.list_all()]
+
+    def get_data_version(self, user_id: Optional[str] = None) -> int:
+        """Get a number that changes whenever any of user_id's records change, or any record if None"""
+        # Frozen months never change and freezing and thawing move the layout
+        # version; other processes' saves are seen in the current and running
+        # months directly and through the floor elsewhere
+        self._check_outside_changes()
+        versions = [partition.get_data_version(user_id) for _, partition in self._watched_partitions()]
+        with self._layout_lock:
+            if user_id is None:
+                # Every version comes from the shared clock
+                return self._clock.value
+            return max([self._layout_version, self._version_floor, self._user_versions.get(user_id, 0)] + versions)
+
+    def wait_for_change(self, user_id: Optional[str], version: int, timeout: float) -> int:
+        """Block until the data version of user_id differs from version, or timeout seconds pass, and return it
+
+        Saves through this repository wake waiters at once; changes made by
+        other processes are seen within CHANGE_POLL_INTERVAL seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            seen = self._clock.value
+            current = self.get_data_version(user_id)
+            remaining = deadline - time.monotonic()
+            if current != version or remaining <= 0:
+                return current
+            self._clock.wait(seen, min(remaining, self.CHANGE_POLL_INTERVAL))
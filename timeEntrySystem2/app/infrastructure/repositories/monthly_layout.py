@@ -0,0 +1,275 @@
+import json
+import math
+import os
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+from app.infrastructure.repositories.json_storage import (
+    JOURNAL_SUFFIX, SEGMENT_SUFFIX, SegmentStorage, SnapshotStorage, write_json, write_segment
+)
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+
+# Directory under the data directory that holds one directory per month
+PARTITION_ROOT = 'time_entries'
+# A month's entries, as a hot snapshot (plus journal) or a frozen segment
+PARTITION_FILE = 'time_entries.json'
+# Written after a month's segment; a segment without it is incomplete
+SEGMENT_SUMMARY = 'segment.json'
+# Under PARTITION_ROOT: every month, whether it is frozen and the longest
+# span of its entries, rewritten on each freeze, thaw, new month and longer
+# entry; its lock guards those changes
+LAYOUT_FILE = 'layout.json'
+# Under PARTITION_ROOT: the months that may hold running timers
+RUNNING_FILE = 'running.json'
+# Under PARTITION_ROOT: rewritten on every save to a month other than the
+# current one, so other processes notice without checking every month
+CHANGES_FILE = 'changes.json'
+
+_MONTH_PATTERN = re.compile(r'^\d{4}-\d{2}$')
+
+def span_minutes(start_time: datetime, end_time: Optional[datetime]) -> int:
+    """Get the whole minutes from start_time to end_time, rounded up, or 0 for a running timer"""
+    if end_time is None:
+        return 0
+    return max(0, math.ceil((end_time - start_time).total_seconds() / 60))
+
+def record_span(record: Dict[str, Any]) -> int:
+    """Get span_minutes() of a stored time entry record"""
+    if not record.get('end_time'):
+        return 0
+    return span_minutes(datetime.fromisoformat(record['start_time']), datetime.fromisoformat(record['end_time']))
+
+class MonthLayout:
+    """
+    The files shared by every process using a monthly repository's partitions
+
+    The layout file lists the months, whether each is frozen and the longest
+    span of its entries. The span only grows and is raised before an entry
+    that exceeds it is saved, so overlap checks can skip months whose
+    entries all end before a range starts without loading them. Freezing
+    and thawing a month's files happen here, under the month's write lock
+    and the layout file's lock.
+    """
+
+    def __init__(self, root: str, fsync: str = 'file'):
+        self.root = root
+        self.fsync = fsync
+        os.makedirs(root, exist_ok=True)
+        self._layout_storage = SnapshotStorage(os.path.join(root, LAYOUT_FILE), 'month', fsync)
+        self._running_storage = SnapshotStorage(os.path.join(root, RUNNING_FILE), 'month', fsync)
+        self._changes_storage = SnapshotStorage(os.path.join(root, CHANGES_FILE), 'month', fsync)
+        # Guards the cached file state below
+        self._lock = threading.Lock()
+        self._running_signature: Optional[tuple] = None
+        self._running_months: Set[str] = set()
+        self._changes_signature = self._changes_storage.signature()
+
+    def month_path(self, month: str) -> str:
+        """Get the directory holding a month's files"""
+        return os.path.join(self.root, month)
+
+    def lock(self):
+        """Hold the layout file's lock; re-entrant within a thread"""
+        return self._layout_storage.lock()
+
+    def signature(self) -> Optional[tuple]:
+        """Get a value that changes whenever the layout file does"""
+        return self._layout_storage.signature()
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Get the layout file's records, ordered by month"""
+        return self._layout_storage.load()
+
+    def scan(self) -> List[Dict[str, Any]]:
+        """Record the month directories on disk in the layout file and return its records; call with lock() held
+
+        Spans already recorded are kept; months without one are never
+        skipped by overlap checks until save_state() records a span counted
+        over all their entries.
+        """
+        stored = self._layout_storage.load()
+        spans = {record['month']: record['longest'] for record in stored if 'longest' in record}
+        layout = []
+        for month in sorted(os.listdir(self.root)):
+            if _MONTH_PATTERN.match(month) and os.path.isdir(self.month_path(month)):
+                record = {'month': month, 'frozen': self.is_frozen_on_disk(month)}
+                if month in spans:
+                    record['longest'] = spans[month]
+                layout.append(record)
+        if layout != stored:
+            self._layout_storage.save(layout, [])
+        return layout
+
+    def save_state(self, month: str, frozen: bool, longest: Optional[int] = None) -> None:
+        """Record a month as hot or frozen
+
+        longest is the span of the month's longest entry, counted over all
+        of them; None keeps the recorded span, or records 0 for a new month.
+        """
+        with self._layout_storage.lock():
+            stored = self._layout_storage.load()
+            current = next((record for record in stored if record['month'] == month), None)
+            record = {'month': month, 'frozen': frozen}
+            if current is None or 'longest' in current or longest is not None:
+                record['longest'] = max(current.get('longest', 0) if current else 0, longest or 0)
+            self._replace(stored, current, record)
+
+    def raise_longest(self, month: str, minutes: int) -> None:
+        """Record that a month holds an entry spanning minutes; call before saving it"""
+        with self._layout_storage.lock():
+            stored = self._layout_storage.load()
+            current = next((record for record in stored if record['month'] == month), None)
+            # An unknown span stays unknown until counted over all entries
+            if current is not None and current.get('longest', minutes) < minutes:
+                self._replace(stored, current, dict(current, longest=minutes))
+
+    def _replace(self, stored: List[Dict[str, Any]], current: Optional[Dict[str, Any]],
+                 record: Dict[str, Any]) -> None:
+        """Save the layout with current replaced by record, unless they are equal"""
+        if record == current:
+            return
+        layout = [other for other in stored if other['month'] != record['month']] + [record]
+        layout.sort(key=lambda other: other['month'])
+        self._layout_storage.save(layout, [])
+
+    def is_frozen_on_disk(self, month: str) -> bool:
+        """Check if a month's directory holds a complete segment"""
+        path = self.month_path(month)
+        return (os.path.exists(os.path.join(path, SEGMENT_SUMMARY)) and
+                os.path.exists(os.path.join(path, PARTITION_FILE) + SEGMENT_SUFFIX))
+
+    @contextmanager
+    def lock_month(self, month: str) -> Iterator[None]:
+        """Hold a month's write lock and the layout file's lock, in that order"""
+        filepath = os.path.join(self.month_path(month), PARTITION_FILE)
+        with SnapshotStorage(filepath, 'entry_id', self.fsync).lock(), self._layout_storage.lock():
+            yield
+
+    def remove_leftovers(self, month: str) -> None:
+        """Delete the hot files a freeze left next to a month's segment"""
+        filepath = os.path.join(self.month_path(month), PARTITION_FILE)
+        if not any(os.path.exists(path) for path in (filepath, filepath + JOURNAL_SUFFIX)):
+            return
+
+        # No process is writing or thawing the month while both locks are held
+        with self.lock_month(month):
+            if not self.is_frozen_on_disk(month):
+                # Thawed since the scan: the hot files are live again
+                return
+            for leftover in (filepath, filepath + JOURNAL_SUFFIX):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+
+    def read_summary(self, month: str) -> Optional[Dict[str, Any]]:
+        """Load a frozen month's segment summary, with the indexed fields as sets, or None if it has none"""
+        try:
+            with open(os.path.join(self.month_path(month), SEGMENT_SUMMARY), 'r') as f:
+                summary = json.load(f)
+        except FileNotFoundError:
+            return None
+        loaded = dict(summary)
+        for field in JsonTimeEntryRepository.INDEXED_FIELDS:
+            loaded[field] = set(summary.get(f'{field}s', []))
+        return loaded
+
+    def freeze(self, month: str, records: List[Dict[str, Any]]) -> None:
+        """Write a month's records as a segment with its summary and record it as frozen
+
+        Call while holding the month's write lock, so no write lands
+        between reading the records and the segment taking over.
+        """
+        path = self.month_path(month)
+        write_segment(os.path.join(path, PARTITION_FILE), records, self.fsync)
+        ends = [datetime.fromisoformat(record['end_time']) for record in records if record.get('end_time')]
+        summary = {
+            'entries': len(records),
+            'latest_end': max(ends).isoformat() if ends else None
+        }
+        for field in JsonTimeEntryRepository.INDEXED_FIELDS:
+            summary[f'{field}s'] = sorted({record.get(field) for record in records if record.get(field)})
+        write_json(os.path.join(path, SEGMENT_SUMMARY), summary, self.fsync)
+        self.save_state(month, True, max(record_span(record) for record in records))
+
+    def thaw(self, month: str) -> None:
+        """Turn a frozen month's segment back into a hot snapshot holding the same entries"""
+        path = self.month_path(month)
+        filepath = os.path.join(path, PARTITION_FILE)
+        with self.lock_month(month):
+            longest = None
+            if self.is_frozen_on_disk(month):
+                # Not already thawed by another process
+                records = SegmentStorage(filepath, 'entry_id').load()
+                longest = max((record_span(record) for record in records), default=0)
+
+                # The hot snapshot is complete before the segment stops being valid
+                if os.path.exists(filepath + JOURNAL_SUFFIX):
+                    os.remove(filepath + JOURNAL_SUFFIX)
+                write_json(filepath, records, self.fsync)
+                os.remove(os.path.join(path, SEGMENT_SUMMARY))
+                os.remove(filepath + SEGMENT_SUFFIX)
+            self.save_state(month, False, longest)
+
+    def add_month(self, month: str) -> None:
+        """Create a new hot month unless it exists"""
+        with self._layout_storage.lock():
+            if all(record['month'] != month for record in self._layout_storage.load()):
+                os.makedirs(self.month_path(month), exist_ok=True)
+                self.save_state(month, False)
+
+    def has_running_file(self) -> bool:
+        """Check if the running file exists"""
+        return os.path.exists(self._running_storage.filepath)
+
+    def seed_running(self, months: Iterable[str], has_running: Callable[[str], bool]) -> None:
+        """Write the running file from the months for which has_running is true, unless it exists"""
+        with self._running_storage.lock():
+            if self.has_running_file():
+                return
+            self._running_storage.save([{'month': month} for month in sorted(months) if has_running(month)], [])
+
+    def running_months(self) -> Set[str]:
+        """Get the months in the running file"""
+        signature = self._running_storage.signature()
+        with self._lock:
+            if signature != self._running_signature:
+                self._running_months = {record['month'] for record in self._running_storage.load()}
+                self._running_signature = signature
+            return set(self._running_months)
+
+    def record_running(self, month: str) -> None:
+        """Add a month to the running file; call after saving a running timer in it"""
+        with self._running_storage.lock():
+            records = self._running_storage.load()
+            if all(record['month'] != month for record in records):
+                records.append({'month': month})
+                records.sort(key=lambda record: record['month'])
+                self._running_storage.save(records, [])
+
+    def forget_running(self, month: str, still_running: Optional[Callable[[], bool]] = None) -> None:
+        """Drop a month from the running file unless still_running reports a running timer in it"""
+        with self._running_storage.lock():
+            # Timers saved after this check record their month again once the lock is free
+            if still_running is not None and still_running():
+                return
+            records = self._running_storage.load()
+            kept = [record for record in records if record['month'] != month]
+            if len(kept) != len(records):
+                self._running_storage.save(kept, [])
+
+    def changed_elsewhere(self) -> bool:
+        """Check if another process announced a change since the last check or announcement"""
+        signature = self._changes_storage.signature()
+        with self._lock:
+            if signature == self._changes_signature:
+                return False
+            self._changes_signature = signature
+            return True
+
+    def announce_change(self) -> None:
+        """Tell other processes about a save they would not otherwise notice"""
+        self._changes_storage.save([], [])
+        signature = self._changes_storage.signature()
+        with self._lock:
+            self._changes_signature = signature
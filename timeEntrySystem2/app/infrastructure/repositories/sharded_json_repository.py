@@ -0,0 +1,201 @@
+import os
+import threading
+import time
+from contextlib import contextmanager, ExitStack
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+from urllib.parse import quote, unquote
+
+R = TypeVar('R')
+
+# Directory under the data directory that holds one directory per user
+SHARD_ROOT = 'users'
+_SHARD_PREFIX = 'user-'
+
+def shard_dir(data_dir: str, user_id: str) -> str:
+    """Get the directory holding a user's shard files"""
+    # Quoting keeps any user ID a single, safe path component
+    return os.path.join(data_dir, SHARD_ROOT, _SHARD_PREFIX + quote(user_id, safe=''))
+
+def list_shard_users(data_dir: str) -> List[str]:
+    """Get the IDs of users that have a shard directory"""
+    root = os.path.join(data_dir, SHARD_ROOT)
+    if not os.path.isdir(root):
+        return []
+    return [unquote(name[len(_SHARD_PREFIX):]) for name in sorted(os.listdir(root))
+            if name.startswith(_SHARD_PREFIX) and os.path.isdir(os.path.join(root, name))]
+
+class BaseShardedJsonRepository(Generic[R]):
+    """
+    Base class for JSON repositories split into one repository per shard key
+
+    By default the key is a user ID: each user's records live in their own
+    directory (see shard_dir), with their own files, locks, cache and
+    indexes. Subclasses shard by another key by overriding _shard_path and
+    _shard_keys. Operations for one key only touch that key's shard, and
+    writes to different shards run in parallel. Lookups by record ID
+    remember which shard answered; unknown IDs are looked for in every
+    shard.
+    """
+
+    # Seconds between version checks while waiting for a change
+    CHANGE_POLL_INTERVAL = 1.0
+
+    def __init__(self, data_dir: str, create_shard: Callable[[str], R]):
+        self.data_dir = data_dir
+        self._create_shard = create_shard
+        self._shards: Dict[str, R] = {}
+        self._shards_lock = threading.Lock()
+        # record ID -> key of the shard it was last found in
+        self._owners: Dict[str, str] = {}
+        # The calling thread's open batch(): its ExitStack, entered shards and after-save callbacks
+        self._local = threading.local()
+
+    def _shard_path(self, key: str) -> str:
+        """Get the directory holding a shard's files"""
+        return shard_dir(self.data_dir, key)
+
+    def _shard_keys(self) -> List[str]:
+        """Get the keys of existing shards, in the order lookups by ID try them"""
+        return list_shard_users(self.data_dir)
+
+    def _shard(self, key: str, create: bool = False) -> Optional[R]:
+        """Get a key's shard, or None if it has none and create is False"""
+        with self._shards_lock:
+            shard = self._shards.get(key)
+            if shard is None:
+                path = self._shard_path(key)
+                if not create and not os.path.isdir(path):
+                    return None
+                os.makedirs(path, exist_ok=True)
+                shard = self._shards[key] = self._create_shard(path)
+        self._join_batch(shard)
+        return shard
+
+    def _all_shards(self) -> List[R]:
+        """Get every shard"""
+        return [self._shard(key) for key in self._shard_keys()]
+
+    def _locate(self, record_id: str, get: Callable[[R, str], Optional[Any]]) -> Optional[Tuple[str, Any]]:
+        """Find a record with get(shard, record_id), trying the shard that last held it first
+
+        Returns the owning shard's key and the record, or None if no shard has it.
+        """
+        key = self._owners.get(record_id)
+        if key is not None:
+            shard = self._shard(key)
+            record = get(shard, record_id) if shard is not None else None
+            if record is not None:
+                return key, record
+
+        for key in self._shard_keys():
+            record = get(self._shard(key), record_id)
+            if record is not None:
+                self._owners[record_id] = key
+                return key, record
+        self._owners.pop(record_id, None)
+        return None
+
+    def _locate_many(self, record_ids: List[str], get_many: Callable[[R, List[str]], List[Any]],
+                     id_of: Callable[[Any], str]) -> List[Any]:
+        """Find records with get_many(shard, ids), in the given order, skipping unknown IDs
+
+        IDs whose shard is remembered are looked up there; the rest are
+        asked of each shard in turn until all are found.
+        """
+        found: Dict[str, Any] = {}
+        known: Dict[str, List[str]] = {}
+        for record_id in record_ids:
+            key = self._owners.get(record_id)
+            if key is not None:
+                known.setdefault(key, []).append(record_id)
+        for key, ids in known.items():
+            shard = self._shard(key)
+            if shard is not None:
+                for record in get_many(shard, ids):
+                    found[id_of(record)] = record
+
+        missing = [record_id for record_id in record_ids if record_id not in found]
+        for key in self._shard_keys():
+            if not missing:
+                break
+            for record in get_many(self._shard(key), missing):
+                found[id_of(record)] = record
+                self._owners[id_of(record)] = key
+            missing = [record_id for record_id in missing if record_id not in found]
+        return [found[record_id] for record_id in record_ids if record_id in found]
+
+    def _remember_owner(self, record_id: str, key: str) -> None:
+        """Note which shard holds a record"""
+        self._owners[record_id] = key
+
+    def _forget_owner(self, record_id: str) -> None:
+        """Drop a deleted record's shard"""
+        self._owners.pop(record_id, None)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group changes into a single save per shard
+
+        Each shard touched inside the block joins the batch and saves when
+        the block exits, or discards its changes if it raises. Shards save
+        one after another, so a failure can leave earlier shards saved.
+        """
+        if getattr(self._local, 'stack', None) is not None:
+            # Nested batch: the outermost one saves
+            yield
+            return
+
+        saved: List[Callable[[], None]] = []
+        self._local.after_save = saved
+        try:
+            with ExitStack() as stack:
+                self._local.stack = stack
+                self._local.joined = set()
+                try:
+                    yield
+                finally:
+                    self._local.stack = None
+                    self._local.joined = None
+        finally:
+            self._local.after_save = None
+        # Every shard has saved and released its locks
+        for callback in saved:
+            callback()
+
+    def _after_save(self, callback: Callable[[], None]) -> None:
+        """Run callback once the calling thread's batch has saved, or now if it has none open"""
+        saved = getattr(self._local, 'after_save', None)
+        if saved is None:
+            callback()
+        else:
+            saved.append(callback)
+
+    def _join_batch(self, shard: R) -> None:
+        """Enter the shard's batch() if the calling thread has a batch open"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is not None and shard not in self._local.joined:
+            self._local.joined.add(shard)
+            stack.enter_context(shard.batch())
+
+    def get_data_version(self, user_id: Optional[str] = None) -> int:
+        """Get a number that changes whenever any of user_id's records change, or any record if None"""
+        if user_id is None:
+            # Shard versions only grow, so their sum changes whenever any of them does
+            return sum(shard.get_data_version() for shard in self._all_shards())
+        shard = self._shard(user_id)
+        return shard.get_data_version(user_id) if shard is not None else 0
+
+    def wait_for_change(self, user_id: Optional[str], version: int, timeout: float) -> int:
+        """Block until the data version of user_id differs from version, or timeout seconds pass, and return it"""
+        shard = self._shard(user_id) if user_id is not None else None
+        if shard is not None:
+            return shard.wait_for_change(user_id, version, timeout)
+
+        # Nothing to wait on yet: poll until a shard appears or changes
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self.get_data_version(user_id)
+            remaining = deadline - time.monotonic()
+            if current != version or remaining <= 0:
+                return current
+            time.sleep(min(remaining, self.CHANGE_POLL_INTERVAL))
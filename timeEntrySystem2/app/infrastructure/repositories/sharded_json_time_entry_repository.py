@@ -0,0 +1,187 @@
+import heapq
+from collections import defaultdict
+from typing import List, Optional, Dict, Iterator, Tuple
+from datetime import datetime, date
+from app.core.entities.time_entry import TimeEntry
+from app.core.entities.daily_rollup import DailyRollup
+from app.core.entities.range_aggregate import RangeAggregate
+from app.core.entities.time_entry_changes import TimeEntryChanges
+from app.core.entities.search_query import SearchQuery
+from app.core.interfaces.time_entry_repository import ITimeEntryRepository
+from app.core.services.change_event_bus import ChangeEventBus
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.sharded_json_repository import BaseShardedJsonRepository
+from app.infrastructure.repositories.time_entry_column_store import (
+    TimeEntryColumns, TimeEntryColumnStore, aggregate_columns, COLUMNS_AVAILABLE
+)
+
+class ShardedJsonTimeEntryRepository(BaseShardedJsonRepository[JsonTimeEntryRepository], ITimeEntryRepository):
+    """
+    Time entry repository with one JsonTimeEntryRepository per user
+
+    Per-user queries, including the running timer, date ranges, reports
+    and overlap checks, read only the user's own file. Queries by project
+    or timesheet visit every shard.
+    """
+
+    def __init__(self, data_dir: str, storage: str = 'snapshot',
+                 fsync: str = 'file', event_bus: Optional[ChangeEventBus] = None):
+        super().__init__(data_dir, lambda path: JsonTimeEntryRepository(path, storage, fsync, event_bus))
+
+    def create(self, time_entry: TimeEntry) -> TimeEntry:
+        """Create a new time entry in its user's shard"""
+        self._shard(time_entry.user_id, create=True).create(time_entry)
+        self._remember_owner(time_entry.entry_id, time_entry.user_id)
+        return time_entry
+
+    def create_many(self, time_entries: List[TimeEntry]) -> List[TimeEntry]:
+        """Create several time entries with one write per user's shard"""
+        by_user: Dict[str, List[TimeEntry]] = defaultdict(list)
+        for time_entry in time_entries:
+            by_user[time_entry.user_id].append(time_entry)
+
+        with self.batch():
+            for user_id, entries in by_user.items():
+                self._shard(user_id, create=True).create_many(entries)
+        for time_entry in time_entries:
+            self._remember_owner(time_entry.entry_id, time_entry.user_id)
+        return time_entries
+
+    def get_by_id(self, entry_id: str) -> Optional[TimeEntry]:
+        """Get time entry by ID"""
+        found = self._locate(entry_id, lambda shard, record_id: shard.get_by_id(record_id))
+        return found[1] if found else None
+
+    def get_many(self, entry_ids: List[str]) -> List[TimeEntry]:
+        """Get time entries for a list of IDs"""
+        return self._locate_many(entry_ids, lambda shard, ids: shard.get_many(ids), lambda e: e.entry_id)
+
+    def get_by_user_id(self, user_id: str) -> List[TimeEntry]:
+        """Get all time entries for a user"""
+        shard = self._shard(user_id)
+        return shard.get_by_user_id(user_id) if shard is not None else []
+
+    def get_by_project_id(self, project_id: str) -> List[TimeEntry]:
+        """Get all time entries for a project from every shard"""
+        entries = [entry for shard in self._all_shards() for entry in shard.get_by_project_id(project_id)]
+
+        # Sort by start_time descending
+        entries.sort(key=lambda e: e.start_time, reverse=True)
+        return entries
+
+    def get_by_timesheet_id(self, timesheet_id: str) -> List[TimeEntry]:
+        """Get all time entries for a timesheet from every shard"""
+        entries = [entry for shard in self._all_shards() for entry in shard.get_by_timesheet_id(timesheet_id)]
+
+        # Sort by start_time ascending for timesheet view
+        entries.sort(key=lambda e: e.start_time)
+        return entries
+
+    def get_running_timer(self, user_id: str) -> Optional[TimeEntry]:
+        """Get currently running timer for a user"""
+        shard = self._shard(user_id)
+        return shard.get_running_timer(user_id) if shard is not None else None
+
+    def get_by_date_range(self, user_id: str, start_date: date, end_date: date) -> List[TimeEntry]:
+        """Get time entries within a date range for a user"""
+        shard = self._shard(user_id)
+        return shard.get_by_date_range(user_id, start_date, end_date) if shard is not None else []
+
+    def iter_by_date_range(self, user_id: str, start_date: date, end_date: date) -> Iterator[TimeEntry]:
+        """Yield time entries within a date range for a user, ordered by start time"""
+        shard = self._shard(user_id)
+        if shard is not None:
+            yield from shard.iter_by_date_range(user_id, start_date, end_date)
+
+    def get_page(self, user_id: str, limit: Optional[int] = None, after: Optional[Tuple[datetime, str]] = None,
+                 start_date: Optional[date] = None, end_date: Optional[date] = None,
+                 project_id: Optional[str] = None) -> List[TimeEntry]:
+        """Get up to limit of a user's entries ordered by (start_time, entry_id) descending, starting after the given key"""
+        shard = self._shard(user_id)
+        if shard is None:
+            return []
+        return shard.get_page(user_id, limit, after, start_date, end_date, project_id)
+
+    def get_by_project_and_date_range(self, project_id: str, start_date: date, end_date: date) -> List[TimeEntry]:
+        """Get time entries for a project within a date range from every shard"""
+        # Each shard's entries are already sorted by start_time ascending
+        return list(heapq.merge(*(shard.get_by_project_and_date_range(project_id, start_date, end_date)
+                                  for shard in self._all_shards()),
+                                key=lambda e: e.start_time))
+
+    def get_daily_rollups(self, user_id: str, start_date: date, end_date: date,
+                          project_id: Optional[str] = None) -> List[DailyRollup]:
+        """Get per-day, per-project totals for a user within a date range"""
+        shard = self._shard(user_id)
+        return shard.get_daily_rollups(user_id, start_date, end_date, project_id) if shard is not None else []
+
+    def get_range_totals(self, user_id: str, start_date: date, end_date: date,
+                         project_id: Optional[str] = None) -> Tuple[int, int]:
+        """Get (total minutes, entry count) of a user's entries starting within a date range"""
+        shard = self._shard(user_id)
+        return shard.get_range_totals(user_id, start_date, end_date, project_id) if shard is not None else (0, 0)
+
+    def get_project_totals(self, user_id: str, start_date: Optional[date] = None,
+                           end_date: Optional[date] = None) -> Dict[str, Tuple[int, int]]:
+        """Get project_id -> (total minutes, entry count) of a user's entries, for projects with entries"""
+        shard = self._shard(user_id)
+        return shard.get_project_totals(user_id, start_date, end_date) if shard is not None else {}
+
+    def get_columns(self, user_id: str, start_date: date, end_date: date) -> Optional[TimeEntryColumns]:
+        """Get a user's entries starting within a date range as NumPy columns, or None without NumPy"""
+        shard = self._shard(user_id)
+        if shard is not None:
+            return shard.get_columns(user_id, start_date, end_date)
+        return TimeEntryColumnStore().select(start_date, end_date) if COLUMNS_AVAILABLE else None
+
+    def aggregate_range(self, user_id: str, start_date: date, end_date: date,
+                        by_day: bool = False, by_week: bool = False) -> Optional[RangeAggregate]:
+        """Total a user's entries starting within a date range over NumPy columns, or None without NumPy"""
+        columns = self.get_columns(user_id, start_date, end_date)
+        return aggregate_columns(columns, end_date, by_day, by_week) if columns is not None else None
+
+    def search_descriptions(self, user_id: str, query: SearchQuery,
+                            start_date: Optional[date] = None, end_date: Optional[date] = None,
+                            project_id: Optional[str] = None) -> List[Tuple[str, datetime, float]]:
+        """Get (entry_id, start_time, relevance) of a user's entries whose descriptions match query"""
+        shard = self._shard(user_id)
+        if shard is None:
+            return []
+        return shard.search_descriptions(user_id, query, start_date, end_date, project_id)
+
+    def get_changes(self, user_id: str, since_version: Optional[int] = None) -> TimeEntryChanges:
+        """Get a user's entries saved or deleted after since_version, or all of them if that version is not known"""
+        shard = self._shard(user_id)
+        if shard is not None:
+            return shard.get_changes(user_id, since_version)
+        # No shard yet: version 0 has no entries
+        return TimeEntryChanges(0, reset=since_version != 0)
+
+    def check_overlap(self, user_id: str, start_time: datetime, end_time: datetime,
+                     exclude_entry_id: Optional[str] = None) -> bool:
+        """Check if time range overlaps with existing entries"""
+        shard = self._shard(user_id)
+        return shard is not None and shard.check_overlap(user_id, start_time, end_time, exclude_entry_id)
+
+    def update(self, time_entry: TimeEntry) -> TimeEntry:
+        """Update existing time entry in its user's shard"""
+        shard = self._shard(time_entry.user_id)
+        if shard is None:
+            raise ValueError(f"Time entry with ID {time_entry.entry_id} not found")
+        return shard.update(time_entry)
+
+    def delete(self, entry_id: str) -> bool:
+        """Delete time entry by ID from the shard holding it"""
+        found = self._locate(entry_id, lambda shard, record_id: shard.get_by_id(record_id))
+        if found is None:
+            return False
+        self._forget_owner(entry_id)
+        return self._shard(found[0]).delete(entry_id)
+
+    def list_all(self) -> List[TimeEntry]:
+        """Get all time entries from every shard"""
+        entries = [entry for shard in self._all_shards() for entry in shard.list_all()]
+
+        # Sort by start_time descending
+        entries.sort(key=lambda e: e.start_time, reverse=True)
+        return entries
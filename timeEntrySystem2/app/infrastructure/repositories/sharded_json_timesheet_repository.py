@@ -0,0 +1,80 @@
+from typing import List, Optional
+from datetime import date
+from app.core.entities.timesheet import Timesheet, TimesheetStatus
+from app.core.interfaces.timesheet_repository import ITimesheetRepository
+from app.core.services.change_event_bus import ChangeEventBus
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+from app.infrastructure.repositories.sharded_json_repository import BaseShardedJsonRepository
+
+class ShardedJsonTimesheetRepository(BaseShardedJsonRepository[JsonTimesheetRepository], ITimesheetRepository):
+    """
+    Timesheet repository with one JsonTimesheetRepository per user
+    """
+
+    def __init__(self, data_dir: str, storage: str = 'snapshot',
+                 fsync: str = 'file', event_bus: Optional[ChangeEventBus] = None):
+        super().__init__(data_dir, lambda path: JsonTimesheetRepository(path, storage, fsync, event_bus))
+
+    def create(self, timesheet: Timesheet) -> Timesheet:
+        """Create a new timesheet in its user's shard"""
+        self._shard(timesheet.user_id, create=True).create(timesheet)
+        self._remember_owner(timesheet.timesheet_id, timesheet.user_id)
+        return timesheet
+
+    def get_by_id(self, timesheet_id: str) -> Optional[Timesheet]:
+        """Get timesheet by ID"""
+        found = self._locate(timesheet_id, lambda shard, record_id: shard.get_by_id(record_id))
+        return found[1] if found else None
+
+    def get_many(self, timesheet_ids: List[str]) -> List[Timesheet]:
+        """Get timesheets for a list of IDs"""
+        return self._locate_many(timesheet_ids, lambda shard, ids: shard.get_many(ids), lambda t: t.timesheet_id)
+
+    def get_by_user_id(self, user_id: str) -> List[Timesheet]:
+        """Get all timesheets for a user"""
+        shard = self._shard(user_id)
+        return shard.get_by_user_id(user_id) if shard is not None else []
+
+    def get_by_user_and_status(self, user_id: str, status: TimesheetStatus) -> List[Timesheet]:
+        """Get timesheets by user and status"""
+        shard = self._shard(user_id)
+        return shard.get_by_user_and_status(user_id, status) if shard is not None else []
+
+    def get_by_period(self, user_id: str, start_date: date, end_date: date) -> Optional[Timesheet]:
+        """Get timesheet for a specific period"""
+        shard = self._shard(user_id)
+        return shard.get_by_period(user_id, start_date, end_date) if shard is not None else None
+
+    def check_period_overlap(self, user_id: str, start_date: date, end_date: date,
+                             exclude_timesheet_id: Optional[str] = None) -> bool:
+        """Check if period overlaps with existing timesheets"""
+        shard = self._shard(user_id)
+        return shard is not None and shard.check_period_overlap(user_id, start_date, end_date, exclude_timesheet_id)
+
+    def get_by_date_range(self, user_id: str, start_date: date, end_date: date) -> List[Timesheet]:
+        """Get timesheets that overlap with a date range"""
+        shard = self._shard(user_id)
+        return shard.get_by_date_range(user_id, start_date, end_date) if shard is not None else []
+
+    def update(self, timesheet: Timesheet) -> Timesheet:
+        """Update existing timesheet in its user's shard"""
+        shard = self._shard(timesheet.user_id)
+        if shard is None:
+            raise ValueError(f"Timesheet with ID {timesheet.timesheet_id} not found")
+        return shard.update(timesheet)
+
+    def delete(self, timesheet_id: str) -> bool:
+        """Delete timesheet by ID from the shard holding it"""
+        found = self._locate(timesheet_id, lambda shard, record_id: shard.get_by_id(record_id))
+        if found is None:
+            return False
+        self._forget_owner(timesheet_id)
+        return self._shard(found[0]).delete(timesheet_id)
+
+    def list_all(self) -> List[Timesheet]:
+        """Get all timesheets from every shard"""
+        timesheets = [timesheet for shard in self._all_shards() for timesheet in shard.list_all()]
+
+        # Sort by start_date descending
+        timesheets.sort(key=lambda t: t.start_date, reverse=True)
+        return timesheets
@@ -0,0 +1,77 @@
+from typing import List, Optional, Dict, Any
+from app.core.entities.project import Project, ProjectStatus
+from app.core.interfaces.project_repository import IProjectRepository
+from app.infrastructure.repositories.base_sqlite_repository import BaseSqliteRepository
+
+class SqliteProjectRepository(BaseSqliteRepository[Project], IProjectRepository):
+    """
+    SQLite implementation of project repository
+    """
+
+    def _to_entity(self, row: Dict[str, Any]) -> Project:
+        """Convert database row to Project entity"""
+        return Project.from_dict(row)
+
+    def _from_entity(self, entity: Project) -> Dict[str, Any]:
+        """Convert Project entity to database row"""
+        return entity.to_dict()
+
+    def _get_table(self) -> str:
+        """Get the table name"""
+        return "projects"
+
+    def _get_id_field(self) -> str:
+        """Get the ID field name"""
+        return "project_id"
+
+    def create(self, project: Project) -> Project:
+        """Create a new project"""
+        if self._exists(project.project_id):
+            raise ValueError(f"Project with ID {project.project_id} already exists")
+
+        if self.get_by_name(project.user_id, project.name):
+            raise ValueError(f"Project name '{project.name}' already exists for this user")
+
+        self._insert(self._from_entity(project))
+        return project
+
+    def get_by_id(self, project_id: str) -> Optional[Project]:
+        """Get project by ID"""
+        row = self._get_row(project_id)
+        return self._to_entity(row) if row else None
+
+    def get_by_user_id(self, user_id: str) -> List[Project]:
+        """Get all projects for a user"""
+        rows = self._query('SELECT * FROM projects WHERE user_id = ? ORDER BY created_at DESC', (user_id,))
+        return [self._to_entity(row) for row in rows]
+
+    def get_by_user_and_status(self, user_id: str, status: ProjectStatus) -> List[Project]:
+        """Get projects by user and status"""
+        rows = self._query('SELECT * FROM projects WHERE user_id = ? AND status = ? ORDER BY created_at DESC',
+                           (user_id, status.value))
+        return [self._to_entity(row) for row in rows]
+
+    def get_by_name(self, user_id: str, name: str) -> Optional[Project]:
+        """Get project by user and name"""
+        row = self._query_one('SELECT * FROM projects WHERE user_id = ? AND name = ? LIMIT 1', (user_id, name))
+        return self._to_entity(row) if row else None
+
+    def update(self, project: Project) -> Project:
+        """Update existing project"""
+        if not self._exists(project.project_id):
+            raise ValueError(f"Project with ID {project.project_id} not found")
+
+        if self._query_one('SELECT 1 FROM projects WHERE user_id = ? AND name = ? AND project_id != ?',
+                           (project.user_id, project.name, project.project_id)):
+            raise ValueError(f"Project name '{project.name}' already exists for this user")
+
+        self._update_row(self._from_entity(project))
+        return project
+
+    def delete(self, project_id: str) -> bool:
+        """Delete project by ID"""
+        return self._delete_row(project_id)
+
+    def list_all(self) -> List[Project]:
+        """Get all projects"""
+        return [self._to_entity(row) for row in self._query('SELECT * FROM projects ORDER BY created_at DESC')]
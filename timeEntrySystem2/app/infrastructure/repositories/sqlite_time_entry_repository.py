@@ -0,0 +1,276 @@
+import sqlite3
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+from datetime import datetime, date, timedelta
+from app.core.entities.time_entry import TimeEntry
+from app.core.entities.daily_rollup import DailyRollup
+from app.core.entities.time_entry_changes import TimeEntryChanges
+from app.core.entities.search_query import SearchQuery
+from app.core.interfaces.time_entry_repository import ITimeEntryRepository
+from app.infrastructure.repositories.base_sqlite_repository import BaseSqliteRepository, ROLLUP_SELECT
+
+class SqliteTimeEntryRepository(BaseSqliteRepository[TimeEntry], ITimeEntryRepository):
+    """
+    SQLite implementation of time entry repository
+    """
+
+    def __init__(self, db_path: str):
+        super().__init__(db_path)
+        # Databases created before daily_rollups existed need it filled once
+        if (self._query_one('SELECT 1 FROM daily_rollups LIMIT 1') is None and
+                self._query_one('SELECT 1 FROM time_entries LIMIT 1') is not None):
+            self.rebuild_rollups()
+        # Likewise the description search index
+        if (self._query_one('SELECT 1 FROM time_entries_fts_docsize LIMIT 1') is None and
+                self._query_one('SELECT 1 FROM time_entries LIMIT 1') is not None):
+            self.rebuild_search_index()
+
+    def _to_entity(self, row: Dict[str, Any]) -> TimeEntry:
+        """Convert database row to TimeEntry entity"""
+        row['is_running'] = bool(row.get('is_running'))
+        return TimeEntry.from_dict(row)
+
+    def _from_entity(self, entity: TimeEntry) -> Dict[str, Any]:
+        """Convert TimeEntry entity to database row"""
+        row = entity.to_dict()
+        row['is_running'] = int(row['is_running'])
+        return row
+
+    def _get_table(self) -> str:
+        """Get the table name"""
+        return "time_entries"
+
+    def _get_id_field(self) -> str:
+        """Get the ID field name"""
+        return "entry_id"
+
+    def create(self, time_entry: TimeEntry) -> TimeEntry:
+        """Create a new time entry"""
+        if self._exists(time_entry.entry_id):
+            raise ValueError(f"Time entry with ID {time_entry.entry_id} already exists")
+
+        self._insert(self._from_entity(time_entry))
+        return time_entry
+
+    def create_many(self, time_entries: List[TimeEntry]) -> List[TimeEntry]:
+        """Create several time entries in one transaction"""
+        try:
+            self._insert_many([self._from_entity(time_entry) for time_entry in time_entries])
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Time entry already exists: {e}") from e
+        return time_entries
+
+    def get_by_id(self, entry_id: str) -> Optional[TimeEntry]:
+        """Get time entry by ID"""
+        row = self._get_row(entry_id)
+        return self._to_entity(row) if row else None
+
+    def get_many(self, entry_ids: List[str]) -> List[TimeEntry]:
+        """Get time entries for a list of IDs"""
+        return [self._to_entity(row) for row in self._get_rows(entry_ids)]
+
+    def get_by_user_id(self, user_id: str) -> List[TimeEntry]:
+        """Get all time entries for a user"""
+        rows = self._query('SELECT * FROM time_entries WHERE user_id = ? ORDER BY start_time DESC', (user_id,))
+        return [self._to_entity(row) for row in rows]
+
+    def get_by_project_id(self, project_id: str) -> List[TimeEntry]:
+        """Get all time entries for a project"""
+        rows = self._query('SELECT * FROM time_entries WHERE project_id = ? ORDER BY start_time DESC', (project_id,))
+        return [self._to_entity(row) for row in rows]
+
+    def get_by_timesheet_id(self, timesheet_id: str) -> List[TimeEntry]:
+        """Get all time entries for a timesheet"""
+        rows = self._query('SELECT * FROM time_entries WHERE timesheet_id IS ? ORDER BY start_time', (timesheet_id,))
+        return [self._to_entity(row) for row in rows]
+
+    def get_running_timer(self, user_id: str) -> Optional[TimeEntry]:
+        """Get currently running timer for a user"""
+        row = self._query_one('SELECT * FROM time_entries WHERE user_id = ? AND is_running = 1 LIMIT 1', (user_id,))
+        return self._to_entity(row) if row else None
+
+    def get_by_date_range(self, user_id: str, start_date: date, end_date: date) -> List[TimeEntry]:
+        """Get time entries within a date range for a user"""
+        rows = self._query(
+            'SELECT * FROM time_entries WHERE user_id = ? AND start_time >= ? AND start_time < ? '
+            'ORDER BY start_time',
+            (user_id, start_date.isoformat(), (end_date + timedelta(days=1)).isoformat()))
+        return [self._to_entity(row) for row in rows]
+
+    def iter_by_date_range(self, user_id: str, start_date: date, end_date: date) -> Iterator[TimeEntry]:
+        """Yield time entries within a date range for a user, ordered by start time"""
+        rows = self._iter_query(
+            'SELECT * FROM time_entries WHERE user_id = ? AND start_time >= ? AND start_time < ? '
+            'ORDER BY start_time',
+            (user_id, start_date.isoformat(), (end_date + timedelta(days=1)).isoformat()))
+        for row in rows:
+            yield self._to_entity(row)
+
+    def get_page(self, user_id: str, limit: Optional[int] = None, after: Optional[Tuple[datetime, str]] = None,
+                 start_date: Optional[date] = None, end_date: Optional[date] = None,
+                 project_id: Optional[str] = None) -> List[TimeEntry]:
+        """Get up to limit of a user's entries ordered by (start_time, entry_id) descending, starting after the given key"""
+        sql, params = self._add_filters('SELECT * FROM time_entries WHERE user_id = ?', (user_id,),
+                                        start_date, end_date, project_id)
+        if after is not None:
+            # A row-value comparison lets SQLite seek the (user_id, start_time, entry_id) index
+            sql += ' AND (start_time, entry_id) < (?, ?)'
+            params += (after[0].isoformat(), after[1])
+        sql += ' ORDER BY start_time DESC, entry_id DESC LIMIT ?'
+        params += (limit if limit is not None else -1,)
+        return [self._to_entity(row) for row in self._query(sql, params)]
+
+    def get_by_project_and_date_range(self, project_id: str, start_date: date, end_date: date) -> List[TimeEntry]:
+        """Get time entries for a project within a date range"""
+        rows = self._query(
+            'SELECT * FROM time_entries WHERE project_id = ? AND start_time >= ? AND start_time < ? '
+            'ORDER BY start_time',
+            (project_id, start_date.isoformat(), (end_date + timedelta(days=1)).isoformat()))
+        return [self._to_entity(row) for row in rows]
+
+    def get_daily_rollups(self, user_id: str, start_date: date, end_date: date,
+                          project_id: Optional[str] = None) -> List[DailyRollup]:
+        """Get per-day, per-project totals for a user within a date range"""
+        sql = 'SELECT * FROM daily_rollups WHERE user_id = ? AND day >= ? AND day <= ?'
+        params = (user_id, start_date.isoformat(), end_date.isoformat())
+        if project_id is not None:
+            sql += ' AND project_id = ?'
+            params += (project_id,)
+        return [DailyRollup.from_dict(row) for row in self._query(sql + ' ORDER BY day', params)]
+
+    def get_range_totals(self, user_id: str, start_date: date, end_date: date,
+                         project_id: Optional[str] = None) -> Tuple[int, int]:
+        """Get (total minutes, entry count) of a user's entries starting within a date range"""
+        # Sums one rollup row per project and day from the primary key range
+        sql = ('SELECT COALESCE(SUM(minutes), 0) AS minutes, COALESCE(SUM(entry_count), 0) AS entry_count '
+               'FROM daily_rollups WHERE user_id = ? AND day >= ? AND day <= ?')
+        params = (user_id, start_date.isoformat(), end_date.isoformat())
+        if project_id is not None:
+            sql += ' AND project_id = ?'
+            params += (project_id,)
+        row = self._query_one(sql, params)
+        return row['minutes'], row['entry_count']
+
+    def get_project_totals(self, user_id: str, start_date: Optional[date] = None,
+                           end_date: Optional[date] = None) -> Dict[str, Tuple[int, int]]:
+        """Get project_id -> (total minutes, entry count) of a user's entries, for projects with entries"""
+        rows = self._query(
+            'SELECT project_id, SUM(minutes) AS minutes, SUM(entry_count) AS entry_count FROM daily_rollups '
+            'WHERE user_id = ? AND day >= ? AND day <= ? GROUP BY project_id',
+            (user_id, (start_date or date.min).isoformat(), (end_date or date.max).isoformat()))
+        return {row['project_id']: (row['minutes'], row['entry_count']) for row in rows if row['entry_count']}
+
+    def rebuild_rollups(self) -> None:
+        """Recompute daily_rollups from all time entries"""
+        connection = self._connection()
+        with connection:
+            connection.execute('DELETE FROM daily_rollups')
+            connection.execute('INSERT INTO daily_rollups ' + ROLLUP_SELECT +
+                               'GROUP BY user_id, project_id, substr(start_time, 1, 10)')
+
+    def rebuild_search_index(self) -> None:
+        """Reindex all entry descriptions"""
+        connection = self._connection()
+        with connection:
+            connection.execute("INSERT INTO time_entries_fts (time_entries_fts) VALUES ('rebuild')")
+
+    def search_descriptions(self, user_id: str, query: SearchQuery,
+                            start_date: Optional[date] = None, end_date: Optional[date] = None,
+                            project_id: Optional[str] = None) -> List[Tuple[str, datetime, float]]:
+        """Get (entry_id, start_time, relevance) of a user's entries whose descriptions match query"""
+        if query.is_empty():
+            return []
+        # A term matches the words starting with it through a prefix query,
+        # and the words containing it further in, looked up in the index
+        # vocabulary. Phrases are exact. The query tokens hold only letters
+        # and digits, so quoting them is safe.
+        clauses = []
+        for term in query.terms:
+            words = [f'"{term}"*'] + ['"' + row['term'].replace('"', '""') + '"' for row in self._query(
+                'SELECT term FROM time_entries_fts_vocab WHERE instr(term, ?) > 1', (term,))]
+            clauses.append('(' + ' OR '.join(words) + ')')
+        match = ' AND '.join(clauses + ['"' + ' '.join(phrase) + '"' for phrase in query.phrases])
+        sql = ('SELECT time_entries.entry_id, time_entries.start_time, -bm25(time_entries_fts) AS relevance '
+               'FROM time_entries_fts JOIN time_entries ON time_entries.rowid = time_entries_fts.rowid '
+               'WHERE time_entries_fts MATCH ? AND time_entries.user_id = ?')
+        params = (match, user_id)
+        sql, params = self._add_filters(sql, params, start_date, end_date, project_id, 'time_entries.')
+        return [(row['entry_id'], datetime.fromisoformat(row['start_time']), row['relevance'])
+                for row in self._query(sql, params)]
+
+    def _add_filters(self, sql: str, params: tuple, start_date: Optional[date], end_date: Optional[date],
+                     project_id: Optional[str], prefix: str = '') -> Tuple[str, tuple]:
+        """Append optional start date and project conditions to a WHERE clause"""
+        if start_date is not None:
+            sql += f' AND {prefix}start_time >= ?'
+            params += (start_date.isoformat(),)
+        if end_date is not None:
+            sql += f' AND {prefix}start_time < ?'
+            params += ((end_date + timedelta(days=1)).isoformat(),)
+        if project_id is not None:
+            sql += f' AND {prefix}project_id = ?'
+            params += (project_id,)
+        return sql, params
+
+    def get_data_version(self, user_id: Optional[str] = None) -> int:
+        """Get the latest change version of user_id's time entries, or of any time entry if None"""
+        # Change versions come from one sequence, so delta sync clients can
+        # use the version also sent with ETags and event streams
+        if user_id is None:
+            row = self._query_one('SELECT COALESCE(MAX(version), 0) AS version FROM time_entry_changes')
+        else:
+            row = self._query_one('SELECT COALESCE(MAX(version), 0) AS version FROM time_entry_changes '
+                                  'WHERE user_id = ?', (user_id,))
+        return row['version']
+
+    def get_changes(self, user_id: str, since_version: Optional[int] = None) -> TimeEntryChanges:
+        """Get a user's entries saved or deleted after since_version, or all of them if that version is not known"""
+        version = self.get_data_version(user_id)
+        if since_version is None or since_version > version:
+            return TimeEntryChanges(version, reset=True, entries=self.get_by_user_id(user_id))
+
+        # Changes committed after version are left for the next call
+        rows = self._query(
+            'SELECT c.entry_id AS changed_id, c.deleted AS change_deleted, e.* FROM time_entry_changes c '
+            'LEFT JOIN time_entries e ON e.entry_id = c.entry_id AND c.deleted = 0 '
+            'WHERE c.user_id = ? AND c.version > ? AND c.version <= ? ORDER BY c.version',
+            (user_id, since_version, version))
+        changes = TimeEntryChanges(version)
+        for row in rows:
+            changed_id = row.pop('changed_id')
+            if row.pop('change_deleted') or row['entry_id'] is None:
+                changes.deleted_ids.append(changed_id)
+            else:
+                changes.entries.append(self._to_entity(row))
+        return changes
+
+    def check_overlap(self, user_id: str, start_time: datetime, end_time: datetime,
+                      exclude_entry_id: Optional[str] = None) -> bool:
+        """Check if time range overlaps with existing entries"""
+        # No entry is longer than the user's longest duration, so only entries
+        # starting after start_time minus that duration can overlap. This keeps
+        # the (user_id, start_time) index scan short.
+        longest = self._query_one('SELECT MAX(duration_minutes) AS longest FROM time_entries WHERE user_id = ?',
+                                  (user_id,))
+        if not longest or longest['longest'] is None:
+            return False
+        earliest_start = start_time - timedelta(minutes=longest['longest'] + 1)
+
+        row = self._query_one(
+            'SELECT 1 FROM time_entries WHERE user_id = ? AND start_time >= ? AND start_time < ? '
+            'AND end_time IS NOT NULL AND end_time > ? AND entry_id IS NOT ? LIMIT 1',
+            (user_id, earliest_start.isoformat(), end_time.isoformat(), start_time.isoformat(), exclude_entry_id))
+        return row is not None
+
+    def update(self, time_entry: TimeEntry) -> TimeEntry:
+        """Update existing time entry"""
+        if not self._update_row(self._from_entity(time_entry)):
+            raise ValueError(f"Time entry with ID {time_entry.entry_id} not found")
+        return time_entry
+
+    def delete(self, entry_id: str) -> bool:
+        """Delete time entry by ID"""
+        return self._delete_row(entry_id)
+
+    def list_all(self) -> List[TimeEntry]:
+        """Get all time entries"""
+        return [self._to_entity(row) for row in self._query('SELECT * FROM time_entries ORDER BY start_time DESC')]
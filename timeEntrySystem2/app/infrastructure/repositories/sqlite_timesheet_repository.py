@@ -0,0 +1,95 @@
+import json
+from typing import List, Optional, Dict, Any
+from datetime import date
+from app.core.entities.timesheet import Timesheet, TimesheetStatus
+from app.core.interfaces.timesheet_repository import ITimesheetRepository
+from app.infrastructure.repositories.base_sqlite_repository import BaseSqliteRepository
+
+class SqliteTimesheetRepository(BaseSqliteRepository[Timesheet], ITimesheetRepository):
+    """
+    SQLite implementation of timesheet repository
+    """
+
+    def _to_entity(self, row: Dict[str, Any]) -> Timesheet:
+        """Convert database row to Timesheet entity"""
+        row['entry_ids'] = json.loads(row.get('entry_ids') or '[]')
+        return Timesheet.from_dict(row)
+
+    def _from_entity(self, entity: Timesheet) -> Dict[str, Any]:
+        """Convert Timesheet entity to database row"""
+        row = entity.to_dict()
+        row['entry_ids'] = json.dumps(row['entry_ids'])
+        return row
+
+    def _get_table(self) -> str:
+        """Get the table name"""
+        return "timesheets"
+
+    def _get_id_field(self) -> str:
+        """Get the ID field name"""
+        return "timesheet_id"
+
+    def create(self, timesheet: Timesheet) -> Timesheet:
+        """Create a new timesheet"""
+        if self._exists(timesheet.timesheet_id):
+            raise ValueError(f"Timesheet with ID {timesheet.timesheet_id} already exists")
+
+        self._insert(self._from_entity(timesheet))
+        return timesheet
+
+    def get_by_id(self, timesheet_id: str) -> Optional[Timesheet]:
+        """Get timesheet by ID"""
+        row = self._get_row(timesheet_id)
+        return self._to_entity(row) if row else None
+
+    def get_many(self, timesheet_ids: List[str]) -> List[Timesheet]:
+        """Get timesheets for a list of IDs"""
+        return [self._to_entity(row) for row in self._get_rows(timesheet_ids)]
+
+    def get_by_user_id(self, user_id: str) -> List[Timesheet]:
+        """Get all timesheets for a user"""
+        rows = self._query('SELECT * FROM timesheets WHERE user_id = ? ORDER BY start_date DESC', (user_id,))
+        return [self._to_entity(row) for row in rows]
+
+    def get_by_user_and_status(self, user_id: str, status: TimesheetStatus) -> List[Timesheet]:
+        """Get timesheets by user and status"""
+        rows = self._query('SELECT * FROM timesheets WHERE user_id = ? AND status = ? ORDER BY start_date DESC',
+                           (user_id, status.value))
+        return [self._to_entity(row) for row in rows]
+
+    def get_by_period(self, user_id: str, start_date: date, end_date: date) -> Optional[Timesheet]:
+        """Get timesheet for a specific period"""
+        row = self._query_one('SELECT * FROM timesheets WHERE user_id = ? AND start_date = ? AND end_date = ? LIMIT 1',
+                              (user_id, start_date.isoformat(), end_date.isoformat()))
+        return self._to_entity(row) if row else None
+
+    def check_period_overlap(self, user_id: str, start_date: date, end_date: date,
+                             exclude_timesheet_id: Optional[str] = None) -> bool:
+        """Check if period overlaps with existing timesheets"""
+        row = self._query_one(
+            'SELECT 1 FROM timesheets WHERE user_id = ? AND timesheet_id IS NOT ? '
+            'AND start_date <= ? AND end_date >= ? LIMIT 1',
+            (user_id, exclude_timesheet_id, end_date.isoformat(), start_date.isoformat()))
+        return row is not None
+
+    def get_by_date_range(self, user_id: str, start_date: date, end_date: date) -> List[Timesheet]:
+        """Get timesheets that overlap with a date range"""
+        rows = self._query(
+            'SELECT * FROM timesheets WHERE user_id = ? AND start_date <= ? AND end_date >= ? '
+            'ORDER BY start_date',
+            (user_id, end_date.isoformat(), start_date.isoformat()))
+        return [self._to_entity(row) for row in rows]
+
+    def update(self, timesheet: Timesheet) -> Timesheet:
+        """Update existing timesheet"""
+        if not self._update_row(self._from_entity(timesheet)):
+            raise ValueError(f"Timesheet with ID {timesheet.timesheet_id} not found")
+        return timesheet
+
+    def delete(self, timesheet_id: str) -> bool:
+        """Delete timesheet by ID"""
+        return self._delete_row(timesheet_id)
+
+    def list_all(self) -> List[Timesheet]:
+        """Get all timesheets"""
+        return [self._to_entity(row) for row in self._query('SELECT * FROM timesheets ORDER BY start_date DESC')]
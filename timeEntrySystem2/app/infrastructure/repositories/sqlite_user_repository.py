@@ -0,0 +1,70 @@
+import json
+from typing import List, Optional, Dict, Any
+from app.core.entities.user import User
+from app.core.interfaces.user_repository import IUserRepository
+from app.infrastructure.repositories.base_sqlite_repository import BaseSqliteRepository
+
+class SqliteUserRepository(BaseSqliteRepository[User], IUserRepository):
+    """
+    SQLite implementation of user repository
+    """
+
+    def _to_entity(self, row: Dict[str, Any]) -> User:
+        """Convert database row to User entity"""
+        row['preferences'] = json.loads(row.get('preferences') or '{}')
+        return User.from_dict(row)
+
+    def _from_entity(self, entity: User) -> Dict[str, Any]:
+        """Convert User entity to database row"""
+        row = entity.to_dict()
+        row['preferences'] = json.dumps(row['preferences'], default=str)
+        return row
+
+    def _get_table(self) -> str:
+        """Get the table name"""
+        return "users"
+
+    def _get_id_field(self) -> str:
+        """Get the ID field name"""
+        return "user_id"
+
+    def create(self, user: User) -> User:
+        """Create a new user"""
+        if self._exists(user.user_id):
+            raise ValueError(f"User with ID {user.user_id} already exists")
+
+        if user.username and self.get_by_username(user.username):
+            raise ValueError(f"Username '{user.username}' already exists")
+
+        self._insert(self._from_entity(user))
+        return user
+
+    def get_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        row = self._get_row(user_id)
+        return self._to_entity(row) if row else None
+
+    def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username"""
+        row = self._query_one('SELECT * FROM users WHERE username = ? ORDER BY rowid LIMIT 1', (username,))
+        return self._to_entity(row) if row else None
+
+    def update(self, user: User) -> User:
+        """Update existing user"""
+        if not self._exists(user.user_id):
+            raise ValueError(f"User with ID {user.user_id} not found")
+
+        if user.username and self._query_one('SELECT 1 FROM users WHERE username = ? AND user_id != ?',
+                                             (user.username, user.user_id)):
+            raise ValueError(f"Username '{user.username}' already exists")
+
+        self._update_row(self._from_entity(user))
+        return user
+
+    def delete(self, user_id: str) -> bool:
+        """Delete user by ID"""
+        return self._delete_row(user_id)
+
+    def list_all(self) -> List[User]:
+        """Get all users"""
+        return [self._to_entity(row) for row in self._query('SELECT * FROM users ORDER BY rowid')]
@@ -0,0 +1,126 @@
+import math
+from typing import Dict, List, Optional, Tuple
+from app.core.entities.search_query import SearchQuery, contains_phrase, tokenize
+
+class TextSearchIndex:
+    """
+    Inverted index over one user's entry descriptions.
+
+    Each word maps to the entries containing it and how often. A term
+    matches the words containing it, found by scanning the distinct words
+    rather than the entries. Entries are added and removed in O(words in
+    the description). A search reads the postings of its rarest term or
+    phrase, then checks the remaining ones against each candidate's own
+    words, so its cost follows the vocabulary and the number of matches
+    rather than the size of the history. Matches are scored with BM25.
+    """
+
+    # BM25 term frequency saturation and length normalization
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, int]] = {}  # word -> {entry_id: occurrences}
+        self._documents: Dict[str, Tuple[str, ...]] = {}  # entry_id -> words
+        self._total_words = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, entry_id: str, text: Optional[str]) -> None:
+        """Index an entry's text, replacing any earlier text"""
+        self.remove(entry_id)
+        words = tuple(tokenize(text))
+        if not words:
+            return
+        self._documents[entry_id] = words
+        self._total_words += len(words)
+        for word in words:
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = {}
+            postings[entry_id] = postings.get(entry_id, 0) + 1
+
+    def remove(self, entry_id: str) -> None:
+        """Drop an entry, if present"""
+        words = self._documents.pop(entry_id, None)
+        if words is None:
+            return
+        self._total_words -= len(words)
+        for word in set(words):
+            postings = self._postings[word]
+            del postings[entry_id]
+            if not postings:
+                del self._postings[word]
+
+    def search(self, query: SearchQuery) -> Dict[str, float]:
+        """Get entry_id -> relevance of the entries matching every term and phrase"""
+        # (estimated matches, term, phrase) with exactly one of term and phrase set
+        clauses = []
+        for term in query.terms:
+            clauses.append((sum(len(self._postings[word]) for word in self._expand(term)), term, None))
+        for phrase in query.phrases:
+            clauses.append((min(len(self._postings.get(word, ())) for word in phrase), None, phrase))
+        clauses.sort(key=lambda clause: clause[0])
+
+        scores: Optional[Dict[str, float]] = None
+        for _, term, phrase in clauses:
+            if scores is None:
+                scores = self._match_postings(term, phrase)
+            else:
+                scores = self._match_candidates(term, phrase, scores)
+            if not scores:
+                return {}
+        return scores or {}
+
+    def _expand(self, term: str) -> List[str]:
+        """Get the indexed words containing term"""
+        return [word for word in self._postings if term in word]
+
+    def _match_postings(self, term: Optional[str], phrase: Optional[Tuple[str, ...]]) -> Dict[str, float]:
+        """Score the entries matching one term or phrase, read from the postings"""
+        scores: Dict[str, float] = {}
+        if term is not None:
+            # An entry scores its best-matching word for a term
+            for word in self._expand(term):
+                for entry_id, count in self._postings[word].items():
+                    score = self._weight(word, entry_id, count)
+                    if score > scores.get(entry_id, 0.0):
+                        scores[entry_id] = score
+            return scores
+
+        rarest = min(phrase, key=lambda word: len(self._postings.get(word, ())))
+        for entry_id in self._postings.get(rarest, ()):
+            score = self._phrase_score(entry_id, phrase)
+            if score is not None:
+                scores[entry_id] = score
+        return scores
+
+    def _match_candidates(self, term: Optional[str], phrase: Optional[Tuple[str, ...]],
+                          candidates: Dict[str, float]) -> Dict[str, float]:
+        """Keep the candidates that also match a term or phrase, adding its score"""
+        scores = {}
+        for entry_id, score in candidates.items():
+            if term is not None:
+                words = {word for word in self._documents[entry_id] if term in word}
+                added = max((self._weight(word, entry_id, self._postings[word][entry_id]) for word in words),
+                            default=None)
+            else:
+                added = self._phrase_score(entry_id, phrase)
+            if added is not None:
+                scores[entry_id] = score + added
+        return scores
+
+    def _phrase_score(self, entry_id: str, phrase: Tuple[str, ...]) -> Optional[float]:
+        """Score an entry containing the phrase, or None if it does not"""
+        if not contains_phrase(self._documents[entry_id], phrase):
+            return None
+        return sum(self._weight(word, entry_id, self._postings[word][entry_id]) for word in set(phrase))
+
+    def _weight(self, word: str, entry_id: str, count: int) -> float:
+        """BM25 weight of a word occurring count times in an entry"""
+        documents = len(self._documents)
+        frequency = len(self._postings[word])
+        idf = math.log(1 + (documents - frequency + 0.5) / (frequency + 0.5))
+        length_ratio = len(self._documents[entry_id]) * documents / self._total_words
+        return idf * count * (self.K1 + 1) / (count + self.K1 * (1 - self.B + self.B * length_ratio))
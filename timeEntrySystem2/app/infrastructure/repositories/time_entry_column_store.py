@@ -0,0 +1,244 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from app.core.entities.range_aggregate import RangeAggregate
+
+try:
+    import numpy as np
+except ImportError:  # optional, see requirements-numpy.txt; reports total daily rollups instead
+    np = None
+
+COLUMNS_AVAILABLE = np is not None
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+def epoch_seconds(moment: datetime) -> int:
+    """Seconds from 1970-01-01 to moment, ignoring any time zone"""
+    return ((moment.toordinal() - _EPOCH_ORDINAL) * 86400 +
+            moment.hour * 3600 + moment.minute * 60 + moment.second)
+
+@dataclass
+class TimeEntryColumns:
+    """
+    Time entries of one user as parallel NumPy arrays, for vectorized reports
+    
+    Times are whole seconds since 1970-01-01 in the entries' own (naive)
+    time, so day boundaries match start_time.date().
+    """
+    start_date: date
+    starts: Any
+    ends: Any  # -1 for running timers
+    durations: Any  # minutes
+    projects: Any  # codes into project_ids
+    project_ids: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def day_offsets(self) -> Any:
+        """Get the number of days from start_date to each entry's start"""
+        start_seconds = (self.start_date.toordinal() - _EPOCH_ORDINAL) * 86400
+        return (self.starts - start_seconds) // 86400
+
+class TimeEntryColumnStore:
+    """
+    One user's time entries as growable NumPy columns.
+
+    Added entries are buffered in a list and copied into the columns on the
+    next read, so indexing an entry costs one append. Removed entries are
+    masked out, and the columns are compacted once more than half of the
+    rows are dead. Requires NumPy.
+    """
+
+    _MIN_CAPACITY = 1024
+
+    def __init__(self):
+        self._rows: Dict[str, int] = {}  # entry_id -> row
+        self._project_codes: Dict[str, int] = {}
+        self._project_ids: List[str] = []
+        # (start, end, duration, project code) of rows not yet in the columns
+        self._pending: List[Tuple[int, int, int, int]] = []
+        self._removed: List[int] = []
+        self._size = 0  # rows in the columns, live or dead
+        self._dead = 0
+        # Bounds of the start times ever added, for whole-history selects
+        self._min_start: Optional[int] = None
+        self._max_start: Optional[int] = None
+        self._allocate(0)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, entry_id: str, start_time: datetime, end_time: Optional[datetime],
+            minutes: int, project_id: str) -> None:
+        """Add an entry"""
+        code = self._project_codes.get(project_id)
+        if code is None:
+            code = self._project_codes[project_id] = len(self._project_ids)
+            self._project_ids.append(project_id)
+        self.remove(entry_id)
+        self._rows[entry_id] = self._size + len(self._pending)
+        self._pending.append((epoch_seconds(start_time),
+                              epoch_seconds(end_time) if end_time else -1, minutes, code))
+
+    def remove(self, entry_id: str) -> None:
+        """Remove an entry, if present"""
+        row = self._rows.pop(entry_id, None)
+        if row is not None:
+            self._removed.append(row)
+
+    def select(self, start_date: date, end_date: date) -> TimeEntryColumns:
+        """Copy out the entries starting in [start_date, end_date]"""
+        self._flush()
+        size = self._size
+        low = (start_date.toordinal() - _EPOCH_ORDINAL) * 86400
+        high = (end_date.toordinal() + 1 - _EPOCH_ORDINAL) * 86400
+        columns = (self._starts[:size], self._ends[:size], self._durations[:size], self._projects[:size])
+
+        if self._dead or size == 0 or self._min_start < low or self._max_start >= high:
+            mask = self._alive[:size] & (columns[0] >= low) & (columns[0] < high)
+            columns = tuple(column[mask] for column in columns)
+        # else every row is live and in range: return views, which stay valid
+        # since rows are never changed in place, only masked or copied away
+
+        starts, ends, durations, projects = columns
+        return TimeEntryColumns(
+            start_date=start_date,
+            starts=starts,
+            ends=ends,
+            durations=durations,
+            projects=projects,
+            project_ids=list(self._project_ids)
+        )
+
+    def _flush(self) -> None:
+        """Copy buffered rows into the columns and apply removals"""
+        if self._pending:
+            needed = self._size + len(self._pending)
+            if needed > len(self._starts):
+                self._grow(max(needed, 2 * len(self._starts), self._MIN_CAPACITY))
+            block = np.array(self._pending, dtype=np.int64)
+            rows = slice(self._size, needed)
+            self._starts[rows] = block[:, 0]
+            self._ends[rows] = block[:, 1]
+            self._durations[rows] = block[:, 2]
+            self._projects[rows] = block[:, 3]
+            self._alive[rows] = True
+            self._size = needed
+            low, high = int(block[:, 0].min()), int(block[:, 0].max())
+            self._min_start = low if self._min_start is None else min(self._min_start, low)
+            self._max_start = high if self._max_start is None else max(self._max_start, high)
+            self._pending = []
+
+        if self._removed:
+            self._alive[self._removed] = False
+            self._dead += len(self._removed)
+            self._removed = []
+            if self._dead > len(self._rows):
+                self._compact()
+
+    def _allocate(self, capacity: int) -> None:
+        """Replace the columns with empty ones of the given capacity"""
+        self._starts = np.empty(capacity, dtype=np.int64)
+        self._ends = np.empty(capacity, dtype=np.int64)
+        self._durations = np.empty(capacity, dtype=np.int64)
+        self._projects = np.empty(capacity, dtype=np.int32)
+        self._alive = np.zeros(capacity, dtype=bool)
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate the columns with more room, keeping existing rows"""
+        old = (self._starts, self._ends, self._durations, self._projects, self._alive)
+        self._allocate(capacity)
+        size = self._size
+        for new, existing in zip((self._starts, self._ends, self._durations, self._projects, self._alive), old):
+            new[:size] = existing[:size]
+
+    def _compact(self) -> None:
+        """Drop dead rows and renumber the live ones"""
+        live = np.flatnonzero(self._alive[:self._size])
+        positions = np.full(self._size, -1, dtype=np.int64)
+        positions[live] = np.arange(len(live))
+        new_rows = positions.tolist()
+        self._rows = {entry_id: new_rows[row] for entry_id, row in self._rows.items()}
+
+        self._starts = self._starts[live]
+        self._ends = self._ends[live]
+        self._durations = self._durations[live]
+        self._projects = self._projects[live]
+        self._alive = np.ones(len(live), dtype=bool)
+        self._size = len(live)
+        self._dead = 0
+
+def concat_columns(parts: List[TimeEntryColumns], start_date: date) -> TimeEntryColumns:
+    """Join column selections of disjoint entry sets, merging their project codes"""
+    if not parts:
+        return TimeEntryColumnStore().select(start_date, start_date)
+
+    project_codes: Dict[str, int] = {}
+    project_ids: List[str] = []
+    projects = []
+    for part in parts:
+        mapping = np.empty(len(part.project_ids), dtype=np.int32)
+        for code, project_id in enumerate(part.project_ids):
+            merged = project_codes.get(project_id)
+            if merged is None:
+                merged = project_codes[project_id] = len(project_ids)
+                project_ids.append(project_id)
+            mapping[code] = merged
+        projects.append(mapping[part.projects])
+
+    return TimeEntryColumns(
+        start_date=start_date,
+        starts=np.concatenate([part.starts for part in parts]),
+        ends=np.concatenate([part.ends for part in parts]),
+        durations=np.concatenate([part.durations for part in parts]),
+        projects=np.concatenate(projects).astype(np.int32),
+        project_ids=project_ids
+    )
+
+def aggregate_columns(columns: TimeEntryColumns, end_date: date,
+                      by_day: bool = False, by_week: bool = False) -> RangeAggregate:
+    """Total NumPy columns with vectorized project, day and week bucketing"""
+    start_date = columns.start_date
+    span = (end_date - start_date).days + 1
+    aggregate = RangeAggregate(entry_count=len(columns))
+    if not len(columns):
+        if by_day:
+            aggregate.day_minutes = [0] * span
+        return aggregate
+    
+    durations = columns.durations
+    codes = columns.projects
+    project_counts = np.bincount(codes)
+    project_minutes = np.bincount(codes, weights=durations)
+    for code in np.flatnonzero(project_counts).tolist():
+        aggregate.project_minutes[columns.project_ids[code]] = int(project_minutes[code])
+    
+    days = columns.day_offsets()
+    # Count active days over the days the entries actually cover, not the whole range
+    first_day = int(days.min())
+    aggregate.active_days = int(np.count_nonzero(np.bincount(days - first_day)))
+    
+    if by_day or by_week:
+        daily_minutes = np.bincount(days, weights=durations, minlength=span)
+        if by_day:
+            aggregate.day_minutes = daily_minutes.astype(np.int64).tolist()
+        if by_week:
+            daily_counts = np.bincount(days, minlength=span)
+            # Offsets of the first day of each (possibly partial) week in the range
+            first_monday = (7 - start_date.weekday()) % 7
+            boundaries = np.arange(first_monday, span, 7)
+            if first_monday:
+                boundaries = np.concatenate(([0], boundaries))
+            week_minutes = np.add.reduceat(daily_minutes, boundaries)
+            week_counts = np.add.reduceat(daily_counts, boundaries)
+            for i in np.flatnonzero(week_counts).tolist():
+                day = start_date + timedelta(days=int(boundaries[i]))
+                aggregate.week_minutes.append((day - timedelta(days=day.weekday()), int(week_minutes[i])))
+    
+    sessions = durations[durations > 0]
+    aggregate.session_count = len(sessions)
+    if len(sessions):
+        aggregate.longest_session_minutes = int(sessions.max())
+        aggregate.shortest_session_minutes = int(sessions.min())
+    return aggregate
@@ -0,0 +1,104 @@
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+class TimeIntervalIndex:
+    """
+    Start-time sorted index of time entry intervals.
+
+    Range queries bisect on start time and cost O(log n + k). Overlap checks
+    only look at entries starting within the longest indexed duration before
+    the queried range, which keeps them O(log n) for typical data.
+    """
+
+    # Pending additions above this size are merged with a full sort
+    # instead of one insort each
+    _BULK_THRESHOLD = 64
+
+    def __init__(self):
+        self._keys: List[Tuple[datetime, str]] = []
+        self._pending: List[Tuple[datetime, str]] = []
+        self._spans: Dict[str, Tuple[datetime, Optional[datetime]]] = {}
+        self._max_duration = timedelta(0)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def add(self, entry_id: str, start: datetime, end: Optional[datetime]) -> None:
+        """Add an interval; end is None for running timers"""
+        if entry_id in self._spans:
+            self.remove(entry_id)
+
+        self._spans[entry_id] = (start, end)
+        self._pending.append((start, entry_id))
+        if end is not None and end - start > self._max_duration:
+            self._max_duration = end - start
+
+    def remove(self, entry_id: str) -> None:
+        """Remove an interval if present"""
+        span = self._spans.pop(entry_id, None)
+        if span is None:
+            return
+
+        self._flush()
+        key = (span[0], entry_id)
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+        # The longest duration is kept as an upper bound; it is not shrunk
+
+    def span(self, entry_id: str) -> Optional[Tuple[datetime, Optional[datetime]]]:
+        """Get (start, end) for an indexed entry"""
+        return self._spans.get(entry_id)
+
+    def range(self, start: datetime, end: datetime) -> List[str]:
+        """Get IDs of entries with start <= start_time < end, ordered by start time"""
+        self._flush()
+        lo = bisect_left(self._keys, (start,))
+        hi = bisect_left(self._keys, (end,))
+        return [entry_id for _, entry_id in self._keys[lo:hi]]
+
+    def descending(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                   before: Optional[Tuple[datetime, str]] = None) -> Iterator[str]:
+        """Yield IDs of entries with start <= start_time < end and (start_time, entry_id) < before, newest first
+
+        Finding the first ID costs O(log n), each further one O(1). The index
+        must not change while the iterator is in use.
+        """
+        self._flush()
+        lo = bisect_left(self._keys, (start,)) if start is not None else 0
+        hi = bisect_left(self._keys, (end,)) if end is not None else len(self._keys)
+        if before is not None:
+            hi = min(hi, bisect_left(self._keys, before))
+        for i in range(hi - 1, lo - 1, -1):
+            yield self._keys[i][1]
+
+    def overlaps(self, start: datetime, end: datetime, exclude_id: Optional[str] = None) -> bool:
+        """Check if [start, end) overlaps any finished interval"""
+        self._flush()
+
+        # An overlapping entry must start before end and, since no entry
+        # is longer than _max_duration, after start - _max_duration
+        lo = bisect_left(self._keys, (start - self._max_duration,))
+        hi = bisect_left(self._keys, (end,))
+        for i in range(lo, hi):
+            entry_id = self._keys[i][1]
+            if entry_id == exclude_id:
+                continue
+            entry_end = self._spans[entry_id][1]
+            if entry_end is not None and entry_end > start:
+                return True
+        return False
+
+    def _flush(self) -> None:
+        """Merge pending additions into the sorted keys"""
+        if not self._pending:
+            return
+
+        if len(self._pending) > self._BULK_THRESHOLD:
+            self._keys.extend(self._pending)
+            self._keys.sort()
+        else:
+            for key in self._pending:
+                insort(self._keys, key)
+        self._pending = []
@@ -0,0 +1,42 @@
+import functools
+import hashlib
+from datetime import date
+from typing import Callable, Union
+from flask import request, jsonify, current_app, make_response
+
+def etag_from_versions(service_name: str, per_user: Union[bool, Callable[[], bool]] = True):
+    """Answer GET requests with 304 Not Modified while the data behind them is unchanged
+    
+    The ETag hashes the request path and query string with the named
+    service's data version, for the requested user, or for all users when
+    per_user is False (routes that look a record up by ID). per_user may
+    also be a function deciding this for each request. A matching
+    If-None-Match skips the view, and with it the repository reads and
+    serialization.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                scoped = per_user() if callable(per_user) else per_user
+                user_id = request.args.get('user_id', 'default_user') if scoped else None
+                version = getattr(current_app, service_name).get_data_version(user_id)
+            except Exception as e:
+                return jsonify({'error': str(e)}), 500
+            
+            # Today's date is included for routes that default to the current day
+            etag = hashlib.sha1(repr((request.full_path, version, date.today())).encode()).hexdigest()
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            
+            # Weak, since some responses carry a timestamp that may differ
+            response.set_etag(etag, weak=True)
+            # Clients may keep responses but must revalidate before reuse
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
\ No newline at end of file
@@ -0,0 +1,63 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+# Page size when no limit is given, and the largest accepted
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+def parse_limit(value: Optional[str]) -> int:
+    """Parse a limit parameter, defaulting to DEFAULT_PAGE_SIZE"""
+    if value is None or value == '':
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    return limit
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """Encode the sort key of a page's last row as an opaque, URL-safe cursor"""
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in key]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+def decode_cursor(cursor: Optional[str], types: Sequence[type]) -> Optional[tuple]:
+    """Decode a cursor from encode_cursor whose values have the given types"""
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError
+        key = []
+        for value, value_type in zip(values, types):
+            if value_type is datetime:
+                key.append(datetime.fromisoformat(value))
+            elif value_type is float and isinstance(value, (int, float)):
+                key.append(float(value))
+            elif isinstance(value, value_type):
+                key.append(value)
+            else:
+                raise ValueError
+        return tuple(key)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+def parse_fields(value: Optional[str], allowed: Sequence[str]) -> Optional[List[str]]:
+    """Parse a comma-separated fields parameter, or None to keep every field"""
+    if not value:
+        return None
+    fields = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+def select_fields(row: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Keep only the requested fields of a row"""
+    if fields is None:
+        return row
+    return {name: row[name] for name in fields}
\ No newline at end of file
@@ -1,18 +1,41 @@
 from flask import Blueprint, request, jsonify, current_app
 from datetime import date, datetime
 from app.core.entities.project import ProjectStatus
+from app.presentation.api.conditional import etag_from_versions
 
 project_bp = Blueprint('projects', __name__)
 
 @project_bp.route('', methods=['GET'])
+@etag_from_versions('project_service')
 def get_projects():
-    """Get all projects for a user"""
+    """Get all projects for a user
+    
+    With include=stats, each project carries its all-time totals under
+    stats, computed for all projects in one query.
+    """
     try:
         user_id = request.args.get('user_id', 'default_user')
         status = request.args.get('status')
+        include = request.args.get('include')
+        
+        if include not in (None, '', 'stats'):
+            return jsonify({'error': 'Invalid include value. Use stats'}), 400
         
         project_service = current_app.project_service
         
+        if include == 'stats':
+            try:
+                status_enum = ProjectStatus(status) if status else None
+            except ValueError:
+                return jsonify({'error': 'Invalid status value'}), 400
+            
+            results = []
+            for project, stats in project_service.get_projects_with_stats(user_id, status_enum):
+                result = project.to_dict()
+                result['stats'] = stats
+                results.append(result)
+            return jsonify(results)
+        
         if status:
             try:
                 status_enum = ProjectStatus(status)
@@ -69,6 +92,7 @@ def create_project():
         return jsonify({'error': str(e)}), 500
 
 @project_bp.route('/<project_id>', methods=['GET'])
+@etag_from_versions('project_service', per_user=False)
 def get_project(project_id):
     """Get a specific project"""
     try:
@@ -141,6 +165,7 @@ def delete_project(project_id):
         return jsonify({'error': str(e)}), 500
 
 @project_bp.route('/<project_id>/time-summary', methods=['GET'])
+@etag_from_versions('project_service', per_user=False)
 def get_project_time_summary(project_id):
     """Get time summary for a project"""
     try:
@@ -171,20 +196,19 @@ def get_project_time_summary(project_id):
         return jsonify({'error': str(e)}), 500
 
 @project_bp.route('/<project_id>/time-stats', methods=['GET'])
+@etag_from_versions('project_service', per_user=False)
 def get_project_time_stats(project_id):
     """Get time statistics for a specific project"""
     try:
         project_service = current_app.project_service
         
-        # Get total hours for this project
-        time_entry_service = current_app.time_entry_service
-        entries = time_entry_service.get_entries_by_project(project_id)
-        
-        total_hours = sum(entry.duration_hours for entry in entries if entry.duration_hours)
+        # Totals come from the repository's indexed range sums
+        summary = project_service.get_project_time_summary(project_id)
         
         return jsonify({
-            'total_hours': total_hours,
-            'entry_count': len(entries)
+            'total_hours': summary['total_hours'],
+            'total_minutes': summary['total_minutes'],
+            'entry_count': summary['entry_count']
         })
     
     except Exception as e:
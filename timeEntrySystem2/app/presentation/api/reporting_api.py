@@ -1,9 +1,13 @@
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app, Response, stream_with_context
 from datetime import date, datetime, timedelta
+from app.core.services.reporting_service import SEARCH_RESULT_FIELDS
+from app.presentation.api.conditional import etag_from_versions
+from app.presentation.api.pagination import parse_limit, encode_cursor, decode_cursor, parse_fields, select_fields
 
 reporting_bp = Blueprint('reports', __name__)
 
 @reporting_bp.route('/time-by-project', methods=['GET'])
+@etag_from_versions('reporting_service')
 def get_time_by_project():
     """Get time distribution by project"""
     try:
@@ -28,7 +32,35 @@ def get_time_by_project():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@reporting_bp.route('/range-total', methods=['GET'])
+@etag_from_versions('reporting_service')
+def get_range_total():
+    """Get total time in a date range, optionally for one project"""
+    try:
+        user_id = request.args.get('user_id', 'default_user')
+        project_id = request.args.get('project_id')
+        start_date_str = request.args.get('start_date')
+        end_date_str = request.args.get('end_date')
+        
+        if not start_date_str or not end_date_str:
+            return jsonify({'error': 'start_date and end_date are required'}), 400
+        
+        try:
+            start_date = date.fromisoformat(start_date_str)
+            end_date = date.fromisoformat(end_date_str)
+        except ValueError:
+            return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
+        
+        reporting_service = current_app.reporting_service
+        total = reporting_service.get_range_total(user_id, start_date, end_date, project_id)
+        
+        return jsonify(total)
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @reporting_bp.route('/daily-summary', methods=['GET'])
+@etag_from_versions('reporting_service')
 def get_daily_summary():
     """Get daily time tracking summary"""
     try:
@@ -52,6 +84,7 @@ def get_daily_summary():
         return jsonify({'error': str(e)}), 500
 
 @reporting_bp.route('/weekly-summary', methods=['GET'])
+@etag_from_versions('reporting_service')
 def get_weekly_summary():
     """Get weekly time tracking summary"""
     try:
@@ -77,6 +110,7 @@ def get_weekly_summary():
         return jsonify({'error': str(e)}), 500
 
 @reporting_bp.route('/monthly-summary', methods=['GET'])
+@etag_from_versions('reporting_service')
 def get_monthly_summary():
     """Get monthly time tracking summary"""
     try:
@@ -108,6 +142,7 @@ def get_monthly_summary():
         return jsonify({'error': str(e)}), 500
 
 @reporting_bp.route('/productivity-trends', methods=['GET'])
+@etag_from_versions('reporting_service')
 def get_productivity_trends():
     """Get productivity analysis and trends"""
     try:
@@ -133,6 +168,7 @@ def get_productivity_trends():
         return jsonify({'error': str(e)}), 500
 
 @reporting_bp.route('/time-distribution-chart', methods=['GET'])
+@etag_from_versions('reporting_service')
 def get_time_distribution_chart():
     """Get chart data for time visualization"""
     try:
@@ -158,8 +194,13 @@ def get_time_distribution_chart():
         return jsonify({'error': str(e)}), 500
 
 @reporting_bp.route('/search', methods=['GET'])
+@etag_from_versions('reporting_service')
 def search_entries():
-    """Search through time entries"""
+    """Search through time entries, a page at a time
+    
+    Each word of query matches words containing it, anywhere in the word,
+    and "quoted phrases" match exact words in order.
+    """
     try:
         user_id = request.args.get('user_id', 'default_user')
         query = request.args.get('query', '')
@@ -184,12 +225,20 @@ def search_entries():
             except ValueError:
                 return jsonify({'error': 'Invalid end_date format. Use YYYY-MM-DD'}), 400
         
+        try:
+            limit = parse_limit(request.args.get('limit'))
+            after = decode_cursor(request.args.get('cursor'), (float, datetime, str))
+            fields = parse_fields(request.args.get('fields'), SEARCH_RESULT_FIELDS)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
         reporting_service = current_app.reporting_service
-        results = reporting_service.search_entries(user_id, query, filters)
+        results, next_key = reporting_service.search_entries(user_id, query, filters, limit, after)
         
         return jsonify({
-            'results': results,
+            'results': [select_fields(result, fields) for result in results],
             'count': len(results),
+            'next_cursor': encode_cursor(next_key) if next_key else None,
             'query': query,
             'filters': {k: v.isoformat() if isinstance(v, date) else v for k, v in filters.items()}
         })
@@ -198,51 +247,100 @@ def search_entries():
         return jsonify({'error': str(e)}), 500
 
 @reporting_bp.route('/export', methods=['GET'])
+@etag_from_versions('reporting_service')
 def export_data():
-    """Export time tracking data"""
+    """Export time entries as a streamed CSV or JSON-lines download"""
     try:
         user_id = request.args.get('user_id', 'default_user')
-        format_type = request.args.get('format', 'json')
+        format_type = request.args.get('format', 'csv')
         start_date_str = request.args.get('start_date')
         end_date_str = request.args.get('end_date')
         
-        if format_type not in ['json', 'csv']:
-            return jsonify({'error': 'Format must be json or csv'}), 400
+        if format_type not in ['csv', 'jsonl', 'json']:
+            return jsonify({'error': 'Format must be csv or jsonl'}), 400
         
-        # For now, return a placeholder response
-        # In a real implementation, you would generate the export file
-        return jsonify({
-            'message': f'Export in {format_type} format initiated',
-            'user_id': user_id,
-            'start_date': start_date_str,
-            'end_date': end_date_str,
-            'download_url': f'/api/reports/download/{format_type}?user_id={user_id}'
-        })
+        if not start_date_str or not end_date_str:
+            return jsonify({'error': 'start_date and end_date are required'}), 400
+        
+        try:
+            start_date = date.fromisoformat(start_date_str)
+            end_date = date.fromisoformat(end_date_str)
+        except ValueError:
+            return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
+        
+        reporting_service = current_app.reporting_service
+        chunks = reporting_service.export_entries(user_id, start_date, end_date, format_type)
+        
+        if format_type == 'csv':
+            mimetype, extension = 'text/csv', 'csv'
+        else:
+            mimetype, extension = 'application/x-ndjson', 'jsonl'
+        filename = f'time-entries-{start_date.isoformat()}-{end_date.isoformat()}.{extension}'
+        
+        # Rows are generated while the response is sent, so nothing is
+        # buffered beyond one chunk
+        return Response(stream_with_context(chunks), mimetype=mimetype,
+                        headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@reporting_bp.route('/dashboard', methods=['GET'])
+@etag_from_versions('reporting_service')
+def get_dashboard():
+    """Get everything the dashboard shows in one response"""
+    try:
+        user_id = request.args.get('user_id', 'default_user')
+        date_str = request.args.get('date')
+        
+        if not date_str:
+            today = date.today()
+        else:
+            try:
+                today = date.fromisoformat(date_str)
+            except ValueError:
+                return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
+        
+        reporting_service = current_app.reporting_service
+        dashboard = reporting_service.get_dashboard(user_id, today)
+        
+        # The report may be shared through the cache, so copy before adding to it
+        return jsonify(dict(dashboard, last_updated=datetime.now().isoformat()))
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @reporting_bp.route('/summary', methods=['GET'])
+@etag_from_versions('reporting_service')
 def get_summary():
     """Get overall time tracking summary"""
     try:
         user_id = request.args.get('user_id', 'default_user')
         reporting_service = current_app.reporting_service
         
-        # Get today's summary
+        # Get today's and this week's totals
         today = date.today()
-        daily_summary = reporting_service.get_daily_summary(user_id, today)
+        daily_total = reporting_service.get_range_total(user_id, today, today)
         
-        # Get this week's summary
         week_start = today - timedelta(days=today.weekday())
-        weekly_summary = reporting_service.get_weekly_summary(user_id, week_start)
+        weekly_total = reporting_service.get_range_total(user_id, week_start, week_start + timedelta(days=6))
         
         return jsonify({
-            'total_hours': daily_summary.get('total_hours', 0),
-            'week_hours': weekly_summary.get('total_hours', 0),
-            'entries_today': daily_summary.get('entry_count', 0),
+            'total_hours': daily_total['total_hours'],
+            'week_hours': weekly_total['total_hours'],
+            'entries_today': daily_total['entry_count'],
             'last_updated': datetime.now().isoformat()
         })
     
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@reporting_bp.route('/cache-stats', methods=['GET'])
+def get_cache_stats():
+    """Get report cache hit/miss counters"""
+    try:
+        reporting_service = current_app.reporting_service
+        return jsonify(reporting_service.get_cache_stats())
+    
     except Exception as e:
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
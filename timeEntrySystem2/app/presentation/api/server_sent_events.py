@@ -0,0 +1,24 @@
+import json
+from typing import Any, Optional
+
+# Sent when nothing else was, so proxies keep the connection open and
+# disconnected clients are noticed
+HEARTBEAT = ': heartbeat\n\n'
+
+# Milliseconds an EventSource waits before reconnecting
+RETRY_MILLISECONDS = 5000
+
+def format_event(event: str, data: Any, event_id: Optional[Any] = None) -> str:
+    """Format one Server-Sent Event with a JSON data line"""
+    lines = [f'event: {event}']
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    lines.append(f'data: {json.dumps(data)}')
+    return '\n'.join(lines) + '\n\n'
+
+def parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    """Parse a numeric Last-Event-ID header, ignoring missing or malformed values"""
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
@@ -1,11 +1,43 @@
-from flask import Blueprint, request, jsonify, current_app
+import io
+from flask import Blueprint, request, jsonify, current_app, Response
 from datetime import date, datetime
+from app.presentation.api.conditional import etag_from_versions
+from app.presentation.api.pagination import parse_limit, encode_cursor, decode_cursor, parse_fields, select_fields
+from app.presentation.api.server_sent_events import HEARTBEAT, RETRY_MILLISECONDS, format_event, parse_last_event_id
 
 time_entry_bp = Blueprint('time_entries', __name__)
 
+# Request content types accepted by the bulk import, by import format
+IMPORT_CONTENT_TYPES = {
+    'text/csv': 'csv',
+    'application/x-ndjson': 'jsonl',
+    'application/jsonl': 'jsonl',
+    'application/json': 'json',
+}
+
+# Fields of a time entry that fields= may select
+ENTRY_FIELDS = ('entry_id', 'user_id', 'project_id', 'timesheet_id', 'description', 'start_time',
+                'end_time', 'duration_minutes', 'is_running', 'created_at', 'updated_at')
+
+# Seconds between heartbeats on an idle event stream
+STREAM_HEARTBEAT_SECONDS = 15
+
+def _listing_is_per_user() -> bool:
+    """Whether get_time_entries reads only the requested user's entries
+    
+    The unpaged project listing returns every user's entries of the project.
+    """
+    return not request.args.get('project_id') or 'limit' in request.args or 'cursor' in request.args
+
 @time_entry_bp.route('', methods=['GET'])
+@etag_from_versions('time_entry_service', per_user=_listing_is_per_user)
 def get_time_entries():
-    """Get time entries for a user"""
+    """Get a user's time entries
+    
+    Without limit or cursor, returns the list of all matching entries.
+    With either, returns a page, newest first; pass the returned
+    next_cursor as cursor to get the following page.
+    """
     try:
         user_id = request.args.get('user_id', 'default_user')
         project_id = request.args.get('project_id')
@@ -30,15 +62,39 @@ def get_time_entries():
             except ValueError:
                 return jsonify({'error': 'Invalid end_date format. Use YYYY-MM-DD'}), 400
         
-        # Get entries based on filters
-        if project_id:
-            entries = time_entry_service.get_entries_by_project(project_id, start_date, end_date)
-        elif start_date and end_date:
-            entries = time_entry_service.get_entries_by_date_range(user_id, start_date, end_date)
-        else:
-            entries = time_entry_service.get_user_entries(user_id)
+        try:
+            fields = parse_fields(request.args.get('fields'), ENTRY_FIELDS)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        if 'limit' not in request.args and 'cursor' not in request.args:
+            # Unpaged: the plain list existing clients expect
+            if project_id:
+                entries = time_entry_service.get_entries_by_project(project_id, start_date, end_date)
+            elif start_date and end_date:
+                entries = time_entry_service.get_entries_by_date_range(user_id, start_date, end_date)
+            else:
+                entries = time_entry_service.get_user_entries(user_id)
+            return jsonify([select_fields(entry.to_dict(), fields) for entry in entries])
+        
+        try:
+            limit = parse_limit(request.args.get('limit'))
+            after = decode_cursor(request.args.get('cursor'), (datetime, str))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        return jsonify([entry.to_dict() for entry in entries])
+        # Taken before the read, so changes sent to /changes?since=version
+        # cover everything this page may have missed
+        version = time_entry_service.get_data_version(user_id)
+        entries, next_key = time_entry_service.get_entries_page(
+            user_id, limit, after, start_date, end_date, project_id or None)
+        
+        return jsonify({
+            'entries': [select_fields(entry.to_dict(), fields) for entry in entries],
+            'count': len(entries),
+            'next_cursor': encode_cursor(next_key) if next_key else None,
+            'version': version
+        })
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -90,7 +146,101 @@ def create_time_entry():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@time_entry_bp.route('/bulk', methods=['POST'])
+def bulk_import_time_entries():
+    """Import a user's time entries from a CSV, JSON-lines or JSON array request body
+    
+    Rows naming another user_id are rejected.
+    """
+    try:
+        user_id = request.args.get('user_id', 'default_user')
+        format_type = request.args.get('format') or IMPORT_CONTENT_TYPES.get(request.mimetype)
+        
+        if not format_type:
+            return jsonify({'error': 'Unknown import format. Use format=csv or format=jsonl'}), 400
+        
+        # Read the body as it arrives instead of buffering it
+        lines = io.TextIOWrapper(request.stream, encoding='utf-8', newline='')
+        
+        import_service = current_app.time_entry_import_service
+        result = import_service.import_entries(lines, format_type, user_id)
+        
+        return jsonify(result)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@time_entry_bp.route('/changes', methods=['GET'])
+@etag_from_versions('time_entry_service')
+def get_time_entry_changes():
+    """Get a user's time entries changed since a data version
+    
+    since is the version from a previous response of this route, the
+    entry listing or the event stream. The response holds the entries
+    created or updated since then, the IDs of those deleted, and the
+    version to pass next. When reset is true the server no longer knows
+    since, and entries holds all of the user's entries instead.
+    """
+    try:
+        user_id = request.args.get('user_id', 'default_user')
+        since_str = request.args.get('since')
+        
+        since_version = None
+        if since_str:
+            try:
+                since_version = int(since_str)
+            except ValueError:
+                return jsonify({'error': 'since must be an integer version'}), 400
+        
+        time_entry_service = current_app.time_entry_service
+        changes = time_entry_service.get_changes(user_id, since_version)
+        
+        return jsonify(changes.to_dict())
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@time_entry_bp.route('/stream', methods=['GET'])
+def stream_time_entries():
+    """Push a user's running timer and time entry changes as Server-Sent Events
+    
+    'timer' events carry the running timer, or null, when it starts or
+    stops; 'entries' events tell the client its entries changed. Event IDs
+    are data versions, so a client reconnecting with Last-Event-ID only
+    gets events for changes made while it was away.
+    
+    A stream holds its worker for as long as the client stays connected,
+    so it needs a threaded or async server (the Flask development server,
+    or gunicorn with gthread, gevent or eventlet workers). Servers that
+    handle one request per process at a time, such as gunicorn's sync
+    workers, get 503 and the client falls back to polling. Changes saved
+    by other processes are picked up within a second.
+    """
+    if not request.environ.get('wsgi.multithread'):
+        return jsonify({'error': 'Event streams need a threaded or async server'}), 503
+    
+    user_id = request.args.get('user_id', 'default_user')
+    since_version = parse_last_event_id(request.headers.get('Last-Event-ID'))
+    time_entry_service = current_app.time_entry_service
+    
+    def events():
+        yield f'retry: {RETRY_MILLISECONDS}\n\n'
+        for change in time_entry_service.watch_changes(user_id, since_version, STREAM_HEARTBEAT_SECONDS):
+            if change is None:
+                yield HEARTBEAT
+            else:
+                event, version, data = change
+                yield format_event(event, data, version)
+    
+    # The generator holds no request context; it ends when a write to the
+    # closed connection fails, at the latest one heartbeat after disconnect
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @time_entry_bp.route('/<entry_id>', methods=['GET'])
+@etag_from_versions('time_entry_service', per_user=False)
 def get_time_entry(entry_id):
     """Get a specific time entry"""
     try:
@@ -169,6 +319,7 @@ def delete_time_entry(entry_id):
         return jsonify({'error': str(e)}), 500
 
 @time_entry_bp.route('/running', methods=['GET'])
+@etag_from_versions('time_entry_service')
 def get_running_timer():
     """Get the currently running timer for a user"""
     try:
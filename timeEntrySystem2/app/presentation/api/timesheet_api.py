@@ -1,18 +1,46 @@
 from flask import Blueprint, request, jsonify, current_app
 from datetime import date
 from app.core.entities.timesheet import PeriodType, TimesheetStatus
+from app.presentation.api.conditional import etag_from_versions
 
 timesheet_bp = Blueprint('timesheets', __name__)
 
 @timesheet_bp.route('', methods=['GET'])
+@etag_from_versions('timesheet_service')
 def get_timesheets():
-    """Get timesheets for a user"""
+    """Get timesheets for a user
+    
+    With include=entries, each timesheet carries its time entries under
+    time_entries, all loaded in one lookup.
+    """
     try:
         user_id = request.args.get('user_id', 'default_user')
         status = request.args.get('status')
+        include = request.args.get('include')
+        
+        if include not in (None, '', 'entries'):
+            return jsonify({'error': 'Invalid include value. Use entries'}), 400
         
         timesheet_service = current_app.timesheet_service
         
+        if include == 'entries':
+            try:
+                status_enum = TimesheetStatus(status) if status else None
+            except ValueError:
+                return jsonify({'error': 'Invalid status value'}), 400
+            
+            timesheets = timesheet_service.get_timesheets_with_entries(user_id, status_enum)
+            results = []
+            for timesheet, time_entries in timesheets:
+                result = timesheet.to_dict()
+                result['time_entries'] = [entry.to_dict() for entry in time_entries]
+                results.append(result)
+            
+            return jsonify({
+                'timesheets': results,
+                'count': len(results)
+            })
+        
         if status:
             try:
                 status_enum = TimesheetStatus(status)
@@ -75,6 +103,7 @@ def create_timesheet():
         return jsonify({'error': str(e)}), 500
 
 @timesheet_bp.route('/<timesheet_id>', methods=['GET'])
+@etag_from_versions('timesheet_service', per_user=False)
 def get_timesheet(timesheet_id):
     """Get a specific timesheet with its time entries"""
     try:
@@ -86,14 +115,10 @@ def get_timesheet(timesheet_id):
         
         # Get associated time entries
         time_entry_service = current_app.time_entry_service
-        time_entries = []
-        for entry_id in timesheet.entry_ids:
-            entry = time_entry_service.get_entry_by_id(entry_id)
-            if entry:
-                time_entries.append(entry.to_dict())
+        time_entries = time_entry_service.get_entries_by_ids(timesheet.entry_ids)
         
         result = timesheet.to_dict()
-        result['time_entries'] = time_entries
+        result['time_entries'] = [entry.to_dict() for entry in time_entries]
         
         return jsonify(result)
     
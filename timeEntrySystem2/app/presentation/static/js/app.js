@@ -5,16 +5,19 @@ class TimeTracker {
         this.apiBase = '/api';
         this.runningTimer = null;
         this.projects = [];
+        // Entries shown under Recent Entries and the data version they
+        // were loaded at, for fetching only what changed since
+        this.recentEntries = [];
+        this.entriesVersion = null;
+        this.recentLimit = 10;
         
         this.init();
     }
     
     init() {
         this.loadProjects();
-        this.loadDailySummary();
+        this.loadDashboard();
         this.loadRecentEntries();
-        this.loadQuickStats();
-        this.checkRunningTimer();
         this.setupEventListeners();
         
         // Refresh running timer every 5 seconds
@@ -24,14 +27,47 @@ class TimeTracker {
             }
         }, 1000);
         
-        // Refresh data every 30 seconds
+        // The server pushes timer and entry changes; poll only where
+        // EventSource is unavailable or the server refuses the stream
+        if (window.EventSource) {
+            this.subscribeToChanges();
+        } else {
+            this.startPolling();
+        }
+    }
+    
+    startPolling() {
         setInterval(() => {
-            this.loadDailySummary();
-            this.loadRecentEntries();
-            this.loadQuickStats();
+            this.loadDashboard();
+            this.syncRecentEntries();
         }, 30000);
     }
     
+    subscribeToChanges() {
+        // EventSource reconnects by itself and sends the last event ID, so
+        // only changes missed while disconnected are delivered
+        const source = new EventSource(`${this.apiBase}/time-entries/stream?user_id=${this.userId}`);
+        
+        source.addEventListener('timer', (event) => {
+            this.syncRunningTimer(JSON.parse(event.data));
+        });
+        
+        source.addEventListener('entries', () => {
+            this.loadDashboard();
+            this.syncRecentEntries();
+        });
+        
+        // EventSource gives up for good on an error status, such as the
+        // 503 of a server without threaded workers
+        source.addEventListener('error', () => {
+            if (source.readyState === EventSource.CLOSED) {
+                this.startPolling();
+            }
+        });
+        
+        this.eventSource = source;
+    }
+    
     setupEventListeners() {
         // Timer controls
         document.getElementById('start-timer-btn')?.addEventListener('click', () => this.startTimer());
@@ -79,19 +115,29 @@ class TimeTracker {
         });
     }
     
-    async loadDailySummary() {
+    async loadDashboard() {
         try {
             const today = new Date().toISOString().split('T')[0];
-            const response = await fetch(`${this.apiBase}/reports/daily-summary?user_id=${this.userId}&date=${today}`);
+            const response = await fetch(`${this.apiBase}/reports/dashboard?user_id=${this.userId}&date=${today}`);
             const data = await response.json();
             
             if (response.ok) {
-                this.renderDailySummary(data);
+                this.renderDailySummary(data.today);
+                this.renderQuickStats(data.today, data.week);
+                this.syncRunningTimer(data.running_timer);
             } else {
-                console.error('Error loading daily summary:', data.error);
+                console.error('Error loading dashboard:', data.error);
             }
         } catch (error) {
-            console.error('Error loading daily summary:', error);
+            console.error('Error loading dashboard:', error);
+        }
+    }
+    
+    syncRunningTimer(timer) {
+        this.runningTimer = timer;
+        this.updateTimerUI(Boolean(timer));
+        if (timer) {
+            this.updateTimerDisplay();
         }
     }
     
@@ -135,11 +181,13 @@ class TimeTracker {
     
     async loadRecentEntries() {
         try {
-            const response = await fetch(`${this.apiBase}/time-entries?user_id=${this.userId}`);
+            const response = await fetch(`${this.apiBase}/time-entries?user_id=${this.userId}&limit=${this.recentLimit}`);
             const data = await response.json();
             
             if (response.ok) {
-                this.renderRecentEntries(data.entries.slice(0, 10));
+                this.recentEntries = data.entries;
+                this.entriesVersion = data.version;
+                this.renderRecentEntries(this.recentEntries);
             } else {
                 console.error('Error loading recent entries:', data.error);
             }
@@ -148,6 +196,49 @@ class TimeTracker {
         }
     }
     
+    async syncRecentEntries() {
+        // Fetch only the entries changed since the list was loaded
+        if (this.entriesVersion === null) {
+            return this.loadRecentEntries();
+        }
+        
+        try {
+            const response = await fetch(`${this.apiBase}/time-entries/changes?user_id=${this.userId}&since=${this.entriesVersion}`);
+            const data = await response.json();
+            
+            if (!response.ok) {
+                console.error('Error syncing recent entries:', data.error);
+                return;
+            }
+            
+            const shown = new Map(this.recentEntries.map(entry => [entry.entry_id, entry]));
+            const full = this.recentEntries.length >= this.recentLimit;
+            const oldest = full ? this.recentEntries[this.recentEntries.length - 1].start_time : null;
+            
+            // A shown entry that was deleted or moved past the end of a full
+            // list leaves a gap that only the server can fill
+            const needsReload = data.reset ||
+                data.deleted_ids.some(id => shown.has(id)) ||
+                data.entries.some(entry => shown.has(entry.entry_id) && oldest !== null && entry.start_time < oldest);
+            if (needsReload) {
+                return this.loadRecentEntries();
+            }
+            
+            data.entries.forEach(entry => {
+                if (oldest === null || entry.start_time >= oldest) {
+                    shown.set(entry.entry_id, entry);
+                }
+            });
+            this.recentEntries = [...shown.values()]
+                .sort((a, b) => b.start_time.localeCompare(a.start_time) || b.entry_id.localeCompare(a.entry_id))
+                .slice(0, this.recentLimit);
+            this.entriesVersion = data.version;
+            this.renderRecentEntries(this.recentEntries);
+        } catch (error) {
+            console.error('Error syncing recent entries:', error);
+        }
+    }
+    
     renderRecentEntries(entries) {
         const container = document.getElementById('recent-entries');
         if (!container) return;
@@ -196,27 +287,6 @@ class TimeTracker {
         container.innerHTML = html;
     }
     
-    async loadQuickStats() {
-        try {
-            const today = new Date().toISOString().split('T')[0];
-            const weekStart = this.getWeekStart().toISOString().split('T')[0];
-            
-            const [dailyResponse, weeklyResponse] = await Promise.all([
-                fetch(`${this.apiBase}/reports/daily-summary?user_id=${this.userId}&date=${today}`),
-                fetch(`${this.apiBase}/reports/weekly-summary?user_id=${this.userId}&week_start=${weekStart}`)
-            ]);
-            
-            const dailyData = await dailyResponse.json();
-            const weeklyData = await weeklyResponse.json();
-            
-            if (dailyResponse.ok && weeklyResponse.ok) {
-                this.renderQuickStats(dailyData, weeklyData);
-            }
-        } catch (error) {
-            console.error('Error loading quick stats:', error);
-        }
-    }
-    
     renderQuickStats(daily, weekly) {
         const container = document.getElementById('quick-stats');
         if (!container) return;
@@ -239,24 +309,6 @@ class TimeTracker {
         container.innerHTML = html;
     }
     
-    async checkRunningTimer() {
-        try {
-            const response = await fetch(`${this.apiBase}/time-entries/running?user_id=${this.userId}`);
-            
-            if (response.ok) {
-                const data = await response.json();
-                this.runningTimer = data;
-                this.updateTimerUI(true);
-                this.updateTimerDisplay();
-            } else if (response.status === 404) {
-                this.runningTimer = null;
-                this.updateTimerUI(false);
-            }
-        } catch (error) {
-            console.error('Error checking running timer:', error);
-        }
-    }
-    
     async startTimer() {
         const projectId = document.getElementById('timer-project').value;
         const description = document.getElementById('timer-description').value;
@@ -286,7 +338,7 @@ class TimeTracker {
                 this.runningTimer = data;
                 this.updateTimerUI(true);
                 this.showAlert('Timer started successfully!', 'success');
-                this.loadRecentEntries(); // Refresh entries
+                this.syncRecentEntries(); // Refresh entries
             } else {
                 this.showAlert('Error starting timer: ' + data.error, 'danger');
             }
@@ -310,9 +362,8 @@ class TimeTracker {
                 this.runningTimer = null;
                 this.updateTimerUI(false);
                 this.showAlert('Timer stopped successfully!', 'success');
-                this.loadDailySummary(); // Refresh summary
-                this.loadRecentEntries(); // Refresh entries
-                this.loadQuickStats(); // Refresh stats
+                this.loadDashboard(); // Refresh summary and stats
+                this.syncRecentEntries(); // Refresh entries
             } else {
                 this.showAlert('Error stopping timer: ' + data.error, 'danger');
             }
@@ -391,9 +442,8 @@ class TimeTracker {
                 modal?.hide();
                 
                 // Refresh data
-                this.loadDailySummary();
-                this.loadRecentEntries();
-                this.loadQuickStats();
+                this.loadDashboard();
+                this.syncRecentEntries();
             } else {
                 this.showAlert('Error adding entry: ' + data.error, 'danger');
             }
@@ -413,9 +463,8 @@ class TimeTracker {
             
             if (response.ok) {
                 this.showAlert('Time entry deleted successfully!', 'success');
-                this.loadDailySummary();
-                this.loadRecentEntries();
-                this.loadQuickStats();
+                this.loadDashboard();
+                this.syncRecentEntries();
             } else {
                 const data = await response.json();
                 this.showAlert('Error deleting entry: ' + data.error, 'danger');
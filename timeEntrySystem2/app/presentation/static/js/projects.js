@@ -32,7 +32,8 @@ class ProjectManager {
 
     async loadProjects() {
         try {
-            const response = await fetch('/api/projects');
+            // Totals come embedded, so cards need no further requests
+            const response = await fetch('/api/projects?include=stats');
             if (response.ok) {
                 this.projects = await response.json();
                 this.filteredProjects = [...this.projects];
@@ -107,6 +108,8 @@ class ProjectManager {
                 const updatedProject = await response.json();
                 const index = this.projects.findIndex(p => p.project_id === projectId);
                 if (index !== -1) {
+                    // Editing a project does not change its totals
+                    updatedProject.stats = this.projects[index].stats;
                     this.projects[index] = updatedProject;
                 }
                 this.filterProjects();
@@ -258,23 +261,15 @@ class ProjectManager {
 
         container.innerHTML = projectsHTML;
         
-        // Load time stats for each project
-        this.loadProjectTimeStats();
+        // Show time stats for each project
+        this.renderProjectTimeStats();
     }
 
-    async loadProjectTimeStats() {
+    renderProjectTimeStats() {
         for (const project of this.filteredProjects) {
-            try {
-                const response = await fetch(`/api/projects/${project.project_id}/time-stats`);
-                if (response.ok) {
-                    const stats = await response.json();
-                    const element = document.getElementById(`project-hours-${project.project_id}`);
-                    if (element) {
-                        element.textContent = this.formatDuration(stats.total_hours || 0);
-                    }
-                }
-            } catch (error) {
-                console.error(`Error loading stats for project ${project.project_id}:`, error);
+            const element = document.getElementById(`project-hours-${project.project_id}`);
+            if (element) {
+                element.textContent = this.formatDuration(project.stats ? project.stats.total_hours : 0);
             }
         }
     }
@@ -64,7 +64,7 @@ class Timer {
     
     async suggestDescription(projectId) {
         try {
-            const response = await fetch(`${this.timeTracker.apiBase}/time-entries?project_id=${projectId}&user_id=${this.timeTracker.userId}`);
+            const response = await fetch(`${this.timeTracker.apiBase}/time-entries?project_id=${projectId}&user_id=${this.timeTracker.userId}&limit=20&fields=description`);
             const data = await response.json();
             
             if (response.ok && data.entries.length > 0) {
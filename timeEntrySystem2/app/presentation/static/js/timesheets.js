@@ -44,9 +44,11 @@ class TimesheetManager {
 
     async loadTimesheets() {
         try {
-            const response = await fetch('/api/timesheets?user_id=default_user');
+            // Entries come embedded, so hours need no further requests
+            const response = await fetch('/api/timesheets?user_id=default_user&include=entries');
             if (response.ok) {
-                this.timesheets = await response.json();
+                const data = await response.json();
+                this.timesheets = data.timesheets;
                 this.filteredTimesheets = [...this.timesheets];
                 this.renderTimesheets();
                 this.updateStats();
@@ -101,7 +103,7 @@ class TimesheetManager {
             const response = await fetch(`/api/timesheets/${timesheetId}`);
             if (response.ok) {
                 this.currentTimesheet = await response.json();
-                await this.loadTimesheetEntries(timesheetId);
+                this.currentTimesheet.entries = this.currentTimesheet.time_entries || [];
                 this.renderTimesheetDetails();
                 
                 const modal = new bootstrap.Modal(document.getElementById('viewTimesheetModal'));
@@ -115,27 +117,13 @@ class TimesheetManager {
         }
     }
 
-    async loadTimesheetEntries(timesheetId) {
-        try {
-            const response = await fetch(`/api/timesheets/${timesheetId}/entries`);
-            if (response.ok) {
-                this.currentTimesheet.entries = await response.json();
-            } else {
-                this.currentTimesheet.entries = [];
-            }
-        } catch (error) {
-            console.error('Error loading timesheet entries:', error);
-            this.currentTimesheet.entries = [];
-        }
-    }
-
     renderTimesheetDetails() {
         if (!this.currentTimesheet) return;
 
         const container = document.getElementById('timesheet-details');
         const timesheet = this.currentTimesheet;
         
-        const totalHours = timesheet.entries.reduce((sum, entry) => sum + entry.duration_hours, 0);
+        const totalHours = this.sumHours(timesheet.entries);
         const statusBadge = this.getStatusBadge(timesheet.status);
 
         container.innerHTML = `
@@ -193,7 +181,7 @@ class TimesheetManager {
                                 <td>${this.formatDate(entry.start_time)}</td>
                                 <td>${entry.project_name || 'Unknown'}</td>
                                 <td>${entry.description || '-'}</td>
-                                <td>${this.formatDuration(entry.duration_hours)}</td>
+                                <td>${this.formatDuration(entry.duration_minutes / 60)}</td>
                             </tr>
                         `).join('')}
                     </tbody>
@@ -402,28 +390,23 @@ class TimesheetManager {
 
         container.innerHTML = timesheetsHTML;
         
-        // Load hours for each timesheet
-        this.loadTimesheetHours();
+        // Show hours for each timesheet
+        this.renderTimesheetHours();
     }
 
-    async loadTimesheetHours() {
+    renderTimesheetHours() {
         for (const timesheet of this.filteredTimesheets) {
-            try {
-                const response = await fetch(`/api/timesheets/${timesheet.id}/entries`);
-                if (response.ok) {
-                    const entries = await response.json();
-                    const totalHours = entries.reduce((sum, entry) => sum + entry.duration_hours, 0);
-                    const element = document.getElementById(`timesheet-hours-${timesheet.id}`);
-                    if (element) {
-                        element.textContent = this.formatDuration(totalHours);
-                    }
-                }
-            } catch (error) {
-                console.error(`Error loading hours for timesheet ${timesheet.id}:`, error);
+            const element = document.getElementById(`timesheet-hours-${timesheet.id}`);
+            if (element) {
+                element.textContent = this.formatDuration(this.sumHours(timesheet.time_entries || []));
             }
         }
     }
 
+    sumHours(entries) {
+        return entries.reduce((sum, entry) => sum + entry.duration_minutes / 60, 0);
+    }
+
     updateStats() {
         const totalTimesheets = this.timesheets.length;
         const submittedTimesheets = this.timesheets.filter(t => t.status === 'submitted' || t.status === 'approved').length;
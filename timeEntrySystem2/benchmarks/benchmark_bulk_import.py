@@ -0,0 +1,60 @@
+"""
+Benchmark TimeEntryImportService against the JSON and SQLite repositories.
+
+Generates a CSV of non-overlapping historical entries for one user and
+imports it in one call.
+
+Usage: python benchmarks/benchmark_bulk_import.py [rows]
+"""
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.entities.project import Project
+from app.core.services.time_entry_import_service import TimeEntryImportService
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.sqlite_project_repository import SqliteProjectRepository
+from app.infrastructure.repositories.sqlite_time_entry_repository import SqliteTimeEntryRepository
+
+USER_ID = 'user-1'
+BASE_TIME = datetime(2015, 1, 1, 8, 0)
+
+def generate_csv(rows, project_id):
+    """Write rows of back-to-back one-hour entries as CSV"""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(['project_id', 'start_time', 'end_time', 'description'])
+    for i in range(rows):
+        start = BASE_TIME + timedelta(hours=i)
+        writer.writerow([project_id, start.isoformat(),
+                         (start + timedelta(minutes=50)).isoformat(), f'Imported entry {i}'])
+    return out.getvalue()
+
+def run(name, project_repo, time_entry_repo, rows):
+    project = Project(user_id=USER_ID, name='History')
+    project_repo.create(project)
+
+    data = generate_csv(rows, project.project_id)
+    service = TimeEntryImportService(time_entry_repo, project_repo)
+    started = time.perf_counter()
+    result = service.import_entries(io.StringIO(data, newline=''), 'csv', USER_ID)
+    elapsed = time.perf_counter() - started
+    print(f'{name:>8}: {result["entries_imported"]:,}/{rows:,} rows in {elapsed:.2f} s '
+          f'({rows / elapsed:,.0f} rows/sec), {result["error_count"]} errors')
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    data_dir = tempfile.mkdtemp()
+    run('snapshot', JsonProjectRepository(data_dir), JsonTimeEntryRepository(data_dir), rows)
+    data_dir = tempfile.mkdtemp()
+    run('journal', JsonProjectRepository(data_dir),
+        JsonTimeEntryRepository(data_dir, storage='journal'), rows)
+    db_path = os.path.join(tempfile.mkdtemp(), 'time_entries.db')
+    run('sqlite', SqliteProjectRepository(db_path), SqliteTimeEntryRepository(db_path), rows)
@@ -0,0 +1,74 @@
+"""
+Benchmark report aggregation over NumPy columns against daily rollups.
+
+Fills a JSON repository with one user's back-to-back entries spread over
+several years, then totals the whole history both ways.
+
+Usage: python benchmarks/benchmark_columnar_reports.py [entries]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.entities.project import Project
+from app.core.entities.time_entry import TimeEntry
+from app.core.services.report_aggregates import aggregate_rollups
+from app.infrastructure.repositories.time_entry_column_store import aggregate_columns
+from app.core.services.reporting_service import ReportingService
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+
+PROJECTS = 12
+BASE_TIME = datetime(2020, 1, 1, 8, 0)
+
+def timed(label, func, repeat=5):
+    """Print the best time of several runs of func"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{label:>40}: {best * 1000:8.1f} ms')
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    data_dir = tempfile.mkdtemp()
+    project_repo = JsonProjectRepository(data_dir)
+    time_entry_repo = JsonTimeEntryRepository(data_dir, storage='journal')
+    service = ReportingService(time_entry_repo, project_repo, JsonTimesheetRepository(data_dir))
+
+    project_ids = []
+    for i in range(PROJECTS):
+        project = Project(user_id='user', name=f'Project {i}')
+        project_repo.create(project)
+        project_ids.append(project.project_id)
+
+    # Space entries so the history covers about four years
+    step = timedelta(minutes=max(1, 4 * 365 * 24 * 60 // count))
+    entries = []
+    for i in range(count):
+        start = BASE_TIME + step * i
+        entries.append(TimeEntry(user_id='user', project_id=project_ids[i % PROJECTS],
+                                 start_time=start, end_time=start + step))
+    time_entry_repo.create_many(entries)
+    del entries
+    start_date = BASE_TIME.date()
+    end_date = (BASE_TIME + step * count).date()
+    print(f'{count:,} entries from {start_date} to {end_date}')
+
+    # Build the indexes before timing
+    time_entry_repo.get_columns('user', start_date, end_date)
+    time_entry_repo.get_daily_rollups('user', start_date, end_date)
+
+    timed('columns: select + aggregate', lambda: aggregate_columns(
+        time_entry_repo.get_columns('user', start_date, end_date), end_date))
+    timed('rollups: select + aggregate', lambda: aggregate_rollups(
+        time_entry_repo.get_daily_rollups('user', start_date, end_date), start_date, end_date))
+    timed('get_productivity_trends', lambda: service.get_productivity_trends('user', start_date, end_date))
+    timed('get_time_by_project', lambda: service.get_time_by_project('user', start_date, end_date))
@@ -0,0 +1,78 @@
+"""
+Benchmark entry search through the description index against a full scan.
+
+Fills a JSON repository with one user's entries with random descriptions,
+then searches for a rare word, a common prefix and a phrase, both through
+ReportingService.search_entries and by scanning every entry as searches
+did before the index.
+
+Usage: python benchmarks/benchmark_search.py [entries]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.entities.project import Project
+from app.core.entities.time_entry import TimeEntry
+from app.core.services.reporting_service import ReportingService
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+
+WORDS = ['review', 'meeting', 'deploy', 'fix', 'bug', 'design', 'planning', 'client', 'call',
+         'refactor', 'tests', 'docs', 'release', 'support', 'research', 'standup']
+BASE_TIME = datetime(2020, 1, 1, 8, 0)
+
+def timed(label, func, repeat=5):
+    """Print the best time of several runs of func and its result count"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{label:>40}: {best * 1000:8.1f} ms  ({len(result):,} results)')
+
+def scan(time_entry_repo, text):
+    """Match descriptions by substring over every entry"""
+    text = text.lower()
+    return [entry for entry in time_entry_repo.get_by_user_id('user')
+            if entry.description and text in entry.description.lower()]
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    data_dir = tempfile.mkdtemp()
+    project_repo = JsonProjectRepository(data_dir)
+    time_entry_repo = JsonTimeEntryRepository(data_dir, storage='journal')
+    service = ReportingService(time_entry_repo, project_repo, JsonTimesheetRepository(data_dir))
+    project = Project(user_id='user', name='Product')
+    project_repo.create(project)
+
+    rnd = random.Random(42)
+    entries = []
+    for i in range(count):
+        start = BASE_TIME + timedelta(minutes=30 * i)
+        description = ' '.join(rnd.choice(WORDS) for _ in range(rnd.randint(2, 6)))
+        if i % 10_000 == 0:
+            description += ' quarterly audit'
+        entries.append(TimeEntry(user_id='user', project_id=project.project_id, description=description,
+                                 start_time=start, end_time=start + timedelta(minutes=25)))
+    time_entry_repo.create_many(entries)
+    del entries
+    print(f'{count:,} entries')
+
+    # Build the indexes before timing
+    service.search_entries('user', 'audit')
+
+    timed('index: rare word', lambda: service.search_entries('user', 'audit')[0])
+    timed('scan: rare word', lambda: scan(time_entry_repo, 'audit'))
+    timed('index: phrase', lambda: service.search_entries('user', '"quarterly audit"')[0])
+    timed('scan: phrase', lambda: scan(time_entry_repo, 'quarterly audit'))
+    timed('index: prefix', lambda: service.search_entries('user', 'refac')[0], repeat=2)
+    timed('index: prefix, first 50', lambda: service.search_entries('user', 'refac', limit=50)[0])
+    timed('scan: prefix', lambda: scan(time_entry_repo, 'refac'), repeat=2)
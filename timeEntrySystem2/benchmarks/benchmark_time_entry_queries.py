@@ -0,0 +1,115 @@
+"""
+Benchmark date-range and overlap queries of JsonTimeEntryRepository.
+
+Compares the indexed repository against the previous full-scan
+implementation over the same in-memory records.
+
+Usage: python benchmarks/benchmark_time_entry_queries.py [sizes...]
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+
+USERS = 50
+QUERIES = 200
+BASE_TIME = datetime(2020, 1, 1, 8, 0)
+
+def generate_records(count):
+    """Generate non-overlapping entries spread across users"""
+    records = []
+    per_user = count // USERS
+    for u in range(USERS):
+        current = BASE_TIME
+        for i in range(per_user):
+            start = current + timedelta(minutes=random.randint(0, 120))
+            end = start + timedelta(minutes=random.randint(15, 240))
+            current = end
+            records.append({
+                'entry_id': f'{u}-{i}',
+                'user_id': f'user-{u}',
+                'project_id': f'project-{u}-{i % 5}',
+                'timesheet_id': None,
+                'description': None,
+                'start_time': start.isoformat(),
+                'end_time': end.isoformat(),
+                'duration_minutes': int((end - start).total_seconds() / 60),
+                'is_running': False,
+                'created_at': start.isoformat(),
+                'updated_at': end.isoformat()
+            })
+    return records
+
+def scan_date_range(records, user_id, start_date, end_date):
+    """Previous get_by_date_range: parse and filter every record"""
+    result = []
+    for item in records:
+        if item.get('user_id') == user_id:
+            entry_date = datetime.fromisoformat(item.get('start_time', '')).date()
+            if start_date <= entry_date <= end_date:
+                result.append(item)
+    return result
+
+def scan_overlap(records, user_id, start_time, end_time):
+    """Previous check_overlap: parse and compare every record"""
+    for item in records:
+        if item.get('user_id') == user_id:
+            entry_start = datetime.fromisoformat(item.get('start_time', ''))
+            entry_end_str = item.get('end_time')
+            if not entry_end_str:
+                continue
+            if start_time < datetime.fromisoformat(entry_end_str) and end_time > entry_start:
+                return True
+    return False
+
+def timed(fn, queries):
+    started = time.perf_counter()
+    for args in queries:
+        fn(*args)
+    return (time.perf_counter() - started) / len(queries) * 1000
+
+def run(count):
+    records = generate_records(count)
+    data_dir = tempfile.mkdtemp()
+    with open(os.path.join(data_dir, 'time_entries.json'), 'w') as f:
+        json.dump(records, f)
+
+    repo = JsonTimeEntryRepository(data_dir)
+    started = time.perf_counter()
+    data = repo._read_data()
+    repo._ensure_indexes(data)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    span_days = max(1, (datetime.fromisoformat(records[-1]['end_time']) - BASE_TIME).days)
+    range_queries = []
+    overlap_queries = []
+    for _ in range(QUERIES):
+        user_id = f'user-{random.randrange(USERS)}'
+        day = BASE_TIME.date() + timedelta(days=random.randrange(span_days))
+        range_queries.append((user_id, day, day + timedelta(days=6)))
+        start = datetime.combine(day, datetime.min.time()) + timedelta(hours=random.randrange(24))
+        overlap_queries.append((user_id, start, start + timedelta(minutes=30)))
+
+    results = {
+        'range_scan': timed(lambda u, s, e: scan_date_range(data, u, s, e), range_queries),
+        'range_index': timed(lambda u, s, e: repo._records_in_date_range('user_id', u, s, e),
+                             range_queries),
+        'overlap_scan': timed(lambda u, s, e: scan_overlap(data, u, s, e), overlap_queries),
+        'overlap_index': timed(repo.check_overlap, overlap_queries),
+    }
+    print(f'{count:>9,} entries | index build {build_ms:8.1f} ms | '
+          f'date range {results["range_scan"]:8.3f} -> {results["range_index"]:6.3f} ms | '
+          f'overlap {results["overlap_scan"]:8.3f} -> {results["overlap_index"]:6.3f} ms')
+
+if __name__ == '__main__':
+    random.seed(42)
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    for size in sizes:
+        run(size)
@@ -0,0 +1,50 @@
+"""
+Stress concurrent writers against JsonTimeEntryRepository.
+
+Several processes start and stop timers against the same data directory,
+the way gunicorn workers do. The run fails if any create or stop is lost.
+
+Usage: python benchmarks/stress_concurrent_writes.py [workers] [timers_per_worker]
+"""
+import os
+import sys
+import tempfile
+import time
+from multiprocessing import Process
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.entities.time_entry import TimeEntry
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+
+def worker(data_dir, worker_id, storage, timers):
+    repo = JsonTimeEntryRepository(data_dir, storage=storage)
+    for _ in range(timers):
+        entry = TimeEntry(user_id=f'user-{worker_id}', project_id='project', is_running=True)
+        repo.create(entry)
+        entry.stop_timer()
+        repo.update(entry)
+
+def run(storage, workers, timers):
+    data_dir = tempfile.mkdtemp()
+    started = time.perf_counter()
+    processes = [Process(target=worker, args=(data_dir, w, storage, timers)) for w in range(workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - started
+
+    entries = JsonTimeEntryRepository(data_dir, storage=storage).list_all()
+    running = sum(1 for entry in entries if entry.is_running)
+    expected = workers * timers
+    status = 'ok' if len(entries) == expected and running == 0 else 'FAILED'
+    print(f'{storage:>8}: {len(entries)}/{expected} entries, {running} left running, '
+          f'{expected * 2 / elapsed:,.0f} writes/sec - {status}')
+    return status == 'ok'
+
+if __name__ == '__main__':
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    timers = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    results = [run(storage, workers, timers) for storage in ('snapshot', 'journal')]
+    sys.exit(0 if all(results) else 1)
@@ -4,11 +4,22 @@ from app.infrastructure.repositories.json_user_repository import JsonUserReposit
 from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
 from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
 from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+from app.infrastructure.repositories.sharded_json_time_entry_repository import ShardedJsonTimeEntryRepository
+from app.infrastructure.repositories.sharded_json_timesheet_repository import ShardedJsonTimesheetRepository
+from app.infrastructure.repositories.monthly_json_time_entry_repository import MonthlyJsonTimeEntryRepository
+from app.infrastructure.repositories.sqlite_user_repository import SqliteUserRepository
+from app.infrastructure.repositories.sqlite_project_repository import SqliteProjectRepository
+from app.infrastructure.repositories.sqlite_time_entry_repository import SqliteTimeEntryRepository
+from app.infrastructure.repositories.sqlite_timesheet_repository import SqliteTimesheetRepository
 from app.core.services.project_service import ProjectService
 from app.core.services.time_entry_service import TimeEntryService
+from app.core.services.time_entry_import_service import TimeEntryImportService
 from app.core.services.timesheet_service import TimesheetService
 from app.core.services.reporting_service import ReportingService
+from app.core.services.report_cache import ReportCache
+from app.core.services.change_event_bus import ChangeEventBus
 from app.core.services.user_preferences_service import UserPreferencesService
+from app.core.entities.timesheet import TimesheetStatus
 from app.presentation.api.project_api import project_bp
 from app.presentation.api.time_entry_api import time_entry_bp
 from app.presentation.api.timesheet_api import timesheet_bp
@@ -27,25 +38,87 @@ def create_app():
     data_dir = os.path.join(os.path.dirname(__file__), 'data')
     os.makedirs(data_dir, exist_ok=True)
     
-    # Initialize repositories
-    user_repo = JsonUserRepository(data_dir)
-    project_repo = JsonProjectRepository(data_dir)
-    time_entry_repo = JsonTimeEntryRepository(data_dir)
-    timesheet_repo = JsonTimesheetRepository(data_dir)
+    # Repository backend: 'json' (default) or 'sqlite'. Existing JSON data can
+    # be copied over with: python -m app.infrastructure.migrations.json_to_sqlite
+    backend = os.environ.get('REPOSITORY_BACKEND', 'json')
+    # Saved changes are published here by the JSON repositories
+    event_bus = None
+    
+    if backend == 'sqlite':
+        db_path = os.path.join(data_dir, 'time_tracking.db')
+        user_repo = SqliteUserRepository(db_path)
+        project_repo = SqliteProjectRepository(db_path)
+        time_entry_repo = SqliteTimeEntryRepository(db_path)
+        timesheet_repo = SqliteTimesheetRepository(db_path)
+    else:
+        # Storage backend per repository: 'snapshot' (default) rewrites the whole
+        # JSON file on every change, 'journal' appends each change to a JSON-lines
+        # journal that is compacted into the snapshot in the background, so the
+        # snapshot file alone lags behind. Chosen with <NAME>_STORAGE, e.g.
+        # TIME_ENTRIES_STORAGE=journal
+        storage = {
+            name: os.environ.get(f'{name.upper()}_STORAGE', 'snapshot')
+            for name in ('users', 'projects', 'time_entries', 'timesheets')
+        }
+        
+        event_bus = ChangeEventBus()
+        
+        # File layout of time entries and timesheets: 'single' keeps all users
+        # in one file each, 'sharded' gives every user their own directory,
+        # 'monthly' splits time entries by month and freezes approved months.
+        # Existing data can be split with:
+        # python -m app.infrastructure.migrations.json_to_sharded
+        # python -m app.infrastructure.migrations.json_to_monthly
+        layout = os.environ.get('JSON_LAYOUT', 'single')
+        if layout == 'sharded':
+            time_entry_class, timesheet_class = ShardedJsonTimeEntryRepository, ShardedJsonTimesheetRepository
+        elif layout == 'monthly':
+            time_entry_class, timesheet_class = MonthlyJsonTimeEntryRepository, JsonTimesheetRepository
+        else:
+            time_entry_class, timesheet_class = JsonTimeEntryRepository, JsonTimesheetRepository
+        
+        # Initialize repositories (parsed records stay in memory and are
+        # reloaded only when the files' mtime/size change)
+        user_repo = JsonUserRepository(data_dir, storage=storage['users'], event_bus=event_bus)
+        project_repo = JsonProjectRepository(data_dir, storage=storage['projects'], event_bus=event_bus)
+        time_entry_repo = time_entry_class(data_dir, storage=storage['time_entries'],
+                                           event_bus=event_bus)
+        timesheet_repo = timesheet_class(data_dir, storage=storage['timesheets'],
+                                         event_bus=event_bus)
+        
+        if layout == 'monthly':
+            def archive_approved_months():
+                approved = [timesheet.timesheet_id for timesheet in timesheet_repo.list_all()
+                            if timesheet.status == TimesheetStatus.APPROVED]
+                time_entry_repo.archive_approved_months(approved)
+            
+            # Freeze months on start and after each approval, off the request
+            # thread; one queued run covers any approvals dropped behind it
+            archive_approved_months()
+            event_bus.subscribe(
+                lambda event: archive_approved_months()
+                if event.after and event.after.get('status') == TimesheetStatus.APPROVED.value else None,
+                entities=['timesheets'], threaded=True, max_queue=1, overflow='drop')
     
     # Initialize services
     project_service = ProjectService(project_repo, time_entry_repo)
     time_entry_service = TimeEntryService(time_entry_repo, project_repo)
+    time_entry_import_service = TimeEntryImportService(time_entry_repo, project_repo)
     timesheet_service = TimesheetService(timesheet_repo, time_entry_repo)
-    reporting_service = ReportingService(time_entry_repo, project_repo, timesheet_repo)
-    user_preferences_service = UserPreferencesService(user_repo)
+    # Report results are cached until the user's data changes; REPORT_CACHE_SIZE=0 disables it
+    report_cache_size = int(os.environ.get('REPORT_CACHE_SIZE', 1024))
+    report_cache = ReportCache(report_cache_size) if report_cache_size > 0 else None
+    reporting_service = ReportingService(time_entry_repo, project_repo, timesheet_repo, report_cache)
+    user_preferences_service = UserPreferencesService(user_repo, time_entry_import_service)
     
     # Store services in app context
     app.project_service = project_service
     app.time_entry_service = time_entry_service
+    app.time_entry_import_service = time_entry_import_service
     app.timesheet_service = timesheet_service
     app.reporting_service = reporting_service
     app.user_preferences_service = user_preferences_service
+    app.event_bus = event_bus
     
     # Register blueprints
     app.register_blueprint(project_bp, url_prefix='/api/projects')
@@ -53,6 +126,13 @@ def create_app():
     app.register_blueprint(timesheet_bp, url_prefix='/api/timesheets')
     app.register_blueprint(reporting_bp, url_prefix='/api/reports')
     
+    @app.route('/api/change-events/stats')
+    def change_event_stats():
+        # Subscriber queue depths, drops and time writers spent blocked
+        if event_bus is None:
+            return jsonify({'enabled': False})
+        return jsonify(dict(event_bus.stats(), enabled=True))
+    
     @app.route('/')
     def index():
         return render_template('index.html')
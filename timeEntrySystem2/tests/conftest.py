@@ -0,0 +1,54 @@
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pytest
+
+# The app package lives next to this directory
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.entities.time_entry import TimeEntry
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.monthly_json_time_entry_repository import MonthlyJsonTimeEntryRepository
+from app.infrastructure.repositories.sharded_json_time_entry_repository import ShardedJsonTimeEntryRepository
+from app.infrastructure.repositories.sqlite_time_entry_repository import SqliteTimeEntryRepository
+
+def make_entry(start_time: datetime, user_id: str = 'user-1', project_id: str = 'project-1',
+               minutes: Optional[int] = 60, **kwargs) -> TimeEntry:
+    """Build a time entry lasting minutes from start_time, or a running one if minutes is None"""
+    end_time = start_time + timedelta(minutes=minutes) if minutes is not None else None
+    return TimeEntry(user_id=user_id, project_id=project_id, start_time=start_time, end_time=end_time,
+                     is_running=minutes is None, **kwargs)
+
+TIME_ENTRY_REPOSITORIES = {
+    'json': lambda path: JsonTimeEntryRepository(path),
+    'json-journal': lambda path: JsonTimeEntryRepository(path, storage='journal'),
+    'sharded': lambda path: ShardedJsonTimeEntryRepository(path),
+    'monthly': lambda path: MonthlyJsonTimeEntryRepository(path),
+    'sqlite': lambda path: SqliteTimeEntryRepository(os.path.join(path, 'time_tracking.db')),
+}
+
+@pytest.fixture(params=sorted(TIME_ENTRY_REPOSITORIES))
+def open_time_entry_repo(request, tmp_path):
+    """Open a new instance of each time entry repository implementation over one data directory"""
+    return lambda: TIME_ENTRY_REPOSITORIES[request.param](str(tmp_path))
+
+@pytest.fixture
+def time_entry_repo(open_time_entry_repo):
+    """Each time entry repository implementation, over an empty data directory"""
+    return open_time_entry_repo()
+
+@pytest.fixture
+def time_entry_client(tmp_path):
+    """Test client of the time entry API over a JSON repository, available as app.test_repo"""
+    flask = pytest.importorskip('flask')
+    from app.core.services.time_entry_service import TimeEntryService
+    from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+    from app.presentation.api.time_entry_api import time_entry_bp
+
+    app = flask.Flask(__name__)
+    app.test_repo = JsonTimeEntryRepository(str(tmp_path))
+    app.time_entry_service = TimeEntryService(app.test_repo, JsonProjectRepository(str(tmp_path)))
+    app.register_blueprint(time_entry_bp, url_prefix='/api/time-entries')
+    return app.test_client()
@@ -0,0 +1,91 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import make_entry
+from app.core.entities.change_event import ChangeOperation
+from app.core.services.change_event_bus import ChangeEventBus
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+
+START = datetime(2026, 1, 12, 9)
+
+def test_events_are_numbered_and_filtered_by_entity():
+    bus = ChangeEventBus()
+    everything, projects = [], []
+    bus.subscribe(everything.append)
+    bus.subscribe(projects.append, entities=['projects'])
+
+    bus.publish('time_entries', 'entry-1', ChangeOperation.CREATE, 'user-1')
+    bus.publish('projects', 'project-1', ChangeOperation.UPDATE, 'user-1')
+
+    assert [event.sequence for event in everything] == [1, 2]
+    assert [event.entity_id for event in projects] == ['project-1']
+    assert bus.last_sequence == 2
+
+def test_handler_errors_are_counted_not_raised():
+    bus = ChangeEventBus()
+
+    def fail(event):
+        raise RuntimeError('handler broke')
+
+    subscription = bus.subscribe(fail)
+    bus.publish('time_entries', 'entry-1', ChangeOperation.CREATE)
+
+    assert (subscription.errors, subscription.last_error) == (1, 'handler broke')
+
+def test_full_threaded_queue_drops_or_blocks_by_policy():
+    bus = ChangeEventBus()
+    release = threading.Event()
+    dropping = bus.subscribe(lambda event: release.wait(), threaded=True, max_queue=1, overflow='drop')
+    blocking = bus.subscribe(lambda event: release.wait(), threaded=True, max_queue=1, block_timeout=0.05)
+
+    # The first event is taken by each worker, the second fills its queue
+    for i in range(4):
+        bus.publish('time_entries', f'entry-{i}', ChangeOperation.CREATE)
+    release.set()
+    bus.unsubscribe(dropping)
+    bus.unsubscribe(blocking)
+    dropping._worker.join(5)
+    blocking._worker.join(5)
+
+    assert dropping.dropped >= 1 and dropping.blocked == 0
+    assert blocking.blocked >= blocking.dropped >= 1
+    assert dropping.delivered + dropping.dropped == 4
+    assert blocking.delivered + blocking.dropped == 4
+
+def test_repository_publishes_saved_changes(tmp_path):
+    bus = ChangeEventBus()
+    events = []
+    bus.subscribe(events.append)
+    repo = JsonTimeEntryRepository(str(tmp_path), event_bus=bus)
+
+    entry = repo.create(make_entry(START))
+    entry.description = 'edited'
+    repo.update(entry)
+    repo.delete(entry.entry_id)
+
+    assert [(event.operation, event.entity, event.entity_id, event.user_id) for event in events] == [
+        (operation, 'time_entries', entry.entry_id, 'user-1')
+        for operation in (ChangeOperation.CREATE, ChangeOperation.UPDATE, ChangeOperation.DELETE)]
+    assert events[0].before is None and events[2].after is None
+    assert events[1].before['description'] is None and events[1].after['description'] == 'edited'
+
+def test_batches_publish_after_saving_and_rollbacks_publish_nothing(tmp_path):
+    bus = ChangeEventBus()
+    repo = JsonTimeEntryRepository(str(tmp_path), event_bus=bus)
+    seen_on_disk = []
+    bus.subscribe(lambda event: seen_on_disk.append(
+        JsonTimeEntryRepository(str(tmp_path)).get_by_id(event.entity_id) is not None))
+
+    with repo.batch():
+        repo.create(make_entry(START))
+        repo.create(make_entry(START + timedelta(hours=2)))
+        assert seen_on_disk == []
+    with pytest.raises(RuntimeError):
+        with repo.batch():
+            repo.create(make_entry(START + timedelta(hours=4)))
+            raise RuntimeError('abandon')
+
+    assert seen_on_disk == [True, True]
+    assert bus.last_sequence == 2
@@ -0,0 +1,74 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from conftest import make_entry
+from app.core.services.time_entry_service import TimeEntryService
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from app.presentation.api.server_sent_events import format_event, parse_last_event_id
+
+START = datetime(2026, 1, 12, 9)
+
+def _create_later(repo, entry, delay=0.2):
+    thread = threading.Timer(delay, repo.create, (entry,))
+    thread.start()
+    return thread
+
+def test_wait_wakes_on_a_save(time_entry_repo):
+    version = time_entry_repo.get_data_version('user-1')
+    writer = _create_later(time_entry_repo, make_entry(START))
+
+    started = time.monotonic()
+    changed = time_entry_repo.wait_for_change('user-1', version, 10)
+    writer.join()
+
+    assert changed != version
+    assert time.monotonic() - started < 5
+
+def test_wait_sees_saves_of_another_instance(open_time_entry_repo):
+    repo = open_time_entry_repo()
+    version = repo.get_data_version('user-1')
+    writer = _create_later(open_time_entry_repo(), make_entry(START))
+
+    started = time.monotonic()
+    changed = repo.wait_for_change('user-1', version, 10)
+    writer.join()
+
+    assert changed != version
+    assert time.monotonic() - started < 5
+
+def test_wait_times_out_with_the_same_version(time_entry_repo):
+    version = time_entry_repo.get_data_version('user-1')
+
+    assert time_entry_repo.wait_for_change('user-1', version, 0.1) == version
+
+def test_watch_sends_the_timer_then_timer_and_entry_changes(tmp_path, time_entry_repo):
+    service = TimeEntryService(time_entry_repo, JsonProjectRepository(str(tmp_path)))
+    changes = service.watch_changes('user-1', heartbeat_seconds=0.1)
+
+    event, first_version, timer = next(changes)
+    assert (event, timer) == ('timer', None)
+    assert next(changes) is None
+
+    running = time_entry_repo.create(make_entry(datetime.now() - timedelta(minutes=5), minutes=None))
+    events = [next(changes), next(changes)]
+
+    assert [(event, version > first_version) for event, version, _ in events] == [('timer', True), ('entries', True)]
+    assert events[0][2]['entry_id'] == running.entry_id
+
+def test_events_are_formatted_with_ids():
+    assert format_event('timer', None, 7) == 'event: timer\nid: 7\ndata: null\n\n'
+    assert parse_last_event_id('12') == 12
+    assert parse_last_event_id('soon') is None
+    assert parse_last_event_id(None) is None
+
+def test_stream_needs_a_threaded_server(time_entry_client):
+    single = time_entry_client.get('/api/time-entries/stream?user_id=user-1',
+                                   environ_overrides={'wsgi.multithread': False})
+    threaded = time_entry_client.get('/api/time-entries/stream?user_id=user-1', buffered=False,
+                                     environ_overrides={'wsgi.multithread': True})
+
+    assert single.status_code == 503
+    assert threaded.mimetype == 'text/event-stream'
+    assert next(threaded.response) == b'retry: 5000\n\n'
+    threaded.close()
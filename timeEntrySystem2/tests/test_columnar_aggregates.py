@@ -0,0 +1,35 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import make_entry
+from app.core.services.report_aggregates import aggregate_rollups
+
+pytest.importorskip('numpy')
+
+START = datetime(2026, 1, 12, 9)
+
+RANGES = [(date(2025, 12, 1), date(2026, 3, 31)), (date(2026, 1, 7), date(2026, 1, 21)),
+          (date(2026, 1, 12), date(2026, 1, 12)), (date(2027, 1, 1), date(2027, 1, 31))]
+
+def test_columns_and_rollups_give_the_same_totals(time_entry_repo):
+    rng = random.Random(16)
+    entries = [time_entry_repo.create(make_entry(START + timedelta(days=rng.randrange(-30, 40), hours=rng.randrange(8)),
+                                                 project_id=rng.choice(['project-1', 'project-2', 'project-3']),
+                                                 minutes=rng.choice([0, 5, 30, 90, 240])))
+               for _ in range(120)]
+    for entry in entries[:10]:
+        entry.project_id = 'project-4'
+        time_entry_repo.update(entry)
+    for entry in entries[10:25]:
+        time_entry_repo.delete(entry.entry_id)
+
+    for start_date, end_date in RANGES:
+        for by_day, by_week in [(False, False), (True, True)]:
+            columns = time_entry_repo.aggregate_range('user-1', start_date, end_date, by_day, by_week)
+            if columns is None:
+                pytest.skip('repository has no columnar aggregation')
+            rollups = aggregate_rollups(time_entry_repo.get_daily_rollups('user-1', start_date, end_date),
+                                        start_date, end_date, by_day, by_week)
+            assert columns == rollups
@@ -0,0 +1,51 @@
+import threading
+from datetime import datetime, timedelta
+
+from conftest import make_entry
+
+WORKERS = 4
+TIMERS_PER_WORKER = 15
+
+def _run_workers(target):
+    errors = []
+
+    def run(worker_id):
+        try:
+            target(worker_id)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(worker_id,)) for worker_id in range(WORKERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+def test_concurrent_writers_lose_no_updates(open_time_entry_repo):
+    # One repository instance per worker, as with separate server processes
+    def start_and_stop_timers(worker_id):
+        repo = open_time_entry_repo()
+        for timer in range(TIMERS_PER_WORKER):
+            entry = repo.create(make_entry(datetime.now() - timedelta(minutes=timer + 1), minutes=None,
+                                           user_id=f'user-{worker_id % 2}'))
+            entry.stop_timer()
+            repo.update(entry)
+
+    _run_workers(start_and_stop_timers)
+
+    entries = open_time_entry_repo().list_all()
+    assert len(entries) == WORKERS * TIMERS_PER_WORKER
+    assert not any(entry.is_running for entry in entries)
+
+def test_concurrent_writers_through_one_repository(time_entry_repo):
+    def create_and_delete(worker_id):
+        for timer in range(TIMERS_PER_WORKER):
+            kept = time_entry_repo.create(make_entry(datetime(2026, 3, 1 + timer, 9, worker_id)))
+            dropped = time_entry_repo.create(make_entry(datetime(2026, 4, 1 + timer, 9, worker_id)))
+            assert time_entry_repo.delete(dropped.entry_id)
+            assert time_entry_repo.get_by_id(kept.entry_id) is not None
+
+    _run_workers(create_and_delete)
+
+    assert len(time_entry_repo.get_by_user_id('user-1')) == WORKERS * TIMERS_PER_WORKER
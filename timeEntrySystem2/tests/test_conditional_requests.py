@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+from conftest import make_entry
+
+START = datetime(2026, 1, 12, 9)
+
+def _revalidate(client, url, response):
+    return client.get(url, headers={'If-None-Match': response.headers['ETag']})
+
+def test_unchanged_listing_is_not_modified(time_entry_client):
+    repo = time_entry_client.application.test_repo
+    repo.create(make_entry(START))
+    url = '/api/time-entries?user_id=user-1'
+    response = time_entry_client.get(url)
+
+    again = _revalidate(time_entry_client, url, response)
+
+    assert response.status_code == 200
+    assert again.status_code == 304
+    assert again.headers['ETag'] == response.headers['ETag']
+    assert again.data == b''
+
+def test_listing_changes_only_with_the_users_entries(time_entry_client):
+    repo = time_entry_client.application.test_repo
+    url = '/api/time-entries?user_id=user-1'
+    response = time_entry_client.get(url)
+
+    repo.create(make_entry(START, user_id='user-2'))
+    assert _revalidate(time_entry_client, url, response).status_code == 304
+
+    repo.create(make_entry(START))
+    changed = _revalidate(time_entry_client, url, response)
+    assert changed.status_code == 200
+    assert len(changed.get_json()) == 1
+
+def test_project_listing_changes_with_any_users_entries(time_entry_client):
+    repo = time_entry_client.application.test_repo
+    url = '/api/time-entries?user_id=user-1&project_id=project-1'
+    response = time_entry_client.get(url)
+
+    repo.create(make_entry(START, user_id='user-2', project_id='project-1'))
+    changed = _revalidate(time_entry_client, url, response)
+
+    assert changed.status_code == 200
+    assert [entry['user_id'] for entry in changed.get_json()] == ['user-2']
+
+def test_running_timer_is_revalidated(time_entry_client):
+    repo = time_entry_client.application.test_repo
+    running = repo.create(make_entry(datetime.now() - timedelta(minutes=5), minutes=None))
+    url = '/api/time-entries/running?user_id=user-1'
+    response = time_entry_client.get(url)
+
+    assert response.get_json()['entry_id'] == running.entry_id
+    assert _revalidate(time_entry_client, url, response).status_code == 304
+
+    running.stop_timer()
+    repo.update(running)
+    assert _revalidate(time_entry_client, url, response).status_code == 404
+
+def test_errors_carry_no_etag(time_entry_client):
+    response = time_entry_client.get('/api/time-entries?user_id=user-1&start_date=yesterday')
+
+    assert response.status_code == 400
+    assert 'ETag' not in response.headers
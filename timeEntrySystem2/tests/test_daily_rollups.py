@@ -0,0 +1,73 @@
+import random
+from datetime import date, datetime, timedelta
+
+from conftest import make_entry
+from app.core.entities.daily_rollup import DailyRollup
+
+START = datetime(2026, 1, 12, 9)
+
+def _expected_rollups(entries, user_id, start_date, end_date):
+    """Compute rollups the slow way, from the entries themselves"""
+    buckets = {}
+    for entry in entries:
+        day = entry.start_time.date()
+        if entry.user_id != user_id or not start_date <= day <= end_date:
+            continue
+        bucket = buckets.setdefault((day, entry.project_id), [0, 0, []])
+        bucket[0] += entry.duration_minutes
+        bucket[1] += 1
+        if entry.duration_minutes > 0:
+            bucket[2].append(entry.duration_minutes)
+    return [DailyRollup(user_id=user_id, project_id=project_id, day=day, minutes=minutes,
+                        entry_count=count, session_count=len(sessions),
+                        longest_session_minutes=max(sessions, default=0),
+                        shortest_session_minutes=min(sessions, default=0))
+            for (day, project_id), (minutes, count, sessions) in sorted(buckets.items())]
+
+def _rollups(repo, user_id, start_date, end_date):
+    return sorted(repo.get_daily_rollups(user_id, start_date, end_date), key=lambda r: (r.day, r.project_id))
+
+def test_rollups_follow_creates_updates_and_deletes(time_entry_repo):
+    rng = random.Random(11)
+    entries = []
+    for i in range(60):
+        entries.append(time_entry_repo.create(make_entry(
+            START + timedelta(days=rng.randrange(20), hours=rng.randrange(8)),
+            user_id=rng.choice(['user-1', 'user-2']), project_id=rng.choice(['project-1', 'project-2']),
+            minutes=rng.choice([15, 30, 45, 120]))))
+
+    for entry in entries[:10]:
+        entry.project_id = 'project-3'
+        entry.end_time += timedelta(minutes=rng.randrange(1, 60))
+        entry.calculate_duration()
+        time_entry_repo.update(entry)
+    for entry in entries[10:20]:
+        time_entry_repo.delete(entry.entry_id)
+    remaining = entries[:10] + entries[20:]
+
+    for start_date, end_date in [(date(2026, 1, 1), date(2026, 2, 28)), (date(2026, 1, 15), date(2026, 1, 20))]:
+        for user_id in ('user-1', 'user-2'):
+            assert _rollups(time_entry_repo, user_id, start_date, end_date) == \
+                _expected_rollups(remaining, user_id, start_date, end_date)
+
+def test_stopped_timer_counts_as_a_session(time_entry_repo):
+    running = time_entry_repo.create(make_entry(datetime.now() - timedelta(minutes=30), minutes=None))
+    today = running.start_time.date()
+
+    [rollup] = time_entry_repo.get_daily_rollups('user-1', today, today)
+    assert (rollup.entry_count, rollup.session_count) == (1, 0)
+
+    running.stop_timer()
+    time_entry_repo.update(running)
+
+    [rollup] = time_entry_repo.get_daily_rollups('user-1', today, today)
+    assert (rollup.entry_count, rollup.session_count) == (1, 1)
+    assert rollup.minutes == running.duration_minutes
+
+def test_rollups_can_be_limited_to_a_project(time_entry_repo):
+    time_entry_repo.create(make_entry(START, project_id='project-1'))
+    time_entry_repo.create(make_entry(START + timedelta(hours=2), project_id='project-2', minutes=30))
+
+    rollups = time_entry_repo.get_daily_rollups('user-1', START.date(), START.date(), project_id='project-2')
+
+    assert [(rollup.project_id, rollup.minutes) for rollup in rollups] == [('project-2', 30)]
@@ -0,0 +1,50 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import make_entry
+from app.core.entities.project import Project
+from app.core.services.reporting_service import ReportingService
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+
+# A Friday whose week runs into February
+TODAY = date(2026, 1, 30)
+
+@pytest.fixture
+def reporting(tmp_path, time_entry_repo):
+    projects = JsonProjectRepository(str(tmp_path))
+    return ReportingService(time_entry_repo, projects, JsonTimesheetRepository(str(tmp_path))), projects
+
+def _at(day, hour=9):
+    return datetime.combine(day, datetime.min.time()) + timedelta(hours=hour)
+
+def test_dashboard_totals_today_week_and_month(reporting, time_entry_repo):
+    service, projects = reporting
+    project = projects.create(Project(user_id='user-1', name='Client work'))
+    time_entry_repo.create(make_entry(_at(TODAY), project_id=project.project_id, minutes=60))
+    time_entry_repo.create(make_entry(_at(TODAY, 13), project_id='project-2', minutes=30))
+    time_entry_repo.create(make_entry(_at(date(2026, 1, 26)), project_id=project.project_id, minutes=120))
+    time_entry_repo.create(make_entry(_at(date(2026, 2, 1)), project_id=project.project_id, minutes=45))
+    time_entry_repo.create(make_entry(_at(date(2026, 1, 5)), project_id='project-2', minutes=90))
+    time_entry_repo.create(make_entry(_at(TODAY), user_id='user-2', minutes=600))
+
+    dashboard = service.get_dashboard('user-1', today=TODAY)
+
+    assert (dashboard['today']['total_minutes'], dashboard['today']['entry_count']) == (90, 2)
+    assert [entry['project_name'] for entry in dashboard['today']['entries']] == ['Client work', 'Unknown']
+    assert (dashboard['week']['total_minutes'], dashboard['week']['entry_count']) == (255, 4)
+    assert [day['minutes'] for day in dashboard['week']['daily_breakdown']] == [120, 0, 0, 0, 90, 0, 45]
+    assert (dashboard['month']['total_minutes'], dashboard['month']['entry_count']) == (300, 4)
+    assert [(row['project_id'], row['today_hours'], row['week_hours'], row['month_hours'])
+            for row in dashboard['project_breakdown']] == [(project.project_id, 1.0, 3.75, 3.0),
+                                                           ('project-2', 0.5, 0.5, 2.0)]
+    assert dashboard['running_timer'] is None
+
+def test_dashboard_finds_a_timer_started_before_the_month(reporting, time_entry_repo):
+    service, _ = reporting
+    running = time_entry_repo.create(make_entry(_at(date(2025, 12, 31), 22), minutes=None))
+
+    dashboard = service.get_dashboard('user-1', today=TODAY)
+
+    assert dashboard['running_timer']['entry_id'] == running.entry_id
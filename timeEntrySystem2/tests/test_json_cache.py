@@ -0,0 +1,37 @@
+import json
+
+from app.core.entities.user import User
+from app.infrastructure.repositories.json_user_repository import JsonUserRepository
+
+def test_unchanged_file_is_not_read_again(tmp_path):
+    repo = JsonUserRepository(str(tmp_path))
+    repo.create(User(user_id='user-1', username='ada'))
+
+    assert repo._read_data() is repo._read_data()
+
+def test_write_through_another_repository_is_seen(tmp_path):
+    reader = JsonUserRepository(str(tmp_path))
+    writer = JsonUserRepository(str(tmp_path))
+    reader.create(User(user_id='user-1', username='ada'))
+    assert reader.get_by_id('user-1').username == 'ada'
+
+    changed = writer.get_by_id('user-1')
+    changed.username = 'grace'
+    writer.update(changed)
+    writer.create(User(user_id='user-2', username='alan'))
+
+    assert reader.get_by_id('user-1').username == 'grace'
+    assert reader.get_by_username('alan').user_id == 'user-2'
+
+def test_file_edited_by_hand_is_seen(tmp_path):
+    repo = JsonUserRepository(str(tmp_path))
+    repo.create(User(user_id='user-1', username='ada'))
+    repo.get_by_id('user-1')
+
+    with open(repo.filepath) as f:
+        records = json.load(f)
+    records[0]['username'] = 'edited'
+    with open(repo.filepath, 'w') as f:
+        json.dump(records, f)
+
+    assert repo.get_by_id('user-1').username == 'edited'
@@ -0,0 +1,61 @@
+import json
+
+from app.infrastructure.repositories.json_storage import JOURNAL_SUFFIX, JournalStorage, SnapshotStorage
+
+def _journal(tmp_path):
+    storage = JournalStorage(str(tmp_path / 'records.json'), 'id')
+    storage.ensure_exists()
+    return storage
+
+def test_journal_replays_puts_and_deletes_over_snapshot(tmp_path):
+    storage = _journal(tmp_path)
+    storage.save([], [('put', {'id': 'a', 'value': 1}), ('put', {'id': 'b', 'value': 2})])
+    storage.save([], [('put', {'id': 'a', 'value': 3}), ('delete', 'b')])
+
+    assert storage.load() == [{'id': 'a', 'value': 3}]
+    assert storage.journal_length == 4
+
+def test_journal_skips_torn_last_line(tmp_path):
+    storage = _journal(tmp_path)
+    storage.save([], [('put', {'id': 'a'})])
+    with open(storage.journal_path, 'a') as f:
+        # An append interrupted mid-line
+        f.write('{"op": "put", "record": {"id": "b"')
+
+    assert storage.load() == [{'id': 'a'}]
+    assert storage.journal_length == 1
+
+def test_append_after_torn_line_starts_a_new_line(tmp_path):
+    storage = _journal(tmp_path)
+    storage.save([], [('put', {'id': 'a'})])
+    with open(storage.journal_path, 'a') as f:
+        f.write('{"op": "put", "rec')
+
+    storage.save([], [('put', {'id': 'c'})])
+
+    assert sorted(record['id'] for record in storage.load()) == ['a', 'c']
+    with open(storage.journal_path) as f:
+        lines = f.read().splitlines()
+    assert json.loads(lines[-1]) == {'op': 'put', 'record': {'id': 'c'}}
+
+def test_compact_folds_journal_into_snapshot(tmp_path):
+    storage = _journal(tmp_path)
+    storage.save([], [('put', {'id': 'a'}), ('put', {'id': 'b'}), ('delete', 'a')])
+
+    storage.compact(storage.load())
+
+    with open(storage.filepath) as f:
+        assert json.load(f) == [{'id': 'b'}]
+    assert (tmp_path / ('records.json' + JOURNAL_SUFFIX)).read_text() == ''
+    assert storage.load() == [{'id': 'b'}]
+
+def test_snapshot_storage_folds_in_a_leftover_journal(tmp_path):
+    journal = _journal(tmp_path)
+    journal.save([], [('put', {'id': 'a'})])
+
+    # The same file switched back to snapshot storage
+    snapshot = SnapshotStorage(journal.filepath, 'id')
+    snapshot.ensure_exists()
+
+    assert snapshot.load() == [{'id': 'a'}]
+    assert (tmp_path / ('records.json' + JOURNAL_SUFFIX)).read_text() == ''
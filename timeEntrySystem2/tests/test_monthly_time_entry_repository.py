@@ -0,0 +1,166 @@
+import json
+import os
+from datetime import datetime, timedelta
+
+from app.infrastructure.repositories.monthly_json_time_entry_repository import MonthlyJsonTimeEntryRepository
+from app.infrastructure.repositories.monthly_layout import PARTITION_FILE, PARTITION_ROOT, SEGMENT_SUMMARY
+from app.infrastructure.repositories.json_storage import SEGMENT_SUFFIX
+from conftest import make_entry
+
+# Past months, so they can be frozen
+JANUARY = datetime(2025, 1, 6, 9)
+FEBRUARY = datetime(2025, 2, 3, 9)
+
+def _month_files(data_dir, month):
+    return sorted(name for name in os.listdir(os.path.join(data_dir, PARTITION_ROOT, month))
+                  if not name.endswith('.lock'))
+
+def _approved_january(repo):
+    entries = [make_entry(JANUARY + timedelta(days=day), timesheet_id='sheet-1') for day in range(3)]
+    repo.create_many(entries)
+    return entries
+
+def test_archive_freezes_only_fully_approved_past_months(tmp_path):
+    repo = MonthlyJsonTimeEntryRepository(str(tmp_path))
+    _approved_january(repo)
+    repo.create(make_entry(FEBRUARY, timesheet_id='sheet-2'))
+    repo.create(make_entry(datetime.now() - timedelta(minutes=90), timesheet_id='sheet-1'))
+
+    assert repo.archive_approved_months(['sheet-1']) == ['2025-01']
+    assert _month_files(str(tmp_path), '2025-01') == sorted([SEGMENT_SUMMARY, PARTITION_FILE + SEGMENT_SUFFIX,
+                                                             PARTITION_FILE])
+    assert repo.archive_approved_months(['sheet-1']) == []
+
+def test_running_timer_keeps_month_hot(tmp_path):
+    repo = MonthlyJsonTimeEntryRepository(str(tmp_path))
+    _approved_january(repo)
+    running = repo.create(make_entry(JANUARY, minutes=None, timesheet_id='sheet-1'))
+
+    assert repo.archive_approved_months(['sheet-1']) == []
+    assert repo.get_running_timer('user-1').entry_id == running.entry_id
+
+def test_frozen_month_reads_like_hot_one(tmp_path):
+    repo = MonthlyJsonTimeEntryRepository(str(tmp_path))
+    entries = _approved_january(repo)
+    before = [entry.to_dict() for entry in repo.get_by_user_id('user-1')]
+
+    repo.archive_approved_months(['sheet-1'])
+
+    assert [entry.to_dict() for entry in repo.get_by_user_id('user-1')] == before
+    assert repo.get_by_id(entries[1].entry_id).entry_id == entries[1].entry_id
+    assert len(repo.get_by_date_range('user-1', JANUARY.date(), JANUARY.date() + timedelta(days=1))) == 2
+    assert repo.get_by_timesheet_id('sheet-1') and not repo.get_by_project_id('project-2')
+
+def test_start_removes_hot_files_left_by_freezing(tmp_path):
+    data_dir = str(tmp_path)
+    repo = MonthlyJsonTimeEntryRepository(data_dir)
+    entries = _approved_january(repo)
+    repo.archive_approved_months(['sheet-1'])
+
+    restarted = MonthlyJsonTimeEntryRepository(data_dir)
+
+    assert _month_files(data_dir, '2025-01') == sorted([SEGMENT_SUMMARY, PARTITION_FILE + SEGMENT_SUFFIX])
+    assert len(restarted.get_by_user_id('user-1')) == len(entries)
+
+def test_writing_to_frozen_month_thaws_it(tmp_path):
+    data_dir = str(tmp_path)
+    repo = MonthlyJsonTimeEntryRepository(data_dir)
+    entries = _approved_january(repo)
+    repo.archive_approved_months(['sheet-1'])
+    version = repo.get_changes('user-1').version
+
+    added = repo.create(make_entry(JANUARY + timedelta(days=10)))
+
+    assert SEGMENT_SUMMARY not in _month_files(data_dir, '2025-01')
+    assert len(repo.get_by_user_id('user-1')) == len(entries) + 1
+    # Thawing moves the layout, so clients start over
+    assert repo.get_changes('user-1', version).reset
+    restarted = MonthlyJsonTimeEntryRepository(data_dir)
+    assert restarted.get_by_id(added.entry_id) is not None
+    assert _month_files(data_dir, '2025-01') == [PARTITION_FILE]
+
+def test_write_from_process_that_missed_the_freeze_is_kept(tmp_path):
+    data_dir = str(tmp_path)
+    freezer = MonthlyJsonTimeEntryRepository(data_dir)
+    writer = MonthlyJsonTimeEntryRepository(data_dir)
+    entries = _approved_january(freezer)
+    # The writer holds January's hot partition open
+    assert len(writer.get_by_user_id('user-1')) == len(entries)
+
+    freezer.archive_approved_months(['sheet-1'])
+    entries[0].description = 'late edit'
+    writer.update(entries[0])
+
+    assert freezer.get_by_id(entries[0].entry_id).description == 'late edit'
+    assert len(freezer.get_by_user_id('user-1')) == len(entries)
+    assert SEGMENT_SUMMARY not in _month_files(data_dir, '2025-01')
+
+def test_months_created_by_another_process_are_seen(tmp_path):
+    data_dir = str(tmp_path)
+    first = MonthlyJsonTimeEntryRepository(data_dir)
+    second = MonthlyJsonTimeEntryRepository(data_dir)
+    version = second.get_data_version('user-1')
+
+    entry = first.create(make_entry(FEBRUARY))
+
+    assert second.get_data_version('user-1') != version
+    assert [found.entry_id for found in second.get_by_user_id('user-1')] == [entry.entry_id]
+    assert entry.entry_id in [changed.entry_id for changed in second.get_changes('user-1', version).entries]
+
+def test_running_timer_in_past_month_is_found_until_stopped(tmp_path):
+    data_dir = str(tmp_path)
+    first = MonthlyJsonTimeEntryRepository(data_dir)
+    second = MonthlyJsonTimeEntryRepository(data_dir)
+    running = first.create(make_entry(JANUARY, minutes=None))
+
+    assert second.get_running_timer('user-1').entry_id == running.entry_id
+
+    running.stop_timer()
+    second.update(running)
+
+    assert first.get_running_timer('user-1') is None
+    assert '2025-01' not in first._layout.running_months()
+
+def test_overlap_only_loads_months_the_longest_entry_can_reach(tmp_path):
+    repo = MonthlyJsonTimeEntryRepository(str(tmp_path))
+    repo.create(make_entry(JANUARY, minutes=60))
+    repo.create(make_entry(FEBRUARY, minutes=60))
+    # Ends on 2 March, so March checks must look back into February
+    repo.create(make_entry(datetime(2025, 2, 28, 20), minutes=24 * 60))
+    restarted = MonthlyJsonTimeEntryRepository(str(tmp_path))
+    assert not restarted._shards
+
+    assert restarted.check_overlap('user-1', datetime(2025, 3, 1, 9), datetime(2025, 3, 1, 10))
+    assert not restarted.check_overlap('user-1', datetime(2025, 3, 3, 9), datetime(2025, 3, 3, 10))
+    assert sorted(restarted._shards) == ['2025-02']
+    assert restarted.check_overlap('user-1', JANUARY + timedelta(minutes=30), JANUARY + timedelta(hours=2))
+
+def test_longer_entry_saved_elsewhere_widens_the_overlap_check(tmp_path):
+    data_dir = str(tmp_path)
+    checker = MonthlyJsonTimeEntryRepository(data_dir)
+    writer = MonthlyJsonTimeEntryRepository(data_dir)
+    entry = writer.create(make_entry(datetime(2025, 1, 31, 9), minutes=60))
+    assert not checker.check_overlap('user-1', datetime(2025, 2, 1, 12), datetime(2025, 2, 1, 13))
+
+    entry.end_time = datetime(2025, 2, 2, 9)
+    entry.calculate_duration()
+    writer.update(entry)
+
+    assert checker.check_overlap('user-1', datetime(2025, 2, 1, 12), datetime(2025, 2, 1, 13))
+    assert not checker.check_overlap('user-1', datetime(2025, 2, 1, 12), datetime(2025, 2, 1, 13),
+                                     exclude_entry_id=entry.entry_id)
+
+def test_months_saved_without_a_span_are_counted_at_start(tmp_path):
+    data_dir = str(tmp_path)
+    repo = MonthlyJsonTimeEntryRepository(data_dir)
+    repo.create(make_entry(datetime(2025, 1, 31, 20), minutes=12 * 60))
+    layout_path = os.path.join(data_dir, PARTITION_ROOT, 'layout.json')
+    with open(layout_path) as f:
+        layout = json.load(f)
+    with open(layout_path, 'w') as f:
+        json.dump([{'month': record['month'], 'frozen': record['frozen']} for record in layout], f)
+
+    restarted = MonthlyJsonTimeEntryRepository(data_dir)
+
+    assert restarted._longest == {'2025-01': 12 * 60}
+    assert restarted.check_overlap('user-1', datetime(2025, 2, 1, 7), datetime(2025, 2, 1, 9))
@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.entities.project import Project
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from conftest import make_entry
+
+START = datetime(2026, 2, 2, 9)
+
+def test_get_many_keeps_order_and_skips_unknown_ids(time_entry_repo):
+    entries = time_entry_repo.create_many([make_entry(START + timedelta(days=day)) for day in range(4)])
+    wanted = [entries[2].entry_id, 'missing', entries[0].entry_id, entries[3].entry_id]
+
+    found = time_entry_repo.get_many(wanted)
+
+    assert [entry.entry_id for entry in found] == [wanted[0], wanted[2], wanted[3]]
+
+def test_lookups_by_id_follow_deletes(time_entry_repo):
+    entries = time_entry_repo.create_many([make_entry(START + timedelta(days=day)) for day in range(5)])
+
+    assert time_entry_repo.delete(entries[1].entry_id)
+    assert not time_entry_repo.delete(entries[1].entry_id)
+
+    assert time_entry_repo.get_by_id(entries[1].entry_id) is None
+    for entry in entries[2:]:
+        assert time_entry_repo.get_by_id(entry.entry_id).start_time == entry.start_time
+
+def test_duplicate_id_is_rejected(tmp_path):
+    repo = JsonProjectRepository(str(tmp_path))
+    repo.create(Project(project_id='project-1', user_id='user-1', name='Website'))
+
+    with pytest.raises(ValueError):
+        repo.create(Project(project_id='project-1', user_id='user-1', name='Other'))
+
+    repo.delete('project-1')
+    repo.create(Project(project_id='project-1', user_id='user-1', name='Other'))
+    assert repo.get_by_id('project-1').name == 'Other'
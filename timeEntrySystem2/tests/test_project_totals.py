@@ -0,0 +1,55 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import make_entry
+from app.core.entities.project import Project, ProjectStatus
+from app.core.services.project_service import ProjectService
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+
+START = datetime(2026, 1, 12, 9)
+
+@pytest.fixture
+def projects(tmp_path, time_entry_repo):
+    repo = JsonProjectRepository(str(tmp_path))
+    return ProjectService(repo, time_entry_repo), repo
+
+def test_project_totals_are_grouped_by_project(time_entry_repo):
+    time_entry_repo.create(make_entry(START, project_id='project-1', minutes=30))
+    moved = time_entry_repo.create(make_entry(START + timedelta(days=40), project_id='project-1', minutes=45))
+    time_entry_repo.create(make_entry(START + timedelta(hours=2), project_id='project-2', minutes=60))
+    time_entry_repo.create(make_entry(START, user_id='user-2', project_id='project-1', minutes=600))
+    moved.project_id = 'project-3'
+    time_entry_repo.update(moved)
+
+    assert time_entry_repo.get_project_totals('user-1') == {'project-1': (30, 1), 'project-2': (60, 1),
+                                                           'project-3': (45, 1)}
+    assert time_entry_repo.get_project_totals('user-1', date(2026, 2, 1), date(2026, 3, 31)) == {
+        'project-3': (45, 1)}
+    assert time_entry_repo.get_project_totals('user-3') == {}
+
+def test_projects_are_listed_with_their_totals(projects, time_entry_repo):
+    service, repo = projects
+    busy = repo.create(Project(user_id='user-1', name='Busy'))
+    idle = repo.create(Project(user_id='user-1', name='Idle'))
+    time_entry_repo.create(make_entry(START, project_id=busy.project_id, minutes=90))
+    time_entry_repo.create(make_entry(START + timedelta(days=3), project_id=busy.project_id, minutes=30))
+
+    stats = {project.name: totals for project, totals in service.get_projects_with_stats('user-1')}
+
+    assert stats == {'Busy': {'total_hours': 2.0, 'total_minutes': 120, 'entry_count': 2},
+                     'Idle': {'total_hours': 0.0, 'total_minutes': 0, 'entry_count': 0}}
+    assert service.get_projects_with_stats('user-1', ProjectStatus.ARCHIVED) == []
+
+def test_project_time_summary_uses_the_owners_range_totals(projects, time_entry_repo):
+    service, repo = projects
+    project = repo.create(Project(user_id='user-1', name='Client'))
+    time_entry_repo.create(make_entry(START, project_id=project.project_id, minutes=90))
+    time_entry_repo.create(make_entry(START + timedelta(days=20), project_id=project.project_id, minutes=30))
+
+    summary = service.get_project_time_summary(project.project_id)
+    january_first_half = service.get_project_time_summary(project.project_id, date(2026, 1, 1), date(2026, 1, 15))
+
+    assert (summary['total_minutes'], summary['entry_count']) == (120, 2)
+    assert (january_first_half['total_minutes'], january_first_half['entry_count']) == (90, 1)
+    assert service.get_project_time_summary('missing')['total_minutes'] == 0
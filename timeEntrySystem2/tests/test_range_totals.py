@@ -0,0 +1,45 @@
+import random
+from datetime import date, datetime, timedelta
+
+from conftest import make_entry
+from app.infrastructure.repositories.day_fenwick_tree import DayFenwickTree
+
+START = datetime(2026, 1, 12, 9)
+
+def test_tree_sums_match_a_plain_sum_as_days_are_added_on_both_sides():
+    rng = random.Random(12)
+    tree = DayFenwickTree()
+    totals = {}
+    origin = date(2026, 1, 1)
+    # Days before and well after the first one make the tree grow both ways
+    for _ in range(500):
+        day = origin + timedelta(days=rng.randrange(-400, 400))
+        delta = rng.randrange(-50, 100)
+        tree.add(day, delta)
+        totals[day] = totals.get(day, 0) + delta
+
+    for _ in range(200):
+        start = origin + timedelta(days=rng.randrange(-500, 500))
+        end = start + timedelta(days=rng.randrange(-5, 300))
+        assert tree.range_sum(start, end) == sum(total for day, total in totals.items() if start <= day <= end)
+
+def test_empty_tree_sums_to_zero():
+    assert DayFenwickTree().range_sum(date(2026, 1, 1), date(2026, 12, 31)) == 0
+
+def test_range_totals_match_the_entries(time_entry_repo):
+    rng = random.Random(12)
+    entries = [time_entry_repo.create(make_entry(START + timedelta(days=rng.randrange(-40, 40), hours=rng.randrange(8)),
+                                                 project_id=rng.choice(['project-1', 'project-2']),
+                                                 minutes=rng.choice([10, 25, 60])))
+               for _ in range(80)]
+    for entry in entries[:15]:
+        time_entry_repo.delete(entry.entry_id)
+    remaining = entries[15:]
+
+    for start_date, end_date in [(date(2025, 12, 1), date(2026, 3, 1)), (date(2026, 1, 5), date(2026, 1, 12)),
+                                 (date(2026, 1, 12), date(2026, 1, 12)), (date(2027, 1, 1), date(2027, 1, 31))]:
+        for project_id in (None, 'project-1', 'project-2', 'project-9'):
+            matching = [entry for entry in remaining if start_date <= entry.start_time.date() <= end_date and
+                        project_id in (None, entry.project_id)]
+            assert time_entry_repo.get_range_totals('user-1', start_date, end_date, project_id) == \
+                (sum(entry.duration_minutes for entry in matching), len(matching))
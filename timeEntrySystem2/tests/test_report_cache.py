@@ -0,0 +1,71 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import make_entry
+from app.core.services.report_cache import ReportCache
+from app.core.services.reporting_service import ReportingService
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+
+START = datetime(2026, 1, 12, 9)
+JANUARY = (date(2026, 1, 1), date(2026, 1, 31))
+
+@pytest.fixture
+def reporting(tmp_path, time_entry_repo):
+    service = ReportingService(time_entry_repo, JsonProjectRepository(str(tmp_path)),
+                               JsonTimesheetRepository(str(tmp_path)), ReportCache())
+    return service
+
+def test_results_are_reused_only_for_the_same_version():
+    cache = ReportCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute('report', 1, compute) == 1
+    assert cache.get_or_compute('report', 1, compute) == 1
+    assert cache.get_or_compute('report', 2, compute) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_least_recently_used_results_are_evicted():
+    cache = ReportCache(max_entries=2)
+    cache.get_or_compute('a', 1, lambda: 'a')
+    cache.get_or_compute('b', 1, lambda: 'b')
+    cache.get_or_compute('a', 1, lambda: 'recomputed')
+    cache.get_or_compute('c', 1, lambda: 'c')
+
+    assert cache.get_or_compute('a', 1, lambda: 'recomputed') == 'a'
+    assert cache.get_or_compute('b', 1, lambda: 'recomputed') == 'recomputed'
+    assert cache.stats()['evictions'] == 2
+
+def test_zero_size_cache_stores_nothing():
+    cache = ReportCache(max_entries=0)
+    cache.get_or_compute('a', 1, lambda: 'a')
+
+    assert cache.get_or_compute('a', 1, lambda: 'recomputed') == 'recomputed'
+    assert cache.stats()['entries'] == 0
+
+def test_report_is_cached_until_the_users_entries_change(reporting, time_entry_repo):
+    entry = time_entry_repo.create(make_entry(START))
+    first = reporting.get_time_by_project('user-1', *JANUARY)
+
+    assert reporting.get_time_by_project('user-1', *JANUARY) is first
+
+    time_entry_repo.create(make_entry(START, user_id='user-2'))
+    assert reporting.get_time_by_project('user-1', *JANUARY) is first
+
+    entry.end_time += timedelta(minutes=30)
+    entry.calculate_duration()
+    time_entry_repo.update(entry)
+    assert reporting.get_time_by_project('user-1', *JANUARY)['total_minutes'] == 90
+
+def test_writes_from_another_instance_invalidate_the_cache(reporting, time_entry_repo, open_time_entry_repo):
+    time_entry_repo.create(make_entry(START))
+    assert reporting.get_time_by_project('user-1', *JANUARY)['total_minutes'] == 60
+
+    open_time_entry_repo().create(make_entry(START + timedelta(days=1)))
+
+    assert reporting.get_time_by_project('user-1', *JANUARY)['total_minutes'] == 120
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+
+from conftest import make_entry
+from app.core.entities.project import Project
+from app.core.entities.search_query import SearchQuery
+from app.core.services.reporting_service import ReportingService
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+
+START = datetime(2026, 3, 30, 9)
+
+def _search(repo, text, user_id='user-1'):
+    return sorted(entry_id for entry_id, _, _ in repo.search_descriptions(user_id, SearchQuery.parse(text)))
+
+def test_query_parses_words_and_phrases():
+    query = SearchQuery.parse('Port "release  notes" port*')
+
+    assert query.terms == ['port']
+    assert query.phrases == [('release', 'notes')]
+    assert query.matches('Quarterly report: release notes')
+    assert not query.matches('release the notes for the report')
+
+def test_words_match_anywhere_inside_words(time_entry_repo):
+    report, portal, other = time_entry_repo.create_many([
+        make_entry(START, description='Quarterly report'),
+        make_entry(START + timedelta(hours=1), description='Portal login fix'),
+        make_entry(START + timedelta(hours=2), description='Team meeting'),
+    ])
+    support = time_entry_repo.create(make_entry(START, user_id='user-2', description='Support call'))
+
+    assert _search(time_entry_repo, 'port') == sorted([report.entry_id, portal.entry_id])
+    assert _search(time_entry_repo, 'quarter') == [report.entry_id]
+    assert _search(time_entry_repo, 'eport quart') == [report.entry_id]
+    assert _search(time_entry_repo, 'xyz') == []
+    assert _search(time_entry_repo, 'port', user_id='user-2') == [support.entry_id]
+
+def test_phrases_match_exact_words_in_order(time_entry_repo):
+    notes, reversed_notes = time_entry_repo.create_many([
+        make_entry(START, description='Write release notes'),
+        make_entry(START + timedelta(hours=1), description='Notes on the release'),
+    ])
+
+    assert _search(time_entry_repo, '"release notes"') == [notes.entry_id]
+    assert _search(time_entry_repo, '"release note"') == []
+    assert _search(time_entry_repo, 'release notes') == sorted([notes.entry_id, reversed_notes.entry_id])
+
+def test_index_follows_description_changes_and_deletes(time_entry_repo):
+    entry = time_entry_repo.create(make_entry(START, description='Draft budget'))
+    gone = time_entry_repo.create(make_entry(START + timedelta(hours=1), description='Budget review'))
+
+    entry.description = 'Final report'
+    time_entry_repo.update(entry)
+    time_entry_repo.delete(gone.entry_id)
+
+    assert _search(time_entry_repo, 'budget') == []
+    assert _search(time_entry_repo, 'report') == [entry.entry_id]
+
+def test_search_pages_by_relevance_without_gaps(tmp_path, time_entry_repo):
+    project_repo = JsonProjectRepository(str(tmp_path))
+    project_repo.create(Project(project_id='project-1', user_id='user-1', name='Website'))
+    time_entry_repo.create_many(
+        [make_entry(START + timedelta(hours=hour), description='website release notes' if hour % 3 else 'notes')
+         for hour in range(12)])
+    service = ReportingService(time_entry_repo, project_repo, JsonTimesheetRepository(str(tmp_path)))
+
+    # Every entry matches through its project's name; most also through their description
+    everything, _ = service.search_entries('user-1', 'website')
+    paged = []
+    after = None
+    while True:
+        results, after = service.search_entries('user-1', 'website', limit=5, after=after)
+        paged.extend(results)
+        if after is None:
+            break
+
+    assert [result['entry_id'] for result in paged] == [result['entry_id'] for result in everything]
+    assert len(paged) == 12
@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta
+
+from conftest import make_entry
+
+START = datetime(2026, 1, 12, 9)
+
+def _ids(entries):
+    return sorted(entry.entry_id for entry in entries)
+
+def test_queries_by_field_follow_updates(time_entry_repo):
+    first = time_entry_repo.create(make_entry(START, project_id='project-1', timesheet_id='sheet-1'))
+    second = time_entry_repo.create(make_entry(START + timedelta(days=1), project_id='project-1'))
+    time_entry_repo.create(make_entry(START, user_id='user-2', project_id='project-2'))
+
+    second.project_id = 'project-2'
+    second.timesheet_id = 'sheet-1'
+    time_entry_repo.update(second)
+
+    assert _ids(time_entry_repo.get_by_user_id('user-1')) == _ids([first, second])
+    assert _ids(time_entry_repo.get_by_project_id('project-1')) == _ids([first])
+    assert len(time_entry_repo.get_by_project_id('project-2')) == 2
+    assert _ids(time_entry_repo.get_by_timesheet_id('sheet-1')) == _ids([first, second])
+    # Newest first
+    assert [entry.entry_id for entry in time_entry_repo.get_by_user_id('user-1')] == [second.entry_id,
+                                                                                    first.entry_id]
+
+def test_running_timer_follows_start_and_stop(time_entry_repo):
+    running = time_entry_repo.create(make_entry(datetime.now() - timedelta(hours=1), minutes=None))
+    time_entry_repo.create(make_entry(datetime.now() - timedelta(hours=3)))
+
+    assert time_entry_repo.get_running_timer('user-1').entry_id == running.entry_id
+    assert time_entry_repo.get_running_timer('user-2') is None
+
+    running.stop_timer()
+    time_entry_repo.update(running)
+
+    assert time_entry_repo.get_running_timer('user-1') is None
+
+def test_deleted_entry_leaves_every_index(time_entry_repo):
+    entry = time_entry_repo.create(make_entry(START, timesheet_id='sheet-1'))
+
+    time_entry_repo.delete(entry.entry_id)
+
+    assert time_entry_repo.get_by_user_id('user-1') == []
+    assert time_entry_repo.get_by_project_id('project-1') == []
+    assert time_entry_repo.get_by_timesheet_id('sheet-1') == []
@@ -0,0 +1,93 @@
+import os
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import make_entry
+from app.core.entities.timesheet import PeriodType, Timesheet
+from app.infrastructure.migrations.json_to_sharded import migrate_json_to_sharded
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+from app.infrastructure.repositories.sharded_json_repository import list_shard_users, shard_dir
+from app.infrastructure.repositories.sharded_json_time_entry_repository import ShardedJsonTimeEntryRepository
+from app.infrastructure.repositories.sharded_json_timesheet_repository import ShardedJsonTimesheetRepository
+
+START = datetime(2026, 1, 12, 9)
+
+def _timesheet(user_id, start=date(2026, 1, 12)):
+    return Timesheet(user_id=user_id, name='Week', period_type=PeriodType.WEEKLY,
+                     start_date=start, end_date=start + timedelta(days=6))
+
+def test_each_user_gets_a_shard_directory(tmp_path):
+    repo = ShardedJsonTimeEntryRepository(str(tmp_path))
+    repo.create(make_entry(START, user_id='user-1'))
+    repo.create(make_entry(START, user_id='team/alice'))
+
+    assert sorted(list_shard_users(str(tmp_path))) == ['team/alice', 'user-1']
+    # Any user ID stays one path component
+    assert os.path.dirname(shard_dir(str(tmp_path), 'team/alice')) == os.path.join(str(tmp_path), 'users')
+    for user_id in ('user-1', 'team/alice'):
+        shard = JsonTimeEntryRepository(shard_dir(str(tmp_path), user_id))
+        assert [entry.user_id for entry in shard.list_all()] == [user_id]
+
+def test_lookups_by_id_and_project_cover_every_shard(tmp_path):
+    repo = ShardedJsonTimeEntryRepository(str(tmp_path))
+    first = repo.create(make_entry(START, user_id='user-1', project_id='shared'))
+    second = repo.create(make_entry(START, user_id='user-2', project_id='shared'))
+
+    fresh = ShardedJsonTimeEntryRepository(str(tmp_path))
+
+    assert fresh.get_by_id(second.entry_id).user_id == 'user-2'
+    assert [entry.entry_id for entry in fresh.get_many([second.entry_id, first.entry_id])] == \
+        [second.entry_id, first.entry_id]
+    assert sorted(entry.user_id for entry in fresh.get_by_project_id('shared')) == ['user-1', 'user-2']
+    assert fresh.get_by_user_id('user-3') == []
+    assert fresh.delete(first.entry_id)
+    assert fresh.get_by_id(first.entry_id) is None
+
+def test_batch_saves_every_shard_it_touched(tmp_path):
+    repo = ShardedJsonTimeEntryRepository(str(tmp_path))
+
+    with repo.batch():
+        repo.create(make_entry(START, user_id='user-1'))
+        repo.create(make_entry(START, user_id='user-2'))
+    with pytest.raises(RuntimeError):
+        with repo.batch():
+            repo.create(make_entry(START + timedelta(hours=2), user_id='user-1'))
+            raise RuntimeError('abandon')
+
+    fresh = ShardedJsonTimeEntryRepository(str(tmp_path))
+    assert len(fresh.get_by_user_id('user-1')) == 1
+    assert len(fresh.get_by_user_id('user-2')) == 1
+
+def test_timesheets_are_sharded_by_user(tmp_path):
+    repo = ShardedJsonTimesheetRepository(str(tmp_path))
+    first = repo.create(_timesheet('user-1'))
+    repo.create(_timesheet('user-2'))
+
+    fresh = ShardedJsonTimesheetRepository(str(tmp_path))
+
+    assert fresh.get_by_id(first.timesheet_id).user_id == 'user-1'
+    assert [timesheet.timesheet_id for timesheet in fresh.get_by_user_id('user-1')] == [first.timesheet_id]
+    assert fresh.check_period_overlap('user-1', date(2026, 1, 14), date(2026, 1, 20))
+    assert not fresh.check_period_overlap('user-3', date(2026, 1, 14), date(2026, 1, 20))
+    assert len(fresh.list_all()) == 2
+
+def test_migration_splits_files_by_user_and_can_be_rerun(tmp_path):
+    data_dir = str(tmp_path)
+    entries = JsonTimeEntryRepository(data_dir)
+    kept = entries.create(make_entry(START, user_id='user-1'))
+    entries.create(make_entry(START, user_id='user-2'))
+    JsonTimesheetRepository(data_dir).create(_timesheet('user-2'))
+
+    counts = migrate_json_to_sharded(data_dir)
+    kept.description = 'edited after the first run'
+    entries.update(kept)
+    migrate_json_to_sharded(data_dir)
+
+    assert counts == {'time_entries.json': {'user-1': 1, 'user-2': 1}, 'timesheets.json': {'user-2': 1}}
+    sharded = ShardedJsonTimeEntryRepository(data_dir)
+    assert sharded.get_by_id(kept.entry_id).description == 'edited after the first run'
+    assert len(sharded.list_all()) == 2
+    assert len(ShardedJsonTimesheetRepository(data_dir).get_by_user_id('user-2')) == 1
+    assert len(JsonTimeEntryRepository(data_dir).list_all()) == 2
@@ -0,0 +1,71 @@
+from datetime import date, datetime, timedelta
+
+from app.core.entities.project import Project
+from app.core.entities.search_query import SearchQuery
+from app.core.entities.timesheet import Timesheet
+from app.core.entities.user import User
+from app.infrastructure.migrations.json_to_sqlite import migrate_json_to_sqlite
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+from app.infrastructure.repositories.json_user_repository import JsonUserRepository
+from app.infrastructure.repositories.sqlite_project_repository import SqliteProjectRepository
+from app.infrastructure.repositories.sqlite_time_entry_repository import SqliteTimeEntryRepository
+from app.infrastructure.repositories.sqlite_timesheet_repository import SqliteTimesheetRepository
+from app.infrastructure.repositories.sqlite_user_repository import SqliteUserRepository
+from conftest import make_entry
+
+START = datetime(2026, 6, 1, 9)
+
+def _json_data(data_dir):
+    JsonUserRepository(data_dir).create(User(user_id='user-1', username='ada'))
+    JsonProjectRepository(data_dir).create(Project(project_id='project-1', user_id='user-1', name='Website'))
+    entries = JsonTimeEntryRepository(data_dir).create_many(
+        [make_entry(START + timedelta(days=day), minutes=30 * (day + 1), description=f'draft copy {day}')
+         for day in range(3)])
+    JsonTimesheetRepository(data_dir).create(
+        Timesheet(timesheet_id='sheet-1', user_id='user-1', name='June',
+                  entry_ids=[entry.entry_id for entry in entries]))
+    return entries
+
+def test_migration_copies_every_record(tmp_path):
+    data_dir = str(tmp_path)
+    db_path = str(tmp_path / 'time_tracking.db')
+    entries = _json_data(data_dir)
+
+    counts = migrate_json_to_sqlite(data_dir, db_path)
+
+    assert counts == {'users': 1, 'projects': 1, 'time_entries': 3, 'timesheets': 1}
+    assert SqliteUserRepository(db_path).get_by_username('ada').user_id == 'user-1'
+    assert SqliteProjectRepository(db_path).get_by_id('project-1').name == 'Website'
+    assert SqliteTimesheetRepository(db_path).get_by_id('sheet-1').entry_ids == [entry.entry_id for entry in entries]
+    migrated = SqliteTimeEntryRepository(db_path)
+    assert ([entry.to_dict() for entry in migrated.get_by_user_id('user-1')] ==
+            [entry.to_dict() for entry in JsonTimeEntryRepository(data_dir).get_by_user_id('user-1')])
+
+def test_rerun_updates_rows_through_the_triggers(tmp_path):
+    data_dir = str(tmp_path)
+    db_path = str(tmp_path / 'time_tracking.db')
+    entries = _json_data(data_dir)
+    migrate_json_to_sqlite(data_dir, db_path)
+    migrated = SqliteTimeEntryRepository(db_path)
+    version = migrated.get_changes('user-1').version
+
+    json_repo = JsonTimeEntryRepository(data_dir)
+    entries[0].description = 'final copy'
+    entries[0].end_time = entries[0].start_time + timedelta(minutes=90)
+    entries[0].calculate_duration()
+    json_repo.update(entries[0])
+    json_repo.delete(entries[2].entry_id)
+    migrate_json_to_sqlite(data_dir, db_path)
+
+    # Full-text search
+    assert [entry_id for entry_id, _, _ in migrated.search_descriptions('user-1', SearchQuery.parse('final'))] == \
+        [entries[0].entry_id]
+    assert migrated.search_descriptions('user-1', SearchQuery.parse('"draft copy 0"')) == []
+    # Rollups; rows deleted from the JSON files stay in the database
+    assert migrated.get_range_totals('user-1', date(2026, 6, 1), date(2026, 6, 30)) == (90 + 60 + 90, 3)
+    # Change log: only the changed row is logged
+    changes = migrated.get_changes('user-1', version)
+    assert not changes.reset
+    assert [entry.entry_id for entry in changes.entries] == [entries[0].entry_id]
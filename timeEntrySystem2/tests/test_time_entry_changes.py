@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+
+from conftest import make_entry
+
+START = datetime(2026, 5, 4, 9)
+
+def test_unknown_version_resets_to_every_entry(time_entry_repo):
+    entries = [make_entry(START + timedelta(days=day)) for day in range(3)]
+    time_entry_repo.create_many(entries)
+    time_entry_repo.create(make_entry(START, user_id='user-2'))
+
+    changes = time_entry_repo.get_changes('user-1')
+
+    assert changes.reset
+    assert sorted(entry.entry_id for entry in changes.entries) == sorted(entry.entry_id for entry in entries)
+    assert time_entry_repo.get_changes('user-1', changes.version + 1000).reset
+
+def test_changes_since_version_hold_saves_and_deletions(time_entry_repo):
+    kept, edited, deleted = (make_entry(START + timedelta(hours=hour)) for hour in range(3))
+    time_entry_repo.create_many([kept, edited, deleted])
+    version = time_entry_repo.get_changes('user-1').version
+
+    created = time_entry_repo.create(make_entry(START + timedelta(days=1)))
+    edited.description = 'edited'
+    time_entry_repo.update(edited)
+    time_entry_repo.delete(deleted.entry_id)
+    time_entry_repo.create(make_entry(START, user_id='user-2'))
+    changes = time_entry_repo.get_changes('user-1', version)
+
+    assert not changes.reset
+    assert sorted(entry.entry_id for entry in changes.entries) == sorted([created.entry_id, edited.entry_id])
+    assert changes.deleted_ids == [deleted.entry_id]
+    assert changes.version > version
+
+    unchanged = time_entry_repo.get_changes('user-1', changes.version)
+    assert not unchanged.reset
+    assert unchanged.entries == [] and unchanged.deleted_ids == []
+
+def test_changes_of_another_instance_are_seen(open_time_entry_repo):
+    repo = open_time_entry_repo()
+    repo.create(make_entry(START))
+    version = repo.get_changes('user-1').version
+
+    created = open_time_entry_repo().create(make_entry(START + timedelta(days=1)))
+    changes = repo.get_changes('user-1', version)
+
+    assert created.entry_id in [entry.entry_id for entry in changes.entries]
+
+def test_entry_moved_to_another_month_is_saved_not_deleted(time_entry_repo):
+    entry = time_entry_repo.create(make_entry(START))
+    version = time_entry_repo.get_changes('user-1').version
+
+    entry.start_time = START - timedelta(days=40)
+    entry.end_time = entry.start_time + timedelta(hours=1)
+    time_entry_repo.update(entry)
+    changes = time_entry_repo.get_changes('user-1', version)
+
+    assert [changed.entry_id for changed in changes.entries] == [entry.entry_id]
+    assert changes.deleted_ids == []
+
+def test_changes_route_returns_entries_saved_since(time_entry_client):
+    repo = time_entry_client.application.test_repo
+    repo.create(make_entry(START))
+    first = time_entry_client.get('/api/time-entries/changes?user_id=user-1').get_json()
+    created = repo.create(make_entry(START + timedelta(days=1)))
+
+    response = time_entry_client.get(f"/api/time-entries/changes?user_id=user-1&since={first['version']}")
+
+    body = response.get_json()
+    assert first['reset'] and len(first['entries']) == 1
+    assert response.status_code == 200
+    assert not body['reset']
+    assert [entry['entry_id'] for entry in body['entries']] == [created.entry_id]
+    assert body['deleted_ids'] == []
+
+def test_changes_route_rejects_invalid_since(time_entry_client):
+    response = time_entry_client.get('/api/time-entries/changes?user_id=user-1&since=yesterday')
+
+    assert response.status_code == 400
+
+def test_changes_route_answers_not_modified_while_unchanged(time_entry_client):
+    response = time_entry_client.get('/api/time-entries/changes?user_id=user-1')
+
+    again = time_entry_client.get('/api/time-entries/changes?user_id=user-1',
+                                  headers={'If-None-Match': response.headers['ETag']})
+
+    assert again.status_code == 304
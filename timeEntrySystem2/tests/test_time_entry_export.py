@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import make_entry
+from app.core.entities.project import Project
+from app.core.services.reporting_service import EXPORT_FIELDS, ReportingService
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+
+START = datetime(2026, 1, 12, 9)
+
+@pytest.fixture
+def reporting(tmp_path, time_entry_repo):
+    projects = JsonProjectRepository(str(tmp_path))
+    service = ReportingService(time_entry_repo, projects, JsonTimesheetRepository(str(tmp_path)))
+    service.EXPORT_CHUNK_ROWS = 2
+    return service, projects
+
+def test_range_is_iterated_in_start_time_order(time_entry_repo):
+    entries = [time_entry_repo.create(make_entry(START + timedelta(days=day)))
+               for day in (3, 0, 9, 1)]
+    time_entry_repo.create(make_entry(START, user_id='user-2'))
+
+    expected = [entry.entry_id for entry in sorted(entries[:2] + entries[3:], key=lambda e: e.start_time)]
+    assert [entry.entry_id for entry in
+            time_entry_repo.iter_by_date_range('user-1', date(2026, 1, 12), date(2026, 1, 18))] == expected
+
+def test_csv_export_sends_the_header_first_and_rows_in_chunks(reporting, time_entry_repo):
+    service, projects = reporting
+    project = projects.create(Project(user_id='user-1', name='Client work'))
+    entries = [time_entry_repo.create(make_entry(START + timedelta(days=day), project_id=project.project_id,
+                                                 minutes=90, description=f'Entry {day}'))
+               for day in range(5)]
+
+    chunks = list(service.export_entries('user-1', date(2026, 1, 1), date(2026, 1, 31)))
+
+    assert chunks[0] == ','.join(EXPORT_FIELDS) + '\r\n'
+    assert len(chunks) == 4
+    rows = list(csv.DictReader(io.StringIO(''.join(chunks))))
+    assert [row['entry_id'] for row in rows] == [entry.entry_id for entry in entries]
+    assert rows[0]['project_name'] == 'Client work'
+    assert rows[0]['duration_hours'] == '1.5'
+
+def test_jsonl_export_writes_one_object_per_line(reporting, time_entry_repo):
+    service, _ = reporting
+    entry = time_entry_repo.create(make_entry(START, project_id='gone'))
+
+    lines = ''.join(service.export_entries('user-1', date(2026, 1, 12), date(2026, 1, 12), 'jsonl')).splitlines()
+
+    assert [json.loads(line)['entry_id'] for line in lines] == [entry.entry_id]
+    assert json.loads(lines[0])['project_name'] == 'Unknown Project'
+
+def test_unknown_export_format_is_rejected(reporting):
+    service, _ = reporting
+
+    with pytest.raises(ValueError):
+        next(service.export_entries('user-1', date(2026, 1, 1), date(2026, 1, 31), 'xml'))
@@ -0,0 +1,98 @@
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.entities.project import Project
+from app.core.services.time_entry_import_service import TimeEntryImportService
+from app.infrastructure.repositories.json_project_repository import JsonProjectRepository
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+
+START = datetime(2026, 1, 12, 9)
+
+class CountingTimeEntryRepository(JsonTimeEntryRepository):
+    """Time entry repository recording the size of each create_many call"""
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir)
+        self.writes = []
+
+    def create_many(self, time_entries):
+        self.writes.append(len(time_entries))
+        return super().create_many(time_entries)
+
+@pytest.fixture
+def importer(tmp_path):
+    projects = JsonProjectRepository(str(tmp_path))
+    project = projects.create(Project(user_id='user-1', name='History'))
+    service = TimeEntryImportService(CountingTimeEntryRepository(str(tmp_path)), projects)
+    service.CHUNK_SIZE = 2
+    return service, project.project_id
+
+def _row(project_id, hours, minutes=50, **fields):
+    start = START + timedelta(hours=hours)
+    return dict(project_id=project_id, start_time=start.isoformat(),
+                end_time=(start + timedelta(minutes=minutes)).isoformat(), **fields)
+
+def _jsonl(rows):
+    return io.StringIO(''.join(json.dumps(row) + '\n' for row in rows))
+
+def test_rows_are_saved_a_chunk_at_a_time(importer):
+    service, project_id = importer
+    rows = [_row(project_id, hours) for hours in range(5)]
+
+    result = service.import_entries(_jsonl(rows), 'jsonl', 'user-1')
+
+    assert result['status'] == 'success'
+    assert result['entries_imported'] == 5
+    assert service._time_entry_repository.writes == [2, 2, 1]
+    assert len(service._time_entry_repository.get_by_user_id('user-1')) == 5
+
+def test_overlaps_with_rows_of_earlier_chunks_are_rejected(importer):
+    service, project_id = importer
+    rows = [_row(project_id, 0), _row(project_id, 2), _row(project_id, 0, minutes=20)]
+
+    result = service.import_entries(_jsonl(rows), 'jsonl', 'user-1')
+
+    assert result['entries_imported'] == 2
+    assert result['errors'] == [{'line': 3, 'error': 'Time entry overlaps with existing entry'}]
+
+def test_rows_of_another_user_are_rejected(importer):
+    service, project_id = importer
+    rows = [_row(project_id, 0, user_id='user-1'), _row(project_id, 1, user_id='user-2'), _row(project_id, 2)]
+
+    result = service.import_entries(_jsonl(rows), 'jsonl', 'user-1')
+
+    assert result['status'] == 'partial'
+    assert result['errors'] == [{'line': 2, 'error': 'Row belongs to another user'}]
+    assert service._time_entry_repository.get_by_user_id('user-2') == []
+    assert len(service._time_entry_repository.get_by_user_id('user-1')) == 2
+
+def test_json_array_items_may_span_lines(importer):
+    service, project_id = importer
+    rows = [_row(project_id, hours) for hours in range(3)] + [42]
+
+    result = service.import_entries(io.StringIO(json.dumps(rows, indent=2)), 'json', 'user-1')
+
+    assert result['entries_imported'] == 3
+    assert result['errors'] == [{'line': 4, 'error': 'Row must be an object'}]
+
+def test_malformed_data_ends_the_import_and_keeps_earlier_chunks(importer):
+    service, project_id = importer
+    data = json.dumps([_row(project_id, hours) for hours in range(3)])[:-20]
+
+    result = service.import_entries(io.StringIO(data), 'json', 'user-1')
+
+    assert result['status'] == 'partial'
+    assert result['entries_imported'] == 2
+    assert result['errors'][0]['line'] == 3
+    assert result['errors'][0]['error'].startswith('Invalid JSON')
+
+def test_json_must_be_an_array(importer):
+    service, project_id = importer
+
+    result = service.import_entries(io.StringIO(json.dumps(_row(project_id, 0))), 'json', 'user-1')
+
+    assert result['status'] == 'failed'
+    assert result['errors'] == [{'line': 1, 'error': 'JSON import data must be an array of entries'}]
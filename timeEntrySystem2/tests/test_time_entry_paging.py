@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+from conftest import make_entry
+
+START = datetime(2026, 3, 30, 9)
+
+def _page_through(repo, limit, on_page=None):
+    """Collect a user's entry IDs one page at a time, calling on_page between pages"""
+    seen = []
+    after = None
+    while True:
+        page = repo.get_page('user-1', limit, after)
+        seen.extend(entry.entry_id for entry in page)
+        if len(page) < limit:
+            return seen
+        after = (page[-1].start_time, page[-1].entry_id)
+        if on_page is not None:
+            on_page()
+
+def test_pages_are_ordered_by_start_time_then_id(time_entry_repo):
+    # Ties on start time across a month boundary
+    entries = [make_entry(START + timedelta(days=day)) for day in range(4) for _ in range(3)]
+    time_entry_repo.create_many(entries)
+
+    expected = [entry.entry_id for entry in sorted(entries, key=lambda e: (e.start_time, e.entry_id), reverse=True)]
+    assert _page_through(time_entry_repo, 5) == expected
+
+def test_paging_skips_and_repeats_nothing_while_entries_are_added(time_entry_repo):
+    entries = [make_entry(START + timedelta(hours=hour)) for hour in range(10)]
+    time_entry_repo.create_many(entries)
+    added = []
+
+    def add_newer_entry():
+        # Sorts before the cursor, so the pages already read are unaffected
+        entry = make_entry(START + timedelta(days=10, minutes=len(added)))
+        time_entry_repo.create(entry)
+        added.append(entry.entry_id)
+
+    seen = _page_through(time_entry_repo, 3, add_newer_entry)
+
+    assert len(seen) == len(set(seen))
+    assert seen == [entry.entry_id for entry in reversed(entries)]
+    assert added
+
+def test_page_filters_by_date_range_and_project(time_entry_repo):
+    time_entry_repo.create_many([make_entry(START + timedelta(days=day), project_id=f'project-{day % 2}')
+                                 for day in range(6)])
+
+    page = time_entry_repo.get_page('user-1', 10, None, (START + timedelta(days=1)).date(),
+                                    (START + timedelta(days=4)).date(), 'project-1')
+
+    assert [entry.start_time.day for entry in page] == [2, 31]
+
+def test_listing_pages_follow_next_cursor(time_entry_client):
+    repo = time_entry_client.application.test_repo
+    repo.create_many([make_entry(START + timedelta(hours=hour)) for hour in range(5)])
+
+    ids = []
+    cursor = ''
+    while cursor is not None:
+        body = time_entry_client.get(f'/api/time-entries?user_id=user-1&limit=2&cursor={cursor}').get_json()
+        ids.extend(entry['entry_id'] for entry in body['entries'])
+        cursor = body['next_cursor']
+    listing = time_entry_client.get('/api/time-entries?user_id=user-1').get_json()
+
+    assert ids == [entry['entry_id'] for entry in listing]
+    assert len(ids) == 5
+
+def test_listing_selects_fields_and_rejects_bad_parameters(time_entry_client):
+    time_entry_client.application.test_repo.create(make_entry(START, description='Planning'))
+
+    body = time_entry_client.get('/api/time-entries?user_id=user-1&limit=1&fields=entry_id,description').get_json()
+
+    assert sorted(body['entries'][0]) == ['description', 'entry_id']
+    for query in ('limit=0', 'limit=many', 'cursor=not-a-cursor', 'fields=password'):
+        assert time_entry_client.get(f'/api/time-entries?user_id=user-1&{query}').status_code == 400
@@ -0,0 +1,37 @@
+from datetime import date, datetime, timedelta
+
+from conftest import make_entry
+
+def test_date_range_includes_both_end_days(time_entry_repo):
+    entries = time_entry_repo.create_many([
+        make_entry(datetime(2026, 4, 30, 23, 30)),
+        make_entry(datetime(2026, 5, 1, 0, 0)),
+        make_entry(datetime(2026, 5, 3, 23, 59)),
+        make_entry(datetime(2026, 5, 4, 0, 0)),
+    ])
+
+    found = time_entry_repo.get_by_date_range('user-1', date(2026, 5, 1), date(2026, 5, 3))
+
+    # Oldest first
+    assert [entry.entry_id for entry in found] == [entries[1].entry_id, entries[2].entry_id]
+    assert [entry.entry_id for entry in time_entry_repo.iter_by_date_range(
+        'user-1', date(2026, 4, 30), date(2026, 5, 1))] == [entries[0].entry_id, entries[1].entry_id]
+
+def test_overlap_checks_ranges_against_entries(time_entry_repo):
+    morning = time_entry_repo.create(make_entry(datetime(2026, 5, 4, 9), minutes=120))
+
+    assert time_entry_repo.check_overlap('user-1', datetime(2026, 5, 4, 10), datetime(2026, 5, 4, 12))
+    assert time_entry_repo.check_overlap('user-1', datetime(2026, 5, 4, 8), datetime(2026, 5, 4, 13))
+    # Touching ends do not overlap
+    assert not time_entry_repo.check_overlap('user-1', datetime(2026, 5, 4, 11), datetime(2026, 5, 4, 12))
+    assert not time_entry_repo.check_overlap('user-1', datetime(2026, 5, 4, 7), datetime(2026, 5, 4, 9))
+    assert not time_entry_repo.check_overlap('user-2', datetime(2026, 5, 4, 10), datetime(2026, 5, 4, 12))
+    assert not time_entry_repo.check_overlap('user-1', datetime(2026, 5, 4, 10), datetime(2026, 5, 4, 12),
+                                             morning.entry_id)
+
+def test_long_entry_from_an_earlier_month_overlaps(time_entry_repo):
+    time_entry_repo.create(make_entry(datetime(2026, 4, 30, 20), minutes=10 * 60))
+    time_entry_repo.create_many([make_entry(datetime(2026, 4, day, 9)) for day in range(1, 29)])
+
+    assert time_entry_repo.check_overlap('user-1', datetime(2026, 5, 1, 5), datetime(2026, 5, 1, 6))
+    assert not time_entry_repo.check_overlap('user-1', datetime(2026, 5, 1, 6), datetime(2026, 5, 1, 7))
@@ -0,0 +1,111 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import make_entry
+from app.core.entities.timesheet import PeriodType, TimesheetStatus
+from app.core.services.timesheet_service import TimesheetService
+from app.infrastructure.repositories.json_time_entry_repository import JsonTimeEntryRepository
+from app.infrastructure.repositories.json_timesheet_repository import JsonTimesheetRepository
+
+START = datetime(2026, 1, 12, 9)
+
+class FailingTimesheetRepository(JsonTimesheetRepository):
+    """Timesheet repository whose updates fail"""
+
+    def update(self, timesheet):
+        raise IOError("disk full")
+
+@pytest.fixture
+def repos(tmp_path):
+    return JsonTimesheetRepository(str(tmp_path)), JsonTimeEntryRepository(str(tmp_path))
+
+def _create_timesheet(service, user_id='user-1', start=date(2026, 1, 12)):
+    return service.create_timesheet(user_id, 'Week', PeriodType.WEEKLY, start, start + timedelta(days=6))
+
+def test_added_entries_point_back_and_count_in_totals(repos):
+    timesheets, entries = repos
+    service = TimesheetService(timesheets, entries)
+    timesheet = _create_timesheet(service)
+    first = entries.create(make_entry(START, minutes=90))
+    second = entries.create(make_entry(START + timedelta(days=1), minutes=30))
+
+    updated = service.add_entries_to_timesheet(timesheet.timesheet_id, [first.entry_id, second.entry_id])
+
+    assert updated.entry_ids == [first.entry_id, second.entry_id]
+    assert updated.total_hours == 2.0
+    assert {entry.timesheet_id for entry in entries.get_many(updated.entry_ids)} == {timesheet.timesheet_id}
+
+def test_rejects_entries_of_another_user(repos):
+    timesheets, entries = repos
+    service = TimesheetService(timesheets, entries)
+    timesheet = _create_timesheet(service)
+    own = entries.create(make_entry(START))
+    other = entries.create(make_entry(START, user_id='user-2'))
+
+    with pytest.raises(ValueError, match='another user'):
+        service.add_entries_to_timesheet(timesheet.timesheet_id, [own.entry_id, other.entry_id])
+
+    assert timesheets.get_by_id(timesheet.timesheet_id).entry_ids == []
+    assert entries.get_by_id(own.entry_id).timesheet_id is None
+    assert entries.get_by_id(other.entry_id).timesheet_id is None
+
+def test_rejects_entries_already_in_another_timesheet(repos):
+    timesheets, entries = repos
+    service = TimesheetService(timesheets, entries)
+    entry = entries.create(make_entry(START))
+    approved = _create_timesheet(service)
+    service.submit_timesheet(approved.timesheet_id)
+    service.approve_timesheet(approved.timesheet_id)
+    other = _create_timesheet(service, start=date(2026, 1, 19))
+
+    with pytest.raises(ValueError, match='already in timesheet'):
+        service.add_entries_to_timesheet(other.timesheet_id, [entry.entry_id])
+
+    assert entries.get_by_id(entry.entry_id).timesheet_id == approved.timesheet_id
+    assert timesheets.get_by_id(approved.timesheet_id).entry_ids == [entry.entry_id]
+    assert timesheets.get_by_id(other.timesheet_id).entry_ids == []
+
+def test_entries_are_not_saved_when_the_timesheet_cannot_be(tmp_path):
+    entries = JsonTimeEntryRepository(str(tmp_path))
+    timesheet = _create_timesheet(TimesheetService(JsonTimesheetRepository(str(tmp_path)), entries))
+    entry = entries.create(make_entry(START))
+    service = TimesheetService(FailingTimesheetRepository(str(tmp_path)), entries)
+
+    with pytest.raises(IOError):
+        service.add_entries_to_timesheet(timesheet.timesheet_id, [entry.entry_id])
+
+    assert entries.get_by_id(entry.entry_id).timesheet_id is None
+    assert JsonTimeEntryRepository(str(tmp_path)).get_by_id(entry.entry_id).timesheet_id is None
+
+class CountingTimeEntryRepository(JsonTimeEntryRepository):
+    """Time entry repository counting get_many calls"""
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir)
+        self.lookups = 0
+
+    def get_many(self, entry_ids):
+        self.lookups += 1
+        return super().get_many(entry_ids)
+
+def test_timesheets_are_listed_with_their_entries_in_one_lookup(tmp_path):
+    entries = CountingTimeEntryRepository(str(tmp_path))
+    service = TimesheetService(JsonTimesheetRepository(str(tmp_path)), entries)
+    first_week = [entries.create(make_entry(START + timedelta(days=day))) for day in range(3)]
+    second_week = [entries.create(make_entry(START + timedelta(days=7 + day))) for day in range(2)]
+    first = _create_timesheet(service)
+    second = _create_timesheet(service, start=date(2026, 1, 19))
+    entries.delete(first_week[1].entry_id)
+    service.submit_timesheet(second.timesheet_id)
+    entries.lookups = 0
+
+    listed = service.get_timesheets_with_entries('user-1')
+
+    assert entries.lookups == 1
+    assert {timesheet.timesheet_id: [entry.entry_id for entry in timesheet_entries]
+            for timesheet, timesheet_entries in listed} == {
+        first.timesheet_id: [first_week[0].entry_id, first_week[2].entry_id],
+        second.timesheet_id: [entry.entry_id for entry in second_week]}
+    submitted = service.get_timesheets_with_entries('user-1', TimesheetStatus.SUBMITTED)
+    assert [timesheet.timesheet_id for timesheet, _ in submitted] == [second.timesheet_id]